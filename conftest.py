@@ -1,5 +1,6 @@
 """Configuring tests for the content suite
 """
+import os
 from typing import Generator
 from unittest import mock
 
@@ -89,3 +90,14 @@ def mock_update_id_set_cpu_count() -> Generator:
     """
     with mock.patch('demisto_sdk.commands.common.update_id_set.cpu_count', return_value=2) as _fixture:
         yield _fixture
+
+
+@pytest.fixture(autouse=True)
+def mock_sdk_cache_dir(tmp_path_factory: TempPathFactory) -> Generator:
+    """
+    Keep the caches of demisto-sdk (e.g. the docker tags, the uploaded content and the unified files) of each test in
+    a temporary directory, so the tests neither use the caches of former tests nor fill the caches of the user.
+    """
+    cache_dir = tmp_path_factory.mktemp('sdk_cache')
+    with mock.patch.dict(os.environ, {'DEMISTO_SDK_CACHE_DIR': str(cache_dir)}) as _fixture:
+        yield _fixture
@@ -10,18 +10,14 @@ from typing import IO
 
 # Third party packages
 import click
-import git
-from pkg_resources import get_distribution
 
 from demisto_sdk.commands.common.configuration import Configuration
 # Common tools
 from demisto_sdk.commands.common.constants import FileType
-from demisto_sdk.commands.common.tools import (find_type,
-                                               get_last_remote_release_version,
-                                               get_release_note_entries,
-                                               is_external_repository,
-                                               print_error, print_success,
-                                               print_warning)
+from demisto_sdk.commands.common.tools import (
+    find_type, get_cached_last_remote_release_version, get_current_sdk_version,
+    get_last_remote_release_version, get_release_note_entries,
+    is_external_repository, print_error, print_success, print_warning)
 
 
 class PathsParamType(click.Path):
@@ -126,8 +122,9 @@ def main(config, version, release_notes):
     dotenv.load_dotenv()  # Load a .env file from the cwd.
     config.configuration = Configuration()
     if not os.getenv('DEMISTO_SDK_SKIP_VERSION_CHECK') or version:  # If the key exists/called to version
-        cur_version = get_distribution('demisto-sdk').version
-        last_release = get_last_remote_release_version()
+        cur_version = get_current_sdk_version()
+        # the cached release is refreshed in the background, so only an explicit version check waits for PYPI
+        last_release = get_last_remote_release_version() if version else get_cached_last_remote_release_version()
         print_warning(f'You are using demisto-sdk {cur_version}.')
         if last_release and cur_version != last_release:
             print_warning(f'however version {last_release} is available.\n'
@@ -433,9 +430,14 @@ def zip_packs(**kwargs) -> int:
     "--allow-skipped",
     help="Don't fail on skipped integrations or when all test playbooks are skipped.",
     is_flag=True)
+@click.option(
+    '--workers', type=click.IntRange(min=1), default=1, show_default=True,
+    help='The number of processes used for validating the packs. This applies only when the -a flag is supplied.')
 @pass_config
 def validate(config, **kwargs):
     """Validate your content files. If no additional flags are given, will validated only committed files."""
+    import git
+
     from demisto_sdk.commands.validate.validate_manager import ValidateManager
     check_configuration_file('validate', kwargs)
     sys.path.append(config.configuration.env_dir)
@@ -474,6 +476,7 @@ def validate(config, **kwargs):
             include_untracked=kwargs.get('include_untracked'),
             quite_bc=kwargs.get('quite_bc_validation'),
             check_is_unskipped=not kwargs.get('allow_skipped', False),
+            workers=kwargs.get('workers'),
         )
         return validator.run_validation()
     except (git.InvalidGitRepositoryError, git.NoSuchPathError, FileNotFoundError) as e:
@@ -563,6 +566,10 @@ def create_content_artifacts(**kwargs) -> int:
     '--prev-ver',
     help='The branch against which to run secrets validation.'
 )
+@click.option(
+    '--workers', type=click.IntRange(min=1), default=1, show_default=True,
+    help='The number of processes used for searching the files for secrets.'
+)
 @pass_config
 def secrets(config, **kwargs):
     """Run Secrets validator to catch sensitive data before exposing your code to public repository.
@@ -576,7 +583,8 @@ def secrets(config, **kwargs):
         is_circle=kwargs['post_commit'],
         ignore_entropy=kwargs['ignore_entropy'],
         white_list_path=kwargs['whitelist'],
-        input_path=kwargs.get('input')
+        input_path=kwargs.get('input'),
+        workers=kwargs.get('workers')
     )
     return secrets_validator.run()
 
@@ -622,6 +630,11 @@ def secrets(config, **kwargs):
 )
 @click.option("-dt", "--docker-timeout", default=60,
               help="The timeout (in seconds) for requests done by the docker client.", type=int)
+@click.option("--no-cache", is_flag=True,
+              help="Do NOT use the lint results cache, lint and test all the packages even if they were not changed.")
+@click.option("--batch", is_flag=True,
+              help="Run flake8 and bandit once over all the packages with the same python version, "
+                   "instead of once per package.")
 def lint(**kwargs):
     """Lint command will perform:
         1. Package in host checks - flake8, bandit, mypy, vulture.
@@ -663,6 +676,8 @@ def lint(**kwargs):
         no_coverage=kwargs.get('no_coverage'),  # type: ignore[arg-type]
         coverage_report=kwargs.get('coverage_report'),  # type: ignore[arg-type]
         docker_timeout=kwargs.get('docker_timeout'),  # type: ignore[arg-type]
+        no_cache=kwargs.get('no_cache'),  # type: ignore[arg-type]
+        batch=kwargs.get('batch'),  # type: ignore[arg-type]
     )
 
 
@@ -836,6 +851,11 @@ def format(
     "-v", "--verbose",
     help="Verbose output", is_flag=True
 )
+@click.option(
+    "-f", "--force",
+    help="Upload all the files, including the files which did not change since they were last uploaded to the server",
+    is_flag=True
+)
 def upload(**kwargs):
     """Upload integration or pack to Demisto instance.
     DEMISTO_BASE_URL environment variable should contain the Demisto server base URL.
@@ -1381,6 +1401,12 @@ def generate_docs(**kwargs):
                                            ' inserted to the id set, and which items are present in the id set for '
                                            'each pack. Default is the XSOAR marketplace, that has all of the packs ',
               default='xsoar')
+@click.option(
+    '--incremental',
+    help="Only re-process the content items which were changed since the previous run, using the manifest saved "
+         "next to the id set. Can also be enabled by setting the DEMISTO_SDK_ID_SET_INCREMENTAL env var.",
+    is_flag=True
+)
 def create_id_set(**kwargs):
     """Create the content dependency tree by ids."""
     from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
@@ -1470,7 +1496,8 @@ def merge_id_sets(**kwargs):
     "--pre_release", help="Indicates that this change should be designated a pre-release version.",
     is_flag=True)
 @click.option(
-    "-idp", "--id-set-path", help="The path of the id-set.json used for APIModule updates.",
+    "-idp", "--id-set-path", help="The path of the id-set.json used for APIModule updates. If not given, the "
+                                  "dependents of the changed APIModules are found by their code.",
     type=click.Path(resolve_path=True))
 @click.option(
     '-bc', '--breaking-changes', help='If new version contains breaking changes.',
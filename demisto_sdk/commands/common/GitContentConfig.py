@@ -1,15 +1,15 @@
 import os
 from functools import lru_cache
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 from urllib.parse import urljoin, urlparse
 
 import click
-import giturlparse
-# dirs
-import requests
-from git import InvalidGitRepositoryError
 
-from demisto_sdk.commands.common.git_util import GitUtil
+if TYPE_CHECKING:
+    from giturlparse.result import GitUrlParsed
+
+# git, giturlparse and requests are imported when the repository config is built, as this module is imported on the
+# startup of every command
 
 
 class GitCredentials:
@@ -47,6 +47,10 @@ class GitContentConfig:
     BASE_RAW_GITLAB_LINK = "https://{GITLAB_HOST}/api/v4/projects/{GITLAB_ID}/repository"
 
     def __init__(self, repo_name: Optional[str] = None):
+        from git import InvalidGitRepositoryError
+
+        from demisto_sdk.commands.common.git_util import GitUtil
+
         self.Credentials = GitCredentials()
         if not repo_name:
             try:
@@ -62,17 +66,19 @@ class GitContentConfig:
             self.CONTENT_GITHUB_LINK = urljoin(self.BASE_RAW_GITHUB_LINK, self.CURRENT_REPOSITORY)
             self.CONTENT_GITHUB_MASTER_LINK = urljoin(self.CONTENT_GITHUB_LINK, r'master')
 
-    def _get_repository_properties(self, urls: Iterable) -> Optional[giturlparse.result.GitUrlParsed]:
+    def _get_repository_properties(self, urls: Iterable) -> Optional['GitUrlParsed']:
         """Returns the git repository of the cwd.
         if not running in a git repository, will return an empty string
         """
+        import giturlparse
+
         for url in urls:
             parsed_git = giturlparse.parse(url)
             if parsed_git and parsed_git.host and parsed_git.repo:
                 return parsed_git
         return None
 
-    def _set_repo_config(self, parsed_git: Optional[giturlparse.result.GitUrlParsed]):
+    def _set_repo_config(self, parsed_git: Optional['GitUrlParsed']):
         if parsed_git is None:
             # default to content repo if the repo is not found
             click.secho('Could not find the repository name - defaulting to demisto/content', fg='yellow')
@@ -101,6 +107,8 @@ class GitContentConfig:
 
     @lru_cache(maxsize=10)
     def _search_gitlab_id(self, gitlab_hostname: str, repo: str) -> Optional[int]:
+        import requests
+
         if not self.Credentials.GITLAB_TOKEN:
             click.secho('If your repo is in private gitlab repo,'
                         ' configure `DEMISTO_SDK_GITLAB_TOKEN` enviroment variable', fg='yellow')
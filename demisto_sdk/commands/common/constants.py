@@ -1,5 +1,4 @@
 import re
-from distutils.version import LooseVersion
 from enum import Enum
 from functools import reduce
 from typing import Dict, List
@@ -1344,4 +1343,4 @@ class MarketplaceVersions(Enum):
     MarketplaceV2 = 'marketplacev2'
 
 
-INDICATOR_FIELD_TYPE_TO_MIN_VERSION = {'html': LooseVersion('6.1.0'), 'grid': LooseVersion('5.5.0')}
+INDICATOR_FIELD_TYPE_TO_MIN_VERSION = {'html': '6.1.0', 'grid': '5.5.0'}
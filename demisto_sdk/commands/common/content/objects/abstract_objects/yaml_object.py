@@ -1,3 +1,4 @@
+import threading
 from typing import Union
 
 from ruamel.yaml import YAML
@@ -11,6 +12,8 @@ from .dictionary_based_object import DictionaryBasedObject
 RUYAML = YAML(typ='rt')
 RUYAML.preserve_quotes = True  # type: ignore
 RUYAML.width = 50000  # type: ignore
+# the YAML instance is not thread safe, while the objects may be loaded concurrently, e.g. by the upload command
+RUYAML_LOCK = threading.Lock()
 
 
 class YAMLObject(DictionaryBasedObject):
@@ -48,7 +51,8 @@ class YAMLObject(DictionaryBasedObject):
     def _unserialize(self):
         """Load yaml to dictionary"""
         try:
-            self._as_dict = RUYAML.load(self.path)
+            with RUYAML_LOCK:
+                self._as_dict = RUYAML.load(self.path)
         except ScannerError as e:
             raise exc.ContentSerializeError(self, self.path, e.problem)
 
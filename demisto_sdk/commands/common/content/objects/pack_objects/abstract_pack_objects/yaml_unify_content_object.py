@@ -1,4 +1,5 @@
 import copy
+import os
 from typing import List, Optional, Union
 
 from wcmatch.pathlib import EXTMATCH, Path
@@ -6,6 +7,7 @@ from wcmatch.pathlib import EXTMATCH, Path
 import demisto_sdk.commands.common.content.errors as exc
 from demisto_sdk.commands.common.constants import (INTEGRATIONS_DIR,
                                                    SCRIPTS_DIR, FileType)
+from demisto_sdk.commands.unify.unify_cache import get_unified_content_cache
 from demisto_sdk.commands.unify.yml_unifier import YmlUnifier
 
 from .yaml_content_object import YAMLContentObject
@@ -93,6 +95,7 @@ class YAMLContentUnifiedObject(YAMLContentObject):
 
     def _unify(self, dest_dir: Path) -> List[Path]:
         """Unify YAMLContentUnfiedObject in destination dir.
+        The unified files of an unchanged package are copied from the unified content cache.
 
         Args:
             dest_dir: Destination directory.
@@ -106,12 +109,26 @@ class YAMLContentUnifiedObject(YAMLContentObject):
         """
         # Directory configuration - Integrations or Scripts
         unify_dir = SCRIPTS_DIR if self._content_type == FileType.SCRIPT else INTEGRATIONS_DIR
+        # Cache step - unchanged package
+        unify_cache = get_unified_content_cache()
+        package_dir = str(self.path.parent)
+        cache_key = unify_cache.get_key(package_dir, unify_dir)
+        cached_files = unify_cache.get(package_dir, unify_dir, cache_key)
+        if cached_files:
+            created_paths = []
+            for file_name, file_content in cached_files.items():
+                created_path = os.path.join(dest_dir, file_name)
+                with open(created_path, 'w', encoding='utf-8', newline='') as created_file:
+                    created_file.write(file_content)
+                created_paths.append(Path(created_path))
+            return created_paths
         # Unify step
-        unifier = YmlUnifier(input=str(self.path.parent), dir_name=unify_dir, output=dest_dir, force=True)
+        unifier = YmlUnifier(input=package_dir, dir_name=unify_dir, output=dest_dir, force=True)
         created_files: List[str] = unifier.merge_script_package_to_yml()
         # Validate that unify succeed - there is not exception raised in unify module.
         if not created_files:
             raise exc.ContentDumpError(self, self.path, "Unable to unify object")
+        unify_cache.set(package_dir, unify_dir, cache_key, created_files)
 
         return [Path(path) for path in created_files]
 
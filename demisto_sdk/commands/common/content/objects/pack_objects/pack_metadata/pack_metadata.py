@@ -2,7 +2,7 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 from packaging.version import Version, parse
 from wcmatch.pathlib import Path
@@ -570,19 +570,22 @@ class PackMetaData(JSONObject):
         except Exception:
             logger.error(f'Failed loading {pack_name} user metadata.')
 
-    def handle_dependencies(self, pack_name: str, id_set_path: str, logger: logging.Logger) -> None:
+    def handle_dependencies(self, pack_name: str, id_set_path: str, logger: logging.Logger,
+                            id_set: Optional[dict] = None) -> None:
         """Updates pack's dependencies using the find_dependencies command.
 
         Args:
             pack_name (str): The pack's name.
             id_set_path (str): the id_set file path.
             logger (logging.Logger): System logger already initialized.
+            id_set (dict): the already loaded id_set, used instead of loading id_set_path.
         """
         calculated_dependencies = PackDependencies.find_dependencies(pack_name,
                                                                      id_set_path=id_set_path,
                                                                      update_pack_metadata=False,
                                                                      silent_mode=True,
-                                                                     complete_data=True)
+                                                                     complete_data=True,
+                                                                     id_set=id_set)
 
         # If it is a core pack, check that no new mandatory packs (that are not core packs) were added
         # They can be overridden in the user metadata to be not mandatory so we need to check there as well
@@ -1,8 +1,8 @@
 import tempfile
-from typing import Union
+from typing import Optional, Union
 
 import demisto_client
-from packaging.version import parse
+from packaging.version import LegacyVersion, Version, parse
 from wcmatch.pathlib import Path
 
 from demisto_sdk.commands.common.constants import SCRIPT, FileType
@@ -15,11 +15,12 @@ class Script(YAMLContentUnifiedObject):
     def __init__(self, path: Union[Path, str]):
         super().__init__(path, FileType.SCRIPT, SCRIPT)
 
-    def upload(self, client: demisto_client):
+    def upload(self, client: demisto_client, demisto_version: Optional[Union[Version, LegacyVersion]] = None):
         """
         Upload the integration to demisto_client
         Args:
             client: The demisto_client object of the desired XSOAR machine to upload to.
+            demisto_version: The version of the XSOAR machine, requested from it if not given.
 
         Returns:
             The result of the upload command from demisto_client
@@ -29,8 +30,11 @@ class Script(YAMLContentUnifiedObject):
         else:
             with tempfile.TemporaryDirectory() as dir:
                 unified_files = self._unify(dir)
+                if demisto_version is None:
+                    # the version of an unreachable server is the string "0"
+                    demisto_version = parse(str(get_demisto_version(client)))
                 for file in unified_files:
-                    if (str(file)[-7:] == '_45.yml') == (get_demisto_version(client) < parse('4.6.0')):
+                    if (str(file)[-7:] == '_45.yml') == (demisto_version < parse('4.6.0')):
                         # The above condition checks that the file ends in `_45.yml' and the version is 4.5 or less
                         # or that the file doesn't end in `_45.yml` and the version is higher than 4.5
                         return client.import_script(file=file)
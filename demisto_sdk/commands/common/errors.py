@@ -10,8 +10,41 @@ from demisto_sdk.commands.common.constants import (BETA_INTEGRATION_DISCLAIMER,
                                                    PACK_METADATA_DESC,
                                                    PACK_METADATA_NAME)
 
-FOUND_FILES_AND_ERRORS: list = []
-FOUND_FILES_AND_IGNORED_ERRORS: list = []
+
+class FoundErrors(list):
+    """
+    The '<file path> - [<error code>]' entries of the reported errors, in the order they were found.
+    Membership checks are done by a set, and an entry which was already found is not added again.
+    """
+
+    def __init__(self, errors=()):
+        super().__init__()
+        self._found: set = set()
+        self.extend(errors)
+
+    def __contains__(self, error) -> bool:
+        return error in self._found
+
+    def append(self, error) -> None:
+        if error not in self._found:
+            self._found.add(error)
+            super().append(error)
+
+    def extend(self, errors) -> None:
+        for error in errors:
+            self.append(error)
+
+    def clear(self) -> None:
+        super().clear()
+        self._found.clear()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._found = set(self)
+
+
+FOUND_FILES_AND_ERRORS: list = FoundErrors()
+FOUND_FILES_AND_IGNORED_ERRORS: list = FoundErrors()
 ALLOWED_IGNORE_ERRORS = [
     'BA101', 'BA106', 'BA108', 'BA109', 'BA110', 'BA111', 'BA112', 'BA113',
     'DS107',
@@ -35,7 +68,7 @@ PRESET_ERROR_TO_CHECK = {
     "deprecated": ['ST', 'BC', 'BA', 'IN127', 'IN128', 'PB104', 'SC101'],
 }
 
-ERROR_CODE = {
+ERROR_CODE: Dict[str, Dict[str, Any]] = {
     # BA - Basic
     "wrong_version": {'code': "BA100", 'ui_applicable': False, 'related_field': 'version'},
     "id_should_equal_name": {'code': "BA101", 'ui_applicable': False, 'related_field': 'id'},
@@ -409,11 +442,12 @@ def get_all_error_codes() -> List:
     return error_codes
 
 
+# The error data by error code, the first error of each code is used (as the first in ERROR_CODE)
+ERROR_CODE_BY_CODE: Dict[str, Dict] = {error['code']: error for error in reversed(list(ERROR_CODE.values()))}
+
+
 def get_error_object(error_code: str) -> Dict:
-    for error in ERROR_CODE:
-        if error_code == ERROR_CODE[error].get('code'):
-            return ERROR_CODE[error]
-    return {}
+    return ERROR_CODE_BY_CODE.get(error_code, {})
 
 
 @decorator.decorator
@@ -1,12 +1,142 @@
 import os
 import re
+import threading
 from pathlib import Path
-from typing import Set, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 import click
 import gitdb
 from git import InvalidGitRepositoryError, Repo
 
+# The content of files read from the local git object database, keyed by the commit sha1 and the file path.
+# None marks a file which does not exist in the commit.
+FILES_CONTENT_CACHE: Dict[Tuple[str, str], Optional[bytes]] = {}
+_FILES_CONTENT_LOCK = threading.Lock()
+
+
+class ChangedFile(NamedTuple):
+    """A single entry of a `git diff --name-status` output."""
+    status: str
+    score: Optional[int]
+    a_path: str
+    b_path: str
+
+
+def parse_name_status(diff_output: str) -> List[ChangedFile]:
+    """Parse the output of `git diff --name-status -z`.
+    Args:
+        diff_output (str): the diff output.
+    Returns:
+        List: the changed files - for renames and copies a_path is the old path and b_path is the new one,
+        for any other status both are the file path.
+    """
+    changed_files = []
+    fields = diff_output.split('\0')
+    i = 0
+    while i < len(fields) and fields[i]:
+        change_type = fields[i].upper()
+        status, score = change_type[0], change_type[1:]
+        if status in ('R', 'C'):
+            a_path, b_path = fields[i + 1], fields[i + 2]
+            i += 3
+        else:
+            a_path = b_path = fields[i + 1]
+            i += 2
+        changed_files.append(ChangedFile(status, int(score) if score.isdigit() else None, a_path, b_path))
+
+    return changed_files
+
+
+class GitChangeSet:
+    """A snapshot of the changes of the current branch against a base revision.
+
+    Every git command is run at most once, on first use - the diff of the base revision against the current branch,
+    the diff of the current branch against its merge base with the base revision, the staged diff and the git status.
+    """
+
+    def __init__(self, repo: Repo, base: str, current_branch_or_hash: str):
+        """
+        Args:
+            repo (Repo): the git repository.
+            base (str): the base revision - a remote branch (e.g. origin/master) or a commit sha1.
+            current_branch_or_hash (str): the current branch name or commit hash.
+        """
+        self.repo = repo
+        self.base = base
+        self.current_branch_or_hash = current_branch_or_hash
+        self._committed: Optional[List[ChangedFile]] = None
+        self._staged: Optional[List[ChangedFile]] = None
+        self._branch_files_status: Optional[Dict[str, str]] = None
+        self._status_lines: Optional[List[str]] = None
+
+    @property
+    def committed(self) -> List[ChangedFile]:
+        """The files changed between the base revision and the current branch."""
+        if self._committed is None:
+            self._committed = parse_name_status(self.repo.git.diff('--name-status', '-M', '-z', self.base,
+                                                                   self.current_branch_or_hash))
+        return self._committed
+
+    @property
+    def staged(self) -> List[ChangedFile]:
+        """The files changed between the HEAD commit and the index."""
+        if self._staged is None:
+            self._staged = parse_name_status(self.repo.git.diff('--cached', '--name-status', '-M', '-z', 'HEAD'))
+        return self._staged
+
+    @property
+    def branch_files_status(self) -> Dict[str, str]:
+        """The status of each file touched on the current branch since its merge base with the base revision.
+        The status is of the file by itself, so rename targets are of added status."""
+        if self._branch_files_status is None:
+            branch_changes = parse_name_status(self.repo.git.diff('--name-status', '-z',
+                                                                  f'{self.base}...{self.current_branch_or_hash}'))
+            self._branch_files_status = {item.b_path: 'A' if item.status in ('R', 'C') else item.status
+                                         for item in branch_changes}
+        return self._branch_files_status
+
+    @property
+    def status_lines(self) -> List[str]:
+        """The lines of the short git status, including untracked files."""
+        if self._status_lines is None:
+            self._status_lines = self.repo.git.status('--short', '-u').split('\n')
+        return self._status_lines
+
+    def untracked_files(self, requested_status: str) -> set:
+        """return all untracked files of the given requested status.
+        Args:
+            requested_status (str): M, A, R, D - the git status to return
+        Returns:
+            Set: of path strings which include the untracked files of a certain status.
+        """
+        git_status = self.status_lines
+
+        # in case there are no local changes - return
+        if git_status == ['']:
+            return set()
+
+        extracted_paths = set()
+        for line in git_status:
+            line = line.strip()
+            file_status = line.split()[0].upper() if not line.startswith('?') else 'A'
+            if file_status.startswith(requested_status):
+                if requested_status == 'R':
+                    if file_status == 'R100':
+                        extracted_paths.add((Path(line.split()[-2]), Path(line.split()[-1])))
+                else:
+                    extracted_paths.add(Path(line.split()[-1]))  # type: ignore
+
+        return extracted_paths
+
+    def committed_files(self, change_type: str) -> List[ChangedFile]:
+        return [item for item in self.committed if item.status == change_type]
+
+    def staged_files(self, change_type: str) -> List[ChangedFile]:
+        return [item for item in self.staged if item.status == change_type]
+
+    def branch_changed_files(self) -> Set[Path]:
+        return {Path(path) for path in self.branch_files_status}
+
 
 class GitUtil:
     repo: Repo
@@ -20,6 +150,28 @@ class GitUtil:
         else:
             self.repo = repo
 
+        # the change sets are memoized for the lifetime of the instance, keyed by the base and the current revisions
+        self._change_sets: Dict[Tuple[str, str], GitChangeSet] = {}
+
+    def get_change_set(self, prev_ver: str) -> GitChangeSet:
+        """Get the changes of the current branch against the prev_ver, running each git command only once.
+        Args:
+            prev_ver (str): The base branch against which the comparison is made.
+        Returns:
+            GitChangeSet: the memoized changes snapshot.
+        """
+        remote, branch = self._handle_prev_ver(prev_ver)
+        return self._get_change_set(remote, branch)
+
+    def _get_change_set(self, remote: Optional[str], branch: str) -> GitChangeSet:
+        # if remote does not exist we are checking against the commit sha1
+        base = f'{remote}/{branch}' if remote else branch
+        current_branch_or_hash = self.get_current_git_branch_or_hash()
+        key = (base, current_branch_or_hash)
+        if key not in self._change_sets:
+            self._change_sets[key] = GitChangeSet(self.repo, base, current_branch_or_hash)
+        return self._change_sets[key]
+
     def modified_files(self, prev_ver: str = 'master', committed_only: bool = False,
                        staged_only: bool = False, debug: bool = False, include_untracked: bool = False) -> Set[Path]:
         """Gets all the files that are recognized by git as modified against the prev_ver.
@@ -33,7 +185,7 @@ class GitUtil:
             Set: A set of Paths to the modified files.
         """
         remote, branch = self._handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
+        changes = self._get_change_set(remote, branch)
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status='M')
@@ -59,19 +211,12 @@ class GitUtil:
         if not staged_only:
             # get all committed files identified as modified which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {Path(os.path.join(item.a_path)) for item
-                             in self.repo.remote(name=remote).refs[branch].commit.diff(
-                    current_branch_or_hash).iter_change_type('M')}.union(untrue_rename_committed)
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {Path(os.path.join(item.a_path)) for item in self.repo.commit(rev=prev_ver).diff(
-                    current_branch_or_hash).iter_change_type('M')}.union(untrue_rename_committed)
+            committed = {Path(os.path.join(item.a_path)) for item
+                         in changes.committed_files('M')}.union(untrue_rename_committed)
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed modified files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
+            all_branch_changed_files = changes.branch_changed_files()
             committed = committed.intersection(all_branch_changed_files)
 
         # remove the renamed and deleted files from the committed
@@ -84,26 +229,18 @@ class GitUtil:
         untracked = set()  # type: Set
         if include_untracked:
             # get all untracked modified files
-            untracked = self._get_untracked_files('M')
+            untracked = changes.untracked_files('M')
 
         # get all the files that are staged on the branch and identified as modified.
         staged = {Path(os.path.join(item.a_path)) for item
-                  in self.repo.head.commit.diff().iter_change_type('M')}.union(untracked).union(untrue_rename_staged)
+                  in changes.staged_files('M')}.union(untracked).union(untrue_rename_staged)
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will remove it from the staged modified files.
         # also remove the deleted and renamed files as well.
-        if remote:
-            committed_added = {Path(os.path.join(item.a_path)) for item in
-                               self.repo.remote(name=remote).refs[branch].commit.
-                               diff(current_branch_or_hash).iter_change_type('A')}
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed_added = {Path(os.path.join(item.a_path)) for item in
-                               self.repo.commit(rev=prev_ver).diff(current_branch_or_hash).iter_change_type('A')}
+        committed_added = {Path(os.path.join(item.a_path)) for item in changes.committed_files('A')}
 
         staged = staged - committed_added - renamed - deleted
 
@@ -128,7 +265,7 @@ class GitUtil:
             Set: A set of Paths to the added files.
         """
         remote, branch = self._handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
+        changes = self._get_change_set(remote, branch)
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status='A')
@@ -146,20 +283,12 @@ class GitUtil:
 
         # get all committed files identified as added which are changed from prev_ver.
         # this can result in extra files identified which were not touched on this branch.
-        if remote:
-            committed = {Path(os.path.join(item.a_path)) for item
-                         in self.repo.remote(name=remote).refs[branch].commit.diff(
-                current_branch_or_hash).iter_change_type('A')}.union(untrue_rename_committed)
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed = {Path(os.path.join(item.a_path)) for item
-                         in self.repo.commit(rev=prev_ver).diff(
-                current_branch_or_hash).iter_change_type('A')}.union(untrue_rename_committed)
+        committed = {Path(os.path.join(item.a_path)) for item
+                     in changes.committed_files('A')}.union(untrue_rename_committed)
 
         # identify all files that were touched on this branch regardless of status
         # intersect these with all the committed files to identify the committed added files.
-        all_branch_changed_files = self._get_all_changed_files(prev_ver)
+        all_branch_changed_files = changes.branch_changed_files()
         committed = committed.intersection(all_branch_changed_files)
 
         # remove deleted files
@@ -173,14 +302,14 @@ class GitUtil:
         untracked_modified = set()  # type: Set
         if include_untracked:
             # get all untracked added files
-            untracked_added = self._get_untracked_files('A')
+            untracked_added = changes.untracked_files('A')
 
             # get all untracked modified files
-            untracked_modified = self._get_untracked_files('M')
+            untracked_modified = changes.untracked_files('M')
 
         # get all the files that are staged on the branch and identified as added.
         staged = {Path(os.path.join(item.a_path)) for item in
-                  self.repo.head.commit.diff().iter_change_type('A')}.union(untrue_rename_staged)
+                  changes.staged_files('A')}.union(untrue_rename_staged)
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
@@ -188,7 +317,7 @@ class GitUtil:
         # so will added it from the staged added files.
         # same goes to untracked files - can be identified as modified but are actually added against prev_ver
         committed_added_locally_modified = {Path(os.path.join(item.a_path)) for item in
-                                            self.repo.head.commit.diff().iter_change_type('M')}.intersection(committed)
+                                            changes.staged_files('M')}.intersection(committed)
         untracked = untracked_added.union(untracked_modified.intersection(committed))
 
         staged = staged.union(committed_added_locally_modified).union(untracked)
@@ -216,7 +345,7 @@ class GitUtil:
             Set: A set of Paths to the deleted files.
         """
         remote, branch = self._handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
+        changes = self._get_change_set(remote, branch)
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status='D')
@@ -228,20 +357,11 @@ class GitUtil:
         if not staged_only:
             # get all committed files identified as added which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {Path(os.path.join(item.a_path)) for item
-                             in self.repo.remote(name=remote).refs[branch].commit.diff(
-                    current_branch_or_hash).iter_change_type('D')}
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {Path(os.path.join(item.a_path)) for item
-                             in self.repo.commit(rev=prev_ver).diff(
-                    current_branch_or_hash).iter_change_type('D')}
+            committed = {Path(os.path.join(item.a_path)) for item in changes.committed_files('D')}
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
+            all_branch_changed_files = changes.branch_changed_files()
             committed = committed.intersection(all_branch_changed_files)
 
         if committed_only:
@@ -250,11 +370,10 @@ class GitUtil:
         untracked = set()  # type: Set
         if include_untracked:
             # get all untracked deleted files
-            untracked = self._get_untracked_files('D')
+            untracked = changes.untracked_files('D')
 
         # get all the files that are staged on the branch and identified as added.
-        staged = {Path(os.path.join(item.a_path)) for item in
-                  self.repo.head.commit.diff().iter_change_type('D')}.union(untracked)
+        staged = {Path(os.path.join(item.a_path)) for item in changes.staged_files('D')}.union(untracked)
 
         if staged_only:
             return staged
@@ -278,7 +397,7 @@ class GitUtil:
             first element being the old file path and the second is the new.
         """
         remote, branch = self._handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
+        changes = self._get_change_set(remote, branch)
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status='R')
@@ -292,20 +411,12 @@ class GitUtil:
         if not staged_only:
             # get all committed files identified as renamed which are changed from prev_ver and are with 100% score.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {(Path(item.a_path), Path(item.b_path)) for item
-                             in self.repo.remote(name=remote).refs[branch].commit.diff(
-                    current_branch_or_hash).iter_change_type('R') if item.score == 100}
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {(Path(item.a_path), Path(item.b_path)) for item
-                             in self.repo.commit(rev=prev_ver).diff(
-                    current_branch_or_hash).iter_change_type('R') if item.score == 100}
+            committed = {(Path(item.a_path), Path(item.b_path)) for item
+                         in changes.committed_files('R') if item.score == 100}
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
+            all_branch_changed_files = changes.branch_changed_files()
             committed = {tuple_item for tuple_item in committed
                          if (tuple_item[1] in all_branch_changed_files and tuple_item[1] not in deleted)}
 
@@ -320,11 +431,11 @@ class GitUtil:
         untracked = set()  # type:Set
         if include_untracked:
             # get all untracked renamed files
-            untracked = self._get_untracked_files('R')
+            untracked = changes.untracked_files('R')
 
         # get all the files that are staged on the branch and identified as renamed and are with 100% score.
         staged = {(Path(item.a_path), Path(item.b_path)) for item
-                  in self.repo.head.commit.diff().iter_change_type('R') if item.score == 100}.union(untracked)
+                  in changes.staged_files('R') if item.score == 100}.union(untracked)
 
         if staged_only:
             self.debug_print(debug=debug, status='Renamed', staged=staged, committed=set())
@@ -343,32 +454,6 @@ class GitUtil:
 
         return all_renamed_files
 
-    def _get_untracked_files(self, requested_status: str) -> set:
-        """return all untracked files of the given requested status.
-        Args:
-            requested_status (str): M, A, R, D - the git status to return
-        Returns:
-            Set: of path strings which include the untracked files of a certain status.
-        """
-        git_status = self.repo.git.status('--short', '-u').split('\n')
-
-        # in case there are no local changes - return
-        if git_status == ['']:
-            return set()
-
-        extracted_paths = set()
-        for line in git_status:
-            line = line.strip()
-            file_status = line.split()[0].upper() if not line.startswith('?') else 'A'
-            if file_status.startswith(requested_status):
-                if requested_status == 'R':
-                    if file_status == 'R100':
-                        extracted_paths.add((Path(line.split()[-2]), Path(line.split()[-1])))
-                else:
-                    extracted_paths.add(Path(line.split()[-1]))  # type: ignore
-
-        return extracted_paths
-
     def _get_all_changed_files(self, prev_ver: str) -> Set[Path]:
         """Get all the files changed in the current branch without status distinction.
         Args:
@@ -376,19 +461,7 @@ class GitUtil:
         Returns:
             Set: of Paths to files changed in the current branch.
         """
-        remote, branch = self._handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
-        if remote:
-            return {Path(os.path.join(item)) for item
-                    in self.repo.git.diff('--name-only',
-                                          f'{remote}/{branch}...{current_branch_or_hash}').split('\n')}
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            return {Path(os.path.join(item)) for item
-                    in self.repo.git.diff('--name-only',
-                                          f'{prev_ver}...{current_branch_or_hash}').split('\n')}
+        return self.get_change_set(prev_ver).branch_changed_files()
 
     def _only_last_commit(self, prev_ver: str, requested_status: str) -> Set:
         """Get all the files that were changed in the last commit of a given type when checking a branch against itself.
@@ -474,23 +547,11 @@ class GitUtil:
         Returns:
             Set: of Paths to non 100% renamed files which are of a given status.
         """
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
-        if staged_only:
-            return {Path(item.b_path) for item
-                    in self.repo.head.commit.diff().iter_change_type('R') if item.score < 100 and
-                    self._check_file_status(file_path=str(item.b_path), remote=remote, branch=branch) == status}
-
-        if remote:
-            return {Path(item.b_path) for item in self.repo.remote(name=remote).refs[branch].commit.diff(
-                current_branch_or_hash).iter_change_type('R') if item.score < 100 and
+        changes = self._get_change_set(remote, branch)
+        renamed = changes.staged_files('R') if staged_only else changes.committed_files('R')
+        return {Path(item.b_path) for item in renamed if item.score < 100 and  # type: ignore[operator]
                 self._check_file_status(file_path=str(item.b_path), remote=remote, branch=branch) == status}
 
-        # if remote does not exist we are checking against the commit sha1
-        return {Path(item.b_path) for item in self.repo.commit(rev=branch).diff(
-            current_branch_or_hash).iter_change_type('R') if item.score < 100 and
-            self._check_file_status(file_path=str(item.b_path), remote=remote, branch=branch) == status}
-
     def _check_file_status(self, file_path: str, remote: str, branch: str) -> str:
         """Get the git status of a given file path
         Args:
@@ -500,23 +561,7 @@ class GitUtil:
         Returns:
             str: the git status of the file (M, A, R, D).
         """
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
-        if remote:
-            diff_line = self.repo.git.diff('--name-status',
-                                           f'{remote}/{branch}...{current_branch_or_hash}',
-                                           '--', file_path)
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            diff_line = self.repo.git.diff('--name-status',
-                                           f'{branch}...{current_branch_or_hash}',
-                                           '--', file_path)
-
-        if not diff_line:
-            return ''
-
-        return diff_line.split()[0].upper() if not diff_line.startswith('?') else 'A'
+        return self._get_change_set(remote, branch).branch_files_status.get(file_path, '')
 
     def get_local_remote_file_content(self, git_file_path: str) -> str:
         """Get local file content from remote branch. For example get origin/master:README.md
@@ -530,6 +575,40 @@ class GitUtil:
         file_content = self.repo.git.show(git_file_path)
         return file_content
 
+    def get_remote_file_content(self, full_file_path: str, tag: str = 'master') -> Optional[bytes]:
+        """Get the content of a file in a remote branch or a commit from the local git object database.
+        The objects are read through a single persistent `git cat-file --batch` process of the repository.
+
+        Args:
+            full_file_path: The file path to fetch. For example 'Packs/HelloWorld/pack_metadata.json'
+            tag: The remote branch or the commit sha1. For example 'master' or 'origin/master'
+
+        Returns:
+            The file content, or None if the branch or the file do not exist in the local repository.
+        """
+        try:
+            remote, branch = self._handle_prev_ver(tag)
+            commit_sha = self.repo.commit(f'{remote}/{branch}' if remote else branch).hexsha
+        except (ValueError, gitdb.exc.BadName, gitdb.exc.BadObject):
+            return None
+
+        file_path = Path(os.path.relpath(os.path.abspath(full_file_path), str(self.repo.working_tree_dir))).as_posix()
+        if file_path.startswith('..'):
+            return None
+
+        key = (commit_sha, file_path)
+        with _FILES_CONTENT_LOCK:
+            if key not in FILES_CONTENT_CACHE:
+                try:
+                    _, type_name, _, content = self.repo.git.get_object_data(f'{commit_sha}:{file_path}')
+                    # the object type is returned as bytes or as str, depending on the GitPython version
+                    FILES_CONTENT_CACHE[key] = content if type_name in (b'blob', 'blob') else None
+                except ValueError:
+                    # the file does not exist in the commit
+                    FILES_CONTENT_CACHE[key] = None
+
+            return FILES_CONTENT_CACHE[key]
+
     def get_local_remote_file_path(self, full_file_path: str, tag: str) -> str:
         """Get local file path of remote branch. For example get origin/master:README.md
 
@@ -1,7 +1,8 @@
+import atexit
 import io
 import json
 import os
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import click
 
@@ -20,6 +21,90 @@ from demisto_sdk.commands.common.tools import (
     get_relative_path_from_packs_dir, get_yaml)
 
 
+class JsonErrorsOutput:
+    """ Collects the errors of the validators for the --json-file output, and writes each file once, by `flush`.
+
+    The errors are appended to the JSON list which is already in the file (if there is one), so the file content is
+    the same as if each error was written to it when it was found. The file type and the displayed name of each
+    erroneous file are resolved once per file, when the errors are written.
+    """
+
+    def __init__(self):
+        self._errors: Dict[str, List[Tuple[str, str, str, bool]]] = {}
+
+    def add(self, json_file_path: str, file_path: str, error_code: str, error_message: str, warning: bool):
+        self._errors.setdefault(json_file_path, []).append((file_path, error_code, error_message, warning))
+
+    def extend(self, json_file_path: str, errors: List[Tuple[str, str, str, bool]]):
+        self._errors.setdefault(json_file_path, []).extend(errors)
+
+    def pop(self, json_file_path: str) -> List[Tuple[str, str, str, bool]]:
+        """Removes the errors which were not written yet to the given JSON file, and returns them."""
+        return self._errors.pop(json_file_path, [])
+
+    def flush(self, json_file_path: Optional[str] = None):
+        """ Writes the collected errors to their JSON files.
+
+        Args:
+            json_file_path (str): The JSON file to write, all the files if not given.
+        """
+        json_file_paths = [json_file_path] if json_file_path else list(self._errors)
+        for path in json_file_paths:
+            errors = self.pop(path)
+            if not errors:
+                continue
+
+            json_contents = []
+            if os.path.exists(path):
+                try:
+                    existing_json = get_json(path)
+                except ValueError:
+                    existing_json = []
+                if isinstance(existing_json, list):
+                    json_contents = existing_json
+
+            files_data: Dict[str, Tuple[str, str]] = {}
+            for file_path, error_code, error_message, warning in errors:
+                if file_path not in files_data:
+                    file_type = find_type(file_path)
+                    files_data[file_path] = (file_type.value if file_type else 'pack',
+                                             get_file_displayed_name(file_path))
+                entity_type, name = files_data[file_path]
+                json_contents.append(self.format_error(file_path, error_code, error_message, warning,
+                                                       entity_type, name))
+
+            with open(path, 'w') as f:
+                json.dump(json_contents, f, indent=4)
+
+    @staticmethod
+    def format_error(file_path: str, error_code: str, error_message: str, warning: bool, entity_type: str,
+                     name: str) -> dict:
+        error_data = get_error_object(error_code)
+
+        # handling unified yml image errors
+        if entity_type == FileType.INTEGRATION.value and error_code.startswith('IM'):
+            entity_type = FileType.IMAGE.value
+
+        return {
+            'filePath': file_path,
+            'fileType': os.path.splitext(file_path)[1].replace('.', ''),
+            'entityType': entity_type,
+            'errorType': 'Settings',
+            'name': name,
+            'linter': 'validate',
+            'severity': 'warning' if warning else 'error',
+            'errorCode': error_code,
+            'message': error_message,
+            'ui': error_data.get('ui_applicable'),
+            'relatedField': error_data.get('related_field'),
+        }
+
+
+# The errors of all the validators, the validate command writes them when it finishes
+JSON_ERRORS_OUTPUT = JsonErrorsOutput()
+atexit.register(JSON_ERRORS_OUTPUT.flush)
+
+
 class BaseValidator:
 
     def __init__(self, ignored_errors=None, print_as_warnings=False, suppress_print: bool = False,
@@ -181,7 +266,7 @@ class BaseValidator:
         return False
 
     def json_output(self, file_path: str, error_code: str, error_message: str, warning: bool) -> None:
-        """Adds an error's info to the output JSON file
+        """Adds an error's info to the output JSON file, the file is written by JSON_ERRORS_OUTPUT.flush
 
         Args:
             file_path (str): The file path where the error ocurred.
@@ -192,43 +277,4 @@ class BaseValidator:
         if not self.json_file_path:
             return
 
-        error_data = get_error_object(error_code)
-
-        output = {
-            'severity': 'warning' if warning else 'error',
-            'errorCode': error_code,
-            'message': error_message,
-            'ui': error_data.get('ui_applicable'),
-            'relatedField': error_data.get('related_field'),
-            'linter': 'validate'
-        }
-
-        json_contents = []
-        existing_json = ''
-        if os.path.exists(self.json_file_path):
-            try:
-                existing_json = get_json(self.json_file_path)
-            except ValueError:
-                pass
-            if isinstance(existing_json, list):
-                json_contents = existing_json
-
-        file_type = find_type(file_path)
-        entity_type = file_type.value if file_type else 'pack'
-
-        # handling unified yml image errors
-        if entity_type == FileType.INTEGRATION.value and error_code.startswith('IM'):
-            entity_type = FileType.IMAGE.value
-
-        formatted_error_output = {
-            'filePath': file_path,
-            'fileType': os.path.splitext(file_path)[1].replace('.', ''),
-            'entityType': entity_type,
-            'errorType': 'Settings',
-            'name': get_file_displayed_name(file_path),
-            'linter': 'validate',
-            **output
-        }
-        json_contents.append(formatted_error_output)
-        with open(self.json_file_path, 'w') as f:
-            json.dump(json_contents, f, indent=4)
+        JSON_ERRORS_OUTPUT.add(self.json_file_path, file_path, error_code, error_message, warning)
@@ -1,7 +1,10 @@
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 import requests
 from pkg_resources import parse_version
@@ -10,7 +13,10 @@ from demisto_sdk.commands.common.constants import IronBankDockers
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
-from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.common.tools import (get_pooled_session,
+                                               get_sdk_cache_path, get_yaml,
+                                               read_json_cache,
+                                               write_json_cache)
 
 # disable insecure warnings
 requests.packages.urllib3.disable_warnings()
@@ -24,6 +30,80 @@ ACCEPT_HEADER = {
 # use 10 seconds timeout for requests
 TIMEOUT = 10
 DEFAULT_REGISTRY = 'registry-1.docker.io'
+DOCKER_HUB_URL = 'https://hub.docker.com'
+
+# the cached latest tags are fetched again once they're older than an hour, as new docker images are released daily
+DOCKER_TAGS_CACHE_TTL = 60 * 60
+# the number of docker images whose latest tags are fetched concurrently
+DOCKER_PREFETCH_WORKERS = 8
+
+
+class DockerTagsCache:
+    """
+    On disk cache of the latest tags of docker images, shared by the commands which run in the next
+    DOCKER_TAGS_CACHE_TTL seconds. Only fetched tags are stored, so an image whose tag could not be fetched is
+    requested again by the next command.
+
+    Attributes:
+        cache_path(str): The path of the cache file.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def _load_entries(self) -> Dict[str, dict]:
+        """
+        Load the cache entries which are not older than DOCKER_TAGS_CACHE_TTL.
+        """
+        fresh_entries = {}
+        now = time.time()
+        for image, entry in read_json_cache(self.cache_path).items():
+            if not isinstance(entry, dict) or not entry.get('tag') or not isinstance(entry['tag'], str):
+                continue
+            timestamp = entry.get('timestamp')
+            if isinstance(timestamp, (int, float)) and 0 <= now - timestamp < DOCKER_TAGS_CACHE_TTL:
+                fresh_entries[image] = entry
+        return fresh_entries
+
+    def get(self, docker_image_name: str) -> str:
+        """
+        Get the cached latest tag of a docker image.
+
+        Returns:
+            The latest tag, or an empty string if it's not cached.
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load_entries()
+            return self._entries.get(docker_image_name, {}).get('tag', '')
+
+    def update(self, latest_tags: Dict[str, str]) -> None:
+        """
+        Store the latest tags of docker images, along with the time they were fetched.
+        The tags stored by other commands meanwhile are kept.
+        """
+        now = time.time()
+        entries = {image: {'tag': tag, 'timestamp': now} for image, tag in latest_tags.items() if tag}
+        if not entries:
+            return
+
+        with self._lock:
+            self._entries = {**self._load_entries(), **entries}
+            write_json_cache(self.cache_path, self._entries, indent=4, sort_keys=True)
+
+
+@lru_cache()
+def _get_docker_tags_cache(cache_path: str) -> DockerTagsCache:
+    return DockerTagsCache(cache_path)
+
+
+def get_docker_tags_cache() -> DockerTagsCache:
+    """
+    Get the docker tags cache of this process.
+    """
+    return _get_docker_tags_cache(get_sdk_cache_path('docker_tags.json'))
 
 
 class DockerImageValidator(BaseValidator):
@@ -147,7 +227,8 @@ class DockerImageValidator(BaseValidator):
         """
         Authenticate to the docker service. Return an authentication token if authentication is required.
         """
-        res = requests.get(
+        session = get_pooled_session('docker', DOCKER_PREFETCH_WORKERS)
+        res = session.get(
             'https://{}/v2/'.format(registry),
             headers=ACCEPT_HEADER,
             timeout=TIMEOUT,
@@ -167,7 +248,7 @@ class DockerImageValidator(BaseValidator):
                 'scope': 'repository:{}:pull'.format(image_name),
                 'service': service
             }
-            res = requests.get(
+            res = session.get(
                 url=realm,
                 params=params,
                 headers=ACCEPT_HEADER,
@@ -237,6 +318,23 @@ class DockerImageValidator(BaseValidator):
     @staticmethod
     @lru_cache(256)
     def get_docker_image_latest_tag_request(docker_image_name: str) -> str:
+        """
+        Get the latest tag for a docker image from the docker tags cache, or by request to docker hub.
+        Args:
+            docker_image_name: The docker image name.
+
+        Returns:
+            The latest tag for the docker image.
+        """
+        docker_tags_cache = get_docker_tags_cache()
+        tag = docker_tags_cache.get(docker_image_name)
+        if not tag:
+            tag = DockerImageValidator.request_docker_image_latest_tag(docker_image_name)
+            docker_tags_cache.update({docker_image_name: tag})
+        return tag
+
+    @staticmethod
+    def request_docker_image_latest_tag(docker_image_name: str) -> str:
         """
         Get the latest tag for a docker image by request to docker hub.
         Args:
@@ -246,13 +344,10 @@ class DockerImageValidator(BaseValidator):
             The latest tag for the docker image.
         """
         tag = ''
-        auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
-        headers = ACCEPT_HEADER.copy()
-        if auth_token:
-            headers['Authorization'] = 'Bearer {}'.format(auth_token)
+        session = get_pooled_session('docker', DOCKER_PREFETCH_WORKERS)
         # first try to get the docker image tags using normal http request
-        res = requests.get(
-            url='https://hub.docker.com/v2/repositories/{}/tags'.format(docker_image_name),
+        res = session.get(
+            url='{}/v2/repositories/{}/tags'.format(DOCKER_HUB_URL, docker_image_name),
             verify=False,
             timeout=TIMEOUT,
         )
@@ -265,7 +360,11 @@ class DockerImageValidator(BaseValidator):
         else:
             # if http request did not succeed than get tags using the API.
             # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-            res = requests.get(
+            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
+            headers = ACCEPT_HEADER.copy()
+            if auth_token:
+                headers['Authorization'] = 'Bearer {}'.format(auth_token)
+            res = session.get(
                 'https://{}/v2/{}/tags/list'.format(DEFAULT_REGISTRY, docker_image_name),
                 headers=headers,
                 timeout=TIMEOUT,
@@ -278,6 +377,37 @@ class DockerImageValidator(BaseValidator):
                 tag = DockerImageValidator.lexical_find_latest_tag(tags)
         return tag
 
+    @staticmethod
+    def prefetch_docker_images_latest_tags(docker_image_names: Iterable[str],
+                                           workers: int = DOCKER_PREFETCH_WORKERS) -> Dict[str, str]:
+        """
+        Fetch the latest tags of docker images concurrently into the docker tags cache, so each image is requested
+        once however many integrations and scripts use it.
+        The errors of the images whose tags could not be fetched are left for their validation.
+
+        Args:
+            docker_image_names: The docker image names.
+            workers: The number of images fetched concurrently.
+
+        Returns:
+            The latest tag of each docker image, or an empty string if it could not be fetched.
+        """
+        def request_latest_tag(docker_image_name: str) -> str:
+            try:
+                return DockerImageValidator.request_docker_image_latest_tag(docker_image_name)
+            except Exception:
+                return ''
+
+        docker_tags_cache = get_docker_tags_cache()
+        docker_image_names = sorted(set(filter(None, docker_image_names)))
+        missing_docker_image_names = [name for name in docker_image_names if not docker_tags_cache.get(name)]
+        if missing_docker_image_names:
+            with ThreadPoolExecutor(max_workers=min(workers, len(missing_docker_image_names))) as executor:
+                latest_tags = executor.map(request_latest_tag, missing_docker_image_names)
+                docker_tags_cache.update(dict(zip(missing_docker_image_names, latest_tags)))
+
+        return {name: docker_tags_cache.get(name) for name in docker_image_names}
+
     def get_docker_image_latest_tag(self, docker_image_name, yml_docker_image, is_iron_bank=False):
         """Returns the docker image latest tag of the given docker image
 
@@ -2,6 +2,7 @@ import os
 import re
 from collections import OrderedDict
 from distutils.version import LooseVersion
+from typing import Dict, List, Tuple
 
 import click
 
@@ -20,6 +21,33 @@ from demisto_sdk.commands.common.update_id_set import (
     get_playbook_data, get_script_data)
 from demisto_sdk.commands.unify.yml_unifier import YmlUnifier
 
+IDSetItem = Tuple[int, str, dict]
+
+
+class IDSetSection:
+    """Lookups of the items of an id_set section (e.g. id_set['scripts']) by id and by name.
+
+    The lookups return all the items with the id or name (i.e. all their versions), as (position, id, data) tuples
+    in the section order.
+    """
+
+    def __init__(self, items: list):
+        self.items = items
+        self.by_id: Dict[str, List[IDSetItem]] = {}
+        self.by_name: Dict[str, List[IDSetItem]] = {}
+        for position, item in enumerate(items):
+            item_id, item_data = next(iter(item.items()))
+            self.by_id.setdefault(item_id, []).append((position, item_id, item_data))
+            self.by_name.setdefault(item_data.get('name'), []).append((position, item_id, item_data))
+
+    def get_items_by_ids_or_names(self, ids_or_names: list) -> List[IDSetItem]:
+        """Returns the items whose id or name is one of the given ones, without duplicates, in the section order."""
+        items = {}
+        for id_or_name in ids_or_names:
+            for item in self.by_id.get(id_or_name, []) + self.by_name.get(id_or_name, []):
+                items[item[0]] = item
+        return [items[position] for position in sorted(items)]
+
 
 class IDSetValidations(BaseValidator):
     """IDSetValidations was designed to make sure all the inter connected content entities are valid.
@@ -52,6 +80,8 @@ class IDSetValidations(BaseValidator):
                          suppress_print=suppress_print, json_file_path=json_file_path)
         self.is_circle = is_circle
         self.configuration = configuration
+        # id(section items) -> section lookups, built on first use
+        self._sections: Dict[int, IDSetSection] = {}
         if not is_test_run and self.is_circle:
             self.id_set_file = id_set_file
             self.script_set = self.id_set_file[self.SCRIPTS_SECTION]
@@ -64,6 +94,21 @@ class IDSetValidations(BaseValidator):
             self.incident_types_set = self.id_set_file[self.INCIDENT_TYPES_SECTION]
             self.packs_set = self.id_set_file[self.PACKS_SECTION]
 
+    def _get_section(self, items: list) -> IDSetSection:
+        """Returns the lookups of an id_set section, which are built once for each section list.
+        The section list should not be modified after its lookups are built, only replaced.
+
+        Args:
+            items (list): The items of the section, e.g. self.script_set.
+
+        Returns:
+            IDSetSection. The section lookups.
+        """
+        section = self._sections.get(id(items))
+        if section is None or section.items is not items:
+            section = self._sections[id(items)] = IDSetSection(items)
+        return section
+
     def _is_incident_type_default_playbook_found(self, incident_type_data):
         """Check if the default playbook of an incident type is in the id_set
 
@@ -77,13 +122,7 @@ class IDSetValidations(BaseValidator):
         incident_type_name = list(incident_type_data.keys())[0]
         incident_type_playbook = incident_type_data[incident_type_name].get('playbooks')
         if incident_type_playbook:
-            # setting initially to false, if the default playbook is in the id_set, it will be valid
-            is_valid = False
-            for checked_playbook in self.playbook_set:
-                checked_playbook_name = list(checked_playbook.keys())[0]
-                if incident_type_playbook == checked_playbook_name:
-                    is_valid = True
-                    break
+            is_valid = incident_type_playbook in self._get_section(self.playbook_set).by_id
             if not is_valid:  # add error message if not valid
                 error_message, error_code = Errors.incident_type_non_existent_playbook_id(incident_type_name,
                                                                                           incident_type_playbook)
@@ -207,10 +246,8 @@ class IDSetValidations(BaseValidator):
         Returns:
             A sub set of the input scripts set which contains only scripts that are not in the id set.
         """
-        for checked_script in self.script_set:
-            checked_script_id = list(checked_script.keys())[0]
-            if checked_script_id in scripts_in_entity:
-                scripts_in_entity.remove(checked_script_id)
+        scripts_by_id = self._get_section(self.script_set).by_id
+        scripts_in_entity = {script_id for script_id in scripts_in_entity if script_id not in scripts_by_id}
 
         # Ignore Builtin scripts because they are implemented on the server side and thus not in the id_set.json
         scripts_in_entity = self._remove_builtin_scripts(scripts_in_entity)
@@ -257,12 +294,9 @@ class IDSetValidations(BaseValidator):
         for script_id in scripts_set:
             if '|||' in script_id:
                 integration_id, integration_command = script_id.split('|||')
-                for checked_integration in self.integration_set:
-                    checked_integration_id = list(checked_integration.keys())[0]
-                    if checked_integration_id == integration_id:
-                        commands = checked_integration.get(checked_integration_id, {}).get("commands")
-                        if integration_command in commands:
-                            validated_scripts_set.remove(script_id)
+                for _, _, integration_data in self._get_section(self.integration_set).by_id.get(integration_id, []):
+                    if integration_command in (integration_data.get("commands") or []):
+                        validated_scripts_set.discard(script_id)
         return validated_scripts_set
 
     def _get_layouts_container_tabs(self, layouts_container):
@@ -319,13 +353,7 @@ class IDSetValidations(BaseValidator):
         is_valid_classifier = True
         integration_classifier = integration_data.get('classifiers', '')  # there is only 1 classifier per integration
         if integration_classifier:
-            # setting initially to false, if the classifier is in the id_set, it will be valid
-            is_valid_classifier = False
-            for classifier in self.classifiers_set:
-                checked_classifier_name = list(classifier.keys())[0]
-                if integration_classifier == checked_classifier_name:
-                    is_valid_classifier = True
-                    break
+            is_valid_classifier = integration_classifier in self._get_section(self.classifiers_set).by_id
             if not is_valid_classifier:  # add error message if not valid
                 error_message, error_code = Errors.integration_non_existent_classifier(integration_classifier)
                 if not self.handle_error(error_message, error_code, file_path="id_set.json"):
@@ -334,13 +362,7 @@ class IDSetValidations(BaseValidator):
         is_valid_mapper = True
         integration_mapper = integration_data.get('mappers', [''])[0]  # there is only 1 mapper per integration
         if integration_mapper:
-            # setting initially to false, if the mapper is in the id_set, it will be valid
-            is_valid_mapper = False
-            for mapper in self.mappers_set:
-                checked_mapper_name = list(mapper.keys())[0]
-                if integration_mapper == checked_mapper_name:
-                    is_valid_mapper = True
-                    break
+            is_valid_mapper = integration_mapper in self._get_section(self.mappers_set).by_id
             if not is_valid_mapper:  # add error message if not valid
                 error_message, error_code = Errors.integration_non_existent_mapper(integration_mapper)
                 if not self.handle_error(error_message, error_code, file_path="id_set.json"):
@@ -362,13 +384,8 @@ class IDSetValidations(BaseValidator):
         if classifier_incident_types:
             # setting initially to false, if the incident types is in the id_set, it will be valid
             is_valid = False
-            for incident_type in self.incident_types_set:
-                incident_type_name = list(incident_type.keys())[0]
-                # remove a related incident types if exists in the id_set
-                if incident_type_name in classifier_incident_types:
-                    classifier_incident_types.remove(incident_type_name)
-                    if not classifier_incident_types:
-                        break
+            # remove the related incident types which exist in the id_set
+            classifier_incident_types -= self._get_section(self.incident_types_set).by_id.keys()
 
             if not classifier_incident_types:  # if nothing remains, these incident types were all found
                 is_valid = True
@@ -394,13 +411,8 @@ class IDSetValidations(BaseValidator):
         if mapper_incident_types:
             # setting initially to false, if the incident types is in the id_set, it will be valid
             is_valid = False
-            for incident_type in self.incident_types_set:
-                incident_type_name = list(incident_type.keys())[0]
-                # remove a related incident types if exists in the id_set
-                if incident_type_name in mapper_incident_types:
-                    mapper_incident_types.remove(incident_type_name)
-                    if not mapper_incident_types:
-                        break
+            # remove the related incident types which exist in the id_set
+            mapper_incident_types -= self._get_section(self.incident_types_set).by_id.keys()
 
             if not mapper_incident_types:  # if nothing remains, these incident types were all found
                 is_valid = True
@@ -460,11 +472,9 @@ class IDSetValidations(BaseValidator):
         # Get a dict with all playbook fields from the playbook data dict.
         playbook_data_2nd_level = playbook_data.get(list(playbook_data.keys())[0])
         main_playbook_name = playbook_data_2nd_level.get("name")
-        sub_playbooks_list = playbook_data_2nd_level.get("implementing_playbooks", [])
-        for playbook_dict in self.playbook_set:
-            playbook_name = list(playbook_dict.values())[0].get('name')
-            if playbook_name in sub_playbooks_list:
-                sub_playbooks_list.remove(playbook_name)
+        playbooks_by_name = self._get_section(self.playbook_set).by_name
+        sub_playbooks_list = [sub_playbook for sub_playbook in playbook_data_2nd_level.get("implementing_playbooks", [])
+                              if sub_playbook not in playbooks_by_name]
 
         if sub_playbooks_list:
             error_message, error_code = Errors.invalid_subplaybook_name(sub_playbooks_list, main_playbook_name)
@@ -484,12 +494,8 @@ class IDSetValidations(BaseValidator):
             dictionary. Playbook's 'command_to_integration' dict.
         """
         commands_to_integration = {}
-        for playbook_dict in self.playbook_set:
-            playbook_name = list(playbook_dict.keys())[0]
-            playbook_path = playbook_dict[playbook_name].get("file_path")
-            is_this_the_playbook = playbook_name == file_name and file_path == playbook_path
-            if is_this_the_playbook:
-                playbook_data = playbook_dict[playbook_name]
+        for _, _, playbook_data in self._get_section(self.playbook_set).by_id.get(file_name, []):
+            if file_path == playbook_data.get("file_path"):
                 commands_to_integration = playbook_data.get("command_to_integration", {})
                 return commands_to_integration
         return commands_to_integration
@@ -526,14 +532,15 @@ class IDSetValidations(BaseValidator):
         entity_status: dict = {}
         implemented_entities = implemented_entity_list_from_playbook.copy()
         is_valid = True, None
-        for entity_data_dict in entity_set_from_id_set:
+        # only the entities whose id or name is used in the playbook are checked
+        entity_section = self._get_section(entity_set_from_id_set)
+        for _, entity_id, all_entity_fields in entity_section.get_items_by_ids_or_names(
+                implemented_entity_list_from_playbook):
             if not implemented_entities:
                 break
 
-            entity_id = list(entity_data_dict.keys())[0]
-            all_entity_fields = entity_data_dict[entity_id]
             entity_name = entity_id if entity_id in implemented_entity_list_from_playbook else all_entity_fields.get(
-                "name")
+                "name", "")
             is_entity_used_in_playbook = entity_name in implemented_entity_list_from_playbook
 
             if is_entity_used_in_playbook:
@@ -613,11 +620,10 @@ class IDSetValidations(BaseValidator):
 
     def get_integration_version(self, integration_to_search):
         general_version = ""  # i.e integration has no specific version
-        for integration_dict in self.integration_set:
-            integration_name = list(integration_dict.keys())[0]
-            if integration_name == integration_to_search:
-                integration_data = integration_dict[integration_name]
-                return integration_data.get("fromversion", "")
+        integrations = self._get_section(self.integration_set).by_id.get(integration_to_search)
+        if integrations:
+            _, _, integration_data = integrations[0]
+            return integration_data.get("fromversion", "")
         return general_version
 
     def is_file_valid_in_set(self, file_path, file_type, ignored_errors=None):
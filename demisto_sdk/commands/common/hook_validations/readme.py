@@ -1,20 +1,20 @@
 import atexit
+import hashlib
 import json
 import os
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from threading import Lock
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
 import click
 import requests
 from git import InvalidGitRepositoryError
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
 
 from demisto_sdk.commands.common.errors import (FOUND_FILES_AND_ERRORS,
                                                 FOUND_FILES_AND_IGNORED_ERRORS,
@@ -23,8 +23,9 @@ from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
 from demisto_sdk.commands.common.tools import (
-    compare_context_path_in_yml_and_readme, get_content_path, get_yaml,
-    get_yml_paths_in_dir, print_warning, run_command_os)
+    compare_context_path_in_yml_and_readme, get_content_path,
+    get_pooled_session, get_yaml, get_yml_paths_in_dir, print_warning,
+    run_command_os)
 
 NO_HTML = '<!-- NOT_HTML_DOC -->'
 YES_HTML = '<!-- HTML_DOC -->'
@@ -43,6 +44,13 @@ USER_FILL_SECTIONS = [
 
 REQUIRED_MDX_PACKS = ['@mdx-js/mdx', 'fs-extra', 'commander']
 
+# the number of mdx servers which parse the readme files in parallel
+MDX_SERVERS_COUNT = max(1, min(4, os.cpu_count() or 1))
+# the number of readme files parsed by an mdx server in a single request
+MDX_BATCH_SIZE = 20
+# the timeout of parsing a single readme file, in seconds
+MDX_SERVER_TIMEOUT = 20
+
 PACKS_TO_IGNORE = ['HelloWorld', 'HelloWorldPremium']
 
 DEFAULT_SENTENCES = ['getting started and learn how to build an integration']
@@ -60,9 +68,12 @@ class ReadMeValidator(BaseValidator):
             export DEMISTO_README_VALIDATION=True
     """
 
-    # Static var to hold the mdx server process
-    _MDX_SERVER_PROCESS: Optional[subprocess.Popen] = None
+    # Static vars to hold the mdx server processes and the ports they listen on
+    _MDX_SERVER_PROCESSES: List[subprocess.Popen] = []
+    _MDX_SERVER_PORTS: List[int] = []
     _MDX_SERVER_LOCK = Lock()
+    # Static var to hold the mdx parse failure of each readme content by its hash ('' if it's valid)
+    _MDX_VERDICTS: Dict[str, str] = {}
     MINIMUM_README_LENGTH = 30
 
     def __init__(self, file_path: str, ignored_errors=None, print_as_warnings=False, suppress_print=False,
@@ -110,35 +121,100 @@ class ReadMeValidator(BaseValidator):
         return True
 
     def mdx_verify_server(self) -> bool:
-        if not ReadMeValidator._MDX_SERVER_PROCESS:
-            server_started = ReadMeValidator.start_mdx_server(handle_error=self.handle_error,
-                                                              file_path=str(self.file_path))
-            if not server_started:
-                return False
         readme_content = self.fix_mdx()
-        retry = Retry(total=2)
-        adapter = HTTPAdapter(max_retries=retry)
-        session = requests.Session()
-        session.mount('http://', adapter)
-        response = session.request(
-            'POST',
-            'http://localhost:6161',
-            data=readme_content.encode('utf-8'),
-            timeout=20
-        )
-        if response.status_code != 200:
-            error_message, error_code = Errors.readme_error(response.text)
+        content_hash = hashlib.sha256(readme_content.encode('utf-8')).hexdigest()
+        mdx_failure = ReadMeValidator._MDX_VERDICTS.get(content_hash)
+        if mdx_failure is None:
+            if not ReadMeValidator._MDX_SERVER_PROCESSES:
+                server_started = ReadMeValidator.start_mdx_server(handle_error=self.handle_error,
+                                                                  file_path=str(self.file_path))
+                if not server_started:
+                    return False
+                if not ReadMeValidator._MDX_SERVER_PORTS:  # the server error is ignored
+                    return True
+            response = get_pooled_session('mdx', MDX_SERVERS_COUNT, retries=2).post(
+                f'http://localhost:{ReadMeValidator._MDX_SERVER_PORTS[0]}',
+                data=readme_content.encode('utf-8'),
+                timeout=MDX_SERVER_TIMEOUT
+            )
+            mdx_failure = response.text if response.status_code != 200 else ''
+            if response.status_code in (200, 500):  # parsed successfully or failed parsing
+                ReadMeValidator._MDX_VERDICTS[content_hash] = mdx_failure
+        if mdx_failure:
+            error_message, error_code = Errors.readme_error(mdx_failure)
             if self.handle_error(error_message, error_code, file_path=self.file_path):
                 return False
         return True
 
+    @staticmethod
+    def is_mdx_validation_enabled(content_path) -> bool:
+        """Whether the readme files should be parsed as mdx, and set the node modules path for the mdx parser."""
+        valid = os.environ.get('DEMISTO_README_VALIDATION') or os.environ.get(
+            'CI') or ReadMeValidator.are_modules_installed_for_verify(content_path)
+        if valid:
+            # add to env var the directory of node modules
+            node_modules_path = str(Path(content_path) / 'node_modules')
+            if node_modules_path not in os.getenv('NODE_PATH', '').split(os.pathsep):
+                os.environ['NODE_PATH'] = node_modules_path + os.pathsep + os.getenv("NODE_PATH", "")
+        return bool(valid)
+
+    @staticmethod
+    def verify_mdx_in_batches(file_paths: Iterable[str]) -> None:
+        """Parse readme files as mdx ahead of their validation, in batches spread over a pool of mdx servers.
+        Each distinct content is parsed once, and its verdict is kept for the validation of the readme files.
+        The files which could not be parsed are left for their validation, which reports the error.
+
+        Args:
+            file_paths: The paths of the readme files.
+        """
+        content_path = get_content_path()
+        if os.getenv('DEMISTO_MDX_CMD_VERIFY') or not ReadMeValidator.is_mdx_validation_enabled(content_path):
+            return
+
+        readme_contents = {}
+        for file_path in file_paths:
+            try:
+                with open(file_path) as readme_file:
+                    readme_content = readme_file.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            if not ReadMeValidator.is_html_content(readme_content):
+                readme_content = ReadMeValidator.fix_mdx_content(readme_content)
+                readme_contents[hashlib.sha256(readme_content.encode('utf-8')).hexdigest()] = readme_content
+
+        unparsed_contents = [(content_hash, readme_content) for content_hash, readme_content in readme_contents.items()
+                             if content_hash not in ReadMeValidator._MDX_VERDICTS]
+        if not unparsed_contents:
+            return
+        batches = [unparsed_contents[i:i + MDX_BATCH_SIZE] for i in range(0, len(unparsed_contents), MDX_BATCH_SIZE)]
+        try:
+            ReadMeValidator.start_mdx_server(servers_count=min(MDX_SERVERS_COUNT, len(batches)))
+        except Exception:
+            return
+        ports = ReadMeValidator._MDX_SERVER_PORTS
+
+        def verify_batches(server_index: int):
+            session = get_pooled_session('mdx', MDX_SERVERS_COUNT, retries=2)
+            # each server parses its own share of the batches, one batch at a time
+            for batch in batches[server_index::len(ports)]:
+                try:
+                    response = session.post(f'http://localhost:{ports[server_index]}/batch',
+                                            json=[readme_content for _, readme_content in batch],
+                                            timeout=MDX_SERVER_TIMEOUT * len(batch))
+                    response.raise_for_status()
+                    mdx_failures = response.json()
+                except (requests.exceptions.RequestException, ValueError):
+                    continue
+                for (content_hash, _), mdx_failure in zip(batch, mdx_failures):
+                    ReadMeValidator._MDX_VERDICTS[content_hash] = mdx_failure
+
+        with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+            list(executor.map(verify_batches, range(len(ports))))
+
     def is_mdx_file(self) -> bool:
         html = self.is_html_doc()
-        valid = os.environ.get('DEMISTO_README_VALIDATION') or os.environ.get(
-            'CI') or self.are_modules_installed_for_verify(self.content_path)
+        valid = self.is_mdx_validation_enabled(self.content_path)
         if valid and not html:
-            # add to env var the directory of node modules
-            os.environ['NODE_PATH'] = str(self.node_modules_path) + os.pathsep + os.getenv("NODE_PATH", "")
             if os.getenv('DEMISTO_MDX_CMD_VERIFY'):
                 return self.mdx_verify()
             else:
@@ -146,7 +222,10 @@ class ReadMeValidator(BaseValidator):
         return True
 
     def fix_mdx(self) -> str:
-        txt = self.readme_content
+        return self.fix_mdx_content(self.readme_content)
+
+    @staticmethod
+    def fix_mdx_content(txt: str) -> str:
         # copied from: https://github.com/demisto/content-docs/blob/2402bd1ab1a71f5bf1a23e1028df6ce3b2729cbb/content-repo/mdx_utils.py#L11
         # to use the same logic as we have in the content-docs build
         replace_tuples = [
@@ -195,14 +274,18 @@ class ReadMeValidator(BaseValidator):
         return valid
 
     def is_html_doc(self) -> bool:
-        if self.readme_content.startswith(NO_HTML):
+        return self.is_html_content(self.readme_content)
+
+    @staticmethod
+    def is_html_content(readme_content: str) -> bool:
+        if readme_content.startswith(NO_HTML):
             return False
-        if self.readme_content.startswith(YES_HTML):
+        if readme_content.startswith(YES_HTML):
             return True
         # use some heuristics to try to figure out if this is html
-        return self.readme_content.startswith('<p>') or \
-            self.readme_content.startswith('<!DOCTYPE html>') or \
-            ('<thead>' in self.readme_content and '<tbody>' in self.readme_content)
+        return readme_content.startswith('<p>') or \
+            readme_content.startswith('<!DOCTYPE html>') or \
+            ('<thead>' in readme_content and '<tbody>' in readme_content)
 
     def is_image_path_valid(self) -> bool:
         """ Validate images absolute paths, and prints the suggested path if its not valid.
@@ -523,29 +606,45 @@ class ReadMeValidator(BaseValidator):
         return is_valid
 
     @staticmethod
-    def start_mdx_server(handle_error: Optional[Callable] = None, file_path: Optional[str] = None) -> bool:
+    def start_mdx_server(handle_error: Optional[Callable] = None, file_path: Optional[str] = None,
+                         servers_count: int = 1) -> bool:
+        """Start mdx servers until servers_count of them are running, each listening on a free port.
+
+        Args:
+            handle_error: The function which handles the error of a server which failed starting.
+            file_path: The readme file the error is reported for. If not given, the error is raised as an exception.
+            servers_count: The number of servers which should be running.
+
+        Returns:
+            bool. False if a server failed starting and the error is not ignored, True otherwise.
+        """
         with ReadMeValidator._MDX_SERVER_LOCK:
-            if not ReadMeValidator._MDX_SERVER_PROCESS:
-                mdx_parse_server = Path(__file__).parent.parent / 'mdx-parse-server.js'
-                ReadMeValidator._MDX_SERVER_PROCESS = subprocess.Popen(['node', str(mdx_parse_server)],
-                                                                       stdout=subprocess.PIPE, text=True)
-                line = ReadMeValidator._MDX_SERVER_PROCESS.stdout.readline()  # type: ignore
-                if 'MDX server is listening on port' not in line:
+            mdx_parse_server = Path(__file__).parent.parent / 'mdx-parse-server.js'
+            new_processes = [subprocess.Popen(['node', str(mdx_parse_server), '0'], stdout=subprocess.PIPE, text=True)
+                             for _ in range(servers_count - len(ReadMeValidator._MDX_SERVER_PROCESSES))]
+            ReadMeValidator._MDX_SERVER_PROCESSES.extend(new_processes)
+            for process in new_processes:
+                line = process.stdout.readline()  # type: ignore
+                port = re.search(r'MDX server is listening on port: (\d+)', line)
+                if not port:
                     ReadMeValidator.stop_mdx_server()
                     error_message, error_code = Errors.error_starting_mdx_server(line=line)
                     if handle_error and file_path:
                         if handle_error(error_message, error_code, file_path=file_path):
                             return False
+                        break
 
                     else:
                         raise Exception(error_message)
+                ReadMeValidator._MDX_SERVER_PORTS.append(int(port.group(1)))
         return True
 
     @staticmethod
     def stop_mdx_server():
-        if ReadMeValidator._MDX_SERVER_PROCESS:
-            ReadMeValidator._MDX_SERVER_PROCESS.terminate()
-            ReadMeValidator._MDX_SERVER_PROCESS = None
+        for process in ReadMeValidator._MDX_SERVER_PROCESSES:
+            process.terminate()
+        ReadMeValidator._MDX_SERVER_PROCESSES.clear()
+        ReadMeValidator._MDX_SERVER_PORTS.clear()
 
     @staticmethod
     def _get_error_lists():
@@ -12,7 +12,6 @@ from typing import List, Optional, Tuple
 
 import click
 import yaml
-from pykwalify.core import Core
 from ruamel.yaml import YAML
 
 from demisto_sdk.commands.common.configuration import Configuration
@@ -22,6 +21,7 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
+from demisto_sdk.commands.common.schema_engine import validate_file_schema
 from demisto_sdk.commands.common.tools import (get_remote_file,
                                                is_file_path_in_pack)
 from demisto_sdk.commands.format.format_constants import \
@@ -145,11 +145,8 @@ class StructureValidator(BaseValidator):
                 # reactivating pykwalify ERROR level logs
                 logging.disable(logging.ERROR)
             scheme_file_name = 'integration' if self.scheme_name.value == 'betaintegration' else self.scheme_name.value  # type: ignore
-            path = os.path.normpath(
-                os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(scheme_file_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
-            core.validate(raise_exception=True)
+            # the schema is compiled once per process, and a json file is validated as already loaded
+            validate_file_schema(self.file_path, scheme_file_name, loaded_json_data=self.current_file)
         except Exception as err:
             try:
                 return self.parse_error_msg(err)
@@ -0,0 +1,181 @@
+import copy
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from demisto_sdk.commands.common.tools import read_json_cache, write_json_cache
+
+ID_SET_MANIFEST_SUFFIX = '.manifest'
+ID_SET_MANIFEST_VERSION = 1
+
+
+def get_id_set_manifest_path(id_set_path: str) -> str:
+    """The manifest is kept as a sidecar file next to the id_set it was created for."""
+    return f'{id_set_path}{ID_SET_MANIFEST_SUFFIX}'
+
+
+class IDSetManifest:
+    """
+    Persistent map of content path -> content hash -> extracted id_set entry.
+
+    Used by `re_create_id_set` to only re-process files that were changed, added or removed since
+    the previous run. An entry is reused only when the hash of the item (the file, or all top-level files of
+    a package directory), the hash of its pack metadata and the hash of the extra context passed to the
+    processing function (e.g. the incident types list used by incident fields) are all unchanged.
+    """
+
+    def __init__(self, manifest_path: str, fingerprint: Optional[dict] = None):
+        """
+        Args:
+            manifest_path: path of the manifest file.
+            fingerprint: values which invalidate the whole manifest when changed
+                (marketplace, repo source, extraction code version).
+        """
+        self.manifest_path = manifest_path
+        self.fingerprint = fingerprint or {}
+        self.hits = 0
+        self.misses = 0
+        self._old_sections: Dict[str, Dict[str, dict]] = {}
+        self._old_files: Dict[str, list] = {}
+        self._sections: Dict[str, Dict[str, dict]] = {}
+        self._files: Dict[str, list] = {}
+        self.load()
+
+    def load(self):
+        """Loads the manifest from disk, discarding it if it is corrupted or was created with another fingerprint."""
+        manifest = read_json_cache(self.manifest_path)
+        if manifest.get('version') != ID_SET_MANIFEST_VERSION or \
+                manifest.get('fingerprint') != json.loads(json.dumps(self.fingerprint)):
+            return
+
+        self._old_sections = manifest.get('sections', {})
+        self._old_files = manifest.get('files', {})
+
+    def save(self):
+        """
+        Writes the manifest to disk. Sections which were not processed in this run are kept as is.
+        A manifest which can't be written only makes the next run process all the files.
+        """
+        sections = dict(self._old_sections)
+        sections.update(self._sections)
+        manifest = {
+            'version': ID_SET_MANIFEST_VERSION,
+            'fingerprint': self.fingerprint,
+            'files': self._files,
+            'sections': sections,
+        }
+        write_json_cache(self.manifest_path, manifest)
+
+    def file_digest(self, file_path: str) -> str:
+        """
+        Returns the sha1 of the file content.
+        The (mtime, size) of the previous run is used to avoid re-reading files which were not touched.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return ''
+        cached = self._files.get(file_path) or self._old_files.get(file_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            digest = cached[2]
+        else:
+            with open(file_path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        self._files[file_path] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def path_digest(self, path: str) -> str:
+        """Returns the digest of a file, or of all the top-level files of a package directory."""
+        if not os.path.isdir(path):
+            return self.file_digest(path)
+        sha = hashlib.sha1()
+        for file_name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, file_name)
+            if os.path.isfile(file_path):
+                sha.update(file_name.encode())
+                sha.update(self.file_digest(file_path).encode())
+        return sha.hexdigest()
+
+    def item_key(self, path: str, context_digest: str = '') -> str:
+        """Returns the cache key of a single content item."""
+        pack_metadata_digest = ''
+        parts = os.path.normpath(path).split(os.sep)
+        if 'Packs' in parts:
+            pack_dir_index = parts.index('Packs') + 2
+            pack_metadata_path = os.path.join(*parts[:pack_dir_index], 'pack_metadata.json')
+            if pack_metadata_path != path:
+                pack_metadata_digest = self.file_digest(pack_metadata_path)
+        return f'{self.path_digest(path)}:{pack_metadata_digest}:{context_digest}'
+
+    @staticmethod
+    def context_digest(context: Any) -> str:
+        if context is None:
+            return ''
+        return hashlib.sha1(json.dumps(context, sort_keys=True, default=str).encode()).hexdigest()
+
+    def prepare(self, paths: List[str], section: str, context: Any = None) -> Tuple[List, List[int]]:
+        """
+        Starts the processing of a section: reuses the entries of the paths which were not changed since the
+        previous run. Paths which no longer exist are dropped from the section.
+
+        Args:
+            paths: the paths to process.
+            section: the manifest section name, has to be unique per processing function.
+            context: extra data the processing function depends on, a change in it invalidates the section.
+
+        Returns:
+            the results list (None for paths which have to be processed), and the indices of the paths which have
+            to be processed and passed to `update`.
+        """
+        context_digest = self.context_digest(context)
+        old_entries = self._old_sections.get(section, {})
+        new_entries: Dict[str, dict] = {}
+        results: List = [None] * len(paths)
+        missing_indices = []
+
+        for index, path in enumerate(paths):
+            key = self.item_key(path, context_digest)
+            old_entry = old_entries.get(path)
+            if old_entry and old_entry.get('key') == key:
+                self.hits += 1
+                results[index] = copy.deepcopy(old_entry['result'])
+                new_entries[path] = old_entry
+            else:
+                self.misses += 1
+                missing_indices.append(index)
+                new_entries[path] = {'key': key}
+
+        self._sections[section] = new_entries
+        return results, missing_indices
+
+    def update(self, section: str, path: str, result: Any):
+        """Stores the result of a path which was processed after `prepare`."""
+        # results are modified later on by the id_set creation (e.g. ContentItems), keep a copy
+        self._sections[section][path]['result'] = json.loads(json.dumps(result))
+
+    def map(self, pool, func: Callable, paths: Iterable[str], section: str, context: Any = None) -> List:
+        """
+        Same as `pool.map(func, paths)`, but only the paths which were changed or added since the previous run
+        are processed. The results are returned in the order of `paths`, so the created id_set is identical to
+        the one created without the manifest.
+
+        Args:
+            pool: the multiprocessing pool used for processing the changed files.
+            func: the processing function (e.g. process_integration).
+            paths: the paths to process.
+            section: the manifest section name, has to be unique per processing function.
+            context: extra data the processing function depends on, a change in it invalidates the section.
+
+        Returns:
+            list of the processing function results.
+        """
+        paths = list(paths)
+        results, missing_indices = self.prepare(paths, section, context)
+
+        if missing_indices:
+            for index, result in zip(missing_indices, pool.map(func, [paths[i] for i in missing_indices])):
+                results[index] = result
+                self.update(section, paths[index], result)
+
+        return results
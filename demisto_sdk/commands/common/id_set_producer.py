@@ -0,0 +1,115 @@
+import heapq
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from demisto_sdk.commands.common.id_set_manifest import IDSetManifest
+
+ID_SET_SLOWEST_FILES_TO_REPORT = 10
+
+
+def _process_task(task: Tuple[str, int, Callable, str]) -> Tuple[str, int, Any, float]:
+    """Runs a single processing function on a single content path, inside a pool process."""
+    section, index, func, path = task
+    start = time.perf_counter()
+    result = func(path)
+    return section, index, result, time.perf_counter() - start
+
+
+class IDSetProducer:
+    """
+    Feeds the content files of all the id_set sections into a single work queue of a processes pool.
+
+    The files are dispatched in chunks and their results are routed to their section as soon as they arrive,
+    so a slow file of one section does not leave the pool idle while other sections are waiting to be processed.
+    The results of each section are kept in the order of its paths, so the created id_set does not depend on
+    the processing order.
+    """
+
+    def __init__(self, pool, processes: int = 1, manifest: Optional[IDSetManifest] = None):
+        """
+        Args:
+            pool: the multiprocessing pool used for processing the files.
+            processes: the number of processes of the pool, used for the chunk size.
+            manifest: when given, only the files which were changed since the previous run are processed.
+        """
+        self.pool = pool
+        self.processes = processes
+        self.manifest = manifest
+        self.counts: Dict[str, int] = {}
+        self._sections: Dict[str, Tuple[Callable, List[str], Any]] = {}
+        self._results: Dict[str, List] = {}
+        self._durations: List[Tuple[float, str, str]] = []
+
+    def add(self, section: str, func: Callable, paths: List[str], context: Any = None):
+        """
+        Adds a section to be processed by the next `run`.
+
+        Args:
+            section: the section name, has to be unique per processing function.
+            func: the processing function (e.g. process_integration), has to be picklable.
+            paths: the paths to process.
+            context: extra data the processing function depends on (see IDSetManifest.map).
+        """
+        self._sections[section] = (func, list(paths), context)
+
+    def run(self, on_section_done: Optional[Callable[[str], None]] = None):
+        """
+        Processes the files of all the added sections in a single pass over the pool.
+
+        Args:
+            on_section_done: called with the section name once all the files of the section were processed.
+        """
+        tasks: List[Tuple[str, int, Callable, str]] = []
+        remaining: Dict[str, int] = {}
+        paths_by_section: Dict[str, List[str]] = {}
+        for section, (func, paths, context) in self._sections.items():
+            if self.manifest:
+                results, missing_indices = self.manifest.prepare(paths, section, context)
+            else:
+                results, missing_indices = [None] * len(paths), list(range(len(paths)))
+            self._results[section] = results
+            self.counts[section] = len(paths)
+            paths_by_section[section] = paths
+            remaining[section] = len(missing_indices)
+            tasks.extend((section, index, func, paths[index]) for index in missing_indices)
+        self._sections = {}
+
+        for section, remaining_count in remaining.items():
+            if not remaining_count and on_section_done:
+                on_section_done(section)
+
+        if not tasks:
+            return
+
+        chunksize = max(1, len(tasks) // (self.processes * 4))
+        for section, index, result, duration in self.pool.imap_unordered(_process_task, tasks, chunksize=chunksize):
+            path = paths_by_section[section][index]
+            self._results[section][index] = result
+            if self.manifest:
+                self.manifest.update(section, path, result)
+            self._durations.append((duration, section, path))
+            remaining[section] -= 1
+            if not remaining[section] and on_section_done:
+                on_section_done(section)
+
+    def results(self, section: str) -> List:
+        """Returns the results of a processed section, in the order of its paths."""
+        return self._results.get(section, [])
+
+    def items(self, section: str) -> List:
+        """Returns the id_set items of a processed section."""
+        return [item for result in self.results(section) if result and isinstance(result, list) for item in result]
+
+    def slowest_files(self, count: int = ID_SET_SLOWEST_FILES_TO_REPORT) -> List[Tuple[float, str, str]]:
+        """Returns the (seconds, section, path) of the slowest processed files."""
+        return heapq.nlargest(count, self._durations)
+
+    def report(self, count: int = ID_SET_SLOWEST_FILES_TO_REPORT) -> str:
+        """Returns a summary of the number of files of each section and of the slowest processed files."""
+        lines = ['Processed files per type:']
+        lines.extend(f'  {section}: {section_count}' for section, section_count in self.counts.items())
+        slowest_files = self.slowest_files(count)
+        if slowest_files:
+            lines.append(f'Slowest {len(slowest_files)} files:')
+            lines.extend(f'  {duration:.3f}s {section}: {path}' for duration, section, path in slowest_files)
+        return '\n'.join(lines)
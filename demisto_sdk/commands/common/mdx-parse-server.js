@@ -1,11 +1,24 @@
 const mdx = require('@mdx-js/mdx');
 const http = require('http')
 
+// listen on the port given as the first argument (0 for any free port)
+const port = process.argv.length > 2 ? Number(process.argv[2]) : 6161
+
+async function parseMDX(body) {
+    try {
+        await mdx(body)
+        return ''
+    } catch (error) {
+        return "MDX parse failure: " + error
+    }
+}
+
 function requestHandler(req, res) {
     // console.log(req)
     if (req.method != 'POST') {
         res.statusCode = 405
         res.end('Only POST is supported')
+        return
     }
     let body = ''
     req.setEncoding('utf8');
@@ -14,21 +27,39 @@ function requestHandler(req, res) {
     })
     req.on('end', async function () {
         //   console.log('Body length: ' + body.length)
-        try {
-            parsed = await mdx(body)
-            res.end('Successfully parsed mdx')
-        } catch (error) {
+        if (req.url == '/batch') {
+            // the body is a json list of mdx contents, answered by a json list of their parse failures ('' if valid)
+            let contents
+            try {
+                contents = JSON.parse(body)
+            } catch (error) {
+                res.statusCode = 400
+                res.end("Invalid batch: " + error)
+                return
+            }
+            const failures = []
+            for (const content of contents) {
+                failures.push(await parseMDX(content))
+            }
+            res.setHeader('Content-Type', 'application/json')
+            res.end(JSON.stringify(failures))
+            return
+        }
+        const failure = await parseMDX(body)
+        if (failure) {
             res.statusCode = 500
-            res.end("MDX parse failure: " + error)
+            res.end(failure)
+        } else {
+            res.end('Successfully parsed mdx')
         }
     })
 }
 
 const server = http.createServer(requestHandler);
 
-server.listen(6161, (err) => {
+server.listen(port, (err) => {
     if (err) {
         return console.log('MDX server failed starting.', err)
     }
-    console.log(`MDX server is listening on port: 6161`)
+    console.log(`MDX server is listening on port: ${server.address().port}`)
 });
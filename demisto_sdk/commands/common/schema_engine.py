@@ -0,0 +1,144 @@
+"""Schema validation engine for content files.
+
+The pykwalify schemas are loaded and compiled once per process, instead of once per validated file, and the files are
+validated as loaded data.
+"""
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import pykwalify
+import yaml
+from pykwalify.compat import yml
+from pykwalify.core import Core
+from pykwalify.rule import Rule
+from ruamel.yaml.resolver import implicit_resolvers
+
+SCHEMAS_PATH = os.path.normpath(os.path.join(__file__, '..', 'schemas'))
+
+_BaseSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class PykwalifySourceLoader(_BaseSafeLoader):  # type: ignore[misc, valid-type]
+    """
+    PyYAML loader which loads yml files the way pykwalify loads them, using the libyaml parser when available.
+    pykwalify loads the files by the pure python ruamel.yaml safe loader, which follows YAML 1.2 - e.g. `label: yes`
+    is loaded as a string, while yaml.safe_load follows YAML 1.1 and loads it as True. Duplicate keys are an error in
+    ruamel.yaml, so they are rejected here too.
+    """
+    yaml_implicit_resolvers: Dict[str, list] = {}
+
+    def construct_mapping(self, node, deep=False):
+        if isinstance(node, yaml.MappingNode):
+            self.flatten_mapping(node)
+            keys = [self.construct_object(key_node, deep=deep) for key_node, _ in node.value]
+            for key in keys:
+                if isinstance(key, (str, int, float, bool)) and keys.count(key) > 1:
+                    raise yaml.constructor.ConstructorError('while constructing a mapping', node.start_mark,
+                                                            f'found duplicate key "{key}"', node.start_mark)
+        return super().construct_mapping(node, deep=deep)
+
+    def construct_yaml_int(self, node):
+        # YAML 1.2 has neither 0-prefixed octal nor sexagesimal integers
+        value = self.construct_scalar(node).replace('_', '')
+        sign = -1 if value[0] == '-' else 1
+        if value[0] in '+-':
+            value = value[1:]
+        if value.startswith('0b'):
+            return sign * int(value[2:], 2)
+        if value.startswith('0x'):
+            return sign * int(value[2:], 16)
+        if value.startswith('0o'):
+            return sign * int(value[2:], 8)
+        return sign * int(value)
+
+
+for _versions, _tag, _regexp, _first_chars in implicit_resolvers:
+    if (1, 2) in _versions:
+        PykwalifySourceLoader.add_implicit_resolver(_tag, _regexp, _first_chars)
+PykwalifySourceLoader.add_constructor('tag:yaml.org,2002:int', PykwalifySourceLoader.construct_yaml_int)
+
+
+class CompiledSchema(Core):
+    """
+    A pykwalify schema whose rules, including its `schema;` partial schemas used by `include`, are built once and
+    reused for every validated data.
+    """
+
+    def __init__(self, schema_path: str):
+        with open(schema_path) as schema_file:
+            schema = yml.load(schema_file)
+        super().__init__(source_data={}, schema_data=schema)
+        self.partial_rules = {name.split(';', 1)[1]: Rule(schema=partial_schema)
+                              for name, partial_schema in self.schema.items() if name.startswith('schema;')}
+        self.root_rule = Rule(schema={key: value for key, value in self.schema.items()
+                                      if not key.startswith('schema;')})
+
+    def _start_validate(self, value=None):
+        # the partial rules are global in pykwalify, and may have the same names in different schemas
+        pykwalify.partial_schemas.update(self.partial_rules)
+        self.errors = []
+        self._validate(value, self.root_rule, '', [])
+
+    def validate_data(self, data: Any) -> Any:
+        """
+        Validate loaded data against the schema.
+
+        Raises:
+            SchemaError: with the same message as pykwalify's Core.validate, if the data is invalid.
+        """
+        self.source = data
+        try:
+            return self.validate(raise_exception=True)
+        finally:
+            self.source = {}
+
+
+@lru_cache(maxsize=None)
+def get_compiled_schema(schema_name: str) -> CompiledSchema:
+    return CompiledSchema(os.path.join(SCHEMAS_PATH, f'{schema_name}.yml'))
+
+
+def load_pykwalify_source(file_path: str) -> Any:
+    """
+    Load a json or yml file the way pykwalify loads its source files.
+    """
+    with open(file_path) as source_file:
+        if file_path.endswith('.json'):
+            return json.load(source_file)
+        return yaml.load(source_file, Loader=PykwalifySourceLoader)  # nosec
+
+
+def validate_file_schema(file_path: str, schema_name: str, loaded_json_data: Optional[Any] = None) -> None:
+    """
+    Validate a json or yml file against one of the schemas in the schemas directory, with the same result as
+    `Core(source_file=file_path, schema_files=[schema_path]).validate(raise_exception=True)`.
+
+    Args:
+        file_path: The path of the file.
+        schema_name: The schema file name, without its extension.
+        loaded_json_data: The data already loaded from a json file by json.load, to validate instead of loading it
+            again. yml files are loaded again, as yaml.safe_load does not load them the way pykwalify does.
+
+    Raises:
+        SchemaError: if the file is invalid, or any error pykwalify raises for the file.
+    """
+    if file_path.endswith('.json') and loaded_json_data is not None:
+        source = loaded_json_data
+    else:
+        try:
+            source = load_pykwalify_source(file_path)
+        except Exception:
+            # let pykwalify load the file, and raise the exact same error
+            Core(source_file=file_path, schema_files=[os.path.join(SCHEMAS_PATH, f'{schema_name}.yml')]).validate(
+                raise_exception=True)
+            return
+
+    if source is None:
+        # pykwalify does not accept empty files
+        Core(source_file=file_path, schema_files=[os.path.join(SCHEMAS_PATH, f'{schema_name}.yml')]).validate(
+            raise_exception=True)
+        return
+
+    get_compiled_schema(schema_name).validate_data(source)
@@ -7,8 +7,8 @@ from demisto_sdk.commands.common.errors import (FOUND_FILES_AND_ERRORS,
                                                 FOUND_FILES_AND_IGNORED_ERRORS,
                                                 PRESET_ERROR_TO_CHECK,
                                                 PRESET_ERROR_TO_IGNORE, Errors)
-from demisto_sdk.commands.common.hook_validations.base_validator import \
-    BaseValidator
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    JSON_ERRORS_OUTPUT, BaseValidator)
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import get_yaml
 from TestSuite.test_tools import ChangeCWD
@@ -370,6 +370,7 @@ class TestJsonOutput:
         with ChangeCWD(repo.path):
             # create new file
             base.json_output(integration.yml.path, ui_applicable_error_code, ui_applicable_error_message, False)
+            JSON_ERRORS_OUTPUT.flush()
             with open(base.json_file_path) as f:
                 json_output = json.load(f)
 
@@ -377,6 +378,7 @@ class TestJsonOutput:
 
             # update existing file
             base.json_output(integration.yml.path, non_ui_applicable_error_code, non_ui_applicable_error_message, True)
+            JSON_ERRORS_OUTPUT.flush()
             with open(base.json_file_path) as f:
                 json_output = json.load(f)
 
@@ -421,6 +423,7 @@ class TestJsonOutput:
         with ChangeCWD(repo.path):
             # create new file
             base.json_output(integration.yml.path, ui_applicable_error_code, ui_applicable_error_message, False)
+            JSON_ERRORS_OUTPUT.flush()
             with open(base.json_file_path, 'r') as f:
                 json_output = json.load(f)
 
@@ -465,7 +468,50 @@ class TestJsonOutput:
         with ChangeCWD(repo.path):
             # create new file
             base.json_output(integration.yml.path, ui_applicable_error_code, ui_applicable_error_message, False)
+            JSON_ERRORS_OUTPUT.flush()
             with open(base.json_file_path, 'r') as f:
                 json_output = json.load(f)
 
             assert json_output.sort() == expected_json_1.sort()
+
+    def test_json_output__written_once(self, repo, mocker):
+        """
+        Given
+        - An existing json_outputs file with an error.
+        - Several errors of the same file.
+
+        When
+        - Running json_output method for each error, and then flushing the json output.
+
+        Then
+        - Ensure the json outputs file is not written before the flush.
+        - Ensure the errors are appended to the existing error, in their order.
+        - Ensure the file type of the erroneous file is found only once.
+        """
+        from demisto_sdk.commands.common.hook_validations import base_validator
+
+        pack = repo.create_pack('PackName')
+        integration = pack.create_integration('MyInt')
+        integration.create_default_integration()
+        json_path = os.path.join(repo.path, 'valid_json.json')
+        existing_error = {'filePath': 'Packs/Other/pack_metadata.json', 'linter': 'validate'}
+        with open(json_path, 'w') as f:
+            json.dump([existing_error], f)
+        find_type_spy = mocker.spy(base_validator, 'find_type')
+        base = BaseValidator(json_file_path=json_path)
+        errors = [Errors.wrong_display_name('param1', 'param2'), Errors.wrong_subtype(), Errors.image_too_large()]
+
+        with ChangeCWD(repo.path):
+            for error_message, error_code in errors:
+                base.json_output(integration.yml.path, error_code, error_message, False)
+            with open(json_path) as f:
+                assert json.load(f) == [existing_error]
+
+            JSON_ERRORS_OUTPUT.flush()
+            with open(json_path) as f:
+                json_output = json.load(f)
+
+        assert json_output[0] == existing_error
+        assert [error['errorCode'] for error in json_output[1:]] == [error_code for _, error_code in errors]
+        assert [error['entityType'] for error in json_output[1:]] == ['integration', 'integration', 'image']
+        assert find_type_spy.call_count == 1
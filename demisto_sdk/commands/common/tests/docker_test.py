@@ -1,13 +1,20 @@
+import json
 import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 
 import mock
 import pytest
 
 from demisto_sdk.commands.common.errors import Errors
-from demisto_sdk.commands.common.hook_validations.docker import \
-    DockerImageValidator
+from demisto_sdk.commands.common.hook_validations import docker
+from demisto_sdk.commands.common.hook_validations.docker import (
+    DOCKER_TAGS_CACHE_TTL, DockerImageValidator, DockerTagsCache)
 from demisto_sdk.commands.common.legacy_git_tools import git_path
-from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.common.tools import get_sdk_cache_path, get_yaml
 from TestSuite.test_tools import ChangeCWD
 
 RETURN_ERROR_TARGET = 'GetDockerImageLatestTag.return_error'
@@ -483,3 +490,153 @@ class TestDockerImage:
             with pytest.raises(Exception) as e:
                 DockerImageValidator._get_manifest_from_commit(manifest_url, 'sha1')
             assert str(e.value) == expected
+
+
+@pytest.fixture
+def docker_tags_cache_path():
+    DockerImageValidator.get_docker_image_latest_tag_request.cache_clear()
+    yield Path(get_sdk_cache_path('docker_tags.json'))
+    DockerImageValidator.get_docker_image_latest_tag_request.cache_clear()
+
+
+@pytest.fixture
+def stand_in_docker_hub(mocker):
+    """
+    A local docker hub which returns the tag '1.0.<n>' for the n-th distinct image it's asked about, and counts the
+    requests of each image.
+    """
+    requested_images: Counter = Counter()
+    lock = threading.Lock()
+
+    class DockerHubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            image = self.path.split('/v2/repositories/')[-1].rsplit('/tags', 1)[0]
+            with lock:
+                requested_images[image] += 1
+                tag = f'1.0.{len(requested_images)}'
+            body = json.dumps({'results': [{'name': tag, 'last_updated': '2021-10-23T09:13:30.84299Z'}]}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), DockerHubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    mocker.patch.object(docker, 'DOCKER_HUB_URL', f'http://127.0.0.1:{server.server_port}')
+    docker_auth = mocker.patch.object(DockerImageValidator, 'docker_auth')
+    yield requested_images
+    server.shutdown()
+    server.server_close()
+    assert not docker_auth.called  # docker hub does not require authentication
+
+
+def test_get_docker_image_latest_tag_request__cached_on_disk(docker_tags_cache_path, stand_in_docker_hub):
+    """
+    Given
+    - A docker image whose latest tag is not cached.
+
+    When
+    - Getting its latest tag twice, in two different runs.
+
+    Then
+    - Ensure the tag is requested from docker hub only once, and stored in the docker tags cache file.
+    """
+    assert DockerImageValidator.get_docker_image_latest_tag_request('demisto/python3') == '1.0.1'
+    DockerImageValidator.get_docker_image_latest_tag_request.cache_clear()
+    assert DockerTagsCache(str(docker_tags_cache_path)).get('demisto/python3') == '1.0.1'
+    docker._get_docker_tags_cache.cache_clear()  # a new run
+    assert DockerImageValidator.get_docker_image_latest_tag_request('demisto/python3') == '1.0.1'
+
+    assert stand_in_docker_hub == {'demisto/python3': 1}
+
+
+@pytest.mark.parametrize('cache_content', [
+    {'demisto/python3': {'tag': '1.0.0', 'timestamp': time.time() - DOCKER_TAGS_CACHE_TTL - 1}},
+    {'demisto/python3': {'tag': '1.0.0', 'timestamp': time.time() + 365 * 24 * 60 * 60}},
+    {'demisto/python3': {'tag': '', 'timestamp': time.time()}},
+    {'demisto/python3': '1.0.0'},
+    ['demisto/python3'],
+])
+def test_docker_tags_cache__invalid_entries(tmp_path, cache_content):
+    """
+    Given
+    - A docker tags cache file with an expired, future, empty or malformed entry.
+
+    When
+    - Getting the latest tag of the image.
+
+    Then
+    - Ensure the tag is not taken from the cache.
+    """
+    cache_path = tmp_path / 'docker_tags.json'
+    cache_path.write_text(json.dumps(cache_content))
+
+    assert DockerTagsCache(str(cache_path)).get('demisto/python3') == ''
+
+
+def test_docker_tags_cache__update_merges_entries(tmp_path):
+    """
+    Given
+    - Two docker tags caches of the same file, as in two commands which run at the same time.
+
+    When
+    - Each of them stores the latest tag of a different image, and an empty tag of another image.
+
+    Then
+    - Ensure the file keeps the tags of both of them, and not the empty tag.
+    """
+    cache_path = str(tmp_path / 'cache_dir' / 'docker_tags.json')
+    first_cache, second_cache = DockerTagsCache(cache_path), DockerTagsCache(cache_path)
+    assert first_cache.get('demisto/python3') == ''
+
+    first_cache.update({'demisto/python3': '3.9.7.1'})
+    second_cache.update({'demisto/netutils': '1.0.0.1', 'demisto/error': ''})
+
+    assert DockerTagsCache(cache_path).get('demisto/python3') == '3.9.7.1'
+    assert DockerTagsCache(cache_path).get('demisto/netutils') == '1.0.0.1'
+    assert 'demisto/error' not in json.loads(open(cache_path).read())
+
+
+def test_prefetch_docker_images_latest_tags__many_files(docker_tags_cache_path, stand_in_docker_hub):
+    """
+    Given
+    - 300 integrations which use 30 docker images.
+
+    When
+    - Prefetching the latest tags of their docker images, and then getting the latest tag of each integration image.
+
+    Then
+    - Ensure each docker image is requested once, and the integrations get the prefetched tags without requesting
+      them again.
+    """
+    docker_image_names = [f'demisto/image{i % 30}' for i in range(300)]
+
+    latest_tags = DockerImageValidator.prefetch_docker_images_latest_tags(docker_image_names + [''])
+    integrations_latest_tags = [DockerImageValidator.get_docker_image_latest_tag_request(name)
+                                for name in docker_image_names]
+
+    assert stand_in_docker_hub == {f'demisto/image{i}': 1 for i in range(30)}
+    assert sorted(latest_tags) == sorted(set(docker_image_names))
+    assert sorted(set(latest_tags.values())) == sorted(f'1.0.{i}' for i in range(1, 31))
+    assert integrations_latest_tags == [latest_tags[name] for name in docker_image_names]
+
+
+def test_prefetch_docker_images_latest_tags__request_fails(docker_tags_cache_path, mocker):
+    """
+    Given
+    - Docker images whose latest tag can not be fetched.
+
+    When
+    - Prefetching their latest tags.
+
+    Then
+    - Ensure no error is raised and nothing is cached, so the error is reported by the validation of each file.
+    """
+    mocker.patch.object(DockerImageValidator, 'request_docker_image_latest_tag', side_effect=Exception('timeout'))
+
+    assert DockerImageValidator.prefetch_docker_images_latest_tags(['demisto/python3']) == {'demisto/python3': ''}
+    assert not docker_tags_cache_path.exists()
@@ -1,6 +1,7 @@
 import unittest
 
-from demisto_sdk.commands.common.errors import Errors
+from demisto_sdk.commands.common.errors import (ERROR_CODE, Errors,
+                                                FoundErrors, get_error_object)
 
 
 class TestErrors(unittest.TestCase):
@@ -166,3 +167,29 @@ class TestErrors(unittest.TestCase):
 
         result = Errors.integration_is_skipped(integration_id, skip_comment)
         assert result[0] == expected
+
+    def test_get_error_object(self):
+        """
+        Given: An error code, and an unknown error code
+        When: Getting the error data
+        Then: Return the data of the error with the code from ERROR_CODE, or an empty dict for the unknown code.
+        """
+        assert get_error_object('BA100') is ERROR_CODE['wrong_version']
+        assert get_error_object('XX999') == {}
+
+    def test_found_errors(self):
+        """
+        Given: Found errors, some of them more than once
+        When: Adding them to the found errors, and clearing them
+        Then: Each error is kept once in the order it was found, and membership checks reflect the clearing.
+        """
+        found_errors = FoundErrors(['path - [BA100]'])
+        found_errors.append('path - [BA101]')
+        found_errors.append('path - [BA100]')
+        assert found_errors == ['path - [BA100]', 'path - [BA101]']
+        assert 'path - [BA101]' in found_errors
+
+        del found_errors[:]
+        assert 'path - [BA101]' not in found_errors
+        found_errors.append('path - [BA101]')
+        assert found_errors == ['path - [BA101]']
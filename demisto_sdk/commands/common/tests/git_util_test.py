@@ -0,0 +1,127 @@
+import os
+from pathlib import Path
+
+import pytest
+from git import Git, Repo
+
+from demisto_sdk.commands.common.git_util import GitUtil, parse_name_status
+
+FILE_CONTENT = ''.join(f'line {i}\n' for i in range(100))
+
+
+def write_file(repo: Repo, file_name: str, content: str):
+    with open(os.path.join(repo.working_dir, file_name), 'w') as file:
+        file.write(content)
+
+
+def commit_all(repo: Repo, message: str):
+    repo.git.add('-A')
+    repo.git.commit('-m', message)
+
+
+@pytest.fixture
+def feature_branch_repo(tmp_path) -> Repo:
+    """
+    A clone of an origin repo, checked out on a feature branch which has committed, staged and untracked changes,
+    while the origin master branch advanced after the feature branch was created.
+    """
+    origin = Repo.init(tmp_path / 'origin')
+    origin.git.checkout('-b', 'master')
+    origin.git.config('user.email', 'automatic@example.com')
+    origin.git.config('user.name', 'AutomaticTest')
+    for file_name in ('modified.txt', 'deleted.txt', 'renamed.txt', 'staged.txt', 'master.txt'):
+        write_file(origin, file_name, FILE_CONTENT + file_name)
+    commit_all(origin, 'initial commit')
+
+    repo = origin.clone(tmp_path / 'content')
+    repo.git.config('user.email', 'automatic@example.com')
+    repo.git.config('user.name', 'AutomaticTest')
+    repo.git.checkout('-b', 'feature')
+    write_file(repo, 'modified.txt', FILE_CONTENT + 'changed')
+    write_file(repo, 'added.txt', 'added')
+    os.remove(os.path.join(repo.working_dir, 'deleted.txt'))
+    repo.git.mv('renamed.txt', 'renamed_new.txt')
+    commit_all(repo, 'feature commit')
+
+    write_file(origin, 'master.txt', 'changed on master')
+    commit_all(origin, 'master commit')
+    repo.remote().fetch()
+
+    write_file(repo, 'staged.txt', FILE_CONTENT + 'staged')
+    repo.git.add('staged.txt')
+    write_file(repo, 'untracked.txt', 'untracked')
+    return repo
+
+
+def test_parse_name_status():
+    """
+    Given
+    - A `git diff --name-status -z` output of modified, added, deleted and renamed files.
+
+    When
+    - Parsing it.
+
+    Then
+    - Ensure every entry gets its status and paths, and renames get their score and both paths.
+    """
+    diff_output = 'M\0modified.txt\0A\0dir/added file.txt\0D\0deleted.txt\0R087\0old.txt\0new.txt\0'
+
+    changed_files = parse_name_status(diff_output)
+
+    assert [(item.status, item.score, item.a_path, item.b_path) for item in changed_files] == [
+        ('M', None, 'modified.txt', 'modified.txt'),
+        ('A', None, 'dir/added file.txt', 'dir/added file.txt'),
+        ('D', None, 'deleted.txt', 'deleted.txt'),
+        ('R', 87, 'old.txt', 'new.txt'),
+    ]
+    assert parse_name_status('') == []
+
+
+def test_changed_files(feature_branch_repo):
+    """
+    Given
+    - A feature branch with committed, staged and untracked changes, behind a master branch which changed a file.
+
+    When
+    - Getting the modified, added, deleted and renamed files against master.
+
+    Then
+    - Ensure every file is identified with its status, and the file changed only on master is not identified.
+    """
+    git_util = GitUtil(feature_branch_repo)
+
+    assert git_util.modified_files() == {Path('modified.txt'), Path('staged.txt')}
+    assert git_util.modified_files(committed_only=True) == {Path('modified.txt')}
+    assert git_util.added_files() == {Path('added.txt')}
+    assert git_util.added_files(include_untracked=True) == {Path('added.txt'), Path('untracked.txt')}
+    assert git_util.deleted_files() == {Path('deleted.txt')}
+    assert git_util.renamed_files() == {(Path('renamed.txt'), Path('renamed_new.txt'))}
+    assert git_util.get_all_changed_files() == {Path('modified.txt'), Path('staged.txt'), Path('added.txt'),
+                                                Path('renamed_new.txt')}
+
+
+def test_changed_files__git_commands_run_once(mocker, feature_branch_repo):
+    """
+    Given
+    - A feature branch with committed, staged and untracked changes.
+
+    When
+    - Getting the modified, added and renamed files against master, as validate does.
+
+    Then
+    - Ensure each of the diffs and the git status is run only once.
+    """
+    git_util = GitUtil(feature_branch_repo)
+    call_process = mocker.spy(Git, '_call_process')
+
+    git_util.modified_files(include_untracked=True)
+    git_util.added_files(include_untracked=True)
+    git_util.renamed_files(include_untracked=True)
+
+    git_commands = [call.args[1:] for call in call_process.call_args_list if call.args[1] in ('diff', 'status')]
+    assert sorted(git_commands) == sorted([
+        ('diff', '--name-status', '-M', '-z', 'origin/master', 'feature'),
+        ('diff', '--name-status', '-z', 'origin/master...feature'),
+        ('diff', '--cached', '--name-status', '-M', '-z', 'HEAD'),
+        ('status', '--short', '-u'),
+    ])
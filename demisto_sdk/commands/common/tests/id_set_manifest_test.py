@@ -0,0 +1,100 @@
+import json
+
+from demisto_sdk.commands.common.id_set_manifest import IDSetManifest
+
+
+class PoolMock:
+    def __init__(self):
+        self.processed = []
+
+    def map(self, func, paths):
+        self.processed.extend(paths)
+        return [func(path) for path in paths]
+
+
+def process(path):
+    with open(path) as f:
+        return [json.load(f)]
+
+
+def test_map__only_changed_files_are_processed(tmp_path):
+    """
+    Given
+    - a manifest created for two files
+
+    When
+    - re-processing after one file was changed and another one was added
+
+    Then
+    - ensure only the changed and added files are processed and the results keep the paths order
+    """
+    manifest_path = str(tmp_path / 'id_set.json.manifest')
+    files = [tmp_path / f'file{i}.json' for i in range(3)]
+    for i, file in enumerate(files):
+        file.write_text(json.dumps({f'id{i}': {'name': f'name{i}'}}))
+
+    pool = PoolMock()
+    manifest = IDSetManifest(manifest_path)
+    manifest.map(pool, process, [str(f) for f in files[:2]], 'Scripts')
+    manifest.save()
+
+    files[1].write_text(json.dumps({'id1': {'name': 'changed'}}))
+    pool = PoolMock()
+    manifest = IDSetManifest(manifest_path)
+    results = manifest.map(pool, process, [str(f) for f in files], 'Scripts')
+
+    assert pool.processed == [str(files[1]), str(files[2])]
+    assert results == [[{'id0': {'name': 'name0'}}], [{'id1': {'name': 'changed'}}], [{'id2': {'name': 'name2'}}]]
+    assert (manifest.hits, manifest.misses) == (1, 2)
+
+
+def test_map__context_and_fingerprint_invalidate_entries(tmp_path):
+    """
+    Given
+    - a manifest created for a file with a given context and fingerprint
+
+    When
+    - re-processing with another context, or with another fingerprint
+
+    Then
+    - ensure the file is re-processed
+    """
+    manifest_path = str(tmp_path / 'id_set.json.manifest')
+    file = tmp_path / 'file.json'
+    file.write_text(json.dumps({'id': {}}))
+
+    manifest = IDSetManifest(manifest_path, fingerprint={'marketplace': 'xsoar'})
+    manifest.map(PoolMock(), process, [str(file)], 'IncidentFields', context=['type1'])
+    manifest.save()
+
+    manifest = IDSetManifest(manifest_path, fingerprint={'marketplace': 'xsoar'})
+    manifest.map(PoolMock(), process, [str(file)], 'IncidentFields', context=['type1', 'type2'])
+    assert manifest.misses == 1
+
+    manifest = IDSetManifest(manifest_path, fingerprint={'marketplace': 'marketplacev2'})
+    manifest.map(PoolMock(), process, [str(file)], 'IncidentFields', context=['type1'])
+    assert manifest.misses == 1
+
+
+def test_save__unwritable_manifest(tmp_path):
+    """
+    Given
+    - a manifest whose path is under a file, so it can't be written
+
+    When
+    - processing a file and saving the manifest, then processing the file again
+
+    Then
+    - ensure saving doesn't raise, and the file is processed again as if there was no manifest
+    """
+    manifest_path = str(tmp_path / 'id_set.json' / 'id_set.json.manifest')
+    file = tmp_path / 'id_set.json'
+    file.write_text(json.dumps({'id': {}}))
+
+    manifest = IDSetManifest(manifest_path)
+    manifest.map(PoolMock(), process, [str(file)], 'Scripts')
+    manifest.save()
+
+    manifest = IDSetManifest(manifest_path)
+    manifest.map(PoolMock(), process, [str(file)], 'Scripts')
+    assert (manifest.hits, manifest.misses) == (0, 1)
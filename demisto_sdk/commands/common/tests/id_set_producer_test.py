@@ -0,0 +1,91 @@
+import json
+
+from demisto_sdk.commands.common.id_set_manifest import IDSetManifest
+from demisto_sdk.commands.common.id_set_producer import IDSetProducer
+
+
+class PoolMock:
+    """Returns the results in reverse order, as a pool might when the first files are the slowest."""
+
+    def __init__(self):
+        self.processed = []
+
+    def imap_unordered(self, func, tasks, chunksize=1):
+        self.processed.extend(task[3] for task in tasks)
+        return reversed([func(task) for task in tasks])
+
+
+def process(path):
+    with open(path) as f:
+        return [json.load(f)]
+
+
+def create_files(tmp_path, prefix, count):
+    files = []
+    for i in range(count):
+        file = tmp_path / f'{prefix}{i}.json'
+        file.write_text(json.dumps({f'{prefix}{i}': {'name': f'{prefix}{i}'}}))
+        files.append(str(file))
+    return files
+
+
+def test_run__results_are_routed_to_their_sections_in_paths_order(tmp_path):
+    """
+    Given
+    - two sections added to the producer
+
+    When
+    - processing them in a single pass, with the results arriving in reverse order
+
+    Then
+    - ensure the results of each section are in the order of its paths
+    - ensure each section is reported as done once, and the files count and slowest files are reported
+    """
+    scripts = create_files(tmp_path, 'script', 3)
+    playbooks = create_files(tmp_path, 'playbook', 2)
+    done_sections = []
+
+    producer = IDSetProducer(PoolMock(), processes=2)
+    producer.add('Scripts', process, scripts)
+    producer.add('Playbooks', process, playbooks)
+    producer.add('Lists', process, [])
+    producer.run(done_sections.append)
+
+    assert producer.items('Scripts') == [{f'script{i}': {'name': f'script{i}'}} for i in range(3)]
+    assert producer.items('Playbooks') == [{f'playbook{i}': {'name': f'playbook{i}'}} for i in range(2)]
+    assert producer.results('Mappers') == []
+    assert sorted(done_sections) == ['Lists', 'Playbooks', 'Scripts']
+    assert producer.counts == {'Scripts': 3, 'Playbooks': 2, 'Lists': 0}
+    assert len(producer.slowest_files(4)) == 4
+    assert 'Scripts: 3' in producer.report()
+
+
+def test_run__with_manifest(tmp_path):
+    """
+    Given
+    - a producer with a manifest of a previous run
+
+    When
+    - processing a section after one of its files was changed
+
+    Then
+    - ensure only the changed file is processed, and the results are the same as without the manifest
+    """
+    scripts = create_files(tmp_path, 'script', 3)
+    manifest_path = str(tmp_path / 'id_set.json.manifest')
+    manifest = IDSetManifest(manifest_path)
+    producer = IDSetProducer(PoolMock(), manifest=manifest)
+    producer.add('Scripts', process, scripts)
+    producer.run()
+    manifest.save()
+
+    with open(scripts[1], 'w') as f:
+        json.dump({'script1': {'name': 'changed'}}, f)
+    pool = PoolMock()
+    producer = IDSetProducer(pool, manifest=IDSetManifest(manifest_path))
+    producer.add('Scripts', process, scripts)
+    producer.run()
+
+    assert pool.processed == [scripts[1]]
+    assert producer.items('Scripts') == [{'script0': {'name': 'script0'}}, {'script1': {'name': 'changed'}},
+                                         {'script2': {'name': 'script2'}}]
@@ -1,5 +1,6 @@
 from demisto_sdk.commands.common.configuration import Configuration
-from demisto_sdk.commands.common.hook_validations.id import IDSetValidations
+from demisto_sdk.commands.common.hook_validations.id import (IDSetSection,
+                                                             IDSetValidations)
 from TestSuite.test_tools import ChangeCWD
 
 CONFIG = Configuration()
@@ -1749,3 +1750,49 @@ class TestPlaybookEntitiesVersionsValid:
             is_subplaybook_name_exist = self.validator.is_subplaybook_name_valid(
                 self.playbook_with_invalid_sub_playbook_name, pack.path)
             assert not is_subplaybook_name_exist
+
+
+def test_id_set_validations__large_id_set(mocker):
+    """
+    Given
+        - a synthetic id_set with 20k scripts, 5k integrations and 5k playbooks (some of them in two versions).
+
+    When
+        - validating the scripts of 2k layouts and the entities and versions of 2k playbooks.
+
+    Then
+        - Ensure exactly the missing scripts and the sub playbooks of a newer version are found.
+        - Ensure the lookups of each id_set section are built once, and not for each validated file.
+    """
+    number_of_items = 5000
+    validator = IDSetValidations(is_circle=False, is_test_run=True, configuration=CONFIG)
+    mocker.patch.object(validator, 'handle_error', return_value='error')
+    validator.script_set = [{f'script_{i}': {'name': f'script_{i}', 'fromversion': '5.0.0'}}
+                            for i in range(number_of_items * 4)]
+    validator.integration_set = [{f'integration_{i}': {'name': f'integration_{i}', 'fromversion': '5.0.0',
+                                                       'commands': [f'command-{i}-{j}' for j in range(5)]}}
+                                 for i in range(number_of_items)]
+    validator.playbook_set = [{f'playbook_{i}': {'name': f'playbook {i}', 'fromversion': '5.0.0'}}
+                              for i in range(number_of_items)]
+    # playbooks of a newer version
+    validator.playbook_set += [{f'new_playbook_{i}': {'name': f'new playbook {i}', 'fromversion': '6.5.0'}}
+                               for i in range(10)]
+
+    section_init_spy = mocker.spy(IDSetSection, '__init__')
+    missing_scripts = set()
+    invalid_playbooks = []
+    for i in range(2000):
+        scripts = {f'script_{i}', f'script_{i * 2}', f'integration_{i}|||command-{i}-1', f'missing_script_{i}'}
+        missing_scripts.update(validator._get_scripts_that_are_not_in_id_set(scripts))
+
+        sub_playbooks = [f'playbook_{i}', f'playbook {i * 2 + 1}'] + ([f'new_playbook_{i % 10}'] if i % 2 else [])
+        is_valid, _ = validator.is_entity_version_match_playbook_version(
+            sub_playbooks, '6.0.0', validator.playbook_set, f'main_{i}', f'main_{i}.yml', {})
+        if not is_valid:
+            invalid_playbooks.append(i % 10)
+        assert validator.get_integration_version(f'integration_{i}') == '5.0.0'
+
+    assert missing_scripts == {f'missing_script_{i}' for i in range(2000)}
+    assert len(invalid_playbooks) == 1000
+    assert set(invalid_playbooks) == {1, 3, 5, 7, 9}
+    assert section_init_spy.call_count == 3
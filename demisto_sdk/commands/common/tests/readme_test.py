@@ -1,12 +1,15 @@
 import glob
 import io
+import json
 import os
 import sys
 
 import pytest
+import requests
 import requests_mock
 
 from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.hook_validations import readme
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from TestSuite.test_tools import ChangeCWD
@@ -48,7 +51,7 @@ def test_is_file_valid(mocker, current, answer):
               status_code=200, text="Test3")
         mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes', 'DEMISTO_MDX_CMD_VERIFY': 'yes'})
         assert readme_validator.is_valid_file() is answer
-        assert not ReadMeValidator._MDX_SERVER_PROCESS
+        assert not ReadMeValidator._MDX_SERVER_PROCESSES
 
 
 @pytest.mark.parametrize("current, answer", README_INPUTS)
@@ -60,7 +63,7 @@ def test_is_file_valid_mdx_server(mocker, current, answer):
         return
     mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes'})
     assert readme_validator.is_valid_file() is answer
-    assert ReadMeValidator._MDX_SERVER_PROCESS is not None
+    assert ReadMeValidator._MDX_SERVER_PROCESSES
     ReadMeValidator.stop_mdx_server()
 
 
@@ -443,3 +446,80 @@ def test_verify_readme_image_paths(mocker):
     assert 'please repair it:\n' \
            '![Identity with High Risk Score](https://github.com/demisto/test3.png)' \
            not in captured_output
+
+
+@pytest.fixture
+def mdx_verdicts(mocker):
+    mocker.patch.object(ReadMeValidator, '_MDX_VERDICTS', {})
+    yield ReadMeValidator._MDX_VERDICTS
+
+
+def test_start_mdx_server__pool(mdx_verdicts):
+    """
+    Given
+        - Valid and invalid readme contents.
+    When
+        - Starting a pool of 2 mdx servers, and parsing the contents by the batch endpoint of each of them.
+    Then
+        - Ensure each server listens on its own port, and returns the parse failure of each content.
+    """
+    if not ReadMeValidator.are_modules_installed_for_verify(ReadMeValidator(VALID_MD).content_path):
+        pytest.skip('skipping mdx server test. ' + MDX_SKIP_NPM_MESSAGE)
+    ReadMeValidator.is_mdx_validation_enabled(ReadMeValidator(VALID_MD).content_path)
+    try:
+        assert ReadMeValidator.start_mdx_server(servers_count=2)
+        ports = ReadMeValidator._MDX_SERVER_PORTS
+        assert len(set(ports)) == 2
+        for port in ports:
+            response = requests.post(f'http://localhost:{port}/batch', json=['## Valid', '<div>Invalid'], timeout=20)
+            valid_failure, invalid_failure = response.json()
+            assert not valid_failure
+            assert invalid_failure.startswith('MDX parse failure')
+    finally:
+        ReadMeValidator.stop_mdx_server()
+    assert not ReadMeValidator._MDX_SERVER_PORTS
+
+
+def test_verify_mdx_in_batches(tmp_path, mocker, mdx_verdicts):
+    """
+    Given
+        - 45 readme files, of 42 distinct contents, one of them invalid, and an html readme file.
+    When
+        - Parsing them in batches by a pool of 2 mdx servers, and then validating each of them.
+    Then
+        - Ensure each distinct mdx content is sent once, in batches of up to 20 contents spread over both servers.
+        - Ensure the validation of the readme files uses the verdicts, without sending them again.
+    """
+    readme_paths = []
+    for i in range(45):
+        readme_path = tmp_path / f'Readme{i}_README.md'
+        readme_path.write_text(f'## Readme {i % 42}\n' + ('<div>\n' if i == 7 else ''))
+        readme_paths.append(str(readme_path))
+    html_readme_path = tmp_path / 'Html_README.md'
+    html_readme_path.write_text('<!-- HTML_DOC -->\n<div>')
+    mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes'})
+    mocker.patch.object(readme, 'MDX_SERVERS_COUNT', 2)
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PORTS', [])
+
+    def start_mdx_server(servers_count=1, **_):
+        ReadMeValidator._MDX_SERVER_PORTS[:] = [6161, 6162][:servers_count]
+        return True
+
+    def parse_batch(request, _):
+        return ['MDX parse failure: Expected a closing tag for <div>' if '<div>' in content else ''
+                for content in json.loads(request.body)]
+
+    mocker.patch.object(ReadMeValidator, 'start_mdx_server', side_effect=start_mdx_server)
+    with requests_mock.Mocker() as m:
+        batch_requests = [m.post('http://localhost:6161/batch', json=parse_batch),
+                          m.post('http://localhost:6162/batch', json=parse_batch)]
+        ReadMeValidator.verify_mdx_in_batches(readme_paths + [str(html_readme_path)])
+        readmes_valid = [ReadMeValidator(readme_path).mdx_verify_server() for readme_path in readme_paths]
+
+        assert [batch_request.call_count for batch_request in batch_requests] == [2, 1]
+        assert m.call_count == 3
+    sent_contents = [content for batch_request in batch_requests for request in batch_request.request_history
+                     for content in request.json()]
+    assert sorted(sent_contents) == sorted({ReadMeValidator.fix_mdx_content(open(readme_path).read())
+                                            for readme_path in readme_paths})
+    assert readmes_valid == [i != 7 for i in range(45)]
@@ -0,0 +1,177 @@
+import json
+import os
+import shutil
+from io import StringIO
+
+import pytest
+import yaml
+from pykwalify.core import Core
+from ruamel.yaml import YAML
+
+from demisto_sdk.commands.common.schema_engine import (SCHEMAS_PATH,
+                                                       CompiledSchema,
+                                                       PykwalifySourceLoader,
+                                                       get_compiled_schema,
+                                                       validate_file_schema)
+from demisto_sdk.tests.constants_test import (INVALID_INTEGRATION_YML_1,
+                                              INVALID_LAYOUT_CONTAINER_PATH,
+                                              INVALID_PLAYBOOK_PATH,
+                                              VALID_INTEGRATION_TEST_PATH,
+                                              VALID_LAYOUT_CONTAINER_PATH,
+                                              VALID_PLAYBOOK_ID_PATH)
+
+
+def validate_by_core(file_path: str, schema_name: str) -> str:
+    """
+    Validate a file the way it was validated before the schema engine, by a new pykwalify Core per file.
+    """
+    try:
+        Core(source_file=file_path, schema_files=[os.path.join(SCHEMAS_PATH, f'{schema_name}.yml')]).validate(
+            raise_exception=True)
+    except Exception as err:
+        return f'{type(err).__name__}: {err}'
+    return 'valid'
+
+
+def validate_by_engine(file_path: str, schema_name: str) -> str:
+    loaded_json_data = None
+    if file_path.endswith('.json'):
+        with open(file_path) as json_file:
+            loaded_json_data = json.load(json_file)
+    try:
+        validate_file_schema(file_path, schema_name, loaded_json_data=loaded_json_data)
+    except Exception as err:
+        return f'{type(err).__name__}: {err}'
+    return 'valid'
+
+
+@pytest.mark.parametrize('content', [
+    'a: yes\nb: no\nc: on\nd: true\ne: False\n',
+    'a: 012\nb: 0o12\nc: 0x1A\nd: -10\ne: 1_000\n',
+    'a: 1e3\nb: 1.5\nc: .inf\nd: -.Inf\ne: .nan\nf: 1:30\n',
+    'a: ~\nb: null\nc: 2021-01-01\nd: 2021-01-01 10:00:00\n',
+    'a:\n- 1\n- b: [x, "y", 3]\n',
+])
+def test_pykwalify_source_loader(content):
+    """
+    Given
+    - yml content whose values are loaded differently by YAML 1.1 and YAML 1.2 loaders.
+
+    When
+    - Loading it by the pykwalify source loader.
+
+    Then
+    - Ensure it is loaded the same as the ruamel.yaml safe loader which pykwalify uses loads it.
+    """
+    expected = YAML(typ='safe', pure=True).load(StringIO(content))
+    loaded = yaml.load(content, Loader=PykwalifySourceLoader)  # nosec
+
+    assert json.dumps(loaded, default=str, sort_keys=True) == json.dumps(expected, default=str, sort_keys=True)
+
+
+def test_pykwalify_source_loader__duplicate_keys():
+    """
+    Given
+    - yml content with a duplicate key, which ruamel.yaml does not accept.
+
+    When
+    - Loading it by the pykwalify source loader.
+
+    Then
+    - Ensure it is not accepted.
+    """
+    with pytest.raises(yaml.constructor.ConstructorError, match='duplicate key "a"'):
+        yaml.load('a: 1\nb: 2\na: 3\n', Loader=PykwalifySourceLoader)  # nosec
+
+
+@pytest.mark.parametrize('file_path, schema_name', [
+    (VALID_INTEGRATION_TEST_PATH, 'integration'),
+    (INVALID_INTEGRATION_YML_1, 'integration'),
+    (VALID_PLAYBOOK_ID_PATH, 'playbook'),
+    (INVALID_PLAYBOOK_PATH, 'playbook'),
+    (VALID_LAYOUT_CONTAINER_PATH, 'layoutscontainer'),
+    (INVALID_LAYOUT_CONTAINER_PATH, 'layoutscontainer'),
+])
+def test_validate_file_schema(file_path, schema_name):
+    """
+    Given
+    - Valid and invalid integration, playbook and layouts container files.
+
+    When
+    - Validating them by the schema engine.
+
+    Then
+    - Ensure the result is the same as validating them by a new pykwalify Core, including the error message.
+    """
+    assert validate_by_engine(file_path, schema_name) == validate_by_core(file_path, schema_name)
+
+
+def test_validate_file_schema__unloadable_files(tmp_path):
+    """
+    Given
+    - An empty yml file and a yml file with a duplicate key.
+
+    When
+    - Validating them by the schema engine.
+
+    Then
+    - Ensure the error is the same as pykwalify raises for them.
+    """
+    empty_file = tmp_path / 'empty.yml'
+    empty_file.write_text('')
+    duplicate_key_file = tmp_path / 'duplicate.yml'
+    duplicate_key_file.write_text('id: a\nid: b\n')
+
+    for file_path in (str(empty_file), str(duplicate_key_file)):
+        engine_result = validate_by_engine(file_path, 'playbook')
+        assert engine_result != 'valid'
+        assert engine_result == validate_by_core(file_path, 'playbook')
+
+
+def test_get_compiled_schema__partial_schemas():
+    """
+    Given
+    - The playbook schema, which includes partial schemas, and the integration schema.
+
+    When
+    - Validating a playbook after an integration by the compiled schemas.
+
+    Then
+    - Ensure each schema is compiled once, and the playbook partial schemas are used for the playbook.
+    """
+    get_compiled_schema('integration')
+    assert get_compiled_schema('playbook') is get_compiled_schema('playbook')
+
+    assert validate_by_engine(VALID_INTEGRATION_TEST_PATH, 'integration') == 'valid'
+    assert validate_by_engine(VALID_PLAYBOOK_ID_PATH, 'playbook') == 'valid'
+
+
+def test_validate_file_schema__synthetic_repo(tmp_path, mocker):
+    """
+    Given
+    - A synthetic repo with many valid and invalid integrations and playbooks.
+
+    When
+    - Validating every integration and playbook by the schema engine, and by a new pykwalify Core per file as before.
+
+    Then
+    - Ensure both give the same results.
+    - Ensure the schema engine compiles each schema once, and not once per file.
+    """
+    sources = [(VALID_INTEGRATION_TEST_PATH, 'integration'), (INVALID_INTEGRATION_YML_1, 'integration'),
+               (VALID_PLAYBOOK_ID_PATH, 'playbook'), (INVALID_PLAYBOOK_PATH, 'playbook')]
+    files = []
+    for i in range(3):
+        for source_path, schema_name in sources:
+            file_path = str(tmp_path / f'{i}_{os.path.basename(source_path)}')
+            shutil.copyfile(source_path, file_path)
+            files.append((file_path, schema_name))
+    get_compiled_schema.cache_clear()
+    compile_spy = mocker.spy(CompiledSchema, '__init__')
+
+    core_results = [validate_by_core(file_path, schema_name) for file_path, schema_name in files]
+    engine_results = [validate_by_engine(file_path, schema_name) for file_path, schema_name in files]
+
+    assert engine_results == core_results
+    compiled_schemas = sorted(os.path.basename(call.args[1]) for call in compile_spy.call_args_list)
+    assert compiled_schemas == ['integration.yml', 'playbook.yml']
@@ -1,6 +1,9 @@
 import glob
+import json
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Union
 
@@ -17,10 +20,11 @@ from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import (
     LOG_COLORS, arg_to_list, compare_context_path_in_yml_and_readme,
     filter_files_by_type, filter_files_on_pack, filter_packagify_changes,
-    find_type, get_code_lang, get_current_repo, get_dict_from_file,
-    get_entity_id_by_entity_type, get_entity_name_by_entity_type,
-    get_file_displayed_name, get_file_version_suffix_if_exists,
-    get_files_in_dir, get_ignore_pack_skipped_tests, get_last_release_version,
+    find_type, get_cached_last_remote_release_version, get_code_lang,
+    get_current_repo, get_dict_from_file, get_entity_id_by_entity_type,
+    get_entity_name_by_entity_type, get_file_displayed_name,
+    get_file_version_suffix_if_exists, get_files_in_dir,
+    get_ignore_pack_skipped_tests, get_last_release_version,
     get_last_remote_release_version, get_latest_release_notes_text,
     get_pack_metadata, get_relative_path_from_packs_dir,
     get_release_note_entries, get_release_notes_file_path, get_ryaml,
@@ -135,6 +139,58 @@ class TestGenericFunctions:
         output = find_type(madeup_path)
         assert not output
 
+    def test_find_type__by_pack_layout(self, mocker, pack):
+        """
+        Given
+        - An integration, a script, a playbook, a test playbook and a beta integration in their pack directories.
+
+        When
+        - Running find_type.
+
+        Then
+        - Ensure the types are found without loading the files, besides the beta integration which has to be loaded.
+        """
+        integration = pack.create_integration('integration')
+        integration.create_default_integration()
+        script = pack.create_script('script')
+        script.create_default_script()
+        playbook = pack.create_playbook('playbook')
+        playbook.create_default_playbook()
+        test_playbook = pack.create_test_playbook('test_playbook')
+        test_playbook.create_default_test_playbook()
+        beta_integration = pack.create_integration('beta_integration')
+        beta_integration.create_default_integration()
+        beta_integration.yml.update({'beta': True})
+        get_dict_from_file_mock = mocker.spy(tools, 'get_dict_from_file')
+
+        assert find_type(integration.yml.path) == FileType.INTEGRATION
+        assert find_type(script.yml.path) == FileType.SCRIPT
+        assert find_type(playbook.yml.path) == FileType.PLAYBOOK
+        assert find_type(test_playbook.yml.path) == FileType.TEST_PLAYBOOK
+        assert not get_dict_from_file_mock.called
+
+        assert find_type(beta_integration.yml.path) == FileType.BETA_INTEGRATION
+        assert get_dict_from_file_mock.call_count == 1
+
+    @pytest.mark.parametrize('path', glob.glob(os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files', '**',
+                                                            PACKS_DIR, '*', '*', '**', '*.yml'), recursive=True))
+    def test_find_yml_type_by_layout__same_as_loading(self, path):
+        """
+        Given
+        - A yml file in a pack in the test files.
+
+        When
+        - Finding its type by the pack layout, without loading it.
+
+        Then
+        - Ensure the type is either not decided, or the same as the type found by loading the file.
+        """
+        for ignore_sub_categories in (False, True):
+            type_by_layout = tools.find_yml_type_by_layout(path, ignore_sub_categories)
+            if type_by_layout:
+                _dict, file_type = get_dict_from_file(path)
+                assert type_by_layout == find_type(path, _dict, file_type, ignore_sub_categories)
+
     test_path_md = [
         VALID_MD
     ]
@@ -358,6 +414,45 @@ class TestGetRemoteFileLocally:
         shutil.rmtree(self.REPO_NAME)
 
 
+def test_get_remote_file__from_local_git_objects(mocker, tmp_path):
+    """
+    Given
+    - A clone of a repo, whose metadata file was changed and committed on a feature branch.
+
+    When
+    - Getting the metadata file of the master branch, and a file which does not exist on the master branch.
+
+    Then
+    - Ensure the master branch metadata file is read from the local repository without any request.
+    - Ensure the missing file is requested from github.
+    """
+    origin = git.Repo.init(tmp_path / 'origin')
+    origin.git.checkout('-b', 'master')
+    origin.git.config('user.email', 'automatic@example.com')
+    origin.git.config('user.name', 'AutomaticTest')
+    os.makedirs(tmp_path / 'origin' / 'Packs' / 'MyPack')
+    (tmp_path / 'origin' / 'Packs' / 'MyPack' / 'pack_metadata.json').write_text('{"name": "old"}')
+    origin.git.add('-A')
+    origin.git.commit('-m', 'initial commit')
+    repo = origin.clone(tmp_path / 'content')
+    repo.git.config('user.email', 'automatic@example.com')
+    repo.git.config('user.name', 'AutomaticTest')
+    repo.git.checkout('-b', 'feature')
+    (tmp_path / 'content' / 'Packs' / 'MyPack' / 'pack_metadata.json').write_text('{"name": "new"}')
+    repo.git.add('-A')
+    repo.git.commit('-m', 'feature commit')
+    requests_get = mocker.patch.object(requests, 'get', side_effect=requests.exceptions.ConnectionError)
+
+    with ChangeCWD(repo.working_dir):
+        assert tools.get_remote_file('Packs/MyPack/pack_metadata.json') == {'name': 'old'}
+        assert tools.get_remote_file('Packs/MyPack/pack_metadata.json', tag='origin/master',
+                                     return_content=True) == b'{"name": "old"}'
+        assert not requests_get.called
+
+        assert tools.get_remote_file('Packs/MyPack/README.md', suppress_print=True) == {}
+        assert requests_get.call_count == 1
+
+
 class TestServerVersionCompare:
     V5 = "5.0.0"
     V0 = "0.0.0"
@@ -478,6 +573,125 @@ class TestGetFile:
         assert file_data
         assert file_data.get('name') is not None
 
+    @staticmethod
+    def write_old_file(path, content, mtime=1000000000):
+        path.write_text(content)
+        os.utime(path, (mtime, mtime))
+
+    def test_get_yaml__cached(self, tmp_path):
+        """
+        Given
+        - a yml file which was not modified recently
+
+        When
+        - loading it twice, modifying the first loaded dict
+
+        Then
+        - ensure the file is parsed once and each call returns its own copy
+        """
+        file_path = tmp_path / 'integration.yml'
+        self.write_old_file(file_path, 'name: Integration\nscript:\n  commands: []\n')
+        tools.PARSED_FILE_CACHE.cache_clear()
+
+        first = tools.get_yaml(str(file_path))
+        first['script']['commands'].append('command')
+        second = tools.get_yaml(str(file_path))
+
+        assert second == {'name': 'Integration', 'script': {'commands': []}}
+        assert tools.PARSED_FILE_CACHE.cache_info()['hits'] == 1
+        assert tools.PARSED_FILE_CACHE.cache_info()['misses'] == 1
+
+    def test_get_json__modified_file_is_reloaded(self, tmp_path):
+        """
+        Given
+        - a cached json file
+
+        When
+        - the file is modified, and a recently modified file is loaded
+
+        Then
+        - ensure the new content is returned and recently modified files are not cached
+        """
+        file_path = tmp_path / 'field.json'
+        self.write_old_file(file_path, '{"id": "1"}')
+        tools.PARSED_FILE_CACHE.cache_clear()
+        assert tools.get_json(str(file_path)) == {'id': '1'}
+
+        self.write_old_file(file_path, '{"id": "2"}', mtime=1000000001)
+        assert tools.get_json(str(file_path)) == {'id': '2'}
+
+        file_path.write_text('{"id": "3"}')
+        assert tools.get_json(str(file_path)) == {'id': '3'}
+        assert tools.get_json(str(file_path)) == {'id': '3'}
+        assert tools.PARSED_FILE_CACHE.cache_info() == {'hits': 0, 'misses': 4, 'maxsize': 1024, 'currsize': 2}
+
+    def test_get_file__lru_eviction(self, tmp_path, monkeypatch):
+        """
+        Given
+        - a cache limited to 2 files
+
+        When
+        - loading 3 files
+
+        Then
+        - ensure the least recently used file is evicted
+        """
+        monkeypatch.setattr(tools, 'PARSED_FILE_CACHE', tools.ParsedFileCache(maxsize=2))
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f'file{i}.json')
+            self.write_old_file(paths[-1], f'{{"id": {i}}}')
+
+        for path in (paths[0], paths[1], paths[0], paths[2], paths[1]):
+            tools.get_json(str(path))
+
+        assert tools.PARSED_FILE_CACHE.cache_info() == {'hits': 1, 'misses': 4, 'maxsize': 2, 'currsize': 2}
+
+    def test_get_file__concurrent_threads(self, tmp_path, monkeypatch):
+        """
+        Given
+        - a cache limited to 3 files
+
+        When
+        - loading 12 files repeatedly from 8 threads, so files are evicted while other threads read the cache
+
+        Then
+        - ensure each load returns the file content, and every load is counted once as a hit or a miss
+        """
+        monkeypatch.setattr(tools, 'PARSED_FILE_CACHE', tools.ParsedFileCache(maxsize=3))
+        paths = []
+        for i in range(12):
+            paths.append(tmp_path / f'file{i}.json')
+            self.write_old_file(paths[-1], f'{{"id": {i}}}')
+
+        def load_files(offset):
+            return [tools.get_json(str(paths[(offset + i) % len(paths)]))['id'] for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(load_files, range(8)))
+
+        assert results == [[(offset + i) % len(paths) for i in range(200)] for offset in range(8)]
+        cache_info = tools.PARSED_FILE_CACHE.cache_info()
+        assert cache_info['hits'] + cache_info['misses'] == 8 * 200
+        assert cache_info['currsize'] == 3
+
+    @pytest.mark.parametrize('loaders', [tools.YAML_LOADERS, (tools.XsoarLoader,)])
+    def test_load_yaml__reference_tag(self, monkeypatch, loaders):
+        """
+        Given
+        - yml content with a gitlab ci !reference tag
+
+        When
+        - loading it with the libyaml based loader (if available) and with the pure python loader
+
+        Then
+        - ensure the tag is loaded as a string by both loaders
+        """
+        monkeypatch.setattr(tools, 'YAML_LOADERS', loaders)
+        assert tools.load_yaml('script:\n  - !reference [.setup, script]\n') == {
+            'script': ["!reference ['.setup', 'script']"]
+        }
+
 
 def test_get_latest_release_notes_text_invalid():
     """
@@ -1022,6 +1236,108 @@ def test_get_last_remote_release_version(requests_mock):
     assert get_last_remote_release_version() == expected_version
 
 
+def test_get_cached_last_remote_release_version(mocker, monkeypatch, requests_mock, tmp_path):
+    """
+    Given
+    - A cached latest release version which is older than the cache TTL.
+
+    When
+    - Getting the cached latest release version twice, with the background refresh running in between.
+
+    Then
+    - Ensure the stale version is returned at once, and the refreshed version is returned afterwards.
+    - Ensure PYPI is not requested again while the refreshed version is cached.
+    """
+    monkeypatch.delenv('CI', raising=False)
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path / 'cache'))
+    cache_path = tmp_path / 'cache' / 'last_release_version.json'
+    cache_path.parent.mkdir()
+    cache_path.write_text(json.dumps({'version': '1.3.7', 'timestamp': time.time() - tools.SDK_VERSION_CACHE_TTL - 1}))
+    pypi_request = requests_mock.get(r"https://pypi.org/pypi/demisto-sdk/json", json={'info': {'version': '1.3.8'}})
+    thread = mocker.patch.object(tools.threading, 'Thread')
+
+    assert get_cached_last_remote_release_version() == '1.3.7'
+    assert thread.call_count == 1
+    thread.call_args.kwargs['target'](*thread.call_args.kwargs['args'])
+
+    assert get_cached_last_remote_release_version() == '1.3.8'
+    assert thread.call_count == 1
+    assert pypi_request.call_count == 1
+
+
+@pytest.mark.parametrize('cache_content', [None, 'not a json', '[]', '{"version": "1.3.7", "timestamp": "now"}'])
+def test_get_cached_last_remote_release_version__no_valid_cache(mocker, monkeypatch, requests_mock, tmp_path,
+                                                                cache_content):
+    """
+    Given
+    - A missing or an invalid cache file, and PYPI which can not be reached.
+
+    When
+    - Getting the cached latest release version, with the background refresh running afterwards.
+
+    Then
+    - Ensure the cache is refreshed, and it's not written when PYPI can not be reached.
+    """
+    monkeypatch.delenv('CI', raising=False)
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path))
+    cache_path = tmp_path / 'last_release_version.json'
+    if cache_content is not None:
+        cache_path.write_text(cache_content)
+    requests_mock.get(r"https://pypi.org/pypi/demisto-sdk/json", exc=requests.exceptions.ConnectionError)
+    thread = mocker.patch.object(tools.threading, 'Thread')
+
+    get_cached_last_remote_release_version()
+    assert thread.call_count == 1
+    assert thread.call_args.kwargs['target'](*thread.call_args.kwargs['args']) == ''
+
+    assert not cache_path.exists() if cache_content is None else cache_path.read_text() == cache_content
+
+
+def test_write_json_cache(tmp_path):
+    """
+    Given
+    - A cache file path in a missing directory, and a cache file path under a file.
+
+    When
+    - Writing and reading the cache files.
+
+    Then
+    - Ensure the first cache file is written and read back, without leaving temporary files.
+    - Ensure the second cache file is not written, without raising, and is read as an empty cache.
+    """
+    cache_path = tmp_path / 'cache' / 'cache.json'
+    unwritable_cache_path = cache_path / 'cache.json'
+
+    assert tools.write_json_cache(str(cache_path), {'key': 'value'})
+    assert tools.read_json_cache(str(cache_path)) == {'key': 'value'}
+    assert os.listdir(cache_path.parent) == ['cache.json']
+
+    assert not tools.write_json_cache(str(unwritable_cache_path), {'key': 'value'})
+    assert tools.read_json_cache(str(unwritable_cache_path)) == {}
+
+
+def test_get_pooled_session():
+    """
+    Given
+    - Two services, one of them retrying failed connections.
+
+    When
+    - Getting their pooled sessions.
+
+    Then
+    - Ensure each service gets a single session, with its pool size and retries.
+    """
+    docker_session = tools.get_pooled_session('docker', 8)
+    mdx_session = tools.get_pooled_session('mdx', 4, retries=2)
+
+    assert tools.get_pooled_session('docker', 8) is docker_session
+    assert mdx_session is not docker_session
+    assert docker_session.get_adapter('https://hub.docker.com')._pool_maxsize == 8
+    assert docker_session.get_adapter('https://hub.docker.com').max_retries.total == 0
+    assert mdx_session.get_adapter('http://localhost')._pool_maxsize == 4
+    assert mdx_session.get_adapter('http://localhost').max_retries.total == 2
+
+
 IS_PACK_PATH_INPUTS = [('Packs/BitcoinAbuse', True),
                        ('Packs/BitcoinAbuse/Layouts', False),
                        ('Packs/BitcoinAbuse/Classifiers', False),
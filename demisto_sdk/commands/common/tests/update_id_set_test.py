@@ -13,8 +13,8 @@ from demisto_sdk.commands.common.constants import (DEFAULT_JOB_FROM_VERSION,
                                                    JOBS_DIR, FileType)
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.update_id_set import (
-    find_duplicates, get_classifier_data, get_dashboard_data,
-    get_fields_by_script_argument,
+    build_id_set_index, find_duplicates, get_classifier_data,
+    get_dashboard_data, get_fields_by_script_argument,
     get_filters_and_transformers_from_complex_value,
     get_filters_and_transformers_from_playbook, get_general_data,
     get_generic_field_data, get_generic_module_data, get_generic_type_data,
@@ -344,6 +344,58 @@ class TestDuplicates:
         has_duplicates = has_duplicate(id_set['Layouts'], 'urlRep', 'Layouts', False)
         assert has_duplicates is False
 
+    @staticmethod
+    @pytest.mark.parametrize('id_set_subset, id_to_check, expected', MOCKED_DATA)
+    def test_has_duplicate__interval_sweep(id_set_subset, id_to_check, expected):
+        """
+        Given
+            - id_set sections with items sharing the same id, with and without overlapping versions
+
+        When
+            - checking for duplicate while creating a new id-set, with and without an id_set index
+
+        Then
+            - Ensure the sorted interval sweep finds the same duplicates as the pairwise comparison
+        """
+        id_set_index = build_id_set_index(id_set_subset)
+        assert has_duplicate(id_set_subset, id_to_check, 'Integrations', False, is_create_new=True,
+                             id_set_index=id_set_index) == expected
+        assert has_duplicate(id_set_subset, id_to_check, 'Integrations', False, is_create_new=True) == expected
+
+    @staticmethod
+    def test_find_duplicates__large_id_set(mocker):
+        """
+        Given
+            - a synthetic id_set with 50k incident and indicator fields, a few of them duplicated
+
+        When
+            - finding duplicates
+
+        Then
+            - Ensure exactly the duplicated fields are found
+            - Ensure only the ids with more than one item are checked for duplicates
+        """
+        number_of_fields = 50000
+        id_set = {entity: [] for entity in uis.ID_SET_ENTITIES}
+        for i in range(number_of_fields):
+            section = 'IncidentFields' if i % 2 else 'IndicatorFields'
+            id_set[section].append({f'field_{i}': {'name': f'field {i}', 'fromversion': '5.0.0'}})
+        # overlapping duplicates
+        id_set['IncidentFields'].append({'field_1': {'name': 'field 1', 'fromversion': '6.0.0'}})
+        id_set['IndicatorFields'].append({'field_1': {'name': 'field 1', 'fromversion': '6.0.0'}})
+        # non overlapping versions are not duplicates
+        id_set['IndicatorFields'][0]['field_0']['toversion'] = '5.9.9'
+        id_set['IndicatorFields'].append({'field_0': {'name': 'field 0', 'fromversion': '6.0.0'}})
+        has_duplicate_spy = mocker.spy(uis, 'has_duplicate')
+
+        duplicates = find_duplicates(id_set, False, 'xsoar')
+
+        assert duplicates[uis.ID_SET_ENTITIES.index('IncidentFields')] == ['field_1']
+        assert duplicates[-1] == ['field_1']
+        assert not any(duplicates[uis.ID_SET_ENTITIES.index('IndicatorFields')])
+        checked_ids = sorted(call.args[1] for call in has_duplicate_spy.call_args_list)
+        assert checked_ids == ['field_0', 'field_0', 'field_1', 'field_1']
+
 
 class TestIntegrations:
     INTEGRATION_DATA = {
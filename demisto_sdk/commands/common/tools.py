@@ -1,31 +1,29 @@
 import argparse
 import glob
-import io
 import json
 import os
+import pickle
 import re
 import shlex
 import sys
+import threading
+import time
 import urllib.parse
+import warnings
+from collections import OrderedDict
 from configparser import ConfigParser, MissingSectionHeaderError
 from contextlib import contextmanager
-from distutils.version import LooseVersion
 from enum import Enum
 from functools import lru_cache, partial
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen, check_output
-from typing import Callable, Dict, List, Match, Optional, Tuple, Type, Union
+from typing import (TYPE_CHECKING, Callable, Dict, List, Match, Optional,
+                    Tuple, Type, Union)
 
 import click
 import colorama
-import demisto_client
-import git
-import giturlparse
-import requests
-import urllib3
 import yaml
 from packaging.version import parse
-from ruamel.yaml import YAML
 
 from demisto_sdk.commands.common.constants import (
     ALL_FILES_VALIDATION_IGNORE_WHITELIST, API_MODULES_PACK, CLASSIFIERS_DIR,
@@ -43,17 +41,22 @@ from demisto_sdk.commands.common.constants import (
     TEST_PLAYBOOKS_DIR, TYPE_PWSH, UNRELEASE_HEADER, UUID_REGEX, WIDGETS_DIR,
     XSOAR_CONFIG_FILE, FileType, GitContentConfig, MarketplaceVersions,
     urljoin)
-from demisto_sdk.commands.common.git_util import GitUtil
 
-urllib3.disable_warnings()
+if TYPE_CHECKING:
+    import demisto_client
+    import requests
+    from ruamel.yaml import YAML
+
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+# git, requests, demisto_client, ruamel and distutils (which may import setuptools) are imported by the functions
+# which use them, as importing them takes most of the startup time of the commands which don't.
+# the same as urllib3.disable_warnings() for the unverified requests, without importing urllib3
+warnings.filterwarnings('ignore', message='Unverified HTTPS request')
 
 # inialize color palette
 colorama.init()
 
-ryaml = YAML()
-ryaml.preserve_quotes = True
-ryaml.allow_duplicate_keys = True
-
 
 class LOG_COLORS:
     NATIVE = colorama.Style.RESET_ALL
@@ -68,6 +71,11 @@ LOG_VERBOSE = False
 LAYOUT_CONTAINER_FIELDS = {'details', 'detailsV2', 'edit', 'close', 'mobile', 'quickView', 'indicatorsQuickView',
                            'indicatorsDetails'}
 SDK_PYPI_VERSION = r'https://pypi.org/pypi/demisto-sdk/json'
+# the directory of the caches which demisto-sdk keeps between the commands
+SDK_CACHE_DIR_ENV = 'DEMISTO_SDK_CACHE_DIR'
+DEFAULT_SDK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.demisto-sdk')
+# the cached latest release version is refreshed from PYPI once it's older than a day
+SDK_VERSION_CACHE_TTL = 24 * 60 * 60
 
 
 class XsoarLoader(yaml.SafeLoader):
@@ -86,6 +94,96 @@ class XsoarLoader(yaml.SafeLoader):
 
 XsoarLoader.add_constructor('!reference', XsoarLoader.reference)
 
+if hasattr(yaml, 'CSafeLoader'):
+    class XsoarCLoader(yaml.CSafeLoader):  # type: ignore[name-defined]
+        """
+        XsoarLoader based on the libyaml C parser, used when pyyaml was built with libyaml.
+        """
+        reference = XsoarLoader.reference
+
+    XsoarCLoader.add_constructor('!reference', XsoarCLoader.reference)
+    YAML_LOADERS: Tuple[Type, ...] = (XsoarCLoader, XsoarLoader)
+else:
+    YAML_LOADERS = (XsoarLoader,)
+
+
+def load_yaml(content: str):
+    """
+    Loads yml content with the fastest available XSOAR loader.
+    Content which can not be loaded by the libyaml parser is loaded with the pure python parser.
+    """
+    for loader in YAML_LOADERS[:-1]:
+        try:
+            return yaml.load(content, Loader=loader)
+        except yaml.YAMLError:
+            pass
+    return yaml.load(content, Loader=YAML_LOADERS[-1])
+
+
+class ParsedFileCache:
+    """
+    Process wide LRU cache of parsed yml/json files, keyed on the file path, modification time and size.
+
+    The parsed content is kept pickled, so each caller gets its own copy and may modify it.
+    Files which were modified in the last `RACY_INTERVAL_NS` are not cached, as a modification in the same
+    clock tick which keeps the file size would not change the key.
+    The cache may be used from several threads; the files are loaded outside of its lock.
+    """
+    RACY_INTERVAL_NS = 2 * 10 ** 9
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str, type_of_file: str, load: Callable):
+        """
+        Returns the parsed content of the file, calling `load` only if the file is not cached.
+        """
+        if not self.maxsize:
+            return load()
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return load()
+
+        key = (os.path.abspath(file_path), type_of_file, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            else:
+                self.misses += 1
+        if entry is not None:
+            return pickle.loads(entry)
+
+        data = load()
+        if time.time_ns() - stat.st_mtime_ns > self.RACY_INTERVAL_NS:
+            entry = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return data
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize,
+                    'currsize': len(self._entries)}
+
+    def cache_clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+PARSED_FILE_CACHE = ParsedFileCache(maxsize=int(os.getenv('DEMISTO_SDK_FILE_CACHE_SIZE', 1024)))
+
 
 def set_log_verbose(verbose: bool):
     global LOG_VERBOSE
@@ -142,6 +240,8 @@ def src_root() -> Path:
     Returns:
         Path: src root path.
     """
+    import git
+
     git_dir = git.Repo(Path.cwd(),
                        search_parent_directories=True).working_tree_dir
 
@@ -211,7 +311,46 @@ def get_core_pack_list() -> list:
     return core_pack_list
 
 
-# @lru_cache(maxsize=64)
+@lru_cache()
+def get_process_git_util(cwd: str, pid: int) -> 'GitUtil':
+    """Get the git util of the repository of the working directory.
+    The instance is kept per process, as its persistent git processes can not be shared with forked processes.
+
+    Args:
+        cwd: The working directory.
+        pid: The current process id.
+
+    Returns:
+        The git util of the repository.
+    """
+    import git
+
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    return GitUtil(git.Repo(cwd, search_parent_directories=True))
+
+
+def get_local_remote_file(full_file_path: str, tag: str = 'master') -> Optional[bytes]:
+    """Get the content of a file in a remote branch from the local git repository, avoiding the fetch of the file
+    from github or gitlab.
+
+    Args:
+        full_file_path: The full path of the file.
+        tag: The branch name or commit sha1.
+
+    Returns:
+        The file content, or None if not in a git repository or if the branch or the file do not exist locally.
+    """
+    import git
+
+    try:
+        git_util = get_process_git_util(os.getcwd(), os.getpid())
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        return None
+
+    return git_util.get_remote_file_content(full_file_path, tag)
+
+
 def get_remote_file(
         full_file_path: str,
         tag: str = 'master',
@@ -230,6 +369,23 @@ def get_remote_file(
         The file content in the required format.
 
     """
+    if not github_repo:
+        # the file is of the current repository - use the local git objects of the remote branch if available
+        local_remote_content = get_local_remote_file(full_file_path, tag)
+        if local_remote_content is not None:
+            if return_content:
+                return local_remote_content
+            if full_file_path.endswith('json'):
+                return json.loads(local_remote_content)
+            if full_file_path.endswith('yml'):
+                return yaml.safe_load(local_remote_content)
+            return {}
+
+    import git
+    import requests
+
+    from demisto_sdk.commands.common.git_util import GitUtil
+
     git_config = GitContentConfig(github_repo)
     if git_config.GITLAB_ID:
         full_file_path_quote_plus = urllib.parse.quote_plus(full_file_path)
@@ -440,14 +596,17 @@ def is_origin_content_repo():
         return False
 
 
-def get_last_remote_release_version():
+def get_last_remote_release_version(suppress_print: bool = False):
     """
     Get latest release tag from PYPI.
 
+    :param suppress_print: Whether to not print a warning when the request fails.
     :return: tag
     """
     if not os.environ.get(
             'CI'):  # Check only when no on CI. If you want to disable it - use `DEMISTO_SDK_SKIP_VERSION_CHECK` environment variable
+        import requests
+
         try:
             pypi_request = requests.get(SDK_PYPI_VERSION, verify=False, timeout=5)
             pypi_request.raise_for_status()
@@ -459,25 +618,125 @@ def get_last_remote_release_version():
             if isinstance(exc, requests.exceptions.ConnectionError):
                 exc_msg = f'{exc_msg[exc_msg.find(">") + 3:-3]}.\n' \
                           f'This may happen if you are not connected to the internet.'
-            print_warning(f'Could not get latest demisto-sdk version.\nEncountered error: {exc_msg}')
+            if not suppress_print:
+                print_warning(f'Could not get latest demisto-sdk version.\nEncountered error: {exc_msg}')
 
     return ''
 
 
+def get_current_sdk_version() -> str:
+    """
+    Get the installed demisto-sdk version.
+    importlib.metadata is preferred over pkg_resources, which takes a few hundred milliseconds to import.
+
+    :return: version
+    """
+    if sys.version_info >= (3, 8):
+        from importlib.metadata import version
+        return version('demisto-sdk')
+    from pkg_resources import get_distribution
+    return get_distribution('demisto-sdk').version
+
+
+def get_sdk_cache_path(*names: str) -> str:
+    """
+    Get the path of a cache file or directory in the demisto-sdk cache directory.
+    The cache directory is ~/.demisto-sdk, and can be set by the DEMISTO_SDK_CACHE_DIR environment variable.
+
+    :param names: The names of the path parts in the cache directory.
+    :return: the path
+    """
+    return os.path.join(os.getenv(SDK_CACHE_DIR_ENV) or DEFAULT_SDK_CACHE_DIR, *names)
+
+
+def read_json_cache(cache_path: str) -> dict:
+    """
+    Read a cache file written by write_json_cache.
+
+    :param cache_path: The path of the cache file.
+    :return: the cached data, or an empty dict if the file is missing or corrupted
+    """
+    try:
+        with open(cache_path, encoding='utf-8') as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_json_cache(cache_path: str, data: dict, **json_dump_kwargs) -> bool:
+    """
+    Write a cache file. The file is written to a temporary file of the process and thread and replaced at once, so
+    concurrent commands never read a partially written file. A cache file which can't be written is only a cache miss
+    of the next commands, so the errors are not raised.
+
+    :param cache_path: The path of the cache file.
+    :param data: The data to cache.
+    :param json_dump_kwargs: Keyword arguments of json.dump.
+    :return: whether the cache file was written
+    """
+    temp_cache_path = f'{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        if os.path.dirname(cache_path):
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_cache_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(data, cache_file, **json_dump_kwargs)
+        os.replace(temp_cache_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        if os.path.exists(temp_cache_path):
+            os.remove(temp_cache_path)
+        return False
+    return True
+
+
+def update_last_release_version_cache(cache_path: str) -> str:
+    """
+    Get latest release tag from PYPI and write it to the cache file, along with the time of the check.
+
+    :param cache_path: The path of the cache file.
+    :return: tag
+    """
+    version = get_last_remote_release_version(suppress_print=True)
+    if version:
+        write_json_cache(cache_path, {'version': version, 'timestamp': time.time()})
+    return version
+
+
+def get_cached_last_remote_release_version() -> str:
+    """
+    Get latest release tag from the cache file, without waiting for PYPI.
+    If the cached tag is older than SDK_VERSION_CACHE_TTL, it's refreshed in a background thread for the next commands.
+
+    :return: tag, or an empty string if it was not cached yet
+    """
+    if os.environ.get('CI'):
+        return ''
+    cache_path = get_sdk_cache_path('last_release_version.json')
+    cache = read_json_cache(cache_path)
+    timestamp = cache.get('timestamp')
+    if not isinstance(timestamp, (int, float)) or not 0 <= time.time() - timestamp < SDK_VERSION_CACHE_TTL:
+        threading.Thread(target=update_last_release_version_cache, args=(cache_path,), daemon=True).start()
+    version = cache.get('version')
+    return version if isinstance(version, str) else ''
+
+
 def get_file(file_path, type_of_file):
+    file_path = os.path.expanduser(file_path)
+    return PARSED_FILE_CACHE.get(file_path, type_of_file, partial(_load_file, file_path, type_of_file))
+
+
+def _load_file(file_path, type_of_file):
     data_dictionary = None
-    with open(os.path.expanduser(file_path), mode="r", encoding="utf8") as f:
+    with open(file_path, mode="r", encoding="utf8") as f:
         if file_path.endswith(type_of_file):
             read_file = f.read()
             replaced = read_file.replace("simple: =", "simple: '='")
-            # revert str to stream for loader
-            stream = io.StringIO(replaced)
             try:
                 if type_of_file in ('yml', '.yml'):
-                    data_dictionary = yaml.load(stream, Loader=XsoarLoader)
+                    data_dictionary = load_yaml(replaced)
 
                 else:
-                    data_dictionary = json.load(stream)
+                    data_dictionary = json.loads(replaced)
 
             except Exception as e:
                 raise ValueError(
@@ -491,6 +750,51 @@ def get_yaml(file_path):
     return get_file(file_path, 'yml')
 
 
+@lru_cache()
+def get_ryaml_instance() -> 'YAML':
+    """
+    Get the round-trip ruamel instance used for loading yml files, which preserves the quotes of the values.
+
+    Returns:
+        YAML. The ruamel instance
+    """
+    from ruamel.yaml import YAML
+
+    ryaml = YAML()
+    ryaml.preserve_quotes = True
+    ryaml.allow_duplicate_keys = True
+    return ryaml
+
+
+@lru_cache()
+def get_pooled_session(service: str, pool_maxsize: int, retries: int = 0) -> 'requests.Session':
+    """
+    Get the requests session of a service, which keeps the connections to the service open between the requests.
+    The session is created once per process.
+
+    Args:
+        service: The name of the service the session requests, e.g. 'docker'.
+        pool_maxsize: The number of connections kept open for each host, the number of the concurrent requests.
+        retries: The number of times a failed connection is retried.
+
+    Returns:
+        requests.Session. The session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# a forked process must not share the open connections of its parent (e.g. validate --workers)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=get_pooled_session.cache_clear)
+
+
 def get_ryaml(file_path: str) -> dict:
     """
     Get yml file contents using ruaml
@@ -503,7 +807,7 @@ def get_ryaml(file_path: str) -> dict:
     """
     try:
         with open(os.path.expanduser(file_path), 'r') as yf:
-            data = ryaml.load(yf)
+            data = get_ryaml_instance().load(yf)
     except FileNotFoundError as e:
         click.echo(f'File {file_path} not found. Error was: {str(e)}', nl=True)
     except Exception as e:
@@ -766,6 +1070,8 @@ def server_version_compare(v1, v2):
         negative if v2 later version than v1.
     """
 
+    from distutils.version import LooseVersion
+
     v1 = format_version(v1)
     v2 = format_version(v2)
 
@@ -1121,6 +1427,94 @@ def find_type_by_path(path: Union[str, Path] = '') -> Optional[FileType]:
     return None
 
 
+# The yml file types which can be found in each content entity directory of a pack.
+YML_TYPES_BY_ENTITY_DIR = {
+    INTEGRATIONS_DIR: {FileType.INTEGRATION},
+    SCRIPTS_DIR: {FileType.SCRIPT},
+    PLAYBOOKS_DIR: {FileType.PLAYBOOK},
+    TEST_PLAYBOOKS_DIR: {FileType.TEST_PLAYBOOK, FileType.TEST_SCRIPT, FileType.SCRIPT},
+}
+
+# The top level keys the yml file type is decided by, and keys which can hide top level keys (merge keys).
+YML_TYPE_KEYS_REGEX = re.compile(r'^(?:[\'"]?(category|script|tasks|beta)[\'"]?|(<<))\s*:', re.MULTILINE)
+
+
+def find_yml_type(path: str, _dict: dict, ignore_sub_categories: bool = False) -> Optional[FileType]:
+    """
+    Returns the type of a content yml file by its loaded content.
+
+    Arguments:
+        path - a path to the file
+        _dict - the content of the file (only its top level keys are checked, besides the beta key value)
+        ignore_sub_categories - whether to return the base type instead of the beta and test types
+
+    Returns:
+        the file type, or None if it could not be recognized
+    """
+    if 'category' in _dict:
+        if _dict.get('beta') and not ignore_sub_categories:
+            return FileType.BETA_INTEGRATION
+
+        return FileType.INTEGRATION
+
+    if 'script' in _dict:
+        if TEST_PLAYBOOKS_DIR in Path(path).parts and not ignore_sub_categories:
+            return FileType.TEST_SCRIPT
+
+        return FileType.SCRIPT
+
+    if 'tasks' in _dict:
+        if TEST_PLAYBOOKS_DIR in Path(path).parts:
+            return FileType.TEST_PLAYBOOK
+
+        return FileType.PLAYBOOK
+
+    return None
+
+
+def find_yml_type_by_layout(path: str, ignore_sub_categories: bool = False) -> Optional[FileType]:
+    """
+    Finds the type of a content yml file without loading it.
+
+    The expected types are taken from the location of the file in the pack (Packs/<pack>/<entity dir>/...),
+    and the type is decided by the top level keys found in the raw text of the file. If the found type does not
+    match the location of the file, or the keys are ambiguous (e.g. a beta key whose value has to be checked),
+    None is returned and the file should be loaded.
+
+    Arguments:
+        path - a path to the file
+        ignore_sub_categories - whether to return the base type instead of the beta and test types
+
+    Returns:
+        the file type, or None if it could not be decided without loading the file
+    """
+    path = str(path)
+    parts = Path(path).parts
+    if not path.endswith('.yml') or PACKS_DIR not in parts:
+        return None
+
+    pack_dir_index = len(parts) - 1 - parts[::-1].index(PACKS_DIR)
+    if len(parts) < pack_dir_index + 4:
+        return None
+
+    expected_types = YML_TYPES_BY_ENTITY_DIR.get(parts[pack_dir_index + 2])
+    if not expected_types:
+        return None
+
+    try:
+        with open(path, encoding='utf8') as yml_file:
+            content = yml_file.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    keys = {key or merge_key for key, merge_key in YML_TYPE_KEYS_REGEX.findall(content)}
+    if not keys or keys.intersection({'beta', '<<'}):
+        return None
+
+    file_type = find_yml_type(path, dict.fromkeys(keys), ignore_sub_categories)
+    return file_type if file_type in expected_types else None
+
+
 # flake8: noqa: C901
 
 
@@ -1137,8 +1531,15 @@ def find_type(path: str = '', _dict=None, file_type: Optional[str] = None, ignor
     type_by_path = find_type_by_path(path)
     if type_by_path:
         return type_by_path
+
+    if not _dict and not file_type:
+        type_by_layout = find_yml_type_by_layout(path, ignore_sub_categories)
+        if type_by_layout:
+            return type_by_layout
+
     try:
         if not _dict and not file_type:
+            # loaded through the parsed files cache, so the validation of the file does not load it again
             _dict, file_type = get_dict_from_file(path)
 
     except FileNotFoundError:
@@ -1146,23 +1547,7 @@ def find_type(path: str = '', _dict=None, file_type: Optional[str] = None, ignor
         return None
 
     if file_type == 'yml':
-        if 'category' in _dict:
-            if _dict.get('beta') and not ignore_sub_categories:
-                return FileType.BETA_INTEGRATION
-
-            return FileType.INTEGRATION
-
-        if 'script' in _dict:
-            if TEST_PLAYBOOKS_DIR in Path(path).parts and not ignore_sub_categories:
-                return FileType.TEST_SCRIPT
-
-            return FileType.SCRIPT
-
-        if 'tasks' in _dict:
-            if TEST_PLAYBOOKS_DIR in Path(path).parts:
-                return FileType.TEST_PLAYBOOK
-
-            return FileType.PLAYBOOK
+        return find_yml_type(path, _dict, ignore_sub_categories)
 
     if file_type == 'json':
         if 'widgetType' in _dict:
@@ -1266,6 +1651,8 @@ def is_external_repository() -> bool:
     Returns True if script executed from private repository
 
     """
+    import git
+
     try:
         git_repo = git.Repo(os.getcwd(), search_parent_directories=True)
         private_settings_path = os.path.join(git_repo.working_dir, '.private-repo-settings')
@@ -1276,6 +1663,8 @@ def is_external_repository() -> bool:
 
 def get_content_id_set() -> dict:
     """Getting the ID Set from official content's bucket"""
+    import requests
+
     return requests.get(OFFICIAL_CONTENT_ID_SET_PATH).json()
 
 
@@ -1284,6 +1673,8 @@ def get_content_path() -> str:
     Returns:
         str: Absolute content path
     """
+    import git
+
     try:
         git_repo = git.Repo(os.getcwd(), search_parent_directories=True)
         remote_url = git_repo.remote().urls.__next__()
@@ -1364,6 +1755,8 @@ def get_last_release_version():
 
     :return: tag
     """
+    from distutils.version import LooseVersion
+
     tags = run_command('git tag').split('\n')
     tags = [tag for tag in tags if re.match(r'\d+\.\d+\.\d+', tag) is not None]
     tags.sort(key=LooseVersion, reverse=True)
@@ -1379,6 +1772,8 @@ def is_file_from_content_repo(file_path: str) -> Tuple[bool, str]:
         bool: if file is part of content repo.
         str: relative path of file in content repo.
     """
+    import git
+
     try:
         git_repo = git.Repo(os.getcwd(),
                             search_parent_directories=True)
@@ -1684,7 +2079,7 @@ def open_id_set_file(id_set_path):
         return id_set
 
 
-def get_demisto_version(demisto_client: demisto_client) -> str:
+def get_demisto_version(demisto_client: 'demisto_client') -> str:
     """
     Args:
         demisto_client: A configured demisto_client instance
@@ -1893,6 +2288,8 @@ def compare_context_path_in_yml_and_readme(yml_dict, readme_content):
 
 
 def write_yml(yml_path: str, yml_data: Dict):
+    from ruamel.yaml import YAML
+
     ryaml = YAML()
     ryaml.allow_duplicate_keys = True
     ryaml.preserve_quotes = True
@@ -2160,6 +2557,9 @@ def get_script_or_sub_playbook_tasks_from_playbook(searched_entity_name: str, ma
 
 
 def get_current_repo() -> Tuple[str, str, str]:
+    import git
+    import giturlparse
+
     try:
         git_repo = git.Repo(os.getcwd(), search_parent_directories=True)
         parsed_git = giturlparse.parse(git_repo.remotes.origin.url)
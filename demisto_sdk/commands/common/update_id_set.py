@@ -26,6 +26,9 @@ from demisto_sdk.commands.common.constants import (
     LAYOUTS_DIR, LISTS_DIR, MAPPERS_DIR, MP_V2_ID_SET_PATH, REPORTS_DIR,
     SCRIPTS_DIR, TEST_PLAYBOOKS_DIR, WIDGETS_DIR, FileType,
     MarketplaceVersions)
+from demisto_sdk.commands.common.id_set_manifest import (
+    IDSetManifest, get_id_set_manifest_path)
+from demisto_sdk.commands.common.id_set_producer import IDSetProducer
 from demisto_sdk.commands.common.tools import (
     LOG_COLORS, find_type, get_current_repo, get_file, get_json,
     get_mp_types_from_metadata_by_item, get_pack_name, get_yaml, print_color,
@@ -1599,10 +1602,11 @@ def merge_id_sets(first_id_set_dict: dict, second_id_set_dict: dict, print_logs:
         subset = first_id_set.get_list(object_type)
 
         if object_type != "Packs":
+            subset_index = build_id_set_index(subset)
             for obj in object_list:
                 obj_id = list(obj.keys())[0]
                 is_duplicate = has_duplicate(subset, obj_id, object_type, print_logs,
-                                             external_object=obj, is_create_new=False)
+                                             external_object=obj, is_create_new=False, id_set_index=subset_index)
                 if is_duplicate:
                     duplicates.append(obj_id)
                 else:
@@ -1620,7 +1624,7 @@ def merge_id_sets(first_id_set_dict: dict, second_id_set_dict: dict, print_logs:
 
 def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_create=None,  # noqa : C901
                      objects_to_create: list = None, print_logs: bool = True, fail_on_duplicates: bool = False,
-                     marketplace: str = 'xsoar'):
+                     marketplace: str = 'xsoar', incremental: bool = False):
     """Re create the id-set
 
     Args:
@@ -1632,6 +1636,8 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_c
         fail_on_duplicates: If value is True an error will be raised if duplicates are found
         marketplace: The marketplace the id set is created for.
         print_logs: Whether to print logs or not
+        incremental: Whether to only re-process the files which were changed since the previous run, using the
+        manifest saved next to the id-set. Can also be enabled with the DEMISTO_SDK_ID_SET_INCREMENTAL env var.
 
     Returns: id-set object
     """
@@ -1685,361 +1691,304 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_c
         print("")  # add an empty line for clarity
 
     start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
-
-    classifiers_list = []
-    dashboards_list = []
-    incident_fields_list = []
-    incident_type_list = []
-    indicator_fields_list = []
-    indicator_types_list = []
-    layouts_list = []
-    reports_list = []
-    widgets_list = []
-    mappers_list = []
-    generic_types_list = []
-    generic_fields_list = []
-    generic_modules_list = []
-    generic_definitions_list = []
-    lists_list = []
-    jobs_list = []
+    scripts_list: List[Dict] = []
+    playbooks_list: List[Dict] = []
+    integration_list: List[Dict] = []
+    testplaybooks_list: List[Dict] = []
+
+    classifiers_list: List[Dict] = []
+    dashboards_list: List[Dict] = []
+    incident_fields_list: List[Dict] = []
+    incident_type_list: List[Dict] = []
+    indicator_fields_list: List[Dict] = []
+    indicator_types_list: List[Dict] = []
+    layouts_list: List[Dict] = []
+    reports_list: List[Dict] = []
+    widgets_list: List[Dict] = []
+    mappers_list: List[Dict] = []
+    generic_types_list: List[Dict] = []
+    generic_fields_list: List[Dict] = []
+    generic_modules_list: List[Dict] = []
+    generic_definitions_list: List[Dict] = []
+    lists_list: List[Dict] = []
+    jobs_list: List[Dict] = []
     packs_dict: Dict[str, Dict] = {}
 
-    pool = Pool(processes=int(cpu_count()))
+    processes = int(cpu_count())
+    pool = Pool(processes=processes)
+
+    manifest = None
+    if id_set_path and (incremental or os.getenv('DEMISTO_SDK_ID_SET_INCREMENTAL', '').lower() in ('1', 'true')):
+        manifest = IDSetManifest(get_id_set_manifest_path(id_set_path), fingerprint={
+            'marketplace': marketplace,
+            'source': list(get_current_repo()),
+            'extractor': IDSetManifest.context_digest(Path(__file__).read_text()),
+        })
+
+    producer = IDSetProducer(pool, processes=processes, manifest=manifest)
 
     print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
 
     with click.progressbar(length=len(objects_to_create), label="Creating id-set") as progress_bar:
 
+        def on_section_done(section: str):
+            if section in (objects_to_create or []):
+                progress_bar.update(1)
+
+        # The files of all the content types are processed in a single pass over the pool.
+        # Content types which depend on other content types are processed in a second pass.
         if 'Packs' in objects_to_create:
             print_color("\nStarting iteration over Packs", LOG_COLORS.GREEN)
-            for pack_data in pool.map(partial(get_pack_metadata_data,
-                                              print_logs=print_logs,
-                                              marketplace=marketplace,
-                                              ),
-                                      get_pack_metadata_paths(pack_to_create)):
-                packs_dict.update(pack_data)
-
-        progress_bar.update(1)
+            producer.add('Packs', partial(get_pack_metadata_data,
+                                          print_logs=print_logs,
+                                          marketplace=marketplace,
+                                          ),
+                         get_pack_metadata_paths(pack_to_create))
 
         if 'Integrations' in objects_to_create:
             print_color("\nStarting iteration over Integrations", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_integration,
-                                        print_logs=print_logs,
-                                        marketplace=marketplace,
-                                        ),
-                                get_integrations_paths(pack_to_create)):
-
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('integrations', []).append(_id)
-                integration_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Integrations', partial(process_integration,
+                                                 print_logs=print_logs,
+                                                 marketplace=marketplace,
+                                                 ),
+                         get_integrations_paths(pack_to_create))
 
         if 'Playbooks' in objects_to_create:
             print_color("\nStarting iteration over Playbooks", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.PLAYBOOK,),
-                                        data_extraction_func=get_playbook_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_playbooks_paths(pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('playbooks', []).append(_id)
-                playbooks_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Playbooks', partial(process_general_items,
+                                              print_logs=print_logs,
+                                              expected_file_types=(FileType.PLAYBOOK,),
+                                              data_extraction_func=get_playbook_data,
+                                              marketplace=marketplace,
+                                              ),
+                         get_playbooks_paths(pack_to_create))
 
         if 'Scripts' in objects_to_create:
             print_color("\nStarting iteration over Scripts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_script,
-                                        print_logs=print_logs,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(SCRIPTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('scripts', []).append(_id)
-                scripts_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Scripts', partial(process_script,
+                                            print_logs=print_logs,
+                                            marketplace=marketplace,
+                                            ),
+                         get_general_paths(SCRIPTS_DIR, pack_to_create))
 
         if 'TestPlaybooks' in objects_to_create:
             print_color("\nStarting iteration over TestPlaybooks", LOG_COLORS.GREEN)
-            for pair in pool.map(partial(process_test_playbook_path,
-                                         print_logs=print_logs,
-                                         marketplace=marketplace,
-                                         ),
-                                 get_general_paths(TEST_PLAYBOOKS_DIR, pack_to_create)):
-                if pair[0]:
-                    testplaybooks_list.append(pair[0])
-                if pair[1]:
-                    scripts_list.append(pair[1])
-
-        progress_bar.update(1)
+            producer.add('TestPlaybooks', partial(process_test_playbook_path,
+                                                  print_logs=print_logs,
+                                                  marketplace=marketplace,
+                                                  ),
+                         get_general_paths(TEST_PLAYBOOKS_DIR, pack_to_create))
 
         if 'Classifiers' in objects_to_create:
             print_color("\nStarting iteration over Classifiers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
-                                        data_extraction_func=get_classifier_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(CLASSIFIERS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('classifiers', []).append(_id)
-                classifiers_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Classifiers', partial(process_general_items,
+                                                print_logs=print_logs,
+                                                expected_file_types=(FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
+                                                data_extraction_func=get_classifier_data,
+                                                marketplace=marketplace,
+                                                ),
+                         get_general_paths(CLASSIFIERS_DIR, pack_to_create))
 
         if 'Dashboards' in objects_to_create:
             print_color("\nStarting iteration over Dashboards", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.DASHBOARD,),
-                                        data_extraction_func=get_dashboard_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(DASHBOARDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('dashboards', []).append(_id)
-                dashboards_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Dashboards', partial(process_general_items,
+                                               print_logs=print_logs,
+                                               expected_file_types=(FileType.DASHBOARD,),
+                                               data_extraction_func=get_dashboard_data,
+                                               marketplace=marketplace,
+                                               ),
+                         get_general_paths(DASHBOARDS_DIR, pack_to_create))
 
         if 'IncidentTypes' in objects_to_create:
             print_color("\nStarting iteration over Incident Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.INCIDENT_TYPE,),
-                                        data_extraction_func=get_incident_type_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(INCIDENT_TYPES_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('incidentTypes', []).append(_id)
-                incident_type_list.extend(arr)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'IncidentTypes' is called
-        if 'IncidentFields' in objects_to_create:
-            print_color("\nStarting iteration over Incident Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_incident_fields,
-                                        print_logs=print_logs,
-                                        incidents_types_list=incident_type_list,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(INCIDENT_FIELDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('incidentFields', []).append(_id)
-                incident_fields_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('IncidentTypes', partial(process_general_items,
+                                                  print_logs=print_logs,
+                                                  expected_file_types=(FileType.INCIDENT_TYPE,),
+                                                  data_extraction_func=get_incident_type_data,
+                                                  marketplace=marketplace,
+                                                  ),
+                         get_general_paths(INCIDENT_TYPES_DIR, pack_to_create))
 
         if 'IndicatorFields' in objects_to_create:
             print_color("\nStarting iteration over Indicator Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.INDICATOR_FIELD,),
-                                        data_extraction_func=get_general_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(INDICATOR_FIELDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('indicatorFields', []).append(_id)
-                indicator_fields_list.extend(arr)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'Integrations' is called
-        if 'IndicatorTypes' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_indicator_types,
-                                        print_logs=print_logs,
-                                        all_integrations=integration_list,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(INDICATOR_TYPES_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('indicatorTypes', []).append(_id)
-                indicator_types_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('IndicatorFields', partial(process_general_items,
+                                                    print_logs=print_logs,
+                                                    expected_file_types=(FileType.INDICATOR_FIELD,),
+                                                    data_extraction_func=get_general_data,
+                                                    marketplace=marketplace,
+                                                    ),
+                         get_general_paths(INDICATOR_FIELDS_DIR, pack_to_create))
 
         if 'Layouts' in objects_to_create:
             print_color("\nStarting iteration over Layouts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.LAYOUT,),
-                                        data_extraction_func=get_layout_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(LAYOUTS_DIR, pack_to_create)):
-                layouts_list.extend(arr)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.LAYOUTS_CONTAINER,),
-                                        data_extraction_func=get_layoutscontainer_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(LAYOUTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('layouts', []).append(_id)
-                layouts_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Layouts', partial(process_general_items,
+                                            print_logs=print_logs,
+                                            expected_file_types=(FileType.LAYOUT,),
+                                            data_extraction_func=get_layout_data,
+                                            marketplace=marketplace,
+                                            ),
+                         get_general_paths(LAYOUTS_DIR, pack_to_create))
+            producer.add('LayoutsContainers', partial(process_general_items,
+                                                      print_logs=print_logs,
+                                                      expected_file_types=(FileType.LAYOUTS_CONTAINER,),
+                                                      data_extraction_func=get_layoutscontainer_data,
+                                                      marketplace=marketplace,
+                                                      ),
+                         get_general_paths(LAYOUTS_DIR, pack_to_create))
 
         if 'Reports' in objects_to_create:
             print_color("\nStarting iteration over Reports", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.REPORT,),
-                                        data_extraction_func=get_report_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(REPORTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('reports', []).append(_id)
-                reports_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Reports', partial(process_general_items,
+                                            print_logs=print_logs,
+                                            expected_file_types=(FileType.REPORT,),
+                                            data_extraction_func=get_report_data,
+                                            marketplace=marketplace,
+                                            ),
+                         get_general_paths(REPORTS_DIR, pack_to_create))
 
         if 'Widgets' in objects_to_create:
             print_color("\nStarting iteration over Widgets", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.WIDGET,),
-                                        data_extraction_func=get_widget_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(WIDGETS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('widgets', []).append(_id)
-                widgets_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Widgets', partial(process_general_items,
+                                            print_logs=print_logs,
+                                            expected_file_types=(FileType.WIDGET,),
+                                            data_extraction_func=get_widget_data,
+                                            marketplace=marketplace,
+                                            ),
+                         get_general_paths(WIDGETS_DIR, pack_to_create))
 
         if 'Mappers' in objects_to_create:
             print_color("\nStarting iteration over Mappers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.MAPPER,),
-                                        data_extraction_func=get_mapper_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(MAPPERS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('mappers', []).append(_id)
-                mappers_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Mappers', partial(process_general_items,
+                                            print_logs=print_logs,
+                                            expected_file_types=(FileType.MAPPER,),
+                                            data_extraction_func=get_mapper_data,
+                                            marketplace=marketplace,
+                                            ),
+                         get_general_paths(MAPPERS_DIR, pack_to_create))
 
         if 'Lists' in objects_to_create:
             print_color("\nStarting iteration over Lists", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.LISTS,),
-                                        data_extraction_func=get_list_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(LISTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('lists', []).append(_id)
-                lists_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('Lists', partial(process_general_items,
+                                          print_logs=print_logs,
+                                          expected_file_types=(FileType.LISTS,),
+                                          data_extraction_func=get_list_data,
+                                          marketplace=marketplace,
+                                          ),
+                         get_general_paths(LISTS_DIR, pack_to_create))
 
         if 'GenericDefinitions' in objects_to_create:
             print_color("\nStarting iteration over Generic Definitions", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        expected_file_types=(FileType.GENERIC_DEFINITION,),
-                                        data_extraction_func=get_general_data,
-                                        print_logs=print_logs,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(GENERIC_DEFINITIONS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericDefinitions', []).append(_id)
-                generic_definitions_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('GenericDefinitions', partial(process_general_items,
+                                                       expected_file_types=(FileType.GENERIC_DEFINITION,),
+                                                       data_extraction_func=get_general_data,
+                                                       print_logs=print_logs,
+                                                       marketplace=marketplace,
+                                                       ),
+                         get_general_paths(GENERIC_DEFINITIONS_DIR, pack_to_create))
 
         if 'GenericModules' in objects_to_create:
             print_color("\nStarting iteration over Generic Modules", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.GENERIC_MODULE,),
-                                        data_extraction_func=get_generic_module_data,
-                                        marketplace=marketplace,
-                                        ),
-                                get_general_paths(GENERIC_MODULES_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericModules', []).append(_id)
-                generic_modules_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('GenericModules', partial(process_general_items,
+                                                   print_logs=print_logs,
+                                                   expected_file_types=(FileType.GENERIC_MODULE,),
+                                                   data_extraction_func=get_generic_module_data,
+                                                   marketplace=marketplace,
+                                                   ),
+                         get_general_paths(GENERIC_MODULES_DIR, pack_to_create))
 
         if 'GenericTypes' in objects_to_create:
             print_color("\nStarting iteration over Generic Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_generic_items,
-                                        print_logs=print_logs,
-                                        marketplace=marketplace,
-                                        ),
-                                get_generic_entities_paths(GENERIC_TYPES_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericTypes', []).append(_id)
-                generic_types_list.extend(arr)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'GenericTypes' is called
-        if 'GenericFields' in objects_to_create:
-            print_color("\nStarting iteration over Generic Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_generic_items,
-                                        print_logs=print_logs,
-                                        generic_types_list=generic_types_list,
-                                        marketplace=marketplace,
-                                        ),
-                                get_generic_entities_paths(GENERIC_FIELDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericFields', []).append(_id)
-                generic_fields_list.extend(arr)
-
-        progress_bar.update(1)
+            producer.add('GenericTypes', partial(process_generic_items,
+                                                 print_logs=print_logs,
+                                                 marketplace=marketplace,
+                                                 ),
+                         get_generic_entities_paths(GENERIC_TYPES_DIR, pack_to_create))
 
         if 'Jobs' in objects_to_create:
             print_color("\nStarting iteration over Jobs", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_jobs, print_logs=print_logs, marketplace=marketplace, ),
-                                get_general_paths(JOBS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('jobs', []).append(_id)
-                jobs_list.extend(arr)
+            producer.add('Jobs', partial(process_jobs, print_logs=print_logs, marketplace=marketplace, ),
+                         get_general_paths(JOBS_DIR, pack_to_create))
 
-        progress_bar.update(1)
+        producer.run(on_section_done)
+
+        # Has to be processed after 'IncidentTypes' is processed
+        if 'IncidentFields' in objects_to_create:
+            print_color("\nStarting iteration over Incident Fields", LOG_COLORS.GREEN)
+            incident_types = producer.items('IncidentTypes')
+            producer.add('IncidentFields', partial(process_incident_fields,
+                                                   print_logs=print_logs,
+                                                   incidents_types_list=incident_types,
+                                                   marketplace=marketplace,
+                                                   ),
+                         get_general_paths(INCIDENT_FIELDS_DIR, pack_to_create),
+                         context=[next(iter(incident_type)) for incident_type in incident_types])
+
+        # Has to be processed after 'Integrations' is processed
+        if 'IndicatorTypes' in objects_to_create:
+            print_color("\nStarting iteration over Indicator Types", LOG_COLORS.GREEN)
+            integrations = producer.items('Integrations')
+            producer.add('IndicatorTypes', partial(process_indicator_types,
+                                                   print_logs=print_logs,
+                                                   all_integrations=integrations,
+                                                   marketplace=marketplace,
+                                                   ),
+                         get_general_paths(INDICATOR_TYPES_DIR, pack_to_create),
+                         context=[(next(iter(integration)), next(iter(integration.values())).get('commands'))
+                                  for integration in integrations])
+
+        # Has to be processed after 'GenericTypes' is processed
+        if 'GenericFields' in objects_to_create:
+            print_color("\nStarting iteration over Generic Fields", LOG_COLORS.GREEN)
+            generic_types = producer.items('GenericTypes')
+            producer.add('GenericFields', partial(process_generic_items,
+                                                  print_logs=print_logs,
+                                                  generic_types_list=generic_types,
+                                                  marketplace=marketplace,
+                                                  ),
+                         get_generic_entities_paths(GENERIC_FIELDS_DIR, pack_to_create),
+                         context=[next(iter(generic_type)) for generic_type in generic_types])
+
+        producer.run(on_section_done)
+
+    pool.close()
+    pool.join()
+
+    def add_section_items(section: str, items_list: list, content_items_key: Optional[str] = None):
+        """Adds the processed items of the section to its list and to the ContentItems of their packs."""
+        for arr in producer.results(section):
+            for _id, data in (arr[0].items() if arr and isinstance(arr, list) and content_items_key else {}):
+                if data.get('pack'):
+                    packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault(content_items_key, []).append(_id)
+            items_list.extend(arr)
+
+    # the results are added in the content types order, so the id_set does not depend on the processing order
+    for pack_data in producer.results('Packs'):
+        packs_dict.update(pack_data)
+    add_section_items('Integrations', integration_list, 'integrations')
+    add_section_items('Playbooks', playbooks_list, 'playbooks')
+    add_section_items('Scripts', scripts_list, 'scripts')
+    for pair in producer.results('TestPlaybooks'):
+        if pair[0]:
+            testplaybooks_list.append(pair[0])
+        if pair[1]:
+            scripts_list.append(pair[1])
+    add_section_items('Classifiers', classifiers_list, 'classifiers')
+    add_section_items('Dashboards', dashboards_list, 'dashboards')
+    add_section_items('IncidentTypes', incident_type_list, 'incidentTypes')
+    add_section_items('IncidentFields', incident_fields_list, 'incidentFields')
+    add_section_items('IndicatorFields', indicator_fields_list, 'indicatorFields')
+    add_section_items('IndicatorTypes', indicator_types_list, 'indicatorTypes')
+    add_section_items('Layouts', layouts_list)
+    add_section_items('LayoutsContainers', layouts_list, 'layouts')
+    add_section_items('Reports', reports_list, 'reports')
+    add_section_items('Widgets', widgets_list, 'widgets')
+    add_section_items('Mappers', mappers_list, 'mappers')
+    add_section_items('Lists', lists_list, 'lists')
+    add_section_items('GenericDefinitions', generic_definitions_list, 'genericDefinitions')
+    add_section_items('GenericModules', generic_modules_list, 'genericModules')
+    add_section_items('GenericTypes', generic_types_list, 'genericTypes')
+    add_section_items('GenericFields', generic_fields_list, 'genericFields')
+    add_section_items('Jobs', jobs_list, 'jobs')
 
     new_ids_dict = OrderedDict()
     # we sort each time the whole set in case someone manually changed something
@@ -2080,6 +2029,11 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_c
 
     exec_time = time.time() - start_time
     print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
+    print_color(producer.report(), LOG_COLORS.GREEN)
+    if manifest:
+        manifest.save()
+        print_color(f"Re-processed {manifest.misses} changed items, reused {manifest.hits} items from the id_set "
+                    f"manifest {manifest.manifest_path}", LOG_COLORS.GREEN)
     duplicates = find_duplicates(new_ids_dict, print_logs, marketplace)
     if any(duplicates) and fail_on_duplicates:
         raise Exception(f'The following ids were found duplicates\n{json.dumps(duplicates, indent=4)}\n')
@@ -2096,29 +2050,50 @@ def find_duplicates(id_set, print_logs, marketplace):
         if print_logs:
             print_color("Checking diff for {}".format(object_type), LOG_COLORS.GREEN)
         objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
+        id_set_index = build_id_set_index(objects)
 
         dup_list = []
-        for id_to_check in ids:
-            if has_duplicate(objects, id_to_check, object_type, print_logs, is_create_new=True):
+        for id_to_check, items in id_set_index.items():
+            if len(items) > 1 and has_duplicate(objects, id_to_check, object_type, print_logs, is_create_new=True,
+                                                id_set_index=id_set_index):
                 dup_list.append(id_to_check)
         lists_to_return.append(dup_list)
     if print_logs:
         print_color("Checking diff for Incident and Indicator Fields", LOG_COLORS.GREEN)
 
     fields = id_set['IncidentFields'] + id_set['IndicatorFields']
-    field_ids = {list(field.keys())[0] for field in fields}
+    fields_index = build_id_set_index(fields)
 
     field_list = []
-    for field_to_check in field_ids:
-        if has_duplicate(fields, field_to_check, 'Indicator and Incident Fields', print_logs, is_create_new=True):
+    for field_to_check, items in fields_index.items():
+        if len(items) > 1 and has_duplicate(fields, field_to_check, 'Indicator and Incident Fields', print_logs,
+                                            is_create_new=True, id_set_index=fields_index):
             field_list.append(field_to_check)
     lists_to_return.append(field_list)
 
     return lists_to_return
 
 
-def has_duplicate(id_set_subset_list, id_to_check, object_type=None, print_logs=True, external_object=None, is_create_new=False):
+def build_id_set_index(id_set_subset_list: list) -> Dict[str, list]:
+    """
+    Builds an index of the given id_set section in a single pass.
+
+    Args:
+        id_set_subset_list: an id_set section, e.g. id_set['scripts'].
+
+    Returns:
+        dict of item id -> list of the section items with that id (in their original order).
+    """
+    id_set_index: Dict[str, list] = {}
+    for item in id_set_subset_list:
+        for item_id, item_data in item.items():
+            if item_data:
+                id_set_index.setdefault(item_id, []).append(item)
+    return id_set_index
+
+
+def has_duplicate(id_set_subset_list, id_to_check, object_type=None, print_logs=True, external_object=None,
+                  is_create_new=False, id_set_index=None):
     """
     Finds if id_set_subset_list contains a duplicate items with the same id_to_check.
 
@@ -2127,8 +2102,13 @@ def has_duplicate(id_set_subset_list, id_to_check, object_type=None, print_logs=
 
     Pass `is_create_new` if searching for duplicate while creating a new id-set.
 
+    Pass `id_set_index` (see `build_id_set_index`) to avoid scanning `id_set_subset_list` when checking many ids.
+
     """
-    duplicates = [duplicate for duplicate in id_set_subset_list if duplicate.get(id_to_check)]
+    if id_set_index is not None:
+        duplicates = list(id_set_index.get(id_to_check, []))
+    else:
+        duplicates = [duplicate for duplicate in id_set_subset_list if duplicate.get(id_to_check)]
 
     if external_object and len(duplicates) == 0:
         return False
@@ -2139,13 +2119,59 @@ def has_duplicate(id_set_subset_list, id_to_check, object_type=None, print_logs=
     if external_object:
         duplicates.append(external_object)
 
-    for dup1, dup2 in itertools.combinations(duplicates, 2):
-        dict1 = list(dup1.values())[0]
-        dict2 = list(dup2.values())[0]
-        dict1_from_version = LooseVersion(dict1.get('fromversion', DEFAULT_CONTENT_ITEM_FROM_VERSION))
-        dict2_from_version = LooseVersion(dict2.get('fromversion', DEFAULT_CONTENT_ITEM_FROM_VERSION))
-        dict1_to_version = LooseVersion(dict1.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION))
-        dict2_to_version = LooseVersion(dict2.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION))
+    versioned_duplicates = [_get_item_version_range(duplicate) for duplicate in duplicates]
+
+    # Layouts and merged id-sets have extra rules per pair, only new id-sets can be checked with an interval sweep
+    if is_create_new and object_type != 'Layouts':
+        try:
+            return _has_overlapping_versions(versioned_duplicates, id_to_check, object_type, print_logs)
+        except TypeError:
+            # versions that can not be ordered (e.g. '5.0.0' and 'master'), fallback to comparing pairs
+            pass
+
+    return _has_overlapping_version_pairs(versioned_duplicates, id_to_check, object_type, print_logs, is_create_new)
+
+
+def _get_item_version_range(item: dict) -> Tuple[LooseVersion, LooseVersion, dict]:
+    item_data = list(item.values())[0]
+    return (LooseVersion(item_data.get('fromversion', DEFAULT_CONTENT_ITEM_FROM_VERSION)),
+            LooseVersion(item_data.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION)),
+            item_data)
+
+
+def _has_overlapping_versions(versioned_duplicates: list, id_to_check, object_type, print_logs) -> bool:
+    """
+    Checks whether any two of the items have overlapping version ranges, by sorting them by their from version and
+    comparing each item to the item with the latest to version seen so far.
+    """
+    if any(from_version >= to_version for from_version, to_version, _ in versioned_duplicates):
+        # empty or reversed ranges don't follow the interval semantics, compare every pair
+        return _has_overlapping_version_pairs(versioned_duplicates, id_to_check, object_type, print_logs,
+                                              is_create_new=True)
+
+    sorted_duplicates = sorted(versioned_duplicates, key=lambda versioned_item: versioned_item[0])
+    latest_ending = sorted_duplicates[0]
+    for current in sorted_duplicates[1:]:
+        if current[0] < latest_ending[1]:
+            print_warning(f'The following {object_type} have the same ID ({id_to_check}) and their versions overlap: '
+                          f'1) "{latest_ending[0]}-{latest_ending[1]}", '
+                          f'2) "{current[0]}-{current[1]}".')
+            return True
+        if current[1] > latest_ending[1]:
+            latest_ending = current
+
+    if print_logs:
+        for (_, _, dict1), (_, _, dict2) in itertools.combinations(versioned_duplicates, 2):
+            if dict1.get('name') != dict2.get('name'):
+                print_warning('The following {} have the same ID ({}) but different names: '
+                              '"{}", "{}".'.format(object_type, id_to_check, dict1.get('name'), dict2.get('name')))
+    return False
+
+
+def _has_overlapping_version_pairs(versioned_duplicates: list, id_to_check, object_type, print_logs,
+                                   is_create_new) -> bool:
+    for (dict1_from_version, dict1_to_version, dict1), (dict2_from_version, dict2_to_version, dict2) in \
+            itertools.combinations(versioned_duplicates, 2):
 
         # Checks if the Layouts kind is different then they are not duplicates
         if object_type == 'Layouts':
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import json
 import logging
 import os
 import re
@@ -27,7 +28,10 @@ from demisto_sdk.commands.common.content import (Content, ContentError,
 from demisto_sdk.commands.common.content.objects.pack_objects import (
     JSONContentObject, Script, TextObject, YAMLContentObject,
     YAMLContentUnifiedObject)
-from demisto_sdk.commands.common.tools import arg_to_list
+from demisto_sdk.commands.common.tools import (arg_to_list,
+                                               is_external_repository)
+from demisto_sdk.commands.find_dependencies.find_dependencies import (
+    IDSetIndex, PackDependencies, get_merged_official_and_local_id_set)
 
 from .artifacts_report import ArtifactsReport, ObjectReport
 
@@ -43,6 +47,9 @@ ContentObject = Union[YAMLContentUnifiedObject, YAMLContentObject, JSONContentOb
 logger = logging.getLogger('demisto-sdk')
 EX_SUCCESS = 0
 EX_FAIL = 1
+# Indexed id_set of each id_set path, loaded once per process. It is loaded before the pool is created, so the pool
+# workers inherit it (with the packs dependencies already calculated) instead of loading the id_set for each pack.
+ID_SET_INDEXES: Dict[str, IDSetIndex] = {}
 
 
 ##############
@@ -98,21 +105,24 @@ class ArtifactsManager:
         self.exit_code = EX_SUCCESS
 
     def create_content_artifacts(self) -> int:
-        with ArtifactsDirsHandler(self), ProcessPoolHandler(self) as pool:
-            futures: List[ProcessFuture] = []
-            # content/Packs
-            futures.extend(dump_packs(self, pool))
-            # content/TestPlaybooks
-            if not self.remove_test_playbooks:
-                futures.append(pool.schedule(dump_tests_conditionally, args=(self,)))
-            # content/content-descriptor.json
-            futures.append(pool.schedule(dump_content_descriptor, args=(self,)))
-            # content/Documentation/doc-*.json
-            futures.append(pool.schedule(dump_content_documentations, args=(self,)))
-            # Wait for all futures to be finished
-            wait_futures_complete(futures, self)
-            # Add suffix
-            suffix_handler(self)
+        with ArtifactsDirsHandler(self):
+            # Must be done before the pool is created, so its workers inherit the calculated dependencies
+            calculate_packs_dependencies(self)
+            with ProcessPoolHandler(self) as pool:
+                futures: List[ProcessFuture] = []
+                # content/Packs
+                futures.extend(dump_packs(self, pool))
+                # content/TestPlaybooks
+                if not self.remove_test_playbooks:
+                    futures.append(pool.schedule(dump_tests_conditionally, args=(self,)))
+                # content/content-descriptor.json
+                futures.append(pool.schedule(dump_content_descriptor, args=(self,)))
+                # content/Documentation/doc-*.json
+                futures.append(pool.schedule(dump_content_documentations, args=(self,)))
+                # Wait for all futures to be finished
+                wait_futures_complete(futures, self)
+                # Add suffix
+                suffix_handler(self)
 
         if os.path.exists('keyfile'):
             os.remove('keyfile')
@@ -576,6 +586,22 @@ def dump_tests_conditionally(artifact_manager: ArtifactsManager) -> ArtifactsRep
 # Content packs functions #
 ###########################
 
+def get_packs_to_dump(artifact_manager: ArtifactsManager) -> List[Pack]:
+    """ Get the packs which should be dumped into content/Packs.
+
+    Args:
+        artifact_manager: Artifacts manager object.
+
+    Returns:
+        List[Pack]: The packs to dump.
+    """
+    if 'all' in artifact_manager.pack_names:
+        return [pack for pack_name, pack in artifact_manager.packs.items() if pack_name not in IGNORED_PACKS]
+
+    return [artifact_manager.packs[pack_name] for pack_name in artifact_manager.pack_names
+            if pack_name not in IGNORED_PACKS and pack_name in artifact_manager.packs]
+
+
 def dump_packs(artifact_manager: ArtifactsManager, pool: ProcessPool) -> List[ProcessFuture]:
     """ Create futures which dumps conditionally content/Packs.
 
@@ -586,20 +612,50 @@ def dump_packs(artifact_manager: ArtifactsManager, pool: ProcessPool) -> List[Pr
     Returns:
         List[ProcessFuture]: List of pebble futures to wait for.
     """
-    futures = []
-    if 'all' in artifact_manager.pack_names:
-        for pack_name, pack in artifact_manager.packs.items():
-            if pack_name not in IGNORED_PACKS:
-                futures.append(pool.schedule(dump_pack, args=(artifact_manager, pack)))
+    return [pool.schedule(dump_pack, args=(artifact_manager, pack)) for pack in get_packs_to_dump(artifact_manager)]
 
-    else:
-        for pack_name in artifact_manager.pack_names:
-            if pack_name not in IGNORED_PACKS and pack_name in artifact_manager.packs:
-                futures.append(pool.schedule(dump_pack,
-                                             args=(artifact_manager, artifact_manager.packs[pack_name])
-                                             ))
 
-    return futures
+def get_id_set_index(id_set_path: str) -> Optional[IDSetIndex]:
+    """ Load and index the id_set once per process. In a private repository, the id_set is merged with the official
+    content id_set.
+
+    Args:
+        id_set_path: The id_set file path.
+
+    Returns:
+        IDSetIndex: The indexed id_set, None if the id_set file does not exist.
+    """
+    if id_set_path not in ID_SET_INDEXES:
+        if not os.path.isfile(id_set_path):
+            return None
+        with open(id_set_path, 'r') as id_set_file:
+            id_set = json.load(id_set_file)
+        if is_external_repository():
+            logger.info('Running in a private repository, will download the id set from official content')
+            id_set = get_merged_official_and_local_id_set(id_set, silent_mode=True)
+        ID_SET_INDEXES[id_set_path] = IDSetIndex(id_set)
+    return ID_SET_INDEXES[id_set_path]
+
+
+def calculate_packs_dependencies(artifact_manager: ArtifactsManager):
+    """ Load the id_set and calculate the first level dependencies of the dumped packs once, in parallel.
+    Each dumped pack then only walks its dependencies graph over the calculated dependencies.
+
+    Args:
+        artifact_manager: Artifacts manager object.
+    """
+    if not artifact_manager.id_set_path:
+        return
+    try:
+        # The id_set may have changed since a previous run in this process
+        ID_SET_INDEXES.pop(artifact_manager.id_set_path, None)
+        id_set = get_id_set_index(artifact_manager.id_set_path)
+        if id_set is not None:
+            pack_ids = [pack.path.name for pack in get_packs_to_dump(artifact_manager)]
+            PackDependencies.build_all_dependencies_graph(pack_ids, id_set, workers=artifact_manager.cpus)
+    except Exception as e:
+        logger.exception(e)
+        raise
 
 
 def dump_pack(artifact_manager: ArtifactsManager, pack: Pack) -> ArtifactsReport:  # noqa: C901
@@ -725,7 +781,8 @@ def dump_pack(artifact_manager: ArtifactsManager, pack: Pack) -> ArtifactsReport
         pack.metadata.server_min_version = pack.metadata.server_min_version or content_items_handler.server_min_version
         if artifact_manager.id_set_path:
             # Dependencies can only be done when id_set file is given.
-            pack.metadata.handle_dependencies(pack.path.name, artifact_manager.id_set_path, logger)
+            pack.metadata.handle_dependencies(pack.path.name, artifact_manager.id_set_path, logger,
+                                              id_set=get_id_set_index(artifact_manager.id_set_path))
         else:
             logger.warning('Skipping dependencies extraction since no id_set file was provided.')
         if is_feed_pack and 'TIM' not in pack.metadata.tags:
@@ -173,6 +173,56 @@ def test_dump_pack(mock_git):
                             src2=ARTIFACTS_EXPECTED_RESULTS / 'content' / 'content_packs' / 'Sample01')
 
 
+def test_dump_pack__precalculated_dependencies(mock_git, mocker):
+    """
+    Given
+    - An id_set in which a script of Sample01 depends on a script of Sample02.
+
+    When
+    - Calculating the packs dependencies of the run, and then dumping Sample01.
+
+    Then
+    - Ensure the dependency is added to the dumped pack metadata.
+    - Ensure the id_set is not loaded again and the dependencies are not calculated again for the pack.
+    """
+    import json
+
+    import demisto_sdk.commands.create_artifacts.content_artifacts_creator as cca
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager, Pack, calculate_packs_dependencies, create_dirs,
+        dump_pack)
+    from demisto_sdk.commands.find_dependencies.find_dependencies import (
+        PACK_ITEMS_ID_SET_SECTIONS, IDSetIndex, PackDependencies)
+
+    cca.logger = logging_setup(0)
+    mocker.patch.object(cca, 'is_external_repository', return_value=False)
+    id_set = {section_name: [] for _, section_name in PACK_ITEMS_ID_SET_SECTIONS}
+    id_set['scripts'] = [{'ScriptA': {'name': 'ScriptA', 'pack': 'Sample01', 'depends_on': ['ScriptB']}},
+                         {'ScriptB': {'name': 'ScriptB', 'pack': 'Sample02'}}]
+
+    with temp_dir() as temp:
+        id_set_path = temp / 'id_set.json'
+        id_set_path.write_text(json.dumps(id_set))
+        config = ArtifactsManager(artifacts_path=temp / 'artifacts',
+                                  content_version='6.0.0',
+                                  zip=False,
+                                  suffix='',
+                                  cpus=1,
+                                  packs=False,
+                                  id_set_path=str(id_set_path))
+        create_dirs(artifact_manager=config)
+        calculate_packs_dependencies(config)
+
+        index_spy = mocker.spy(IDSetIndex, '__init__')
+        collect_spy = mocker.spy(PackDependencies, '_collect_pack_items')
+        dump_pack(artifact_manager=config, pack=Pack(TEST_CONTENT_REPO / PACKS_DIR / 'Sample01'))
+
+        metadata = json.loads((temp / 'artifacts' / 'content_packs' / 'Sample01' / 'metadata.json').read_text())
+        assert 'Sample02' in metadata['dependencies']
+        assert not index_spy.called
+        assert not collect_spy.called
+
+
 def test_contains_indicator_type():
     """
     Given
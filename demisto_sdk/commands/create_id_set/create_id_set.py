@@ -15,7 +15,7 @@ from demisto_sdk.commands.common.update_id_set import re_create_id_set
 class IDSetCreator:
 
     def __init__(self, output: Optional[str] = '', input: Optional[str] = None, print_logs: bool = True,
-                 fail_duplicates: bool = False, marketplace: str = 'xsoar'):
+                 fail_duplicates: bool = False, marketplace: str = 'xsoar', incremental: bool = False):
         """IDSetCreator
 
         Args:
@@ -24,6 +24,8 @@ class IDSetCreator:
             print_logs (bool, optional): Print log output. Defaults to True.
             fail_duplicates(bool, optional): Flag which marks whether create_id_set fails when duplicates
              are found or not
+            incremental(bool, optional): Whether to only re-process the content items which were changed since the
+             previous run.
         """
         self.output = output
         self.input = input
@@ -31,6 +33,7 @@ class IDSetCreator:
         self.fail_duplicates = fail_duplicates
         self.id_set = OrderedDict()  # type: ignore
         self.marketplace = marketplace.lower()
+        self.incremental = incremental
 
     def create_id_set(self):
         self.id_set = re_create_id_set(
@@ -38,7 +41,8 @@ class IDSetCreator:
             pack_to_create=self.input,
             print_logs=self.print_logs,
             fail_on_duplicates=self.fail_duplicates,
-            marketplace=self.marketplace
+            marketplace=self.marketplace,
+            incremental=self.incremental,
         )
         self.add_command_to_implementing_integrations_mapping()
         self.save_id_set()
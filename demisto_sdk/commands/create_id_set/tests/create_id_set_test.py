@@ -197,6 +197,48 @@ def test_create_id_set_flow(repo, mocker):
         assert len(entity_content_in_id_set) == factor * number_of_packs_to_create
 
 
+def test_create_id_set_incremental_flow(repo, mocker):
+    """
+    Given
+    - a content repo and an id_set created with the incremental flag
+
+    When
+    - re-creating the id_set without changes, after changing an integration and after removing a script
+
+    Then
+    - ensure an unchanged repo is not re-processed and the id_set is identical to the cold build
+    - ensure only the changed integration is re-processed
+    - ensure the removed script is removed from the id_set
+    """
+    from demisto_sdk.commands.common.id_set_manifest import IDSetManifest
+    mocker.patch.dict(os.environ, {'DEMISTO_SDK_ID_SET_REFRESH_INTERVAL': '-1'})
+    save_spy = mocker.spy(IDSetManifest, 'save')
+    repo.setup_content_repo(2)
+
+    with ChangeCWD(repo.path):
+        IDSetCreator(repo.id_set.path, print_logs=False, incremental=True).create_id_set()
+        cold_id_set = repo.id_set.read_json_as_dict()
+        assert save_spy.call_args[0][0].hits == 0
+
+        IDSetCreator(repo.id_set.path, print_logs=False, incremental=True).create_id_set()
+        assert save_spy.call_args[0][0].misses == 0
+        assert repo.id_set.read_json_as_dict() == cold_id_set
+
+        integration = repo.packs[0].integrations[0]
+        integration.yml.update({'name': 'changed name'})
+        IDSetCreator(repo.id_set.path, print_logs=False, incremental=True).create_id_set()
+        assert save_spy.call_args[0][0].misses == 1
+        integration_id = integration.yml.read_dict()['commonfields']['id']
+        assert [i[integration_id]['name'] for i in repo.id_set.read_json_as_dict()['integrations']
+                if integration_id in i] == ['changed name']
+
+        script = repo.packs[1].scripts[0]
+        script_id = script.yml.read_dict()['commonfields']['id']
+        shutil.rmtree(script.path)
+        IDSetCreator(repo.id_set.path, print_logs=False, incremental=True).create_id_set()
+        assert not [s for s in repo.id_set.read_json_as_dict()['scripts'] if script_id in s]
+
+
 def setup_id_set():
     integration1 = {
         'Integration1': OrderedDict([('name', 'Integration1'), ('commands', ['test-command_1', 'test-command'])])}
@@ -1,5 +1,3 @@
-import ast
-import io
 import json
 import logging
 import os
@@ -7,7 +5,7 @@ import re
 import shutil
 import tarfile
 from tempfile import mkdtemp
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import demisto_client.demisto_api
 from demisto_client.demisto_api.rest import ApiException
@@ -146,23 +144,13 @@ class Downloader:
         try:
             verify = (not self.insecure) if self.insecure else None  # set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
             self.client = demisto_client.configure(verify_ssl=verify)
-            api_response: tuple = demisto_client.generic_request_func(self.client, '/content/bundle', 'GET')
-            body: bytes = ast.literal_eval(api_response[0])
-            io_bytes = io.BytesIO(body)
-            # Demisto's custom content file is of type tar.gz
-            tar = tarfile.open(fileobj=io_bytes, mode='r')
-
-            for member in tar.getmembers():
-                file_name: str = self.update_file_prefix(member.name.strip('/'))
-                file_path: str = os.path.join(self.custom_content_temp_dir, file_name)
-                with open(file_path, 'w') as file:
-                    extracted_file = tar.extractfile(member)
-                    # File might empty
-                    if extracted_file:
-                        string_to_write = extracted_file.read().decode('utf-8')
-                        file.write(string_to_write)
-                    else:
-                        raise FileNotFoundError(f'Could not extract files from tar file: {file_path}')
+            # the response is returned unread, to be read as a stream
+            bundle, _, _ = demisto_client.generic_request_func(self.client, '/content/bundle', 'GET',
+                                                               _preload_content=False)
+            try:
+                self.extract_custom_content(bundle)
+            finally:
+                bundle.release_conn()
 
             return True
 
@@ -181,6 +169,49 @@ class Downloader:
             print_color(f'Exception raised when fetching custom content:\n{e}', LOG_COLORS.NATIVE)
             return False
 
+    def extract_custom_content(self, bundle) -> None:
+        """
+        Extracts the custom content files from the bundle into the temporary dir, reading the bundle as a stream.
+        When specific custom content is requested, only the files which may hold it are extracted.
+        :param bundle: The custom content bundle file object
+        :return: None
+        """
+        requested_names_words = self.get_requested_names_words()
+        # Demisto's custom content file is of type tar.gz
+        with tarfile.open(fileobj=bundle, mode='r|*') as tar:
+            for member in tar:
+                file_name: str = self.update_file_prefix(member.name.strip('/'))
+                file_path: str = os.path.join(self.custom_content_temp_dir, file_name)
+                extracted_file = tar.extractfile(member)
+                # File might empty
+                if not extracted_file:
+                    raise FileNotFoundError(f'Could not extract files from tar file: {file_path}')
+                file_content: bytes = extracted_file.read()
+                if requested_names_words is not None and not any(
+                        all(word in file_content for word in name_words) for name_words in requested_names_words):
+                    continue
+                with open(file_path, 'w') as file:
+                    file.write(file_content.decode('utf-8'))
+
+    def get_requested_names_words(self) -> Optional[List[List[bytes]]]:
+        """
+        Gets the words of each of the requested custom content names, to filter the custom content files by.
+        A file holds each of the words of its custom content name, however the name is quoted, escaped or wrapped in
+        the file, so a file which does not hold all the words of any of the requested names is not requested.
+        :return: The words of each of the requested names, or None if all the custom content files are needed
+        """
+        if self.list_files or self.all_custom_content:
+            return None
+        requested_names_words = []
+        for input_file in self.input_files:
+            if self.regex and not re.search(self.regex, input_file):
+                continue
+            name_words = re.findall(rb'[A-Za-z0-9_]+', input_file.encode('utf-8'))
+            if not name_words:
+                return None
+            requested_names_words.append(name_words)
+        return requested_names_words
+
     def get_custom_content_objects(self) -> List[dict]:
         """
         Creates a list of all custom content objects
@@ -1,5 +1,9 @@
+import io
 import os
 import shutil
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -9,11 +13,12 @@ from ruamel.yaml import YAML
 from demisto_sdk.commands.common.constants import (
     CLASSIFIERS_DIR, CONNECTIONS_DIR, CONTENT_ENTITIES_DIRS, DASHBOARDS_DIR,
     DELETED_JSON_FIELDS_BY_DEMISTO, DELETED_YML_FIELDS_BY_DEMISTO,
-    GENERIC_DEFINITIONS_DIR, GENERIC_FIELDS_DIR, GENERIC_MODULES_DIR,
-    GENERIC_TYPES_DIR, INCIDENT_FIELDS_DIR, INCIDENT_TYPES_DIR,
-    INDICATOR_FIELDS_DIR, INDICATOR_TYPES_DIR, INTEGRATIONS_DIR, JOBS_DIR,
-    LAYOUTS_DIR, LISTS_DIR, PLAYBOOKS_DIR, PRE_PROCESS_RULES_DIR, REPORTS_DIR,
-    SCRIPTS_DIR, TEST_PLAYBOOKS_DIR, WIDGETS_DIR)
+    FILE_NOT_IN_CC_REASON, GENERIC_DEFINITIONS_DIR, GENERIC_FIELDS_DIR,
+    GENERIC_MODULES_DIR, GENERIC_TYPES_DIR, INCIDENT_FIELDS_DIR,
+    INCIDENT_TYPES_DIR, INDICATOR_FIELDS_DIR, INDICATOR_TYPES_DIR,
+    INTEGRATIONS_DIR, JOBS_DIR, LAYOUTS_DIR, LISTS_DIR, PLAYBOOKS_DIR,
+    PRE_PROCESS_RULES_DIR, REPORTS_DIR, SCRIPTS_DIR, TEST_PLAYBOOKS_DIR,
+    WIDGETS_DIR)
 from demisto_sdk.commands.common.tools import (get_child_files, get_json,
                                                get_yaml)
 from demisto_sdk.commands.download.downloader import Downloader
@@ -702,3 +707,145 @@ class TestVerifyPackPath:
         env = Environment(tmp_path)
         downloader = Downloader(output=f'{env.CONTENT_BASE_PATH}/{output_path}', input='', regex='')
         assert downloader.verify_output_pack_is_pack() is valid_ans
+
+
+SCRIPT_TEMPLATE = '''commonfields:
+  id: {name}
+  version: -1
+name: {name}
+comment: {name} comment
+script: |
+  def main():
+      print('{name}')
+subtype: python3
+type: python
+'''
+
+
+@pytest.fixture
+def stand_in_demisto(monkeypatch):
+    """
+    A local Demisto instance whose custom content bundle holds 3000 scripts, named 'Custom Script <n>', and which
+    records how much of the bundle was sent.
+    """
+    bundle_bytes = io.BytesIO()
+    with tarfile.open(fileobj=bundle_bytes, mode='w:gz') as tar:
+        for i in range(3000):
+            content = SCRIPT_TEMPLATE.format(name=f'Custom Script {i:04d}').encode()
+            member = tarfile.TarInfo(f'/automation-Custom_Script_{i:04d}.yml')
+            member.size = len(content)
+            tar.addfile(member, io.BytesIO(content))
+    bundle = bundle_bytes.getvalue()
+    sent = {'bytes': 0}
+
+    class DemistoHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            assert self.path == '/content/bundle'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(len(bundle)))
+            self.end_headers()
+            for start in range(0, len(bundle), 64 * 1024):
+                self.wfile.write(bundle[start:start + 64 * 1024])
+                sent['bytes'] += len(bundle[start:start + 64 * 1024])
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), DemistoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv('DEMISTO_BASE_URL', f'http://127.0.0.1:{server.server_port}')
+    monkeypatch.setenv('DEMISTO_API_KEY', 'dummy-api-key')
+    yield {'size': len(bundle), 'sent': sent}
+    server.shutdown()
+    server.server_close()
+
+
+class TestFetchCustomContent:
+    def test_fetch_custom_content__requested_content(self, stand_in_demisto):
+        """
+        Given
+        - A Demisto instance with 3000 custom scripts.
+
+        When
+        - Fetching the custom content for downloading 2 of the scripts, and one which does not exist.
+
+        Then
+        - Ensure the whole bundle is read, and only the requested scripts are extracted.
+        """
+        downloader = Downloader(output='', input=('Custom Script 0007', 'Custom Script 2999', 'Other Script'))
+
+        assert downloader.fetch_custom_content()
+
+        assert stand_in_demisto['sent']['bytes'] == stand_in_demisto['size']
+        extracted_files = sorted(os.listdir(downloader.custom_content_temp_dir))
+        assert extracted_files == ['script-Custom_Script_0007.yml', 'script-Custom_Script_2999.yml']
+        downloader.build_custom_content()
+        downloaded_names = sorted(cco['name'] for cco in downloader.custom_content)
+        assert downloaded_names == ['Custom Script 0007', 'Custom Script 2999']
+        assert downloader.files_not_downloaded == [['Other Script', FILE_NOT_IN_CC_REASON]]
+        downloader.remove_traces()
+
+    @pytest.mark.parametrize('list_files, all_custom_content, regex, input_files', [
+        (True, False, '', ()),
+        (False, True, '', ()),
+        (False, True, 'Custom Script 00', ()),
+        (False, False, '', ('Custom-Script',)),
+    ])
+    def test_fetch_custom_content__all_content(self, stand_in_demisto, list_files, all_custom_content, regex,
+                                               input_files):
+        """
+        Given
+        - A Demisto instance with 3000 custom scripts.
+
+        When
+        - Fetching the custom content for listing or downloading all of it, or for names whose words all the scripts
+          hold.
+
+        Then
+        - Ensure all of the scripts are extracted.
+        """
+        downloader = Downloader(output='', input=input_files, regex=regex, list_files=list_files,
+                                all_custom_content=all_custom_content)
+
+        assert downloader.fetch_custom_content()
+
+        assert len(os.listdir(downloader.custom_content_temp_dir)) == 3000
+        downloader.remove_traces()
+
+    def test_fetch_custom_content__regex(self, stand_in_demisto):
+        """
+        Given
+        - A Demisto instance with 3000 custom scripts.
+
+        When
+        - Fetching the custom content for downloading the requested scripts which match a regex.
+
+        Then
+        - Ensure only the requested scripts which match the regex are extracted.
+        """
+        downloader = Downloader(output='', input=('Custom Script 0001', 'Custom Script 0002'), regex='0002$')
+
+        assert downloader.fetch_custom_content()
+
+        assert os.listdir(downloader.custom_content_temp_dir) == ['script-Custom_Script_0002.yml']
+        downloader.remove_traces()
+
+    def test_build_custom_content__single_item(self, stand_in_demisto, mocker):
+        """
+        Given
+        - A Demisto instance with 3000 custom scripts.
+
+        When
+        - Fetching and building the custom content for downloading a single script.
+
+        Then
+        - Ensure only the single script is parsed.
+        """
+        build_object_spy = mocker.spy(Downloader, 'build_custom_content_object')
+        downloader = Downloader(output='', input=('Custom Script 1234',))
+        assert downloader.fetch_custom_content()
+        downloader.build_custom_content()
+        assert [cco['name'] for cco in downloader.custom_content] == ['Custom Script 1234']
+        assert build_object_spy.call_count == 1
+        downloader.remove_traces()
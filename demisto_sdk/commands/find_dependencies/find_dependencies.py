@@ -2,9 +2,12 @@ import glob
 import json
 import os
 import sys
+import time
+from contextlib import contextmanager
 from copy import deepcopy
 from distutils.version import LooseVersion
-from typing import Optional, Union
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
 import networkx as nx
@@ -22,6 +25,30 @@ from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 MINIMUM_DEPENDENCY_VERSION = LooseVersion('6.0.0')
 COMMON_TYPES_PACK = 'CommonTypes'
 
+# the id set index shared with the dependencies calculation processes
+_WORKER_ID_SET: dict = {}
+
+# pack items key -> id_set section
+PACK_ITEMS_ID_SET_SECTIONS = (('scripts', 'scripts',),
+                              ('playbooks', 'playbooks'),
+                              ('layouts', 'Layouts'),
+                              ('incidents_fields', 'IncidentFields'),
+                              ('indicators_fields', 'IndicatorFields'),
+                              ('indicators_types', 'IndicatorTypes'),
+                              ('integrations', 'integrations'),
+                              ('incidents_types', 'IncidentTypes'),
+                              ('classifiers', 'Classifiers'),
+                              ('mappers', 'Mappers'),
+                              ('widgets', 'Widgets'),
+                              ('dashboards', 'Dashboards'),
+                              ('reports', 'Reports'),
+                              ('generic_types', 'GenericTypes'),
+                              ('generic_fields', 'GenericFields'),
+                              ('generic_modules', 'GenericModules'),
+                              ('generic_definitions', 'GenericDefinitions'),
+                              ('lists', 'Lists'),
+                              ('jobs', 'Jobs'))
+
 
 def parse_for_pack_metadata(dependency_graph: nx.DiGraph, graph_root: str, verbose: bool = False,
                             complete_data: bool = False, id_set_data=None) -> tuple:
@@ -170,35 +197,130 @@ def get_merged_official_and_local_id_set(local_id_set: dict, silent_mode: bool =
     return unified_id_set.get_dict()
 
 
+class IDSetSectionIndex:
+    """
+    Indexes of a single id_set section (e.g. id_set['scripts']) for the dependencies searches.
+    The minimum dependency version check is done once per item when the index is built.
+    """
+
+    def __init__(self, items_list: list):
+        self.items_by_pack: Dict[Any, list] = {}
+        self.supported_items_by_id: Dict[Any, List[dict]] = {}
+        self.supported_items_by_name: Dict[Any, List[dict]] = {}
+        self.supported_items_by_command: Dict[Any, List[dict]] = {}
+
+        for item in items_list:
+            item_id, item_details = next(iter(item.items()))
+            self.items_by_pack.setdefault(item_details.get('pack'), []).append(item)
+
+            if LooseVersion(item_details.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION)) < MINIMUM_DEPENDENCY_VERSION:
+                continue
+            self.supported_items_by_id.setdefault(item_id, []).append(item_details)
+            self.supported_items_by_name.setdefault(item_details.get('name'), []).append(item_details)
+            for command in set(item_details.get('commands', [])):
+                self.supported_items_by_command.setdefault(command, []).append(item_details)
+
+    @staticmethod
+    def from_items(items_list: Union[list, 'IDSetSectionIndex']) -> 'IDSetSectionIndex':
+        return items_list if isinstance(items_list, IDSetSectionIndex) else IDSetSectionIndex(items_list)
+
+    def get_items_by_pack(self, pack_id: str) -> list:
+        return list(self.items_by_pack.get(pack_id, []))
+
+    def get_items_by_name(self, item_name) -> List[dict]:
+        """Returns the supported items with the given name (items without a name are considered named '')."""
+        items = self.supported_items_by_name.get(item_name, [])
+        if item_name == '':
+            items = items + self.supported_items_by_name.get(None, [])
+        return [item_details for item_details in items if item_details.get('name', '') == item_name]
+
+    def get_items_by_name_or_id(self, item_name, item_possible_ids: list) -> List[dict]:
+        """Returns the supported items with the given name or with one of the given ids, without duplicates."""
+        items = {id(item_details): item_details for item_details in self.supported_items_by_name.get(item_name, [])}
+        for item_id in item_possible_ids:
+            items.update({id(item_details): item_details for item_details in self.supported_items_by_id.get(item_id, [])})
+        return list(items.values())
+
+    def get_items_by_command(self, command: str) -> List[dict]:
+        return self.supported_items_by_command.get(command, [])
+
+
+class IDSetIndex(dict):
+    """
+    An id_set dict with lazily built per section indexes (by pack, id, name and command),
+    so each dependencies search is a lookup instead of a scan of the whole section.
+    The first level dependencies of each pack are memoized, and the time spent in each phase of the
+    dependencies calculation is accumulated in `timings` (phase -> seconds).
+    The id_set should not be modified after the index is created.
+    """
+
+    def __init__(self, id_set: dict):
+        super().__init__(id_set)
+        self._sections: Dict[str, IDSetSectionIndex] = {}
+        self.pack_dependencies: Dict[Tuple[str, bool], set] = {}
+        self.timings: Dict[str, float] = {}
+
+    @staticmethod
+    def from_id_set(id_set: dict) -> 'IDSetIndex':
+        return id_set if isinstance(id_set, IDSetIndex) else IDSetIndex(id_set)
+
+    def section(self, section_name: str) -> IDSetSectionIndex:
+        if section_name not in self._sections:
+            self._sections[section_name] = IDSetSectionIndex(self[section_name])
+        return self._sections[section_name]
+
+    def build_sections(self):
+        """Builds the indexes of all the sections used by the dependencies calculation."""
+        with self.timer('index'):
+            for _, section_name in PACK_ITEMS_ID_SET_SECTIONS:
+                if section_name in self:
+                    self.section(section_name)
+
+    @contextmanager
+    def timer(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0) + time.perf_counter() - start
+
+
+def get_id_set_section(id_set: dict, section_name: str) -> IDSetSectionIndex:
+    """Returns the index of the given id_set section, built only once if the id_set is an IDSetIndex."""
+    if isinstance(id_set, IDSetIndex):
+        return id_set.section(section_name)
+    return IDSetSectionIndex(id_set[section_name])
+
+
 class PackDependencies:
     """
     Pack dependencies calculation class with relevant static methods.
     """
 
     @staticmethod
-    def _search_for_pack_items(pack_id: str, items_list: list) -> list:
+    def _search_for_pack_items(pack_id: str, items_list: Union[list, IDSetSectionIndex]) -> list:
         """
         Filtering of content items that belong to specific pack.
 
         Args:
             pack_id (str): pack id.
-            items_list (list): specific section of id set.
+            items_list (list or IDSetSectionIndex): specific section of id set.
 
         Returns:
             list: collection of content pack items.
         """
-        return list(filter(lambda s: next(iter(s.values())).get('pack') == pack_id, items_list))
+        return IDSetSectionIndex.from_items(items_list).get_items_by_pack(pack_id)
 
     @staticmethod
     def _search_packs_by_items_names(items_names: Union[str, list],
-                                     items_list: list,
+                                     items_list: Union[list, IDSetSectionIndex],
                                      exclude_ignored_dependencies: bool = True) -> set:
         """
         Searches for implemented script/integration/playbook.
 
         Args:
             items_names (str or list): items names to search.
-            items_list (list): specific section of id set.
+            items_list (list or IDSetSectionIndex): specific section of id set.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
         Returns:
@@ -208,12 +330,12 @@ class PackDependencies:
         if not isinstance(items_names, list):
             items_names = [items_names]
 
+        section_index = IDSetSectionIndex.from_items(items_list)
         pack_names = set()
-        for item in items_list:
-            item_details = list(item.values())[0]
-            if item_details.get('name', '') in items_names and 'pack' in item_details and \
-                    LooseVersion(item_details.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION)) >= MINIMUM_DEPENDENCY_VERSION:
-                pack_names.add(item_details.get('pack'))
+        for item_name in set(items_names):
+            for item_details in section_index.get_items_by_name(item_name):
+                if 'pack' in item_details:
+                    pack_names.add(item_details.get('pack'))
 
         if not exclude_ignored_dependencies:
             return set(pack_names)
@@ -221,7 +343,7 @@ class PackDependencies:
 
     @staticmethod
     def _search_packs_by_items_names_or_ids(items_names: Union[str, list],
-                                            items_list: list,
+                                            items_list: Union[list, IDSetSectionIndex],
                                             exclude_ignored_dependencies: bool = True,
                                             incident_or_indicator: Optional[str] = 'Both') -> set:
         """
@@ -229,7 +351,7 @@ class PackDependencies:
 
         Args:
             items_names (str or list): items names to search.
-            items_list (list): specific section of id set.
+            items_list (list or IDSetSectionIndex): specific section of id set.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             incident_or_indicator (str):
                 'Indicator' to search packs with indicator fields,
@@ -243,6 +365,7 @@ class PackDependencies:
         if not isinstance(items_names, list):
             items_names = [items_names]
 
+        section_index = IDSetSectionIndex.from_items(items_list)
         for item_name in items_names:
             if incident_or_indicator == 'Incident':
                 item_possible_ids = [item_name, f'incident_{item_name}', f'{item_name}-mapper']
@@ -254,12 +377,8 @@ class PackDependencies:
                 item_possible_ids = [item_name, f'incident_{item_name}', f'indicator_{item_name}',
                                      f'{item_name}-mapper']
 
-            for item_from_id_set in items_list:
-                machine_name = list(item_from_id_set.keys())[0]
-                item_details = list(item_from_id_set.values())[0]
-                if (machine_name in item_possible_ids or item_name == item_details.get('name')) \
-                        and item_details.get('pack') \
-                        and LooseVersion(item_details.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION)) >= MINIMUM_DEPENDENCY_VERSION \
+            for item_details in section_index.get_items_by_name_or_id(item_name, item_possible_ids):
+                if item_details.get('pack') \
                         and (item_details['pack'] not in constants.IGNORED_DEPENDENCY_CALCULATION or
                              not exclude_ignored_dependencies):
                     packs.add(item_details.get('pack'))
@@ -281,10 +400,8 @@ class PackDependencies:
             set: pack id without ignored packs.
         """
         pack_names = set()
-        for item in id_set['integrations']:
-            item_details = list(item.values())[0]
-            if command in item_details.get('commands', []) and 'pack' in item_details and \
-                    LooseVersion(item_details.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION)) >= MINIMUM_DEPENDENCY_VERSION:
+        for item_details in get_id_set_section(id_set, 'integrations').get_items_by_command(command):
+            if 'pack' in item_details:
                 pack_names.add(item_details.get('pack'))
 
         if not exclude_ignored_dependencies:
@@ -395,7 +512,7 @@ class PackDependencies:
 
             for command in dependencies_commands:
                 # try to search dependency by scripts first
-                pack_name = PackDependencies._search_packs_by_items_names(command, id_set['scripts'],
+                pack_name = PackDependencies._search_packs_by_items_names(command, get_id_set_section(id_set, 'scripts'),
                                                                           exclude_ignored_dependencies)
 
                 if pack_name:  # found script dependency implementing pack name
@@ -421,7 +538,7 @@ class PackDependencies:
     @staticmethod
     def _differentiate_playbook_implementing_objects(implementing_objects: list,
                                                      skippable_tasks: set,
-                                                     id_set_section: list,
+                                                     id_set_section: Union[list, IDSetSectionIndex],
                                                      exclude_ignored_dependencies: bool = True) -> set:
         """
         Differentiate implementing objects by skippable.
@@ -429,7 +546,7 @@ class PackDependencies:
         Args:
             implementing_objects (list): playbook object collection.
             skippable_tasks (set): playbook skippable tasks.
-            id_set_section (list): id set section corresponds to implementing_objects (scripts or playbooks).
+            id_set_section (list or IDSetSectionIndex): id set section corresponds to implementing_objects (scripts or playbooks).
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
         Returns:
@@ -487,7 +604,7 @@ class PackDependencies:
                 packs_found_from_integration = set()
                 if integration_name:
                     packs_found_from_integration = PackDependencies._search_packs_by_items_names(
-                        integration_name, id_set['integrations'], exclude_ignored_dependencies)
+                        integration_name, get_id_set_section(id_set, 'integrations'), exclude_ignored_dependencies)
                 elif command not in GENERIC_COMMANDS_NAMES:  # do not collect deps on generic command in Pbs
                     packs_found_from_integration = PackDependencies._search_packs_by_integration_command(
                         command, id_set, exclude_ignored_dependencies)
@@ -508,7 +625,7 @@ class PackDependencies:
             playbook_dependencies.update(PackDependencies._differentiate_playbook_implementing_objects(
                 implementing_scripts,
                 skippable_tasks,
-                id_set['scripts'],
+                get_id_set_section(id_set, 'scripts'),
                 exclude_ignored_dependencies
             ))
 
@@ -516,14 +633,14 @@ class PackDependencies:
             playbook_dependencies.update(PackDependencies._differentiate_playbook_implementing_objects(
                 playbook_data.get('implementing_playbooks', []),
                 skippable_tasks,
-                id_set['playbooks'],
+                get_id_set_section(id_set, 'playbooks'),
                 exclude_ignored_dependencies,
             ))
 
             playbook_dependencies.update(PackDependencies._differentiate_playbook_implementing_objects(
                 playbook_data.get('lists', []),
                 skippable_tasks,
-                id_set['Lists'],
+                get_id_set_section(id_set, 'Lists'),
                 exclude_ignored_dependencies,
             ))
 
@@ -532,7 +649,7 @@ class PackDependencies:
             # as customers do not have to use the OOTB inputs.
             incident_fields = playbook_data.get('incident_fields', [])
             packs_found_from_incident_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                incident_fields, id_set['IncidentFields'], exclude_ignored_dependencies)
+                incident_fields, get_id_set_section(id_set, 'IncidentFields'), exclude_ignored_dependencies)
             if packs_found_from_incident_fields:
                 pack_dependencies_data = PackDependencies._update_optional_commontypes_pack_dependencies(
                     packs_found_from_incident_fields)
@@ -543,7 +660,7 @@ class PackDependencies:
             # as customers do not have to use the OOTB inputs.
             indicator_fields = playbook_data.get('indicator_fields', [])
             packs_found_from_indicator_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                indicator_fields, id_set['IndicatorFields'], exclude_ignored_dependencies)
+                indicator_fields, get_id_set_section(id_set, 'IndicatorFields'), exclude_ignored_dependencies)
             if packs_found_from_indicator_fields:
                 pack_dependencies_data = PackDependencies._update_optional_commontypes_pack_dependencies(
                     packs_found_from_indicator_fields)
@@ -597,7 +714,7 @@ class PackDependencies:
             if layout_type in ["Incident", "Indicator"]:
                 related_types = layout_data.get('incident_and_indicator_types', [])
                 packs_found_from_incident_indicator_types = PackDependencies._search_packs_by_items_names(
-                    related_types, id_set[f'{layout_type}Types'],
+                    related_types, get_id_set_section(id_set, f'{layout_type}Types'),
                     exclude_ignored_dependencies)
 
                 if packs_found_from_incident_indicator_types:
@@ -607,7 +724,7 @@ class PackDependencies:
 
             related_fields = layout_data.get('incident_and_indicator_fields', [])
             packs_found_from_incident_indicator_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                related_fields, id_set[f'{layout_type}Fields'],
+                related_fields, get_id_set_section(id_set, f'{layout_type}Fields'),
                 exclude_ignored_dependencies, layout_type)
 
             if packs_found_from_incident_indicator_fields:
@@ -660,7 +777,7 @@ class PackDependencies:
 
             related_scripts = incident_field_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -711,7 +828,7 @@ class PackDependencies:
 
             # related_integrations = indicator_type_data.get('integrations', [])
             # packs_found_from_integrations = PackDependencies._search_packs_by_items_names(
-            #     related_integrations, id_set['integrations'], exclude_ignored_dependencies)
+            #     related_integrations, get_id_set_section(id_set, 'integrations'), exclude_ignored_dependencies)
             #
             # if packs_found_from_integrations:
             #     pack_dependencies_data = PackDependencies. \
@@ -720,7 +837,7 @@ class PackDependencies:
 
             related_scripts = indicator_type_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -761,7 +878,7 @@ class PackDependencies:
 
             related_classifiers = integration_data.get('classifiers', [])
             packs_found_from_classifiers = PackDependencies._search_packs_by_items_names_or_ids(
-                related_classifiers, id_set['Classifiers'], exclude_ignored_dependencies)
+                related_classifiers, get_id_set_section(id_set, 'Classifiers'), exclude_ignored_dependencies)
 
             if packs_found_from_classifiers:
                 pack_dependencies_data = PackDependencies. \
@@ -770,7 +887,7 @@ class PackDependencies:
 
             related_mappers = integration_data.get('mappers', [])
             packs_found_from_mappers = PackDependencies._search_packs_by_items_names_or_ids(
-                related_mappers, id_set['Mappers'], exclude_ignored_dependencies)
+                related_mappers, get_id_set_section(id_set, 'Mappers'), exclude_ignored_dependencies)
 
             if packs_found_from_mappers:
                 pack_dependencies_data = PackDependencies. \
@@ -779,7 +896,7 @@ class PackDependencies:
 
             related_incident_types = integration_data.get('incident_types', [])
             packs_found_from_incident_types = PackDependencies._search_packs_by_items_names(
-                related_incident_types, id_set['IncidentTypes'], exclude_ignored_dependencies)
+                related_incident_types, get_id_set_section(id_set, 'IncidentTypes'), exclude_ignored_dependencies)
 
             if packs_found_from_incident_types:
                 pack_dependencies_data = PackDependencies. \
@@ -829,7 +946,7 @@ class PackDependencies:
 
             related_playbooks = incident_type_data.get('playbooks', [])
             packs_found_from_playbooks = PackDependencies._search_packs_by_items_names(
-                related_playbooks, id_set['playbooks'], exclude_ignored_dependencies)
+                related_playbooks, get_id_set_section(id_set, 'playbooks'), exclude_ignored_dependencies)
 
             if packs_found_from_playbooks:
                 pack_dependencies_data = PackDependencies. \
@@ -838,7 +955,7 @@ class PackDependencies:
 
             related_scripts = incident_type_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -884,7 +1001,7 @@ class PackDependencies:
             if classifier_data.get('definitionId') and classifier_data.get('definitionId') not in ['incident',
                                                                                                    'indicator']:
                 packs_found_from_generic_types = PackDependencies._search_packs_by_items_names_or_ids(
-                    related_types, id_set['GenericTypes'], exclude_ignored_dependencies, "Generic")
+                    related_types, get_id_set_section(id_set, 'GenericTypes'), exclude_ignored_dependencies, "Generic")
 
                 if packs_found_from_generic_types:
                     pack_dependencies_data = PackDependencies._label_as_mandatory(
@@ -892,7 +1009,7 @@ class PackDependencies:
                     classifier_dependencies.update(pack_dependencies_data)
             else:
                 packs_found_from_incident_types = PackDependencies._search_packs_by_items_names(
-                    related_types, id_set['IncidentTypes'], exclude_ignored_dependencies)
+                    related_types, get_id_set_section(id_set, 'IncidentTypes'), exclude_ignored_dependencies)
 
                 # classifiers dependencies from incident types should be marked as optional unless CommonTypes pack,
                 # as customers do not have to use the OOTB mapping.
@@ -904,7 +1021,7 @@ class PackDependencies:
             # collect pack dependencies from transformers and filters
             related_scripts = classifier_data.get('filters', []) + classifier_data.get('transformers', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names_or_ids(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies._label_as_mandatory(packs_found_from_scripts)
@@ -948,7 +1065,7 @@ class PackDependencies:
 
             if mapper_data.get('definitionId') and mapper_data.get('definitionId') not in ['incident', 'indicator']:
                 packs_found_from_generic_types = PackDependencies._search_packs_by_items_names(
-                    related_types, id_set['GenericTypes'], exclude_ignored_dependencies)
+                    related_types, get_id_set_section(id_set, 'GenericTypes'), exclude_ignored_dependencies)
 
                 if packs_found_from_generic_types:
                     pack_dependencies_data = PackDependencies._label_as_mandatory(
@@ -956,7 +1073,7 @@ class PackDependencies:
                     mapper_dependencies.update(pack_dependencies_data)
 
                 packs_found_from_generic_fields = PackDependencies._search_packs_by_items_names(
-                    related_types, id_set['GenericFields'], exclude_ignored_dependencies)
+                    related_types, get_id_set_section(id_set, 'GenericFields'), exclude_ignored_dependencies)
 
                 if packs_found_from_generic_fields:
                     pack_dependencies_data = PackDependencies._label_as_mandatory(
@@ -965,7 +1082,7 @@ class PackDependencies:
 
             else:
                 packs_found_from_incident_types = PackDependencies._search_packs_by_items_names(
-                    related_types, id_set['IncidentTypes'], exclude_ignored_dependencies)
+                    related_types, get_id_set_section(id_set, 'IncidentTypes'), exclude_ignored_dependencies)
 
                 # mappers dependencies from incident types should be marked as optional unless CommonTypes Pack,
                 # as customers do not have to use the OOTB mapping.
@@ -976,7 +1093,7 @@ class PackDependencies:
 
                 related_fields = mapper_data.get('incident_fields', [])
                 packs_found_from_incident_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                    related_fields, id_set['IncidentFields'], exclude_ignored_dependencies)
+                    related_fields, get_id_set_section(id_set, 'IncidentFields'), exclude_ignored_dependencies)
 
                 # mappers dependencies from incident fields should be marked as optional unless CommonTypes pack,
                 # as customers do not have to use the OOTB mapping.
@@ -988,7 +1105,7 @@ class PackDependencies:
             # collect pack dependencies from transformers and filters
             related_scripts = mapper_data.get('filters', []) + mapper_data.get('transformers', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names_or_ids(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies._label_as_mandatory(packs_found_from_scripts)
@@ -1030,7 +1147,7 @@ class PackDependencies:
 
             related_scripts = widget_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -1070,7 +1187,7 @@ class PackDependencies:
 
             related_scripts = generic_type_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -1079,7 +1196,7 @@ class PackDependencies:
 
             related_definitions = generic_type_data.get('definitionId')
             packs_found_from_definitions = PackDependencies._search_packs_by_items_names_or_ids(
-                related_definitions, id_set['GenericDefinitions'], exclude_ignored_dependencies)
+                related_definitions, get_id_set_section(id_set, 'GenericDefinitions'), exclude_ignored_dependencies)
 
             if packs_found_from_definitions:
                 pack_dependencies_data = PackDependencies. \
@@ -1088,7 +1205,7 @@ class PackDependencies:
 
             related_layout = generic_type_data.get('layout')
             packs_found_from_layout = PackDependencies._search_packs_by_items_names_or_ids(
-                related_layout, id_set['Layouts'], exclude_ignored_dependencies)
+                related_layout, get_id_set_section(id_set, 'Layouts'), exclude_ignored_dependencies)
 
             if packs_found_from_definitions:
                 pack_dependencies_data = PackDependencies. \
@@ -1131,7 +1248,7 @@ class PackDependencies:
 
             related_scripts = generic_field_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, get_id_set_section(id_set, 'scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -1140,7 +1257,7 @@ class PackDependencies:
 
             related_definitions = generic_field_data.get('definitionId')
             packs_found_from_definitions = PackDependencies._search_packs_by_items_names_or_ids(
-                related_definitions, id_set['GenericDefinitions'], exclude_ignored_dependencies)
+                related_definitions, get_id_set_section(id_set, 'GenericDefinitions'), exclude_ignored_dependencies)
 
             if packs_found_from_definitions:
                 pack_dependencies_data = PackDependencies. \
@@ -1149,7 +1266,7 @@ class PackDependencies:
 
             related_types = generic_field_data.get('generic_types')
             packs_found_from_types = PackDependencies._search_packs_by_items_names_or_ids(
-                related_types, id_set['GenericTypes'], exclude_ignored_dependencies)
+                related_types, get_id_set_section(id_set, 'GenericTypes'), exclude_ignored_dependencies)
 
             if packs_found_from_types:
                 pack_dependencies_data = PackDependencies. \
@@ -1189,7 +1306,7 @@ class PackDependencies:
 
             related_definitions = generic_module_data.get('definitionIds')
             packs_found_from_definitions = PackDependencies._search_packs_by_items_names_or_ids(
-                related_definitions, id_set['GenericDefinitions'], exclude_ignored_dependencies)
+                related_definitions, get_id_set_section(id_set, 'GenericDefinitions'), exclude_ignored_dependencies)
 
             if packs_found_from_definitions:
                 pack_dependencies_data = PackDependencies. \
@@ -1200,7 +1317,7 @@ class PackDependencies:
             for view in related_views:
                 related_dashboards = related_views.get(view, {}).get('dashboards', [])
                 packs_found_from_dashboards = PackDependencies._search_packs_by_items_names_or_ids(
-                    related_dashboards, id_set['Dashboards'], exclude_ignored_dependencies)
+                    related_dashboards, get_id_set_section(id_set, 'Dashboards'), exclude_ignored_dependencies)
 
                 if packs_found_from_dashboards:
                     pack_dependencies_data = PackDependencies. \
@@ -1243,7 +1360,7 @@ class PackDependencies:
             job_dependencies.update(
                 PackDependencies._label_as_mandatory(
                     PackDependencies._search_packs_by_items_names_or_ids(
-                        job_data.get('playbookId', ''), id_set['playbooks'], exclude_ignored_dependencies)
+                        job_data.get('playbookId', ''), get_id_set_section(id_set, 'playbooks'), exclude_ignored_dependencies)
                 )
             )
 
@@ -1251,7 +1368,7 @@ class PackDependencies:
             job_dependencies.update(
                 PackDependencies._label_as_mandatory(
                     PackDependencies._search_packs_by_items_names_or_ids(
-                        job_data.get('selectedFeeds', []), id_set['integrations'], exclude_ignored_dependencies
+                        job_data.get('selectedFeeds', []), get_id_set_section(id_set, 'integrations'), exclude_ignored_dependencies
                     )
                 )
             )
@@ -1279,25 +1396,7 @@ class PackDependencies:
         """
         pack_items = dict()
 
-        for pack_key, id_set_key in (('scripts', 'scripts',),
-                                     ('playbooks', 'playbooks'),
-                                     ('layouts', 'Layouts'),
-                                     ('incidents_fields', 'IncidentFields'),
-                                     ('indicators_fields', 'IndicatorFields'),
-                                     ('indicators_types', 'IndicatorTypes'),
-                                     ('integrations', 'integrations'),
-                                     ('incidents_types', 'IncidentTypes'),
-                                     ('classifiers', 'Classifiers'),
-                                     ('mappers', 'Mappers'),
-                                     ('widgets', 'Widgets'),
-                                     ('dashboards', 'Dashboards'),
-                                     ('reports', 'Reports'),
-                                     ('generic_types', 'GenericTypes'),
-                                     ('generic_fields', 'GenericFields'),
-                                     ('generic_modules', 'GenericModules'),
-                                     ('generic_definitions', 'GenericDefinitions'),
-                                     ('lists', 'Lists'),
-                                     ('jobs', 'Jobs')):
+        for pack_key, id_set_key in PACK_ITEMS_ID_SET_SECTIONS:
             if id_set_key not in id_set:
                 raise RuntimeError(
                     "\n".join((f"Error: the {id_set_key} content type is missing from the id_set.",
@@ -1305,7 +1404,7 @@ class PackDependencies:
                                "of the Demisto SDK. Please delete content/Tests/id_set.json and "
                                "run demisto-sdk find-dependencies again."))
                 )
-            pack_items[pack_key] = PackDependencies._search_for_pack_items(pack_id, id_set[id_set_key])
+            pack_items[pack_key] = PackDependencies._search_for_pack_items(pack_id, get_id_set_section(id_set, id_set_key))
 
         if not sum(pack_items.values(), []):
             click.secho(f"Couldn't find any items for pack '{pack_id}'. Please make sure:\n"
@@ -1330,6 +1429,10 @@ class PackDependencies:
         Returns:
             set: dependencies data that includes pack id and whether is mandatory or not.
         """
+        id_set = IDSetIndex.from_id_set(id_set)
+        if (pack_id, exclude_ignored_dependencies) in id_set.pack_dependencies:
+            return set(id_set.pack_dependencies[(pack_id, exclude_ignored_dependencies)])
+
         if verbose:
             click.secho(f'\n# Pack ID: {pack_id}', fg='white')
         pack_items = PackDependencies._collect_pack_items(pack_id, id_set)
@@ -1440,42 +1543,100 @@ class PackDependencies:
             reports_dependencies | generic_types_dependencies | generic_modules_dependencies |
             generic_fields_dependencies | jobs_dependencies
         )
+        id_set.pack_dependencies[(pack_id, exclude_ignored_dependencies)] = set(pack_dependencies)
 
         return pack_dependencies
 
+    @staticmethod
+    def _find_packs_dependencies(pack_ids: list, id_set: IDSetIndex, verbose: bool,
+                                 exclude_ignored_dependencies: bool = True, workers: int = 1) -> Dict[str, set]:
+        """
+        Searches for the first level dependencies of the given packs, each pack is calculated only once.
+
+        Args:
+            pack_ids (list): pack ids, currently pack folder names is in use.
+            id_set (IDSetIndex): indexed id set json.
+            verbose (bool): Whether to log the dependencies to the console.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            workers (int): Number of processes used for the calculation. The id set index is built before the
+             processes are started, so it is shared with them instead of being rebuilt by each of them.
+
+        Returns:
+            dict: pack id -> dependencies data that includes pack id and whether is mandatory or not.
+        """
+        packs_dependencies = {}
+        missing_pack_ids = [pack_id for pack_id in dict.fromkeys(pack_ids)
+                            if (pack_id, exclude_ignored_dependencies) not in id_set.pack_dependencies]
+
+        use_pool = workers > 1 and len(missing_pack_ids) > 1
+        if use_pool:
+            id_set.build_sections()
+
+        with id_set.timer('dependencies'):
+            if use_pool:
+                chunksize = max(1, len(missing_pack_ids) // (workers * 4))
+                with Pool(processes=workers, initializer=_init_dependencies_worker, initargs=(id_set,)) as pool:
+                    for pack_id, dependencies in pool.imap_unordered(
+                            _find_pack_dependencies_worker,
+                            [(pack_id, exclude_ignored_dependencies) for pack_id in missing_pack_ids],
+                            chunksize=chunksize):
+                        id_set.pack_dependencies[(pack_id, exclude_ignored_dependencies)] = dependencies
+
+            for pack_id in pack_ids:
+                packs_dependencies[pack_id] = PackDependencies._find_pack_dependencies(
+                    pack_id, id_set, verbose=verbose, exclude_ignored_dependencies=exclude_ignored_dependencies)
+
+        return packs_dependencies
+
+    @staticmethod
+    def print_timings(id_set: IDSetIndex):
+        click.secho('\nDependencies calculation timings:', fg='white')
+        for phase, seconds in id_set.timings.items():
+            click.secho(f'{phase}: {seconds:.3f} seconds', fg='white')
+
     @staticmethod
     def build_all_dependencies_graph(
             pack_ids: list,
             id_set: dict,
             verbose: bool = False,
-            exclude_ignored_dependencies: bool = True
+            exclude_ignored_dependencies: bool = True,
+            workers: int = 1,
     ) -> nx.DiGraph:
         """
         Builds all level of dependencies and returns dependency graph for all packs
 
         Args:
             pack_ids (list): pack ids, currently pack folder names is in use.
-            id_set (dict): id set json.
+            id_set (dict): id set json. Pass an IDSetIndex to reuse the calculated dependencies and to get the
+             time spent in each phase from its `timings`.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            workers (int): Number of processes used for calculating the packs first level dependencies.
 
         Returns:
             DiGraph: all dependencies of given packs.
         """
-        dependency_graph = nx.DiGraph()
-        for pack in pack_ids:
-            dependency_graph.add_node(pack, mandatory_for_packs=[])
-        for pack in pack_ids:
-            dependencies = PackDependencies._find_pack_dependencies(
-                pack, id_set, verbose=verbose, exclude_ignored_dependencies=exclude_ignored_dependencies)
-            for dependency_name, is_mandatory in dependencies:
-                if dependency_name == pack:
-                    continue
-                if dependency_name not in dependency_graph:
-                    dependency_graph.add_node(dependency_name, mandatory_for_packs=[])
-                dependency_graph.add_edge(pack, dependency_name)
-                if is_mandatory:
-                    dependency_graph.nodes()[dependency_name]['mandatory_for_packs'].append(pack)
+        id_set = IDSetIndex.from_id_set(id_set)
+        packs_dependencies = PackDependencies._find_packs_dependencies(
+            pack_ids, id_set, verbose=verbose and workers <= 1,
+            exclude_ignored_dependencies=exclude_ignored_dependencies, workers=workers)
+
+        with id_set.timer('graph'):
+            dependency_graph = nx.DiGraph()
+            for pack in pack_ids:
+                dependency_graph.add_node(pack, mandatory_for_packs=[])
+            for pack in pack_ids:
+                for dependency_name, is_mandatory in packs_dependencies[pack]:
+                    if dependency_name == pack:
+                        continue
+                    if dependency_name not in dependency_graph:
+                        dependency_graph.add_node(dependency_name, mandatory_for_packs=[])
+                    dependency_graph.add_edge(pack, dependency_name)
+                    if is_mandatory:
+                        dependency_graph.nodes()[dependency_name]['mandatory_for_packs'].append(pack)
+
+        if verbose:
+            PackDependencies.print_timings(id_set)
         return dependency_graph
 
     @staticmethod
@@ -1509,6 +1670,7 @@ class PackDependencies:
         Returns:
             DiGraph: all level dependencies of given pack.
         """
+        id_set = IDSetIndex.from_id_set(id_set)
         graph = nx.DiGraph()
         graph.add_node(pack_id)  # add pack id as root of the direct graph
         found_new_dependencies = True
@@ -1517,12 +1679,14 @@ class PackDependencies:
             current_number_of_nodes = graph.number_of_nodes()
             leaf_nodes = [n for n in graph.nodes() if graph.out_degree(n) == 0]
 
+            # leaves without dependencies stay leaves, their dependencies are memoized in the id set index
             for leaf in leaf_nodes:
-                leaf_dependencies = PackDependencies._find_pack_dependencies(
-                    leaf, id_set, verbose=verbose, exclude_ignored_dependencies=exclude_ignored_dependencies)
+                with id_set.timer('dependencies'):
+                    leaf_dependencies = PackDependencies._find_pack_dependencies(
+                        leaf, id_set, verbose=verbose, exclude_ignored_dependencies=exclude_ignored_dependencies)
 
-                if leaf_dependencies:
-                    for dependency_name, is_mandatory in leaf_dependencies:
+                with id_set.timer('graph'):
+                    for dependency_name, is_mandatory in leaf_dependencies or ():
                         if dependency_name not in graph.nodes():
                             graph.add_node(dependency_name, mandatory=is_mandatory)
                             graph.add_edge(leaf, dependency_name)
@@ -1542,7 +1706,8 @@ class PackDependencies:
             debug_file_path: str = '',
             skip_id_set_creation: bool = False,
             use_pack_metadata: bool = False,
-            complete_data: bool = False
+            complete_data: bool = False,
+            id_set: Optional[dict] = None,
     ) -> dict:
         """
         Main function for dependencies search and pack metadata update.
@@ -1556,24 +1721,28 @@ class PackDependencies:
             verbose(bool): Whether to print the log to the console.
             skip_id_set_creation (bool): Whether to skip id_set.json file creation.
             complete_data (bool): Whether to update complete data on the dependent packs.
+            id_set (dict): An already loaded id set, used instead of id_set_path. In a private repository it should
+             already be merged with the official id set. Pass an IDSetIndex to reuse the dependencies calculated by
+             previous calls.
 
         Returns:
             Dict: first level dependencies of a given pack.
 
         """
 
-        if id_set_path and os.path.isfile(id_set_path):
-            with open(id_set_path, 'r') as id_set_file:
-                id_set = json.load(id_set_file)
-        else:
-            if skip_id_set_creation:
-                return {}
+        if id_set is None:
+            if id_set_path and os.path.isfile(id_set_path):
+                with open(id_set_path, 'r') as id_set_file:
+                    id_set = json.load(id_set_file)
+            else:
+                if skip_id_set_creation:
+                    return {}
 
-            id_set = IDSetCreator(print_logs=False).create_id_set()
+                id_set = IDSetCreator(print_logs=False).create_id_set()
 
-        if is_external_repository():
-            print_warning('Running in a private repository, will download the id set from official content')
-            id_set = get_merged_official_and_local_id_set(id_set, silent_mode=silent_mode)
+            if is_external_repository():
+                print_warning('Running in a private repository, will download the id set from official content')
+                id_set = get_merged_official_and_local_id_set(id_set, silent_mode=silent_mode)
 
         dependency_graph = PackDependencies.build_dependency_graph(
             pack_id=pack_name,
@@ -1637,3 +1806,14 @@ class PackDependencies:
             pack_meta_file_content = json.loads(pack_metadata.read())
 
         return pack_meta_file_content
+
+
+def _init_dependencies_worker(id_set: IDSetIndex):
+    global _WORKER_ID_SET
+    _WORKER_ID_SET = id_set
+
+
+def _find_pack_dependencies_worker(args: Tuple[str, bool]) -> Tuple[str, set]:
+    pack_id, exclude_ignored_dependencies = args
+    return pack_id, PackDependencies._find_pack_dependencies(
+        pack_id, _WORKER_ID_SET, verbose=False, exclude_ignored_dependencies=exclude_ignored_dependencies)
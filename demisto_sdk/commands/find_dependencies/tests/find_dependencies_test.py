@@ -6,8 +6,8 @@ import pytest
 import demisto_sdk.commands.create_id_set.create_id_set as cis
 from demisto_sdk.commands.common.constants import (DEFAULT_JOB_FROM_VERSION,
                                                    FileType)
-from demisto_sdk.commands.find_dependencies.find_dependencies import \
-    PackDependencies
+from demisto_sdk.commands.find_dependencies.find_dependencies import (
+    IDSetIndex, PackDependencies)
 from TestSuite.test_tools import ChangeCWD
 from TestSuite.utils import IsEqualFunctions
 
@@ -508,6 +508,88 @@ class TestIdSetFilters:
         assert IsEqualFunctions.is_lists_equal(found_filtered_result, expected_result)
 
 
+class TestIDSetIndex:
+    ID_SET = {
+        'scripts': [
+            {'Script1': {'name': 'Script1', 'pack': 'Pack1'}},
+            {'Script2': {'name': 'Script2', 'pack': 'Pack2', 'toversion': '5.9.9'}},
+            {'Script2': {'name': 'Script2', 'pack': 'Pack3'}},
+            {'Script3': {'name': 'Script3'}},
+            {'Script4': {'name': 'Script4', 'pack': ''}},
+        ],
+        'IncidentFields': [
+            {'incident_field1': {'name': 'Field 1', 'pack': 'Pack1'}},
+            {'field2': {'name': 'Field 2', 'pack': 'Pack2'}},
+        ],
+        'integrations': [
+            {'Integration1': {'name': 'Integration1', 'pack': 'Pack1', 'commands': ['cmd1', 'cmd2']}},
+            {'Integration2': {'name': 'Integration2', 'pack': 'Pack2', 'commands': ['cmd2'], 'toversion': '5.5.0'}},
+            {'Integration3': {'name': 'Integration3', 'pack': 'Pack3', 'commands': ['cmd2']}},
+        ],
+    }
+
+    @pytest.mark.parametrize('items_names, expected_packs', [
+        ('Script1', {'Pack1'}),
+        ('Script2', {'Pack3'}),
+        ('Script3', set()),
+        (['Script1', 'Script4', 'Script5'], {'Pack1', ''}),
+    ])
+    def test_search_packs_by_items_names(self, items_names, expected_packs):
+        """
+        Given
+        - an id_set section with unsupported (toversion < 6.0.0), pack-less and duplicated items
+
+        When
+        - searching the packs of items by their names, using the list and the indexed id_set
+
+        Then
+        - ensure the same packs are found
+        """
+        id_set = IDSetIndex(self.ID_SET)
+        assert PackDependencies._search_packs_by_items_names(items_names, self.ID_SET['scripts']) == expected_packs
+        assert PackDependencies._search_packs_by_items_names(items_names, id_set.section('scripts')) == expected_packs
+
+    @pytest.mark.parametrize('items_names, expected_packs', [
+        ('field1', {'Pack1'}),
+        ('Field 1', {'Pack1'}),
+        ('field2', {'Pack2'}),
+        (['Script2', 'Script3', 'Script4'], {'Pack3'}),
+    ])
+    def test_search_packs_by_items_names_or_ids(self, items_names, expected_packs):
+        """
+        Given
+        - an id_set with items that can be found by their name or by their (prefixed) id
+
+        When
+        - searching the packs of the items, using the lists and the indexed id_set
+
+        Then
+        - ensure the same packs are found and that items without a pack are ignored
+        """
+        id_set = IDSetIndex(self.ID_SET)
+        section = 'scripts' if 'Script2' in items_names else 'IncidentFields'
+        assert PackDependencies._search_packs_by_items_names_or_ids(items_names, self.ID_SET[section]) == expected_packs
+        assert PackDependencies._search_packs_by_items_names_or_ids(items_names, id_set.section(section)) == expected_packs
+
+    def test_search_packs_by_integration_command(self):
+        """
+        Given
+        - integrations implementing the same command, one of them unsupported
+
+        When
+        - searching the packs implementing the command with a plain and with an indexed id_set
+
+        Then
+        - ensure the same packs are found and the section index is only built once
+        """
+        id_set = IDSetIndex(self.ID_SET)
+        assert PackDependencies._search_packs_by_integration_command('cmd2', self.ID_SET, False) == {'Pack1', 'Pack3'}
+        assert PackDependencies._search_packs_by_integration_command('cmd2', id_set, False) == {'Pack1', 'Pack3'}
+        assert id_set.section('integrations') is id_set.section('integrations')
+        assert PackDependencies._search_for_pack_items('Pack2', id_set.section('integrations')) == \
+            [self.ID_SET['integrations'][1]]
+
+
 class TestDependsOnScriptAndIntegration:
     @ pytest.mark.parametrize("dependency_script,expected_result",
                               [("GetServerURL", {("GetServerURL", True)}),
@@ -2160,6 +2242,50 @@ class TestDependencyGraph:
         assert nodes['pack3']['mandatory_for_packs'] == []
         assert nodes['pack4']['mandatory_for_packs'] == []
 
+    def test_build_all_dependencies_graph__workers(self, module_repo):
+        """
+        Given
+            - The packs of a content repo and its id set
+        When
+            - Creating the dependencies graph of all packs serially and with a pool of workers
+        Then
+            - Assert both graphs are identical
+            - Assert the time spent in each phase is recorded in the id set index
+        """
+        id_set = module_repo.id_set.read_json_as_dict()
+        pack_ids = sorted({list(item.values())[0]['pack'] for item in id_set['scripts'] + id_set['playbooks']})
+
+        serial_graph = PackDependencies.build_all_dependencies_graph(pack_ids, id_set)
+        id_set_index = IDSetIndex(id_set)
+        parallel_graph = PackDependencies.build_all_dependencies_graph(pack_ids, id_set_index, workers=2)
+
+        # the dependencies are sets, so the order in which the edges are added may differ between processes
+        assert dict(serial_graph.nodes(data=True)).keys() == dict(parallel_graph.nodes(data=True)).keys()
+        for pack_id, data in serial_graph.nodes(data=True):
+            assert sorted(data['mandatory_for_packs']) == sorted(parallel_graph.nodes[pack_id]['mandatory_for_packs'])
+        assert set(serial_graph.edges()) == set(parallel_graph.edges())
+        assert {'index', 'dependencies', 'graph'} <= set(id_set_index.timings)
+
+    def test_build_dependency_graph__memoized(self, mocker, module_repo):
+        """
+        Given
+            - An indexed id set
+        When
+            - Building the dependency graph of a pack twice
+        Then
+            - Assert the first level dependencies of each pack are calculated only once
+        """
+        id_set = IDSetIndex(module_repo.id_set.read_json_as_dict())
+        collect_pack_items = mocker.spy(PackDependencies, '_collect_pack_items')
+
+        first_graph = PackDependencies.build_dependency_graph('ImpossibleTraveler', id_set, verbose=False)
+        calculated_packs = [call.args[0] for call in collect_pack_items.call_args_list]
+        second_graph = PackDependencies.build_dependency_graph('ImpossibleTraveler', id_set, verbose=False)
+
+        assert len(calculated_packs) == len(set(calculated_packs)) == first_graph.number_of_nodes()
+        assert collect_pack_items.call_count == len(calculated_packs)
+        assert list(first_graph.edges()) == list(second_graph.edges())
+
     def test_build_dependency_graph(self, module_repo):
         pack_name = "ImpossibleTraveler"
         found_graph = PackDependencies.build_dependency_graph(pack_id=pack_name,
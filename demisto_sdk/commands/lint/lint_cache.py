@@ -0,0 +1,177 @@
+# STD python packages
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+
+# 3-rd party packages
+from pkg_resources import DistributionNotFound, get_distribution
+from wcmatch.pathlib import Path
+
+from demisto_sdk.commands.common.constants import PACKS_PACK_META_FILE_NAME
+from demisto_sdk.commands.common.tools import read_json_cache, write_json_cache
+from demisto_sdk.commands.lint.helpers import EXIT_CODES
+
+logger = logging.getLogger('demisto-sdk')
+
+# Host linters whose versions take part in the cache key (the docker checks are keyed by the docker images).
+HOST_LINTERS = ('flake8', 'bandit', 'mypy', 'vulture', 'pylint', 'demisto-sdk')
+
+# Content repo files which configure the host linters.
+LINTERS_CONFIG_FILES = ('.flake8', 'tox.ini', 'setup.cfg', 'mypy.ini')
+
+# Files and directories created by the lint run itself, which are not part of the package.
+IGNORED_PACKAGE_FILES = {'.coverage', '__pycache__', '.pytest_cache', '.mypy_cache'}
+
+COVERAGE_FILE = '.coverage'
+
+
+def get_linter_version(linter: str) -> str:
+    try:
+        return get_distribution(linter).version
+    except DistributionNotFound:
+        return ''
+
+
+def list_files(directory: Path) -> List[Path]:
+    """ List the files of a directory recursively, skipping the files created by the lint run itself
+
+    Args:
+        directory(Path): directory to list.
+
+    Returns:
+        List[Path]: the files of the directory.
+    """
+    files: List[Path] = []
+    for root, dirs, file_names in os.walk(directory):
+        dirs[:] = [name for name in dirs if name not in IGNORED_PACKAGE_FILES]
+        files.extend(Path(root) / name for name in file_names
+                     if name not in IGNORED_PACKAGE_FILES and not name.endswith('.pyc'))
+    return files
+
+
+def hash_files(files: Iterable[Path], root: Path) -> str:
+    """ Hash the relative paths and the content of files
+
+    Args:
+        files(Iterable[Path]): files to hash.
+        root(Path): the directory the paths are relative to.
+
+    Returns:
+        str: hex digest of the files.
+    """
+    files_hash = hashlib.sha256()
+    for file in sorted(files):
+        files_hash.update(str(file.relative_to(root)).encode())
+        files_hash.update(hashlib.sha256(file.read_bytes()).digest())
+    return files_hash.hexdigest()
+
+
+class LintResultsCache:
+    """ On disk cache of the lint and test results of packages.
+
+    A package result is replayed only if the package files, the pack metadata, the linters configuration, the
+    mandatory test modules (CommonServerPython etc.), the linters versions and the command flags are all the same as
+    in the run which stored it. The docker images are part of the package yml, so a docker image update invalidates
+    the result too. Each package has a single entry, which is replaced whenever the package is linted again.
+
+    Attributes:
+        cache_dir(Path): Directory of the cache entries.
+        content_repo(Path): Content repo path.
+    """
+
+    def __init__(self, cache_dir: str, content_repo: Optional[Path], modules: Dict[Path, bytes], requirements: List[list],
+                 flags: dict):
+        """
+        Args:
+            cache_dir(str): Directory of the cache entries.
+            content_repo(Path): Content repo path, used for the linters configuration files. Defaults to the cwd.
+            modules(dict): Mandatory test modules and their content.
+            requirements(List[list]): Test requirements of the docker images.
+            flags(dict): Command flags which affect the results.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.content_repo = content_repo or Path.cwd()
+        run_hash = hashlib.sha256()
+        for module in sorted(modules or {}):
+            run_hash.update(str(module).encode())
+            run_hash.update(hashlib.sha256(modules[module]).digest())
+        config_files = [self.content_repo / name for name in LINTERS_CONFIG_FILES]
+        resources_dir = Path(__file__).parent / 'resources'
+        run_hash.update(json.dumps({
+            'linters': {linter: get_linter_version(linter) for linter in HOST_LINTERS},
+            'config': hash_files((file for file in config_files if file.is_file()), self.content_repo),
+            'resources': hash_files(list_files(resources_dir), resources_dir),
+            'requirements': requirements,
+            'flags': flags,
+            'env': [os.getenv('CI', False), os.getenv('DEMISTO_LINT_UPDATE_CERTS', 'yes')],
+        }, sort_keys=True, default=str).encode())
+        self._run_hash = run_hash.hexdigest()
+
+    def _entry_path(self, pack_dir: Path) -> Path:
+        return self.cache_dir / hashlib.sha1(str(pack_dir.absolute()).encode()).hexdigest()
+
+    def get_key(self, pack_dir: Path) -> str:
+        """ Get the cache key of a package
+
+        Args:
+            pack_dir(Path): Package directory.
+
+        Returns:
+            str: the package key, combined of the package files and the run key.
+        """
+        pack_metadata = pack_dir.parent.parent / PACKS_PACK_META_FILE_NAME
+        key = hashlib.sha256(self._run_hash.encode())
+        key.update(str(pack_dir.absolute()).encode())
+        key.update(hash_files(list_files(pack_dir), pack_dir).encode())
+        if pack_metadata.is_file():
+            key.update(pack_metadata.read_bytes())
+        return key.hexdigest()
+
+    def get(self, pack_dir: Path, key: str) -> Optional[dict]:
+        """ Get the stored results of a package, and restore its coverage data.
+
+        Args:
+            pack_dir(Path): Package directory.
+            key(str): The current key of the package.
+
+        Returns:
+            dict: the package lint status, or None if the package results are not cached.
+        """
+        entry_path = self._entry_path(pack_dir)
+        entry = read_json_cache(str(entry_path.with_suffix('.json')))
+        if entry.get('key') != key or not isinstance(entry.get('pkg_status'), dict):
+            return None
+        try:
+            if entry.get('coverage'):
+                (pack_dir / COVERAGE_FILE).write_bytes(entry_path.with_suffix(COVERAGE_FILE).read_bytes())
+        except OSError as e:
+            logger.debug(f"{pack_dir} - Unable to read cached lint results: {e}")
+            return None
+        return entry['pkg_status']
+
+    def set(self, pack_dir: Path, key: str, pkg_status: dict):
+        """ Store the results of a package, with its coverage data.
+        Results of unexpected failures (exceptions or docker image creation errors) are not stored.
+
+        Args:
+            pack_dir(Path): Package directory.
+            key(str): The key of the package, calculated before it was linted.
+            pkg_status(dict): The package lint status.
+        """
+        if pkg_status.get('errors') or pkg_status.get('exit_code', 0) & EXIT_CODES['image']:
+            return
+        entry_path = self._entry_path(pack_dir)
+        coverage_file = pack_dir / COVERAGE_FILE
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            has_coverage = coverage_file.is_file()
+            if has_coverage:
+                entry_path.with_suffix(COVERAGE_FILE).write_bytes(coverage_file.read_bytes())
+        except OSError as e:
+            logger.debug(f"{pack_dir} - Unable to store lint results: {e}")
+            return
+        entry = {'key': key, 'coverage': has_coverage, 'pkg_status': pkg_status}
+        if not write_json_cache(str(entry_path.with_suffix('.json')), entry):
+            logger.debug(f"{pack_dir} - Unable to store lint results")
@@ -6,7 +6,7 @@ import os
 import re
 import sys
 import textwrap
-from typing import Any, Dict, List, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 # Third party packages
 import docker
@@ -24,20 +24,27 @@ from demisto_sdk.commands.common.logger import Colors
 from demisto_sdk.commands.common.tools import (find_file, find_type,
                                                get_content_path,
                                                get_file_displayed_name,
-                                               get_json,
+                                               get_json, get_sdk_cache_path,
                                                is_external_repository,
                                                print_error, print_v,
                                                print_warning,
-                                               retrieve_file_ending)
+                                               retrieve_file_ending,
+                                               run_command_os)
+from demisto_sdk.commands.lint.commands_builder import (build_bandit_command,
+                                                        build_flake8_command)
 from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, PWSH_CHECKS,
-                                               PY_CHCEKS,
+                                               PY_CHCEKS, SUCCESS,
                                                build_skipped_exit_code,
                                                generate_coverage_report,
                                                get_test_modules, validate_env)
+from demisto_sdk.commands.lint.lint_cache import LintResultsCache
 from demisto_sdk.commands.lint.linter import Linter
 
 logger = logging.getLogger('demisto-sdk')
 
+# Maximal number of packages linted by a single host linter process, keeps the command line length bounded
+HOST_LINTERS_BATCH_SIZE = 100
+
 
 class LintManager:
     """ LintManager used to activate lint command using Linters in a single or multi thread.
@@ -252,7 +259,8 @@ class LintManager:
                          no_pylint: bool, no_coverage: bool, coverage_report: str,
                          no_vulture: bool, no_test: bool, no_pwsh_analyze: bool, no_pwsh_test: bool,
                          keep_container: bool,
-                         test_xml: str, failure_report: str, docker_timeout: int) -> int:
+                         test_xml: str, failure_report: str, docker_timeout: int, no_cache: bool = False,
+                         batch: bool = False) -> int:
         """ Runs the Lint command on all given packages.
 
         Args:
@@ -272,6 +280,8 @@ class LintManager:
             test_xml(str): Path for saving pytest xml results
             failure_report(str): Path for store failed packs report
             docker_timeout(int): timeout for docker requests
+            no_cache(bool): Whether to skip the lint results cache
+            batch(bool): Whether to run flake8 and bandit once over all the packages with the same python version
 
         Returns:
             int: exit code by fail exit codes by var EXIT_CODES
@@ -311,12 +321,36 @@ class LintManager:
                                                no_pylint=no_pylint, no_test=no_test, no_pwsh_analyze=no_pwsh_analyze,
                                                no_pwsh_test=no_pwsh_test, docker_engine=self._facts["docker_engine"])
 
+        # The results can't be replayed when the run has to leave artifacts besides the coverage data
+        results_cache: Optional[LintResultsCache] = None
+        if not no_cache and not keep_container and not test_xml:
+            results_cache = self._get_results_cache(no_flake8=no_flake8, no_bandit=no_bandit, no_mypy=no_mypy,
+                                                    no_vulture=no_vulture, no_xsoar_linter=no_xsoar_linter,
+                                                    no_pylint=no_pylint, no_test=no_test,
+                                                    no_pwsh_analyze=no_pwsh_analyze, no_pwsh_test=no_pwsh_test,
+                                                    no_coverage=no_coverage)
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
             return_exit_code: int = 0
             return_warning_code: int = 0
             results = []
+            results_keys: Dict[concurrent.futures.Future, Tuple[Path, str]] = {}
+            linters: List[Tuple[Path, str, Linter]] = []
+            cached_count = 0
             # Executing lint checks in different threads
             for pack in sorted(self._pkgs):
+                key = ''
+                if results_cache:
+                    key = results_cache.get_key(pack)
+                    cached_status = results_cache.get(pack, key)
+                    if cached_status:
+                        print_v(f"Using cached lint results of {Colors.Fg.cyan}{pack}{Colors.reset}",
+                                log_verbose=self._verbose)
+                        cached_result: concurrent.futures.Future = concurrent.futures.Future()
+                        cached_result.set_result(cached_status)
+                        results.append(cached_result)
+                        cached_count += 1
+                        continue
                 linter: Linter = Linter(pack_dir=pack,
                                         content_repo="" if not self._facts["content_repo"] else
                                         Path(self._facts["content_repo"].working_dir),
@@ -324,6 +358,16 @@ class LintManager:
                                         req_3=self._facts["requirements_3"],
                                         docker_engine=self._facts["docker_engine"],
                                         docker_timeout=docker_timeout)
+                linters.append((pack, key, linter))
+
+            host_results: Dict[Linter, Dict[str, Tuple[int, str]]] = {}
+            if batch and len(linters) > 1:
+                host_results = self._run_host_linters_in_batches(executor=executor,
+                                                                 linters=[linter for _, _, linter in linters],
+                                                                 no_flake8=no_flake8,
+                                                                 no_bandit=no_bandit)
+
+            for pack, key, linter in linters:
                 results.append(executor.submit(linter.run_dev_packages,
                                                no_flake8=no_flake8,
                                                no_bandit=no_bandit,
@@ -337,10 +381,18 @@ class LintManager:
                                                modules=self._facts["test_modules"],
                                                keep_container=keep_container,
                                                test_xml=test_xml,
-                                               no_coverage=no_coverage))
+                                               no_coverage=no_coverage,
+                                               host_results=host_results.get(linter)))
+                if results_cache:
+                    results_keys[results[-1]] = (pack, key)
+            if cached_count:
+                print(f"Using cached lint results of {Colors.Fg.cyan}{cached_count}/{len(self._pkgs)}{Colors.reset}"
+                      f" packages")
             try:
                 for future in concurrent.futures.as_completed(results):
                     pkg_status = future.result()
+                    if results_cache and future in results_keys:
+                        results_cache.set(*results_keys[future], pkg_status)
                     pkgs_status[pkg_status["pkg"]] = pkg_status
                     if pkg_status["exit_code"]:
                         for check, code in EXIT_CODES.items():
@@ -387,6 +439,105 @@ class LintManager:
             return_exit_code = FAIL
         return return_exit_code
 
+    def _run_host_linters_in_batches(self, executor: concurrent.futures.Executor, linters: List[Linter],
+                                     no_flake8: bool, no_bandit: bool) -> Dict[Linter, Dict[str, Tuple[int, str]]]:
+        """ Run the host linters which check each file on its own (flake8, bandit) once over many packages.
+
+        The facts of the packages are gathered first, and the packages whose lint commands are the same except for
+        the files (i.e. the same python executable) are linted together. The output is split back to the packages
+        by the file path which starts each output line. A batch whose output can't be split (stderr, or a line which
+        does not belong to any of the files) is not used, and its packages run the linter on their own.
+
+        Args:
+            executor(Executor): The executor used for gathering the packages facts.
+            linters(List[Linter]): Linters of the packages.
+            no_flake8(bool): Whether to skip flake8.
+            no_bandit(bool): Whether to skip bandit.
+
+        Returns:
+            dict: The results of the host lint checks of each package, by check name.
+        """
+        facts = [executor.submit(linter.gather_facts, self._facts["test_modules"]) for linter in linters]
+        concurrent.futures.wait(facts)
+        linters = [linter for linter, gathered in zip(linters, facts) if not gathered.exception()]
+        content_repo: Union[Path, str] = "" if not self._facts["content_repo"] else \
+            Path(self._facts["content_repo"].working_dir)
+        host_results: Dict[Linter, Dict[str, Tuple[int, str]]] = {}
+        lint_checks: List[Tuple[str, Callable[[list, float], str]]] = []
+        if not no_flake8:
+            lint_checks.append(("flake8", build_flake8_command))
+        if not no_bandit:
+            lint_checks.append(("bandit", lambda files, py_num: build_bandit_command(files)))
+
+        for lint_check, build_command in lint_checks:
+            # Group the packages by their command without files
+            batches: Dict[str, List[Linter]] = {}
+            for linter in linters:
+                if linter.get_host_lint_files(lint_check):
+                    batches.setdefault(build_command([], linter.python_version), []).append(linter)
+
+            for batch_linters in batches.values():
+                for i in range(0, len(batch_linters), HOST_LINTERS_BATCH_SIZE):
+                    chunk = batch_linters[i:i + HOST_LINTERS_BATCH_SIZE]
+                    files: Dict[str, Linter] = {}
+                    for linter in chunk:
+                        for lint_file in linter.get_host_lint_files(lint_check):
+                            files[str(lint_file)] = files[os.path.abspath(lint_file)] = linter
+                    lint_files = [lint_file for linter in chunk for lint_file in linter.get_host_lint_files(lint_check)]
+                    logger.info(f"{lint_check} - Running on {len(chunk)} packages")
+                    stdout, stderr, exit_code = run_command_os(
+                        command=build_command(lint_files, chunk[0].python_version), cwd=content_repo)
+                    outputs = self._split_host_linter_output(stdout, files) if not stderr else None
+                    if outputs is None or (exit_code and not outputs):
+                        logger.info(f"{lint_check} - Unable to split the batch output, running on each package")
+                        continue
+                    for linter in chunk:
+                        output = outputs.get(linter) if exit_code else None
+                        host_results.setdefault(linter, {})[lint_check] = (FAIL, output) if output else (SUCCESS, "")
+
+        return host_results
+
+    @staticmethod
+    def _split_host_linter_output(output: str, files: Dict[str, Linter]) -> Optional[Dict[Linter, str]]:
+        """ Split the output of a host linter which ran on many packages to the packages.
+
+        Args:
+            output(str): The linter output, each line starts with the linted file path.
+            files(dict): The linted files, with the linter of their package.
+
+        Returns:
+            dict: The output of each package, or None if a line does not belong to any of the files.
+        """
+        outputs: Dict[Linter, str] = {}
+        for line in output.splitlines():
+            if not line:
+                continue
+            linter = files.get(line.split(':', 1)[0])
+            if not linter:
+                return None
+            outputs[linter] = outputs.get(linter, "") + line + "\n"
+        return outputs
+
+    def _get_results_cache(self, **flags) -> Optional[LintResultsCache]:
+        """ Get the lint results cache of the run.
+
+        Args:
+            flags: The command flags which affect the packages results.
+
+        Returns:
+            LintResultsCache: the cache, or None if it can't be used.
+        """
+        try:
+            return LintResultsCache(cache_dir=get_sdk_cache_path('lint_cache'),
+                                    content_repo=None if not self._facts["content_repo"] else
+                                    Path(self._facts["content_repo"].working_dir),
+                                    modules=self._facts["test_modules"],
+                                    requirements=[self._facts["requirements_2"], self._facts["requirements_3"]],
+                                    flags=dict(flags, docker_engine=self._facts["docker_engine"]))
+        except OSError as e:
+            logger.warning(f"Unable to use the lint results cache: {e}")
+            return None
+
     def _report_results(self, lint_status: dict, pkgs_status: dict, return_exit_code: int, return_warning_code: int,
                         skipped_code: int,
                         pkgs_type: list,
@@ -103,10 +103,13 @@ class Linter:
             "exit_code": SUCCESS,
             "warning_code": SUCCESS,
         }
+        # Whether the package should be skipped, None until the facts are gathered
+        self._skip: Optional[bool] = None
 
     def run_dev_packages(self, no_flake8: bool, no_bandit: bool, no_mypy: bool, no_pylint: bool, no_vulture: bool,
                          no_xsoar_linter: bool, no_pwsh_analyze: bool, no_pwsh_test: bool, no_test: bool, modules: dict,
-                         keep_container: bool, test_xml: str, no_coverage: bool) -> dict:
+                         keep_container: bool, test_xml: str, no_coverage: bool,
+                         host_results: Optional[Dict[str, Tuple[int, str]]] = None) -> dict:
         """ Run lint and tests on single package
         Performing the follow:
             1. Run the lint on OS - flake8, bandit, mypy.
@@ -125,12 +128,13 @@ class Linter:
             keep_container(bool): Whether to keep the test container
             test_xml(str): Path for saving pytest xml results
             no_coverage(bool): Run pytest without coverage report
+            host_results(dict): Results of host lint checks which were already run on the package, by check name
 
         Returns:
             dict: lint and test all status, pkg status)
         """
         # Gather information for lint check information
-        skip = self._gather_facts(modules)
+        skip = self.gather_facts(modules)
         # If not python pack - skip pack
         if skip:
             return self._pkg_lint_status
@@ -147,7 +151,8 @@ class Linter:
                                            no_bandit=no_bandit,
                                            no_mypy=no_mypy,
                                            no_vulture=no_vulture,
-                                           no_xsoar_linter=no_xsoar_linter)
+                                           no_xsoar_linter=no_xsoar_linter,
+                                           host_results=host_results)
 
                 # Run lint and test check on pack docker image
                 if self._facts["docker_engine"]:
@@ -165,6 +170,43 @@ class Linter:
             self._pkg_lint_status['exit_code'] += FAIL
         return self._pkg_lint_status
 
+    def gather_facts(self, modules: dict) -> bool:
+        """ Gathering facts about the package once, so they can be gathered before the package is linted.
+        Args:
+            modules(dict): Test mandatory modules to be ignore in lint check
+
+        Returns:
+            bool: Indicating if to continue further or not, if False exit Thread, Else continue.
+        """
+        if self._skip is None:
+            self._skip = self._gather_facts(modules)
+        return self._skip
+
+    @property
+    def python_version(self) -> float:
+        return self._facts["python_version"]
+
+    def get_host_lint_files(self, lint_check: str) -> List[Path]:
+        """ Get the files a lint check which runs on host would be run on, after the facts were gathered.
+
+        The paths are the ones the package run of the check is given, so the check gives the same results when it
+        runs on the files of many packages at once: flake8 runs in the content repo, and bandit runs in the package
+        directory on the absolute paths of the files.
+
+        Args:
+            lint_check(str): flake8 or bandit.
+
+        Returns:
+            List[Path]: The files to lint, empty if the check would not run on the package.
+        """
+        if self._skip is not False or self._pkg_lint_status["pack_type"] != TYPE_PYTHON:
+            return []
+        if lint_check == "flake8":
+            return self._facts["lint_files"] + self._facts["lint_unittest_files"]
+        if lint_check == "bandit":
+            return [Path(os.path.abspath(lint_file)) for lint_file in self._facts["lint_files"]]
+        return []
+
     def _gather_facts(self, modules: dict) -> bool:
         """ Gathering facts about the package - python version, docker images, valid docker image, yml parsing
         Args:
@@ -316,7 +358,7 @@ class Linter:
                 self._facts["lint_files"].remove(lint_file)
 
     def _run_lint_in_host(self, no_flake8: bool, no_bandit: bool, no_mypy: bool, no_vulture: bool,
-                          no_xsoar_linter: bool):
+                          no_xsoar_linter: bool, host_results: Optional[Dict[str, Tuple[int, str]]] = None):
         """ Run lint check on host
 
         Args:
@@ -324,15 +366,19 @@ class Linter:
             no_bandit(bool): Whether to skip bandit.
             no_mypy(bool): Whether to skip mypy.
             no_vulture(bool): Whether to skip Vulture.
+            host_results(dict): Results of checks which were already run on the package, by check name.
         """
         warning = []
         error = []
         other = []
         exit_code: int = 0
+        host_results = host_results or {}
         for lint_check in ["flake8", "XSOAR_linter", "bandit", "mypy", "vulture"]:
             exit_code = SUCCESS
             output = ""
-            if self._facts["lint_files"] or self._facts["lint_unittest_files"]:
+            if lint_check in host_results:
+                exit_code, output = host_results[lint_check]
+            elif self._facts["lint_files"] or self._facts["lint_unittest_files"]:
                 if lint_check == "flake8" and not no_flake8:
                     flake8_lint_files = copy.deepcopy(self._facts["lint_files"])
                     # if there are unittest.py then we would run flake8 on them too.
@@ -341,7 +387,7 @@ class Linter:
                     exit_code, output = self._run_flake8(py_num=self._facts["python_version"],
                                                          lint_files=flake8_lint_files)
 
-            if self._facts["lint_files"]:
+            if self._facts["lint_files"] and lint_check not in host_results:
                 if lint_check == "XSOAR_linter" and not no_xsoar_linter:
                     exit_code, output = self._run_xsoar_linter(py_num=self._facts["python_version"],
                                                                lint_files=self._facts["lint_files"])
@@ -472,6 +518,8 @@ class Linter:
         """
         log_prompt = f"{self._pack_name} - Bandit"
         logger.info(f"{log_prompt} - Start")
+        # The files are relative to the current directory, not to the package directory bandit runs in
+        lint_files = [Path(os.path.abspath(lint_file)) for lint_file in lint_files]
         stdout, stderr, exit_code = run_command_os(command=build_bandit_command(lint_files),
                                                    cwd=self._pack_abs_dir)
         logger.debug(f"{log_prompt} - Finished exit-code: {exit_code}")
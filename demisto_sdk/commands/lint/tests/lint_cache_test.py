@@ -0,0 +1,147 @@
+from wcmatch.pathlib import Path
+
+from demisto_sdk.commands.lint.helpers import EXIT_CODES, SUCCESS
+from demisto_sdk.commands.lint.lint_cache import LintResultsCache
+from demisto_sdk.commands.lint.lint_manager import LintManager
+from demisto_sdk.commands.lint.linter import Linter
+
+MODULES = {Path('CommonServerPython.py'): b'def demisto_func(): pass'}
+
+
+def get_pkg_status(pack_dir: Path, exit_code: int = SUCCESS, errors: list = None) -> dict:
+    return {
+        'pkg': pack_dir.name,
+        'pack_type': 'python',
+        'path': str(pack_dir),
+        'errors': errors or [],
+        'images': [],
+        'flake8_errors': 'flake8 error' if exit_code else None,
+        'exit_code': exit_code,
+        'warning_code': SUCCESS,
+    }
+
+
+def get_cache(tmp_path, pack, modules=None, **flags) -> LintResultsCache:
+    return LintResultsCache(cache_dir=str(tmp_path / 'lint_cache'), content_repo=Path(pack.repo_path),
+                            modules=modules or MODULES, requirements=[[], []], flags=flags)
+
+
+class TestLintResultsCache:
+    def test_get__unchanged_package(self, tmp_path, pack):
+        """
+        Given
+        - A package whose failed results were stored.
+
+        When
+        - Getting its results with a new cache of the same run settings.
+
+        Then
+        - Ensure the stored results are returned, with the coverage data of the package.
+        """
+        integration = pack.create_integration('Integration')
+        pack_dir = Path(integration.path)
+        (pack_dir / '.coverage').write_bytes(b'coverage data')
+        cache = get_cache(tmp_path, pack)
+        pkg_status = get_pkg_status(pack_dir, exit_code=EXIT_CODES['flake8'])
+        cache.set(pack_dir, cache.get_key(pack_dir), pkg_status)
+        (pack_dir / '.coverage').unlink()
+
+        cache = get_cache(tmp_path, pack)
+        assert cache.get(pack_dir, cache.get_key(pack_dir)) == pkg_status
+        assert (pack_dir / '.coverage').read_bytes() == b'coverage data'
+
+    def test_get__changed_inputs(self, tmp_path, pack):
+        """
+        Given
+        - A package whose results were stored.
+
+        When
+        - Changing the package code, the pack metadata, CommonServerPython or the command flags.
+
+        Then
+        - Ensure the stored results are not returned.
+        """
+        integration = pack.create_integration('Integration')
+        pack_dir = Path(integration.path)
+        cache = get_cache(tmp_path, pack, no_mypy=False)
+        key = cache.get_key(pack_dir)
+        cache.set(pack_dir, key, get_pkg_status(pack_dir))
+
+        assert get_cache(tmp_path, pack, no_mypy=True).get_key(pack_dir) != key
+        modules = {Path('CommonServerPython.py'): b'def changed_func(): pass'}
+        assert get_cache(tmp_path, pack, modules, no_mypy=False).get_key(pack_dir) != key
+
+        assert cache.get(pack_dir, cache.get_key(pack_dir)) is not None
+        pack.pack_metadata.update({'support': 'community'})
+        assert cache.get(pack_dir, cache.get_key(pack_dir)) is None
+
+        cache.set(pack_dir, cache.get_key(pack_dir), get_pkg_status(pack_dir))
+        integration.code.write('def main():\n    pass\n')
+        assert cache.get(pack_dir, cache.get_key(pack_dir)) is None
+
+    def test_set__unexpected_failures_are_not_stored(self, tmp_path, pack):
+        """
+        Given
+        - A package which failed on an unexpected exception, and a package which failed on its docker image creation.
+
+        When
+        - Storing their results.
+
+        Then
+        - Ensure the results are not stored.
+        """
+        integration = pack.create_integration('Integration')
+        pack_dir = Path(integration.path)
+        cache = get_cache(tmp_path, pack)
+        key = cache.get_key(pack_dir)
+
+        cache.set(pack_dir, key, get_pkg_status(pack_dir, errors=['Unexpected fatal exception']))
+        assert cache.get(pack_dir, key) is None
+        cache.set(pack_dir, key, get_pkg_status(pack_dir, exit_code=EXIT_CODES['image']))
+        assert cache.get(pack_dir, key) is None
+
+
+def test_run_dev_packages__replays_cached_results(mocker, pack):
+    """
+    Given
+    - Two packages, one of them fails flake8.
+
+    When
+    - Running lint twice, changing one of the packages before the second run.
+
+    Then
+    - Ensure only the changed package is linted again, and the exit code is the same on both runs.
+    """
+    integration = pack.create_integration('Integration')
+    script = pack.create_script('Script')
+    pack_dirs = [Path(integration.path), Path(script.path)]
+    mocker.patch.object(LintManager, '_get_packages', return_value=pack_dirs)
+    facts = {'content_repo': None, 'test_modules': MODULES, 'requirements_2': [], 'requirements_3': [],
+             'docker_engine': False}
+    mocker.patch.object(LintManager, '_gather_facts', return_value=facts)
+    mocker.patch.object(Linter, '__init__', lambda self, pack_dir, **kwargs: setattr(self, 'pack_dir', pack_dir))
+    linted = []
+
+    def run_dev_packages(self, **kwargs):
+        linted.append(self.pack_dir)
+        exit_code = EXIT_CODES['flake8'] if self.pack_dir == pack_dirs[0] else SUCCESS
+        return get_pkg_status(self.pack_dir, exit_code=exit_code)
+
+    mocker.patch.object(Linter, 'run_dev_packages', run_dev_packages)
+    lint_flags = dict(parallel=1, no_flake8=False, no_xsoar_linter=True, no_bandit=True, no_mypy=True,
+                      no_pylint=True, no_coverage=True, coverage_report='', no_vulture=True, no_test=True,
+                      no_pwsh_analyze=True, no_pwsh_test=True, keep_container=False, test_xml='',
+                      failure_report='', docker_timeout=60)
+
+    lint_manager = LintManager(input='', git=False, all_packs=True, quiet=True, verbose=0, prev_ver='master')
+    assert lint_manager.run_dev_packages(**lint_flags) == 1
+    assert sorted(linted) == sorted(pack_dirs)
+
+    linted.clear()
+    script.code.write('def main():\n    pass\n')
+    assert lint_manager.run_dev_packages(**lint_flags) == 1
+    assert linted == [pack_dirs[1]]
+
+    linted.clear()
+    assert lint_manager.run_dev_packages(no_cache=True, **lint_flags) == 1
+    assert sorted(linted) == sorted(pack_dirs)
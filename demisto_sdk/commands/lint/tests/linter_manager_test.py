@@ -622,3 +622,93 @@ def test_create_json_output_xsoar_linter(repo, mocker):
         }
     ]
     assert json_contents == expected_format
+
+
+def get_mocked_linter(files: list, python_version: float = 3.8) -> MagicMock:
+    linter = MagicMock()
+    linter.python_version = python_version
+    linter.get_host_lint_files.return_value = files
+    return linter
+
+
+def test_split_host_linter_output():
+    """
+    Given
+    - The output of flake8 which ran on the files of two packages.
+
+    When
+    - Splitting the output to the packages.
+
+    Then
+    - Ensure each package gets the lines of its own files.
+    - Ensure the output is not split when a line does not belong to any of the files.
+    """
+    first, second = MagicMock(), MagicMock()
+    files = {'Packs/A/Integrations/A/A.py': first, 'Packs/B/Scripts/B/B.py': second}
+    output = 'Packs/A/Integrations/A/A.py:1:1: F401 unused import\n' \
+             'Packs/A/Integrations/A/A.py:2:1: E302 expected 2 blank lines\n'
+
+    assert LintManager._split_host_linter_output(output, files) == {first: output}
+    assert LintManager._split_host_linter_output(output + 'unexpected error\n', files) is None
+
+
+def test_run_host_linters_in_batches(mocker):
+    """
+    Given
+    - Three packages, two of them with the same python version, one of them has a flake8 error.
+
+    When
+    - Running flake8 in batches.
+
+    Then
+    - Ensure flake8 runs once for each python version, with the files of all the packages.
+    - Ensure only the failed package gets the flake8 errors.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from demisto_sdk.commands.lint import lint_manager
+    from demisto_sdk.commands.lint.helpers import FAIL, SUCCESS
+
+    error = 'Packs/A/Integrations/A/A.py:1:1: F401 unused import\n'
+    mocker.patch.object(lint_manager, 'run_command_os', side_effect=[(error, '', 1), ('', '', 0)])
+    manager = mock_lint_manager(mocker)
+    manager._facts['test_modules'] = {}
+    failed = get_mocked_linter(['Packs/A/Integrations/A/A.py'])
+    passed = get_mocked_linter(['Packs/B/Scripts/B/B.py'])
+    python2 = get_mocked_linter(['Packs/C/Scripts/C/C.py'], python_version=2.7)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        host_results = manager._run_host_linters_in_batches(executor=executor, linters=[failed, passed, python2],
+                                                            no_flake8=False, no_bandit=True)
+
+    commands = [call.kwargs['command'] for call in lint_manager.run_command_os.call_args_list]
+    assert commands == ['python3 -m flake8 Packs/A/Integrations/A/A.py Packs/B/Scripts/B/B.py',
+                        'python -m flake8 Packs/C/Scripts/C/C.py']
+    assert host_results == {failed: {'flake8': (FAIL, error)},
+                            passed: {'flake8': (SUCCESS, '')},
+                            python2: {'flake8': (SUCCESS, '')}}
+
+
+def test_run_host_linters_in_batches__unsplittable_output(mocker):
+    """
+    Given
+    - Two packages, and a flake8 run which failed with stderr.
+
+    When
+    - Running flake8 in batches.
+
+    Then
+    - Ensure no results are returned, so each package runs flake8 on its own.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from demisto_sdk.commands.lint import lint_manager
+
+    mocker.patch.object(lint_manager, 'run_command_os', return_value=('', 'flake8: error', 1))
+    manager = mock_lint_manager(mocker)
+    manager._facts['test_modules'] = {}
+    linters = [get_mocked_linter(['Packs/A/Integrations/A/A.py']), get_mocked_linter(['Packs/B/Scripts/B/B.py'])]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert manager._run_host_linters_in_batches(executor=executor, linters=linters,
+                                                    no_flake8=False, no_bandit=True) == {}
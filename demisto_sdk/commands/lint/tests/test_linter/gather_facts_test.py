@@ -1,3 +1,4 @@
+import os
 from typing import Callable
 
 from wcmatch.pathlib import Path
@@ -146,6 +147,31 @@ class TestLintFilesCollection:
         runner._gather_facts(modules={})
         assert not runner._facts["lint_files"]
 
+    def test_host_lint_files(self, mocker, monkeypatch, demisto_content: Callable, create_integration: Callable):
+        """
+        Given
+        - A python package given by a path relative to the content repo.
+
+        When
+        - Getting the files flake8 and bandit would run on from the host.
+
+        Then
+        - Ensure the flake8 files are relative to the content repo, which flake8 runs in.
+        - Ensure the bandit files are absolute, as bandit runs in the package directory.
+        """
+        mocker.patch.object(linter.Linter, '_docker_login')
+        mocker.patch.object(linter.Linter, '_update_support_level')
+        linter.Linter._docker_login.return_value = False
+        integration_path: Path = create_integration(content_path=demisto_content)
+        monkeypatch.chdir(demisto_content)
+        relative_path = Path(os.path.relpath(integration_path, demisto_content))
+        runner = initiate_linter(demisto_content, relative_path, True)
+        runner.gather_facts(modules={})
+
+        assert runner.get_host_lint_files('flake8') == [relative_path / f'{relative_path.name}.py',
+                                                        relative_path / f'{relative_path.name}_test.py']
+        assert runner.get_host_lint_files('bandit') == [integration_path / f'{integration_path.name}.py']
+
 
 class TestTestRequirementsCollection:
     def test_test_requirements_exists(self, mocker, demisto_content: Callable, create_integration: Callable):
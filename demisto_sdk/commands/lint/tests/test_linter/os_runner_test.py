@@ -419,3 +419,30 @@ class TestRunLintInHost:
         linter_obj._run_vulture.assert_called_once()
         assert linter_obj._pkg_lint_status.get("exit_code") == EXIT_CODES['flake8'] + EXIT_CODES['bandit'] + \
             EXIT_CODES['mypy'] + EXIT_CODES['vulture'] + EXIT_CODES['XSOAR_linter']
+
+
+def test_run_lint_in_host__batched_results(linter_obj: Linter, lint_files: List[Path], mocker):
+    """
+    Given
+    - flake8 and bandit results of a package, from a batched run.
+
+    When
+    - Running the host lint checks of the package.
+
+    Then
+    - Ensure flake8 and bandit do not run again, and their results are used.
+    """
+    from demisto_sdk.commands.lint.helpers import EXIT_CODES, FAIL, SUCCESS
+
+    linter_obj._facts['lint_files'] = lint_files
+    mocker.patch.object(linter_obj, '_run_flake8')
+    mocker.patch.object(linter_obj, '_run_bandit')
+
+    linter_obj._run_lint_in_host(no_flake8=False, no_bandit=False, no_mypy=True, no_vulture=True,
+                                 no_xsoar_linter=True,
+                                 host_results={'flake8': (FAIL, 'flake8 error'), 'bandit': (SUCCESS, '')})
+
+    assert not linter_obj._run_flake8.called
+    assert not linter_obj._run_bandit.called
+    assert linter_obj._pkg_lint_status['exit_code'] == EXIT_CODES['flake8']
+    assert linter_obj._pkg_lint_status['flake8_errors'] == 'flake8 error'
@@ -1,10 +1,12 @@
 import io
 import json
 import math
+import multiprocessing
 import os
 import string
-from collections import defaultdict
-from typing import DefaultDict
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import DefaultDict, Dict, FrozenSet, List, Optional, Pattern
 
 import PyPDF2
 from bs4 import BeautifulSoup
@@ -62,9 +64,55 @@ DATES_REGEX = r'((\d{4}[/.-]\d{2}[/.-]\d{2})[T\s](\d{2}:?\d{2}:?\d{2}:?(\.\d{5,1
 UUID_REGEX = r'([\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{8,12})'
 # find any substring
 WHILEIST_REGEX = r'\S*{}\S*'
+NON_WHITESPACE_REGEX = re.compile(r'\S+')
 
 
 # disable-secrets-detection-end
+# the position of each printable character, the entropy sums its terms in this order
+PRINTABLE_CHARACTERS_ORDER = {char: index for index, char in enumerate(string.printable)}
+
+# the validator of the running secrets detection, inherited by the files scanning processes (secrets --workers)
+_WORKER_SECRETS_VALIDATOR: Optional['SecretsValidator'] = None
+
+
+def _search_file_secrets_worker(file_path_and_ignore_entropy: tuple) -> Dict[int, List[str]]:
+    return _WORKER_SECRETS_VALIDATOR.search_file_secrets(*file_path_and_ignore_entropy)  # type: ignore
+
+
+def _white_list_trie_regex(trie: dict) -> str:
+    alternatives = [re.escape(char) + _white_list_trie_regex(child) for char, child in sorted(trie.items()) if char]
+    if not alternatives:
+        return ''
+    regex = alternatives[0] if len(alternatives) == 1 else f'(?:{"|".join(alternatives)})'
+    # an item ends in this node, so the longer items which continue it are optional
+    return f'(?:{regex})?' if '' in trie else regex
+
+
+@lru_cache(maxsize=16)
+def compile_white_list(white_list: FrozenSet[str]) -> Pattern:
+    """Compiles the whitelist items into a single regex which finds any of them.
+
+    The items are arranged in a trie, so matching at a position checks each character once instead of once per item.
+
+    Arguments:
+        white_list (frozenset): The whitelist items.
+
+    Returns:
+        Pattern: The compiled regex of the whitelist items.
+    """
+    trie: dict = {}
+    for item in white_list:
+        node = trie
+        for char in item:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    try:
+        # an empty whitelist must not find anything
+        return re.compile(_white_list_trie_regex(trie) if trie else r'(?!)')
+    except (re.error, RecursionError) as err:
+        error_string = f"Could not use secrets with whitelist of {len(white_list)} items"
+        print_error(error_string)
+        raise re.error(error_string, str(err))
 
 
 class SecretsValidator(object):
@@ -72,7 +120,7 @@ class SecretsValidator(object):
     def __init__(
             self,
             configuration=Configuration(), is_circle=False, ignore_entropy=False, white_list_path='',
-            input_path='', prev_ver=None
+            input_path='', prev_ver=None, workers=1
     ):
         self.input_paths = input_path.split(',') if input_path else None
         self.configuration = configuration
@@ -80,6 +128,7 @@ class SecretsValidator(object):
         self.white_list_path = white_list_path
         self.ignore_entropy = ignore_entropy
         self.prev_ver = prev_ver if prev_ver is not None else 'origin/master'
+        self.workers = workers or 1
 
     def get_secrets(self, branch_name, is_circle):
         secret_to_location_mapping = {}
@@ -177,63 +226,102 @@ class SecretsValidator(object):
         :return: dictionary(filename: (list)secrets) of strings sorted by file name for secrets found in files
         """
         secret_to_location_mapping: DefaultDict[str, defaultdict] = defaultdict(lambda: defaultdict(list))
-        for file_path in secrets_file_paths:
-            # Get if file path in pack and pack name
-            is_pack = is_file_path_in_pack(file_path)
-            pack_name = get_pack_name(file_path)
-            # Get generic/ioc/files white list sets based on if pack or not
-            secrets_white_list, ioc_white_list, files_white_list = self.get_white_listed_items(is_pack, pack_name)
-            # Skip white listed files
-
-            if file_path in files_white_list:
-                print("Skipping secrets detection for file: {} as it is white listed".format(file_path))
-                continue
-            # Init vars for current loop
-            file_name = os.path.basename(file_path)
-            _, file_extension = os.path.splitext(file_path)
-            # get file contents
-            file_contents = self.get_file_contents(file_path, file_extension)
-            # if detected disable-secrets comments, removes the line/s
-            file_contents = self.remove_secrets_disabled_line(file_contents)
-            # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
-            if is_pack:
-                file_contents = self.remove_whitelisted_items_from_file(file_contents, secrets_white_list)
-
-            yml_file_contents = self.get_related_yml_contents(file_path)
-            # Add all context output paths keywords to whitelist temporary
-            if file_extension == YML_FILE_EXTENSION or yml_file_contents:
-                temp_white_list = self.create_temp_white_list(yml_file_contents if yml_file_contents else file_contents)
-                secrets_white_list = secrets_white_list.union(temp_white_list)
-            # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
-            for line_num, line in enumerate(file_contents.split('\n')):
-                # REGEX scanning for IOCs and false positive groups
-                regex_secrets, false_positives = self.regex_for_secrets(line)
-                for regex_secret in regex_secrets:
-                    if not any(ioc.lower() in regex_secret.lower() for ioc in ioc_white_list):
-                        secret_to_location_mapping[file_path][line_num + 1].append(regex_secret)
-                # added false positives into white list array before testing the strings in line
-
-                secrets_white_list = secrets_white_list.union(false_positives)
-
-                if not ignore_entropy:
-                    # due to nature of eml files, skip string by string secret detection - only regex
-                    if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or \
-                            any(demisto_type in file_name for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS):
-                        continue
-                    line = self.remove_false_positives(line)
-                    # calculate entropy for each string in the file
-                    for string_ in line.split():
-                        # compare the lower case of the string against both generic whitelist & temp white list
-                        if not any(
-                                white_list_string.lower() in string_.lower()
-                                for white_list_string in secrets_white_list):
-
-                            entropy = self.calculate_shannon_entropy(string_)
-                            if entropy >= ENTROPY_THRESHOLD:
-                                secret_to_location_mapping[file_path][line_num + 1].append(string_)
+        if self.workers > 1 and len(secrets_file_paths) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            files_secrets = self.search_files_secrets_in_parallel(secrets_file_paths, ignore_entropy)
+        else:
+            files_secrets = [self.search_file_secrets(file_path, ignore_entropy) for file_path in secrets_file_paths]
+
+        for file_path, file_secrets in zip(secrets_file_paths, files_secrets):
+            for line_num, secrets in file_secrets.items():
+                secret_to_location_mapping[file_path][line_num].extend(secrets)
 
         return secret_to_location_mapping
 
+    def search_files_secrets_in_parallel(self, secrets_file_paths: list, ignore_entropy: bool) -> List[dict]:
+        """Searches the given files for secrets in a pool of `self.workers` processes (--workers option).
+
+        Arguments:
+            secrets_file_paths (list): The paths of the files to search.
+            ignore_entropy (bool): Whether to skip the entropy algorithm.
+
+        Returns:
+            list: The secrets found in each of the files, in the files order.
+        """
+        global _WORKER_SECRETS_VALIDATOR
+        _WORKER_SECRETS_VALIDATOR = self
+        try:
+            with multiprocessing.get_context('fork').Pool(processes=self.workers) as pool:
+                return pool.map(_search_file_secrets_worker,
+                                [(file_path, ignore_entropy) for file_path in secrets_file_paths])
+        finally:
+            _WORKER_SECRETS_VALIDATOR = None
+
+    def search_file_secrets(self, file_path: str, ignore_entropy: bool = False) -> Dict[int, List[str]]:
+        """Returns potential secrets(sensitive data) found in a single file
+        :param file_path: path of the file to search
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+
+        :return: dictionary(line number: (list)secrets) of the secrets found in the file
+        """
+        file_secrets: DefaultDict[int, List[str]] = defaultdict(list)
+        # Get if file path in pack and pack name
+        is_pack = is_file_path_in_pack(file_path)
+        pack_name = get_pack_name(file_path)
+        # Get generic/ioc/files white list sets based on if pack or not
+        secrets_white_list, ioc_white_list, files_white_list = self.get_white_listed_items(is_pack, pack_name)
+        # Skip white listed files
+
+        if file_path in files_white_list:
+            print("Skipping secrets detection for file: {} as it is white listed".format(file_path))
+            return file_secrets
+        # Init vars for current loop
+        file_name = os.path.basename(file_path)
+        _, file_extension = os.path.splitext(file_path)
+        # get file contents
+        file_contents = self.get_file_contents(file_path, file_extension)
+        # if detected disable-secrets comments, removes the line/s
+        file_contents = self.remove_secrets_disabled_line(file_contents)
+        # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
+        if is_pack:
+            file_contents = self.remove_whitelisted_items_from_file(file_contents, secrets_white_list)
+
+        # the generic whitelist is matched by a single compiled regex, the temp white list and false positives of
+        # the file are few, so they are checked one by one
+        white_list_regex = compile_white_list(frozenset(item.lower() for item in secrets_white_list))
+        file_white_list: set = set()
+        yml_file_contents = self.get_related_yml_contents(file_path)
+        # Add all context output paths keywords to whitelist temporary
+        if file_extension == YML_FILE_EXTENSION or yml_file_contents:
+            file_white_list = self.create_temp_white_list(yml_file_contents if yml_file_contents else file_contents)
+        # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
+        for line_num, line in enumerate(file_contents.split('\n')):
+            # REGEX scanning for IOCs and false positive groups
+            regex_secrets, false_positives = self.regex_for_secrets(line)
+            for regex_secret in regex_secrets:
+                if not any(ioc.lower() in regex_secret.lower() for ioc in ioc_white_list):
+                    file_secrets[line_num + 1].append(regex_secret)
+            # added false positives into white list array before testing the strings in line
+            file_white_list.update(false_positive.lower() for false_positive in false_positives)
+
+            if not ignore_entropy:
+                # due to nature of eml files, skip string by string secret detection - only regex
+                if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or \
+                        any(demisto_type in file_name for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS):
+                    continue
+                line = self.remove_false_positives(line)
+                # calculate entropy for each string in the file
+                for string_ in line.split():
+                    # compare the lower case of the string against both generic whitelist & temp white list
+                    lower_string = string_.lower()
+                    if not white_list_regex.search(lower_string) and not any(
+                            white_list_string.lower() in lower_string for white_list_string in file_white_list):
+
+                        entropy = self.calculate_shannon_entropy(string_)
+                        if entropy >= ENTROPY_THRESHOLD:
+                            file_secrets[line_num + 1].append(string_)
+
+        return dict(file_secrets)
+
     @staticmethod
     def remove_whitelisted_items_from_file(file_content: str, secrets_white_list: set) -> str:
         """Removes whitelisted items from file content
@@ -245,14 +333,23 @@ class SecretsValidator(object):
         Returns:
             str: The file content with the whitelisted items removed.
         """
-        for item in secrets_white_list:
+        # an item which spans a whitespace can't be found in a single string, so it's removed on its own
+        spanning_items = {item for item in secrets_white_list if re.search(r'\s', item)}
+        for item in spanning_items:
             try:
                 file_content = re.sub(WHILEIST_REGEX.format(re.escape(item)), '', file_content)
             except re.error as err:
                 error_string = f"Could not use secrets with item: {item}"
                 print_error(error_string)
                 raise re.error(error_string, str(err))
-        return file_content
+
+        white_list = frozenset(secrets_white_list) - spanning_items
+        if not white_list:
+            return file_content
+        # same as removing the `\S*item\S*` matches of every item, in a single pass over the file strings
+        white_list_regex = compile_white_list(white_list)
+        return NON_WHITESPACE_REGEX.sub(
+            lambda match: '' if white_list_regex.search(match.group()) else match.group(), file_content)
 
     @staticmethod
     def create_temp_white_list(file_contents) -> set:
@@ -337,13 +434,13 @@ class SecretsValidator(object):
         if not data:
             return 0
         entropy = 0.0
-        # each unicode code representation of all characters which are considered printable
-        for char in (ord(c) for c in string.printable):
+        char_counts: Counter = Counter(data)
+        # only the characters which are considered printable are counted, in the order of string.printable
+        for char in sorted(char_counts.keys() & PRINTABLE_CHARACTERS_ORDER.keys(), key=PRINTABLE_CHARACTERS_ORDER.__getitem__):
             # probability of event X
-            p_x = float(data.count(chr(char))) / len(data)
-            if p_x > 0:
-                # the information in every possible news, in bits
-                entropy += - p_x * math.log(p_x, 2)
+            p_x = float(char_counts[char]) / len(data)
+            # the information in every possible news, in bits
+            entropy += - p_x * math.log(p_x, 2)
         return entropy
 
     def get_white_listed_items(self, is_pack, pack_name):
@@ -1,10 +1,15 @@
+import hashlib
 import io
 import json
+import math
 import os
+import re
 import shutil
+import string
 
 from demisto_sdk.commands.common.legacy_git_tools import git_path
-from demisto_sdk.commands.secrets.secrets import SecretsValidator
+from demisto_sdk.commands.secrets.secrets import (WHILEIST_REGEX,
+                                                  SecretsValidator)
 
 
 def create_whitelist_secrets_file(file_path, urls=None, ips=None, files=None, generic_strings=None):
@@ -156,6 +161,35 @@ my_email = "fooo@someorg.com"
         assert secrets_found[os.path.join(dir1_path, file_name)] == {4: ['fooo@someorg.com']}
         assert secrets_found[os.path.join(dir2_path, file_name)] == {4: ['fooo@someorg.com']}
 
+    def test_search_potential_secrets__workers(self, tmp_path):
+        """
+        Given
+        - Files with secrets, a file without secrets and a whitelist.
+
+        When
+        - Searching the files for secrets in 2 processes.
+
+        Then
+        - Ensure the secrets of each file are the same as when searching them in a single process.
+        """
+        white_list_path = str(tmp_path / TestSecrets.WHITE_LIST_FILE_NAME)
+        create_whitelist_secrets_file(white_list_path, generic_strings=['OIifdsnsjkgnjwhitelisted'])
+        file_paths = []
+        for i in range(4):
+            file_path = tmp_path / f'file{i}.txt'
+            file_path.write_text(f'my_email = "fooo{i}@someorg.com"\n'
+                                 f'API_KEY = OIifdsnsjkgnj3254nkdfsjKNJD034{i}\n'
+                                 f'OIifdsnsjkgnjwhitelisted{i}\n' if i != 2 else 'no secrets here\n')
+            file_paths.append(str(file_path))
+
+        serial_secrets = SecretsValidator(white_list_path=white_list_path).search_potential_secrets(file_paths)
+        parallel_secrets = SecretsValidator(white_list_path=white_list_path,
+                                            workers=2).search_potential_secrets(file_paths)
+
+        assert parallel_secrets == serial_secrets
+        assert list(parallel_secrets) == [file_paths[0], file_paths[1], file_paths[3]]
+        assert parallel_secrets[file_paths[3]] == {1: ['fooo3@someorg.com'], 2: ['OIifdsnsjkgnj3254nkdfsjKNJD0343']}
+
     def test_remove_white_list_regex(self):
         white_list = '155.165.45.232'
         file_contents = '''
@@ -198,6 +232,32 @@ my_email = "fooo@someorg.com"
         '''
         assert white_list not in self.validator.remove_whitelisted_items_from_file(file_contents, {white_list})
 
+    def test_remove_whitelisted_items_from_file__same_as_removing_each_item(self):
+        """
+        Given
+        - White list with items which are substrings of each other, regex characters, an item with a space
+          and an item which is found in the middle of a string.
+
+        When
+        - Removing the whitelisted items from a file content.
+
+        Then
+        - Ensure the result is the same as removing the items one by one.
+        """
+        white_list = {'boop', 'boopshmoop', 'shmoop', '***.url', 'url.com', 'sade sade', 'a+b', 'xsoar'}
+        file_contents = '''
+        boopshmoop shmoo boo(p) sade sade sad sade
+        ***.url a+b=c ab+
+        cool@url.com	https://url.com/path?q=1 url.co
+        https://www.xsoar.pan.dev XSOAR
+        '''
+        expected_contents = file_contents
+        for item in white_list:
+            expected_contents = re.sub(WHILEIST_REGEX.format(re.escape(item)), '', expected_contents)
+
+        assert self.validator.remove_whitelisted_items_from_file(file_contents, white_list) == expected_contents
+        assert self.validator.remove_whitelisted_items_from_file(file_contents, set()) == file_contents
+
     def test_temp_white_list(self):
         file_contents = self.validator.get_file_contents(self.TEST_YML_FILE, '.yml')
         temp_white_list = self.validator.create_temp_white_list(file_contents)
@@ -219,6 +279,26 @@ my_email = "fooo@someorg.com"
         entropy = self.validator.calculate_shannon_entropy(test_string)
         assert entropy == 2.0
 
+    def test_calculate_shannon_entropy__only_printable_characters(self):
+        """
+        Given
+        - Strings with repeated, non printable and non ascii characters.
+
+        When
+        - Calculating their entropy.
+
+        Then
+        - Ensure only the printable characters are counted, relative to the whole string length.
+        """
+        for test_string in ('OIifdsnsjkgnj3254nkdfsjKNJD0345', 'aaaa', 'ab\x00\x01', 'שלום sade', ''):
+            expected_entropy = 0.0
+            for char in string.printable:
+                p_x = test_string.count(char) / len(test_string) if test_string else 0
+                if p_x > 0:
+                    expected_entropy += - p_x * math.log(p_x, 2)
+
+            assert self.validator.calculate_shannon_entropy(test_string) == expected_entropy
+
     def test_get_packs_white_list(self):
         final_white_list, ioc_white_list, files_while_list = \
             self.validator.get_packs_white_list(self.TEST_WHITELIST_FILE_PACKS)
@@ -339,3 +419,39 @@ my_email = "fooo@someorg.com"
         mocker.patch("demisto_sdk.commands.secrets.secrets.SecretsValidator.get_secrets", return_value=True)
         result = self.validator.find_secrets()
         assert result
+
+    def test_search_potential_secrets__large_white_list(self, tmp_path, monkeypatch, mocker):
+        """
+        Given
+        - A pack file of 5000 lines, and a generic whitelist and a pack whitelist of 3000 items.
+
+        When
+        - Searching the file for secrets.
+
+        Then
+        - Ensure the whitelisted strings are ignored and the secrets are found.
+        - Ensure the whitelist items are removed from the file in a single pass, and not substituted one by one.
+        """
+        monkeypatch.chdir(tmp_path)
+        white_list = [hashlib.md5(str(i).encode()).hexdigest()[:5 + i % 10] for i in range(3000)]
+        white_list_path = str(tmp_path / TestSecrets.WHITE_LIST_FILE_NAME)
+        create_whitelist_secrets_file(white_list_path, generic_strings=white_list[:1500])
+        pack_path = tmp_path / 'Packs' / 'WhitelistPack'
+        os.makedirs(pack_path / 'Scripts')
+        (pack_path / '.secrets-ignore').write_text('\n'.join(white_list[1500:]))
+        lines = []
+        for i in range(5000):
+            whitelisted = white_list[i % 3000]
+            lines.append(f'  key{i}: value with a whitelisted {whitelisted}X9q and printable words {i}')
+            if i % 1000 == 0:
+                lines.append(f'  API_KEY{i} = OIifdsnsjkgnj3254nkdfsjKNJD{i}')
+        file_path = pack_path / 'Scripts' / 'script.txt'
+        file_path.write_text('\n'.join(lines))
+
+        sub_spy = mocker.spy(re, 'sub')
+        secrets_found = SecretsValidator(white_list_path=white_list_path).search_potential_secrets(
+            [os.path.join('Packs', 'WhitelistPack', 'Scripts', 'script.txt')])
+
+        assert [secret for secrets in secrets_found.values() for line_secrets in secrets.values()
+                for secret in line_secrets] == [f'OIifdsnsjkgnj3254nkdfsjKNJD{i}' for i in range(0, 5000, 1000)]
+        assert sub_spy.call_count == 0
@@ -292,3 +292,49 @@ class TestTimeStampReplacer:
         time_stamp_replacer.request(flow)
         assert flow.request.content == b'--fixed_boundary\nContent-Disposision: form-data; ' \
                                        b'name="test"\n\nsomething\n--fixed_boundary--'
+
+
+def get_recorded_body(i: int) -> dict:
+    return {
+        'id': f'{i:08x}-ad13-47dd-8955-c8f7ccd5cba1',
+        'name': f'incident_{i}',
+        'type': 'Phishing',
+        'severity': 3,
+        'url': f'https://example.com/api/v1/incidents?id={i}',
+        'email': f'user{i}@example.com',
+        'description': 'A long description of the incident. ' * 5,
+        'created': f'2021-01-{i % 28 + 1:02d}T13:18:12+00:00',
+        'query': {
+            'filter': {'fromDate': TIMESTAMP_FORMATS[i % len(TIMESTAMP_FORMATS)], 'page': i % 10, 'size': 50},
+            'fields': ['name', 'owner', 'status'],
+        },
+        'lastRun': 1610639147000 + i,
+        'labels': [{'type': 'Email/subject', 'value': f'Subject {i % 50}'},
+                   {'type': 'time', 'value': '2021-01-14 17:44:00.571043'}],
+    }
+
+
+def test_determine_problematic_keys__large_recorded_bodies(mocker):
+    """
+    Given:
+        - Many recorded request bodies with ids, names, urls, emails, free text, epoch timestamps and date strings
+    When:
+        - Determining the problematic keys of all the bodies
+    Then:
+        - Ensure exactly the timestamp keys are found
+        - Ensure each value is parsed as a date at most once, and the ids, names, urls and emails are not parsed
+    """
+    bodies = [get_recorded_body(i) for i in range(1000)]
+    time_stamp_replacer = TimestampReplacer()
+    TimestampReplacer.is_timestamp.cache_clear()
+    safely_parse = mocker.patch.object(TimestampReplacer, 'safely_parse', side_effect=TimestampReplacer.safely_parse)
+
+    problematic_keys = set()
+    for body in bodies:
+        problematic_keys.update(time_stamp_replacer.determine_problematic_keys(body))
+
+    assert problematic_keys == {'created', 'query.filter.fromDate', 'lastRun', 'labels.1.value'}
+    parsed_values = [str(call.args[0]) for call in safely_parse.call_args_list]
+    assert len(parsed_values) == len(set(parsed_values))
+    assert not any(non_timestamp in value for value in parsed_values
+                   for non_timestamp in ('-ad13-', 'incident_', 'https://', '@example.com'))
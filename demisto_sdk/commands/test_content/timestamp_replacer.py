@@ -1,13 +1,14 @@
 import functools
 import json
 import logging
+import re
 import urllib
 from ast import literal_eval
 from collections import OrderedDict
 from copy import deepcopy
 from os import path
 from time import ctime
-from typing import List, Union
+from typing import Any, Iterator, List, Tuple, Union
 
 from dateparser import parse
 from mitmproxy import ctx
@@ -19,6 +20,15 @@ from mitmproxy.script import concurrent
 logging.basicConfig(level=logging.DEBUG,
                     format='[%(asctime)s] - [%(funcName)s] - %(message)s')
 
+# Longer values are free text or encoded data rather than timestamps.
+MAX_TIMESTAMP_LENGTH = 100
+# Characters which do not appear in timestamps, but are common in ids, urls and encoded data.
+NON_TIMESTAMP_CHARACTERS = frozenset('_=@{}[]<>"\\|$#`~^*?!;&')
+# Letters and digits alternating within a word (e.g. 'c8f7ccd5cba1'), as in hashes and ids rather than timestamps.
+HASH_LIKE_PATTERN = re.compile(r'[a-zA-Z]+[0-9]+[a-zA-Z]+[0-9]+[a-zA-Z]')
+# Number of values whose timestamp verdict is memoized.
+TIMESTAMP_VERDICTS_CACHE_SIZE = 65536
+
 
 def record_concurrently(replaying: bool = False):
     """
@@ -302,9 +312,8 @@ class TimestampReplacer:
         logging.info('query_data: {}'.format(query_data))
         for key, val in query_data:
             # don't bother trying to interpret an argument less than 4 characters as some type of timestamp
-            if len(val) > 4:
-                if self.safely_parse(val):
-                    self.query_keys.add(key)
+            if len(val) > 4 and self.is_timestamp(val):
+                self.query_keys.add(key)
 
     def handle_multipart_form(self, req: HTTPRequest) -> None:
         """Used when detecting what keys in a multipart form to replace with constants.
@@ -315,9 +324,8 @@ class TimestampReplacer:
         if req.multipart_form:
             for key, val in req.multipart_form.items(multi=True):
                 # don't bother trying to interpret an argument less than 4 characters as some type of timestamp
-                if len(val) > 4:
-                    if self.safely_parse(val):
-                        self.form_keys.add(key)
+                if len(val) > 4 and self.is_timestamp(val):
+                    self.form_keys.add(key)
 
     def handle_urlencoded_form(self, req: HTTPRequest) -> None:
         """Used when detecting what keys in an url encoded parameters to replace with constants.
@@ -328,9 +336,8 @@ class TimestampReplacer:
         if req.urlencoded_form:
             for key, val in req.urlencoded_form.items(multi=True):
                 # don't bother trying to interpret an argument less than 4 characters as some type of timestamp
-                if len(val) > 4:
-                    if self.safely_parse(val):
-                        self.form_keys.add(key)
+                if len(val) > 4 and self.is_timestamp(val):
+                    self.form_keys.add(key)
 
     def handle_json_body(self, req: HTTPRequest) -> None:
         """Used when detecting what keys in a request's json body to replace with constants.
@@ -376,60 +383,49 @@ class TimestampReplacer:
             List[str]: A list of keys (in dot notation, e.g. 'query.filter.time' is an example of what could be one
                 problematic key) whose values are potentially timestamp data.
         """
-        def travel_dict(obj: Union[dict, list], key_path='') -> List[str]:
-            bad_key_paths = []
-            if isinstance(obj, dict):
-                for key, val in obj.items():
-                    sub_key_path = '{}.{}'.format(key_path, key) if key_path else key
-                    if isinstance(val, (list, dict)):
-                        bad_key_paths.extend(travel_dict(val, sub_key_path))
-                    else:
-                        is_string = isinstance(val, str) and len(val) > 4
-                        possible_timestamp = isinstance(val, (int, float)) and len(str(val)) >= 8
-                        if is_string or possible_timestamp:
-                            for_eval = val
-                            if possible_timestamp:
-                                if isinstance(for_eval, float):
-                                    digits = str(val).split('.')
-                                    for_eval = digits[0]
-                                if len(str(for_eval)) < 13:
-                                    parsed_date = self.safely_parse(ctime(val))
-                                else:
-                                    parsed_date = self.safely_parse(ctime(val / 1000.0))
-                            else:
-                                parsed_date = self.safely_parse(val)
-                            # if parsed_date is not None then successfully interpreted value as some sort of
-                            # time related thingieding
-                            if parsed_date:
-                                bad_key_paths.append(sub_key_path)
-            elif isinstance(obj, list):
-                for i, val in enumerate(obj):
-                    sub_key_path = '{}.{}'.format(key_path, i) if key_path else i
-                    if isinstance(val, (list, dict)):
-                        bad_key_paths.extend(travel_dict(val, sub_key_path))
-                    else:
-                        is_string = isinstance(val, str) and len(val) > 4
-                        possible_timestamp = isinstance(val, (int, float)) and len(str(val)) >= 8
-                        if is_string or possible_timestamp:
-                            for_eval = val
-                            if possible_timestamp:
-                                if isinstance(for_eval, float):
-                                    digits = str(val).split('.')
-                                    for_eval = digits[0]
-                                if len(str(for_eval)) < 13:
-                                    parsed_date = self.safely_parse(ctime(val))
-                                else:
-                                    parsed_date = self.safely_parse(ctime(val / 1000.0))
-                            else:
-                                parsed_date = self.safely_parse(val)
-                            # if parsed_date is not None then successfully interpreted value as some sort of
-                            # time related thingieding
-                            if parsed_date:
-                                bad_key_paths.append(sub_key_path)
-            return bad_key_paths
-
-        bad_keys = travel_dict(content)
-        return bad_keys
+        bad_key_paths = []
+        # walk the body iteratively - each stack entry is the remaining items of a dict or a list and its key path
+        stack: List[Tuple[Iterator[Tuple[Any, Any]], Any]] = [(self._iterate_items(content), '')]
+        while stack:
+            items, key_path = stack[-1]
+            for key, val in items:
+                sub_key_path = '{}.{}'.format(key_path, key) if key_path else key
+                if isinstance(val, (list, dict)):
+                    stack.append((self._iterate_items(val), sub_key_path))
+                    break
+                if self.is_timestamp_value(val):
+                    bad_key_paths.append(sub_key_path)
+            else:
+                stack.pop()
+
+        return bad_key_paths
+
+    @staticmethod
+    def _iterate_items(obj: Union[dict, list]) -> Iterator[Tuple[Any, Any]]:
+        if isinstance(obj, dict):
+            return iter(obj.items())
+        if isinstance(obj, list):
+            return enumerate(obj)
+        return iter(())
+
+    def is_timestamp_value(self, val: Any) -> bool:
+        """Whether a json body value is potentially timestamp data - a date string or an epoch timestamp.
+
+        Args:
+            val (Any): The json value.
+
+        Returns:
+            bool: True if the value is potentially timestamp data, False otherwise.
+        """
+        if isinstance(val, str):
+            return len(val) > 4 and self.is_timestamp(val)
+        if isinstance(val, (int, float)) and len(str(val)) >= 8:
+            integer_digits = str(val).split('.')[0] if isinstance(val, float) else str(val)
+            # epoch timestamps of 13 digits and more are in milliseconds
+            if len(integer_digits) < 13:
+                return self.is_timestamp(ctime(val))
+            return self.is_timestamp(ctime(val / 1000.0))
+        return False
 
     def update_problem_keys_file(self):
         """Update the problem keys dictionary at the keys_filepath with new problematic keys"""
@@ -498,6 +494,27 @@ class TimestampReplacer:
             logging.info('"{}" path doesn\'t exist - no bad keys to set'.format(self.bad_keys_filepath))
             logging.info('not setting bad keys from file')
 
+    @staticmethod
+    @functools.lru_cache(maxsize=TIMESTAMP_VERDICTS_CACHE_SIZE)
+    def is_timestamp(val: str) -> bool:
+        """
+        Whether a value is potentially a timestamp. Obvious non-timestamps are rejected by cheap checks before trying
+        to parse the value as a date, and the verdict is memoized per value, as the same values recur in the requests.
+        Args:
+            val: The value to check
+
+        Returns:
+            True if the value is potentially a timestamp and False otherwise
+        """
+        if not isinstance(val, str) or len(val) > MAX_TIMESTAMP_LENGTH:
+            return False
+        # values without digits (e.g. 'now' or 'yesterday') are the same on every run, so they can not break playback
+        if not any(char.isdigit() for char in val) or not NON_TIMESTAMP_CHARACTERS.isdisjoint(val):
+            return False
+        if HASH_LIKE_PATTERN.search(val):
+            return False
+        return TimestampReplacer.safely_parse(val)
+
     @staticmethod
     def safely_parse(val):
         """
@@ -0,0 +1,104 @@
+# STD python packages
+import glob
+import io
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from demisto_sdk.commands.common.constants import (API_MODULES_PACK,
+                                                   INTEGRATIONS_DIR, PACKS_DIR,
+                                                   SCRIPTS_DIR)
+
+# General regex to find API module imports, for example: "from MicrosoftApiModule import *  # noqa: E402"
+API_MODULE_IMPORT_REGEX = r'from ([\w\d]+ApiModule) import \*(?:  # noqa: E402)?'
+
+# Code files of the packages which are not the package code.
+IGNORED_CODE_FILES_REGEX = r'_test\.py$|conftest\.py$'
+
+
+def get_api_module_path(module_name: str, content_path: str = '.') -> str:
+    """ The path of the API module code in the ApiModules pack. """
+    return os.path.join(content_path, PACKS_DIR, API_MODULES_PACK, SCRIPTS_DIR, module_name, module_name + '.py')
+
+
+class ApiModulesIndex:
+    """ Index of the API modules of a content repo, and of the integrations and scripts which import them.
+
+    The code of each API module is read once, and read again only if the module file was changed since. The dependents
+    of the API modules are found by a single scan of the packages code, done on the first dependents query. The code is
+    kept as read, since the unifier cleans the whole script after the module code is inserted into it.
+
+    Attributes:
+        content_path(str): The content repo path.
+    """
+
+    def __init__(self, content_path: str = '.'):
+        self.content_path = content_path
+        self._modules_code: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._dependents: Optional[Dict[str, List[str]]] = None
+        self._lock = threading.Lock()
+
+    def get_module_code(self, module_name: str, module_path: Optional[str] = None) -> str:
+        """ Get the code of an API module.
+
+        Args:
+            module_name(str): The API module name.
+            module_path(str): The API module code file path, the module path in the ApiModules pack by default.
+
+        Returns:
+            str: the API module code.
+
+        Raises:
+            OSError: if the API module code can't be read.
+        """
+        module_path = os.path.abspath(module_path or get_api_module_path(module_name, self.content_path))
+        module_stat = os.stat(module_path)
+        signature = (module_stat.st_mtime_ns, module_stat.st_size)
+        indexed_module = self._modules_code.get(module_path)
+        if indexed_module and indexed_module[0] == signature:
+            return indexed_module[1]
+        with io.open(module_path, mode='r', encoding='utf-8') as module_file:
+            module_code = module_file.read()
+        self._modules_code[module_path] = (signature, module_code)
+        return module_code
+
+    def _index_dependents(self) -> Dict[str, List[str]]:
+        dependents: Dict[str, Set[str]] = {}
+        for entity_dir in (INTEGRATIONS_DIR, SCRIPTS_DIR):
+            packages_pattern = os.path.join(self.content_path, PACKS_DIR, '*', entity_dir, '*', '*.py')
+            for code_path in glob.glob(packages_pattern):
+                if re.search(IGNORED_CODE_FILES_REGEX, code_path):
+                    continue
+                with io.open(code_path, mode='r', encoding='utf-8') as code_file:
+                    module_names = re.findall(API_MODULE_IMPORT_REGEX, code_file.read())
+                for module_name in module_names:
+                    dependents.setdefault(module_name, set()).add(os.path.relpath(os.path.dirname(code_path),
+                                                                                  self.content_path))
+        return {module_name: sorted(packages) for module_name, packages in dependents.items()}
+
+    def get_dependents(self, module_name: str) -> List[str]:
+        """ Get the packages which import an API module.
+
+        Args:
+            module_name(str): The API module name.
+
+        Returns:
+            List[str]: the directories of the integrations and scripts which import the API module, relative to the
+                content repo.
+        """
+        with self._lock:
+            if self._dependents is None:
+                self._dependents = self._index_dependents()
+        return self._dependents.get(module_name, [])
+
+
+_API_MODULES_INDEXES: Dict[str, ApiModulesIndex] = {}
+
+
+def get_api_modules_index(content_path: str = '.') -> ApiModulesIndex:
+    """ Get the API modules index of a content repo, created once per process. """
+    content_path = os.path.abspath(content_path)
+    if content_path not in _API_MODULES_INDEXES:
+        _API_MODULES_INDEXES[content_path] = ApiModulesIndex(content_path)
+    return _API_MODULES_INDEXES[content_path]
@@ -0,0 +1,119 @@
+import io
+import os
+
+from demisto_sdk.commands.unify import api_modules_index
+from demisto_sdk.commands.unify.api_modules_index import (
+    ApiModulesIndex, get_api_modules_index)
+from demisto_sdk.commands.unify.yml_unifier import YmlUnifier
+
+API_MODULE_CODE = 'def get_client():\n    return "client"\n'
+CODE_WITH_API_MODULE = 'def main():\n    get_client()\n\n\nfrom TestApiModule import *  # noqa: E402\n'
+
+
+def create_api_module(repo, code: str = API_MODULE_CODE):
+    api_module = repo.create_pack('ApiModules').create_script('TestApiModule')
+    api_module.create_default_script()
+    api_module.code.write(code)
+    return api_module
+
+
+class TestApiModulesIndex:
+    def test_get_module_code(self, repo, mocker):
+        """
+        Given
+        - An API module.
+
+        When
+        - Getting its code three times, the third after it was changed.
+
+        Then
+        - Ensure the module file is read once for the first two, and read again once after it was changed.
+        """
+        api_module = create_api_module(repo)
+        index = ApiModulesIndex(repo.path)
+        open_spy = mocker.spy(api_modules_index.io, 'open')
+
+        assert index.get_module_code('TestApiModule') == API_MODULE_CODE
+        assert index.get_module_code('TestApiModule') == API_MODULE_CODE
+        assert open_spy.call_count == 1
+
+        api_module.code.write(API_MODULE_CODE + '\n\ndef changed():\n    pass\n')
+        open_spy.reset_mock()
+        assert 'def changed' in index.get_module_code('TestApiModule')
+        assert open_spy.call_count == 1
+
+    def test_get_dependents(self, repo):
+        """
+        Given
+        - An integration and a script which import an API module, an integration whose tests only import it, and an
+          integration which imports another API module.
+
+        When
+        - Getting the dependents of each API module.
+
+        Then
+        - Ensure only the packages whose code imports the API module are its dependents.
+        """
+        create_api_module(repo)
+        pack = repo.create_pack('Pack')
+        integration = pack.create_integration('Dependent', code=CODE_WITH_API_MODULE)
+        script = pack.create_script('DependentScript', code=CODE_WITH_API_MODULE)
+        test_only = pack.create_integration('TestOnly', code='def main():\n    pass\n')
+        test_only.create_default_integration()
+        with open(os.path.join(test_only.path, 'TestOnly_test.py'), 'w') as test_file:
+            test_file.write(CODE_WITH_API_MODULE)
+        pack.create_integration('Other', code=CODE_WITH_API_MODULE.replace('TestApiModule', 'OtherApiModule'))
+        index = ApiModulesIndex(repo.path)
+
+        assert index.get_dependents('TestApiModule') == sorted([os.path.relpath(integration.path, repo.path),
+                                                                os.path.relpath(script.path, repo.path)])
+        assert index.get_dependents('OtherApiModule') == [os.path.join('Packs', 'Pack', 'Integrations', 'Other')]
+        assert index.get_dependents('MissingApiModule') == []
+
+    def test_get_api_modules_index(self, repo, monkeypatch):
+        """
+        Given
+        - A content repo.
+
+        When
+        - Getting its API modules index by a relative and an absolute path.
+
+        Then
+        - Ensure the same index is returned.
+        """
+        monkeypatch.chdir(repo.path)
+
+        assert get_api_modules_index() is get_api_modules_index(repo.path)
+        assert get_api_modules_index() is not get_api_modules_index(os.path.dirname(repo.path))
+
+
+def test_insert_module_code__many_integrations(repo, monkeypatch, mocker):
+    """
+    Given
+    - An API module, and many integrations which import it.
+
+    When
+    - Inserting the API module code into each of the integrations code, reading the module for each integration as
+      before, and by the API modules index.
+
+    Then
+    - Ensure both give the same code, and the API modules index reads the module once.
+    """
+    monkeypatch.chdir(repo.path)
+    create_api_module(repo, code=API_MODULE_CODE * 200)
+    module_import, module_name = YmlUnifier.check_api_module_imports(CODE_WITH_API_MODULE)
+
+    def get_api_module_code_by_read(module_name, module_path):
+        with io.open(module_path, mode='r', encoding='utf-8') as module_file:
+            return module_file.read()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(YmlUnifier, '_get_api_module_code', staticmethod(get_api_module_code_by_read))
+        read_codes = [YmlUnifier.insert_module_code(CODE_WITH_API_MODULE, module_import, module_name)
+                      for _ in range(300)]
+    open_spy = mocker.spy(api_modules_index.io, 'open')
+    index_codes = [YmlUnifier.insert_module_code(CODE_WITH_API_MODULE, module_import, module_name)
+                   for _ in range(300)]
+
+    assert index_codes == read_codes
+    assert open_spy.call_count == 1
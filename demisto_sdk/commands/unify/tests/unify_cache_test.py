@@ -0,0 +1,183 @@
+import os
+from pathlib import Path
+
+from demisto_sdk.commands.common.content.objects.pack_objects import (
+    Integration, Script)
+from demisto_sdk.commands.common.tools import get_sdk_cache_path
+from demisto_sdk.commands.unify.unify_cache import UnifiedContentCache
+from demisto_sdk.commands.unify.yml_unifier import YmlUnifier
+from TestSuite.repo import Repo
+
+API_MODULE_CODE = 'def get_client():\n    return "client"\n'
+CODE_WITH_API_MODULE = 'import demistomock as demisto\n\n\ndef main():\n    get_client()\n\n\n' \
+                       'from TestApiModule import *  # noqa: E402\n'
+
+
+def create_api_module(repo: Repo):
+    api_module = repo.create_pack('ApiModules').create_script('TestApiModule')
+    api_module.create_default_script()
+    api_module.code.write(API_MODULE_CODE)
+    return api_module
+
+
+def unify(integration, dest_dir: Path):
+    dest_dir.mkdir(exist_ok=True)
+    return Integration(integration.yml.path)._unify(dest_dir)
+
+
+class TestUnifiedContentCache:
+    def test_unify__unchanged_integration(self, repo, tmp_path, mocker):
+        """
+        Given
+        - An integration package, with code, image and description files.
+
+        When
+        - Unifying it into two destination directories.
+
+        Then
+        - Ensure it is unified once, and the same unified file is created in both directories.
+        """
+        integration = repo.create_pack('Pack').create_integration('Sample')
+        integration.create_default_integration()
+        merge_spy = mocker.spy(YmlUnifier, 'merge_script_package_to_yml')
+
+        first_files = unify(integration, tmp_path / 'content_packs')
+        second_files = unify(integration, tmp_path / 'content_new')
+
+        assert merge_spy.call_count == 1
+        assert [path.name for path in first_files] == [path.name for path in second_files] == ['integration-Sample.yml']
+        assert second_files[0].parent == tmp_path / 'content_new'
+        assert second_files[0].read_bytes() == first_files[0].read_bytes()
+        assert 'image: data:image/png;base64,' in second_files[0].read_text()
+
+    def test_unify__changed_package_files(self, repo, tmp_path, mocker):
+        """
+        Given
+        - A unified integration package.
+
+        When
+        - Unifying it again after changing its code, then its description.
+
+        Then
+        - Ensure it is unified again after each change, with the changed code and description.
+        """
+        integration = repo.create_pack('Pack').create_integration('Sample')
+        integration.create_default_integration()
+        unify(integration, tmp_path / 'first')
+        merge_spy = mocker.spy(YmlUnifier, 'merge_script_package_to_yml')
+
+        integration.code.write('def changed_code():\n    pass\n')
+        unified_file = unify(integration, tmp_path / 'second')[0]
+        assert 'changed_code' in unified_file.read_text()
+
+        integration.description.write('changed description')
+        unified_file = unify(integration, tmp_path / 'third')[0]
+        assert 'changed description' in unified_file.read_text()
+
+        assert merge_spy.call_count == 2
+
+    def test_unify__changed_api_module(self, repo, tmp_path, monkeypatch):
+        """
+        Given
+        - An integration which imports an API module.
+
+        When
+        - Unifying it, before and after changing the API module code.
+
+        Then
+        - Ensure the unified code holds the current API module code each time.
+        """
+        monkeypatch.chdir(repo.path)
+        api_module = create_api_module(repo)
+        integration = repo.create_pack('Pack').create_integration('Sample')
+        integration.create_default_integration()
+        integration.code.write(CODE_WITH_API_MODULE)
+
+        unified_file = unify(integration, tmp_path / 'first')[0]
+        assert 'return "client"' in unified_file.read_text()
+
+        api_module.code.write(API_MODULE_CODE.replace('"client"', '"changed client"'))
+        unified_file = unify(integration, tmp_path / 'second')[0]
+        assert 'return "changed client"' in unified_file.read_text()
+
+    def test_unify__script_with_dockerimage45(self, repo, tmp_path, mocker):
+        """
+        Given
+        - A script package with dockerimage45, which is unified into a 4.5 file and a 5.0 file.
+
+        When
+        - Unifying it into two destination directories.
+
+        Then
+        - Ensure it is unified once, and both files are created in both directories.
+        """
+        script = repo.create_pack('Pack').create_script('SampleScript')
+        script.create_default_script()
+        script.yml.update({'dockerimage45': 'demisto/python:1.3-alpine', 'fromversion': '4.1.0'})
+        merge_spy = mocker.spy(YmlUnifier, 'merge_script_package_to_yml')
+
+        for dest_dir in (tmp_path / 'first', tmp_path / 'second'):
+            dest_dir.mkdir()
+            created_files = Script(script.yml.path)._unify(dest_dir)
+            assert sorted(path.name for path in created_files) == ['script-SampleScript.yml',
+                                                                   'script-SampleScript_45.yml']
+            assert all(path.parent == dest_dir for path in created_files)
+
+        assert merge_spy.call_count == 1
+        assert (tmp_path / 'second' / 'script-SampleScript_45.yml').read_text() == \
+               (tmp_path / 'first' / 'script-SampleScript_45.yml').read_text()
+
+    def test_get__corrupted_entry(self, repo, tmp_path):
+        """
+        Given
+        - A cache entry which is not a valid json file.
+
+        When
+        - Getting the unified files of its key.
+
+        Then
+        - Ensure the package is considered not cached.
+        """
+        integration = repo.create_pack('Pack').create_integration('Sample')
+        integration.create_default_integration()
+        cache = UnifiedContentCache(str(tmp_path / 'unify_cache'))
+        key = cache.get_key(integration.path, 'Integrations')
+        os.makedirs(cache.cache_dir)
+        with open(cache._entry_path(integration.path, 'Integrations'), 'w') as entry_file:
+            entry_file.write('{"files": ')
+
+        assert cache.get(integration.path, 'Integrations', key) is None
+
+
+def test_unify__nightly_builds(repo, tmp_path, monkeypatch, mocker):
+    """
+    Given
+    - A repo with many integrations, some of which import an API module.
+
+    When
+    - Unifying all of them, then unifying them again with one of them changed.
+
+    Then
+    - Ensure the second build unifies only the changed integration and gives the same unified files for the others.
+    - Ensure the cache holds a single entry per integration after the change.
+    """
+    monkeypatch.chdir(repo.path)
+    create_api_module(repo)
+    pack = repo.create_pack('Pack')
+    integrations = []
+    for i in range(30):
+        integration = pack.create_integration(f'Sample{i}')
+        integration.create_default_integration(f'Sample{i}')
+        if i % 3 == 0:
+            integration.code.write(CODE_WITH_API_MODULE)
+        integrations.append(integration)
+
+    first_build = [unify(integration, tmp_path / 'first')[0] for integration in integrations]
+    integrations[0].description.write('changed description')
+    merge_spy = mocker.spy(YmlUnifier, 'merge_script_package_to_yml')
+    second_build = [unify(integration, tmp_path / 'second')[0] for integration in integrations]
+
+    assert merge_spy.call_count == 1
+    assert 'changed description' in second_build[0].read_text()
+    assert [path.read_text() for path in second_build[1:]] == [path.read_text() for path in first_build[1:]]
+    assert len(os.listdir(get_sdk_cache_path('unify_cache'))) == len(integrations)
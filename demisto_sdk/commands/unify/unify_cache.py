@@ -0,0 +1,119 @@
+# STD python packages
+import hashlib
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+from demisto_sdk.commands.common.constants import PACKS_PACK_META_FILE_NAME
+from demisto_sdk.commands.common.tools import (get_sdk_cache_path,
+                                               read_json_cache,
+                                               write_json_cache)
+from demisto_sdk.commands.unify.api_modules_index import (
+    API_MODULE_IMPORT_REGEX, get_api_module_path)
+
+logger = logging.getLogger('demisto-sdk')
+
+
+@lru_cache(maxsize=None)
+def get_sdk_version() -> str:
+    from pkg_resources import DistributionNotFound, get_distribution
+    try:
+        return get_distribution('demisto-sdk').version
+    except DistributionNotFound:
+        return ''
+
+
+class UnifiedContentCache:
+    """ On disk cache of the unified yml files of integrations and scripts, with an entry per package.
+
+    The key of a package is a hash of all the files in the package directory (the yml, code, image, description and
+    README files among them), the pack metadata (for the contributor support details), the sources of the API modules
+    the package code imports, the package directory and unify directory names (which make the unified file names) and
+    the demisto-sdk version. The entry of a package holds the key it was unified with, and is replaced when the package
+    is unified again, so the cache holds one entry per package however many times the package changes. An unchanged
+    package is unified once, and later builds - and the other targets of the same build - only copy the unified files
+    of its entry to their destination.
+
+    Attributes:
+        cache_dir(str): Directory of the cache entries.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def get_key(self, package_dir: str, unify_dir: str) -> str:
+        """ Get the cache key of a package
+
+        Args:
+            package_dir(str): Package directory.
+            unify_dir(str): Integrations or Scripts, as given to YmlUnifier.
+
+        Returns:
+            str: the package key.
+        """
+        key = hashlib.sha256(json.dumps([get_sdk_version(), os.path.basename(package_dir.rstrip(os.sep)),
+                                         unify_dir]).encode())
+        package_files = sorted(entry.name for entry in os.scandir(package_dir) if entry.is_file())
+        api_modules: Set[str] = set()
+        for file_name in package_files:
+            with open(os.path.join(package_dir, file_name), 'rb') as package_file:
+                content = package_file.read()
+            key.update(file_name.encode())
+            key.update(hashlib.sha256(content).digest())
+            api_modules.update(module.decode() for module in re.findall(API_MODULE_IMPORT_REGEX.encode(), content))
+        pack_metadata_path = os.path.join(package_dir.split('Integrations')[0], PACKS_PACK_META_FILE_NAME)
+        for dependency_path in [pack_metadata_path] + [get_api_module_path(module) for module in sorted(api_modules)]:
+            key.update(dependency_path.encode())
+            try:
+                with open(dependency_path, 'rb') as dependency_file:
+                    key.update(hashlib.sha256(dependency_file.read()).digest())
+            except OSError:
+                key.update(b'\0')
+        return key.hexdigest()
+
+    def _entry_path(self, package_dir: str, unify_dir: str) -> str:
+        package_id = json.dumps([os.path.abspath(package_dir), unify_dir])
+        return os.path.join(self.cache_dir, f'{hashlib.sha1(package_id.encode()).hexdigest()}.json')
+
+    def get(self, package_dir: str, unify_dir: str, key: str) -> Optional[Dict[str, str]]:
+        """ Get the unified files of a package.
+
+        Args:
+            package_dir(str): Package directory.
+            unify_dir(str): Integrations or Scripts, as given to YmlUnifier.
+            key(str): The current key of the package.
+
+        Returns:
+            dict: the unified files names and contents, or None if the package is not cached or was changed since.
+        """
+        entry = read_json_cache(self._entry_path(package_dir, unify_dir))
+        if entry.get('key') != key or not isinstance(entry.get('files'), dict):
+            return None
+        return entry['files']
+
+    def set(self, package_dir: str, unify_dir: str, key: str, created_files: List[str]):
+        """ Store the unified files of a package, replacing its previous entry.
+
+        Args:
+            package_dir(str): Package directory.
+            unify_dir(str): Integrations or Scripts, as given to YmlUnifier.
+            key(str): The key of the package, calculated before it was unified.
+            created_files(list): The paths of the unified files.
+        """
+        files = {}
+        try:
+            for file_path in created_files:
+                with open(file_path, encoding='utf-8', newline='') as unified_file:
+                    files[os.path.basename(file_path)] = unified_file.read()
+        except (OSError, ValueError) as e:
+            logger.debug(f'{package_dir} - Unable to read the unified files: {e}')
+            return
+        if not write_json_cache(self._entry_path(package_dir, unify_dir), {'key': key, 'files': files}):
+            logger.debug(f'{package_dir} - Unable to store the unified files')
+
+
+def get_unified_content_cache() -> UnifiedContentCache:
+    return UnifiedContentCache(get_sdk_cache_path('unify_cache'))
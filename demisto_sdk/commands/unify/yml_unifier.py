@@ -24,6 +24,8 @@ from demisto_sdk.commands.common.tools import (LOG_COLORS, arg_to_list,
                                                print_color, print_error,
                                                print_warning,
                                                server_version_compare)
+from demisto_sdk.commands.unify.api_modules_index import (
+    API_MODULE_IMPORT_REGEX, get_api_module_path, get_api_modules_index)
 
 PACK_METADATA_PATH = 'pack_metadata.json'
 CONTRIBUTOR_DISPLAY_NAME = ' ({} Contribution)'
@@ -342,10 +344,7 @@ class YmlUnifier:
         :return: The import string and the imported module name
         """
 
-        # General regex to find API module imports, for example: "from MicrosoftApiModule import *  # noqa: E402"
-        module_regex = r'from ([\w\d]+ApiModule) import \*(?:  # noqa: E402)?'
-
-        module_match = re.search(module_regex, script_code)
+        module_match = re.search(API_MODULE_IMPORT_REGEX, script_code)
         if module_match:
             return module_match.group(), module_match.group(1)
 
@@ -361,7 +360,7 @@ class YmlUnifier:
         :return: The integration script with the module code appended in place of the import
         """
 
-        module_path = os.path.join('./Packs', 'ApiModules', 'Scripts', module_name, module_name + '.py')
+        module_path = get_api_module_path(module_name)
         module_code = YmlUnifier._get_api_module_code(module_name, module_path)
 
         module_code = f'\n### GENERATED CODE ###' \
@@ -374,14 +373,14 @@ class YmlUnifier:
     @staticmethod
     def _get_api_module_code(module_name, module_path):
         """
-        Attempts to get the API module code from the ApiModules pack.
+        Attempts to get the API module code from the ApiModules pack, by the API modules index which reads each module
+        once per run.
         :param module_name: The API module name
         :param module_path: The API module code file path
         :return: The API module code
         """
         try:
-            with io.open(module_path, mode='r', encoding='utf-8') as script_file:
-                module_code = script_file.read()
+            module_code = get_api_modules_index().get_module_code(module_name, module_path)
         except Exception as exc:
             raise ValueError('Could not retrieve the module [{}] code: {}'.format(module_name, str(exc)))
 
@@ -11,7 +11,6 @@ from demisto_sdk.commands.common.constants import (
     DEFAULT_CONTENT_ITEM_TO_VERSION, FileType)
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import get_json
-from demisto_sdk.commands.common.update_id_set import DEFAULT_ID_SET_PATH
 from demisto_sdk.commands.update_release_notes.update_rn import UpdateRN
 
 
@@ -1035,24 +1034,37 @@ class TestRNUpdateUnit:
         assert yml_file_path == UpdateRN.change_image_or_desc_file_path(description_file_path)
         assert yml_file_path == UpdateRN.change_image_or_desc_file_path(yml_file_path)
 
-    def test_update_api_modules_dependents_rn__no_id_set(self, mocker):
+    def test_update_api_modules_dependents_rn__no_id_set(self, mocker, repo, monkeypatch):
         """
         Given:
-            - The file system has no id_set.json in its root
+            - TestApiModule which is imported by an integration and a script, and no id_set.json
         When:
             - update_api_modules_rn is called without an id_set.json
         Then:
-            - Call print_error with the appropriate error message
+            - Ensure the release notes of the integration and script packs are updated, by the API modules index
         """
-        import demisto_sdk.commands.update_release_notes.update_rn
-        from demisto_sdk.commands.update_release_notes.update_rn import \
-            update_api_modules_dependents_rn
-        if os.path.exists(DEFAULT_ID_SET_PATH):
-            os.remove(DEFAULT_ID_SET_PATH)
-        print_error_mock = mocker.patch.object(demisto_sdk.commands.update_release_notes.update_rn, "print_error")
-        update_api_modules_dependents_rn(pre_release='', update_type='', added='', modified='',
-                                         id_set_path=None)
-        assert 'no id_set.json is available' in print_error_mock.call_args[0][0]
+        from demisto_sdk.commands.update_release_notes.update_rn import (
+            UpdateRN, update_api_modules_dependents_rn)
+        mocker.patch.object(UpdateRN, 'get_master_version', return_value='0.0.0')
+        api_module = repo.create_pack('ApiModules').create_script('TestApiModule', code='def get_client():\n')
+        integration = repo.create_pack('FeedTAXII').create_integration(
+            'FeedTAXII_integration', code='from TestApiModule import *  # noqa: E402\n')
+        integration.create_default_integration()
+        integration.code.write('from TestApiModule import *  # noqa: E402\n')
+        script = repo.create_pack('Scripts').create_script('Script', code='from TestApiModule import *\n')
+        repo.create_pack('NotDependent').create_integration('NotDependent').create_default_integration()
+        execute_update_mock = mocker.patch.object(UpdateRN, "execute_update", return_value=True)
+        rn_init_spy = mocker.spy(UpdateRN, '__init__')
+
+        with monkeypatch.context() as patch:
+            patch.chdir(repo.path)
+            updated_packs = update_api_modules_dependents_rn(pre_release=None, update_type=None, added=set(),
+                                                             modified={api_module.code.path})
+
+        assert updated_packs == {'FeedTAXII', 'Scripts'}
+        assert execute_update_mock.call_count == 2
+        assert [call.kwargs['modified_files_in_pack'] for call in rn_init_spy.call_args_list] == [
+            {os.path.relpath(integration.yml.path, repo.path)}, {os.path.relpath(script.yml.path, repo.path)}]
 
     def test_update_api_modules_dependents_rn__happy_flow(self, mocker, tmpdir):
         """
@@ -10,8 +10,8 @@ from distutils.version import LooseVersion
 from typing import Optional, Tuple, Union
 
 from demisto_sdk.commands.common.constants import (
-    ALL_FILES_VALIDATION_IGNORE_WHITELIST, DEFAULT_ID_SET_PATH,
-    IGNORED_PACK_NAMES, RN_HEADER_BY_FILE_TYPE, FileType)
+    ALL_FILES_VALIDATION_IGNORE_WHITELIST, IGNORED_PACK_NAMES,
+    RN_HEADER_BY_FILE_TYPE, FileType)
 from demisto_sdk.commands.common.hook_validations.structure import \
     StructureValidator
 from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type,
@@ -21,9 +21,11 @@ from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type,
                                                get_from_version, get_json,
                                                get_latest_release_notes_text,
                                                get_pack_name, get_remote_file,
-                                               get_yaml, pack_name_to_path,
-                                               print_color, print_error,
-                                               print_warning, run_command)
+                                               get_yaml, get_yml_paths_in_dir,
+                                               pack_name_to_path, print_color,
+                                               print_error, print_warning,
+                                               run_command)
+from demisto_sdk.commands.unify.api_modules_index import get_api_modules_index
 
 
 class UpdateRN:
@@ -740,10 +742,33 @@ def get_file_description(path, file_type) -> str:
     return '%%UPDATE_RN%%'
 
 
+def get_api_modules_dependents(api_modules: set) -> list:
+    """ Gets the integrations and scripts which import the given API modules, by the API modules index of the
+        content repo.
+
+        :param
+            api_modules: The API modules names
+
+        :rtype: ``list``
+        :return
+        The dependents data - their yml file path and pack name
+    """
+    api_modules_index = get_api_modules_index()
+    dependents = []
+    for package_path in sorted({package_path for api_module in api_modules
+                                for package_path in api_modules_index.get_dependents(api_module)}):
+        _, yml_path = get_yml_paths_in_dir(package_path, error_msg='')
+        if yml_path:
+            dependents.append({'file_path': yml_path, 'pack': get_pack_name(package_path)})
+    return dependents
+
+
 def update_api_modules_dependents_rn(pre_release: bool, update_type: Union[str, None],
                                      added: Union[list, set], modified: Union[list, set],
                                      id_set_path: Optional[str] = None, text: str = '') -> set:
     """ Updates release notes for any pack that depends on API module that has changed.
+        The dependents are taken from the id set if one is given, and from the API modules index of the content repo
+        otherwise.
 
         :param
             pre_release: The file type
@@ -758,19 +783,16 @@ def update_api_modules_dependents_rn(pre_release: bool, update_type: Union[str,
         A set of updated packs
     """
     total_updated_packs: set = set()
-    if not id_set_path:
-        if not os.path.isfile(DEFAULT_ID_SET_PATH):
-            print_error("Failed to update integrations dependent on the APIModule pack - no id_set.json is "
-                        "available. Please run `demisto-sdk create-id-set` to generate it, and rerun this command.")
-            return total_updated_packs
-        id_set_path = DEFAULT_ID_SET_PATH
-    with open(id_set_path, 'r') as conf_file:
-        id_set = json.load(conf_file)
     api_module_set = get_api_module_ids(added)
     api_module_set = api_module_set.union(get_api_module_ids(modified))
     print_warning(f"Changes were found in the following APIModules: {api_module_set}, updating all dependent "
                   f"integrations.")
-    integrations = get_api_module_integrations_set(api_module_set, id_set.get('integrations', []))
+    if id_set_path:
+        with open(id_set_path, 'r') as conf_file:
+            id_set = json.load(conf_file)
+        integrations = get_api_module_integrations_set(api_module_set, id_set.get('integrations', []))
+    else:
+        integrations = get_api_modules_dependents(api_module_set)
     for integration in integrations:
         integration_path = integration.get('file_path')
         integration_pack = integration.get('pack')
@@ -1,6 +1,10 @@
 import inspect
 import json
+import shutil
+import threading
 from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import click
@@ -15,7 +19,8 @@ from demisto_sdk.__main__ import main, upload
 from demisto_sdk.commands.common import constants
 from demisto_sdk.commands.common.constants import (CLASSIFIERS_DIR,
                                                    INTEGRATIONS_DIR,
-                                                   LAYOUTS_DIR, SCRIPTS_DIR,
+                                                   LAYOUTS_DIR, PLAYBOOKS_DIR,
+                                                   SCRIPTS_DIR,
                                                    TEST_PLAYBOOKS_DIR,
                                                    FileType)
 from demisto_sdk.commands.common.content.objects.pack_objects.pack import (
@@ -1004,3 +1009,163 @@ class TestZippedPackUpload:
 
 def exception_raiser(**kwargs):
     raise Exception()
+
+
+@pytest.fixture
+def stand_in_xsoar(monkeypatch):
+    """
+    A local XSOAR server of version 6.5.0, which records the paths of the requests in the order they arrived.
+    """
+    requested_paths = []
+    lock = threading.Lock()
+
+    class XSOARHandler(BaseHTTPRequestHandler):
+        def send_json(self, data):
+            body = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            with lock:
+                requested_paths.append(self.path)
+            self.send_json({'demistoVersion': '6.5.0'})
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers['Content-Length']))
+            with lock:
+                requested_paths.append(self.path)
+            self.send_json({})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), XSOARHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv('DEMISTO_BASE_URL', f'http://127.0.0.1:{server.server_port}')
+    monkeypatch.setenv('DEMISTO_API_KEY', 'dummy-api-key')
+    monkeypatch.delenv('DEMISTO_VERIFY_SSL', raising=False)
+    yield requested_paths
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def large_pack(tmp_path):
+    """
+    A pack of 200 entities: 90 unified scripts, 10 split scripts and 100 playbooks.
+    """
+    dummy_pack = Path(git_path()) / 'demisto_sdk' / 'tests' / 'test_files' / 'Packs' / 'DummyPack'
+    pack_path = tmp_path / 'Packs' / 'LargePack'
+    scripts_path = pack_path / SCRIPTS_DIR
+    playbooks_path = pack_path / PLAYBOOKS_DIR
+    playbooks_path.mkdir(parents=True)
+    scripts_path.mkdir()
+    for i in range(90):
+        shutil.copyfile(dummy_pack / SCRIPTS_DIR / 'DummyScriptUnified.yml', scripts_path / f'script-Script{i}.yml')
+    for i in range(10):
+        (scripts_path / f'SplitScript{i}').mkdir()
+        for suffix in ('yml', 'py'):
+            shutil.copyfile(dummy_pack / SCRIPTS_DIR / 'DummyScript' / f'DummyScript.{suffix}',
+                            scripts_path / f'SplitScript{i}' / f'SplitScript{i}.{suffix}')
+    for i in range(100):
+        shutil.copyfile(dummy_pack / PLAYBOOKS_DIR / 'DummyPlaybook.yml', playbooks_path / f'playbook-Playbook{i}.yml')
+    return pack_path
+
+
+def test_upload_pack__concurrent_waves(mocker, stand_in_xsoar, large_pack):
+    """
+    Given
+        - A pack of 200 scripts and playbooks.
+
+    When
+        - Uploading the pack.
+
+    Then
+        - Ensure all the entities are uploaded, the scripts before the playbooks which may use them.
+        - Ensure the scripts and the playbooks are uploaded in two concurrent waves.
+        - Ensure the server version is requested once.
+    """
+    mocker.patch('click.secho')
+    run_upload_wave = mocker.spy(Uploader, 'run_upload_wave')
+    uploader = Uploader(input=str(large_pack))
+
+    assert uploader.upload() == 0
+
+    assert len(uploader.successfully_uploaded_files) == 200
+    assert not uploader.failed_uploaded_files
+    assert sorted(len(call.args[0]) for call in run_upload_wave.call_args_list) == [100, 100]
+    assert stand_in_xsoar.count('/about') == 1
+    scripts_uploads = [i for i, path in enumerate(stand_in_xsoar) if path == '/automation/import']
+    playbooks_uploads = [i for i, path in enumerate(stand_in_xsoar) if path == '/playbook/save/yaml']
+    assert len(scripts_uploads) == len(playbooks_uploads) == 100
+    assert max(scripts_uploads) < min(playbooks_uploads)
+
+
+def test_upload_pack__entity_versions_error(mocker, stand_in_xsoar, large_pack):
+    """
+    Given
+        - A pack of 200 scripts and playbooks, one of which fails getting its versions.
+
+    When
+        - Uploading the pack.
+
+    Then
+        - Ensure only that entity fails, and the rest of its wave is uploaded.
+    """
+    mocker.patch('click.secho')
+    get_upload_object_versions = uploader.get_upload_object_versions
+
+    def get_versions(upload_object):
+        if upload_object.path.name == 'playbook-Playbook7.yml':
+            raise ValueError('invalid version')
+        return get_upload_object_versions(upload_object)
+
+    mocker.patch.object(uploader, 'get_upload_object_versions', side_effect=get_versions)
+    playbook_uploader = Uploader(input=str(large_pack))
+
+    assert playbook_uploader.upload() == 1
+
+    assert len(playbook_uploader.successfully_uploaded_files) == 199
+    assert [(file_name, file_type, str(message)) for file_name, file_type, message
+            in playbook_uploader.failed_uploaded_files] == [('playbook-Playbook7.yml', FileType.PLAYBOOK.value,
+                                                             'invalid version')]
+
+
+def test_upload_pack__unchanged_entities(mocker, stand_in_xsoar, large_pack):
+    """
+    Given
+        - A pack of 200 scripts and playbooks, which was uploaded to an XSOAR server.
+
+    When
+        - Uploading the pack again, after changing one playbook and the code of one split script.
+        - Uploading it again with the force flag.
+
+    Then
+        - Ensure only the changed entities are uploaded again, and the rest are reported as unchanged.
+        - Ensure all the entities are uploaded with the force flag.
+    """
+    mocker.patch('click.secho')
+    assert Uploader(input=str(large_pack)).upload() == 0
+
+    uploader = Uploader(input=str(large_pack))
+    assert uploader.upload() == 0
+    assert not uploader.successfully_uploaded_files
+    assert len(uploader.unchanged_files) == 200
+
+    with open(large_pack / PLAYBOOKS_DIR / 'playbook-Playbook7.yml', 'a') as playbook_file:
+        playbook_file.write('# changed\n')
+    with open(large_pack / SCRIPTS_DIR / 'SplitScript3' / 'SplitScript3.py', 'a') as code_file:
+        code_file.write('\n# changed\n')
+    uploader = Uploader(input=str(large_pack))
+    assert uploader.upload() == 0
+    assert sorted(uploader.successfully_uploaded_files) == [('SplitScript3.yml', FileType.SCRIPT.value),
+                                                            ('playbook-Playbook7.yml', FileType.PLAYBOOK.value)]
+    assert len(uploader.unchanged_files) == 198
+
+    uploader = Uploader(input=str(large_pack), force=True)
+    assert uploader.upload() == 0
+    assert len(uploader.successfully_uploaded_files) == 200
+    assert not uploader.unchanged_files
@@ -1,30 +1,31 @@
 import glob
+import hashlib
 import json
 import logging
 import os
-from typing import List, Tuple, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import click
 import demisto_client
 from demisto_client.demisto_api.rest import ApiException
-from packaging.version import Version
+from packaging.version import LegacyVersion, Version, parse
 from tabulate import tabulate
 
-from demisto_sdk.commands.common.constants import (CLASSIFIERS_DIR,
-                                                   CONTENT_ENTITIES_DIRS,
-                                                   DASHBOARDS_DIR,
-                                                   INCIDENT_FIELDS_DIR,
-                                                   INCIDENT_TYPES_DIR,
-                                                   INDICATOR_FIELDS_DIR,
-                                                   INDICATOR_TYPES_DIR,
-                                                   INTEGRATIONS_DIR, JOBS_DIR,
-                                                   LAYOUTS_DIR, PLAYBOOKS_DIR,
-                                                   REPORTS_DIR, SCRIPTS_DIR,
-                                                   TEST_PLAYBOOKS_DIR,
-                                                   WIDGETS_DIR, FileType)
+from demisto_sdk.commands.common.constants import (
+    CLASSIFIERS_DIR, CONTENT_ENTITIES_DIRS, DASHBOARDS_DIR,
+    DEFAULT_CONTENT_ITEM_FROM_VERSION, DEFAULT_CONTENT_ITEM_TO_VERSION,
+    INCIDENT_FIELDS_DIR, INCIDENT_TYPES_DIR, INDICATOR_FIELDS_DIR,
+    INDICATOR_TYPES_DIR, INTEGRATIONS_DIR, JOBS_DIR, LAYOUTS_DIR,
+    PLAYBOOKS_DIR, REPORTS_DIR, SCRIPTS_DIR, TEST_PLAYBOOKS_DIR, WIDGETS_DIR,
+    FileType)
 from demisto_sdk.commands.common.content.errors import ContentFactoryError
 from demisto_sdk.commands.common.content.objects.abstract_objects import (
     JSONObject, YAMLObject)
+from demisto_sdk.commands.common.content.objects.pack_objects import (
+    Integration, Script, YAMLContentObject)
 from demisto_sdk.commands.common.content.objects.pack_objects.pack import Pack
 from demisto_sdk.commands.common.content.objects_factory import \
     path_to_pack_object
@@ -32,7 +33,9 @@ from demisto_sdk.commands.common.tools import (find_type,
                                                get_child_directories,
                                                get_demisto_version,
                                                get_parent_directory_name,
-                                               print_v)
+                                               get_sdk_cache_path, get_yaml,
+                                               print_v, read_json_cache,
+                                               write_json_cache)
 
 # These are the class names of the objects in demisto_sdk.commands.common.content.objects
 UPLOAD_SUPPORTED_ENTITIES = [
@@ -85,6 +88,91 @@ SUCCESS_RETURN_CODE = 0
 ERROR_RETURN_CODE = 1
 ABORTED_RETURN_CODE = 2
 
+# the number of files of the same entity directory which are uploaded concurrently
+UPLOAD_WORKERS = 8
+
+
+class UploadedContentCache:
+    """
+    On disk record of the content hashes of the files last uploaded to each XSOAR server, by which the files which did
+    not change since they were last uploaded to the server are not uploaded again.
+
+    Attributes:
+        cache_path(str): The path of the cache file.
+        server(str): The URL of the XSOAR server.
+    """
+
+    def __init__(self, cache_path: str, server: str):
+        self.cache_path = cache_path
+        self.server = server
+        self._lock = threading.Lock()
+        self._last_uploaded_hashes = self._load_entries().get(server, {})
+        self._uploaded_hashes: Dict[str, str] = {}
+
+    def _load_entries(self) -> Dict[str, Dict[str, str]]:
+        """
+        Load the content hashes of the uploaded files, by the server they were uploaded to.
+        """
+        return {server: hashes for server, hashes in read_json_cache(self.cache_path).items()
+                if isinstance(hashes, dict)}
+
+    def is_unchanged(self, file_path: str, content_hash: str) -> bool:
+        """
+        Whether the file was last uploaded to the server with the same content hash.
+        """
+        return self._last_uploaded_hashes.get(file_path) == content_hash
+
+    def add(self, file_path: str, content_hash: str) -> None:
+        """
+        Record the content hash of a file which was uploaded to the server, to be stored by save.
+        """
+        with self._lock:
+            self._uploaded_hashes[file_path] = content_hash
+
+    def save(self) -> None:
+        """
+        Store the content hashes of the uploaded files, along with the hashes stored by other commands meanwhile.
+        """
+        with self._lock:
+            if not self._uploaded_hashes:
+                return
+            entries = self._load_entries()
+            entries[self.server] = {**entries.get(self.server, {}), **self._uploaded_hashes}
+            write_json_cache(self.cache_path, entries, indent=4, sort_keys=True)
+            self._uploaded_hashes = {}
+
+
+def get_upload_object_versions(upload_object: Union[YAMLObject, JSONObject]) \
+        -> Tuple[Union[Version, LegacyVersion], Union[Version, LegacyVersion]]:
+    """
+    Get the from version and the to version of an object to upload.
+    A yml file is read from the parsed files cache, as it was already parsed to find its type, since loading it by
+    the round trip loader of the object takes much longer than uploading it.
+    """
+    if isinstance(upload_object, YAMLContentObject):
+        file_data = get_yaml(str(upload_object.path))
+        return (parse(file_data.get('fromversion', DEFAULT_CONTENT_ITEM_FROM_VERSION)),
+                parse(file_data.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION)))
+    return upload_object.from_version, upload_object.to_version  # type: ignore
+
+
+def get_upload_content_hash(upload_object: Union[YAMLObject, JSONObject]) -> str:
+    """
+    Get the hash of the content uploaded for a file. A split integration or script is unified with the other files
+    of its directory before it's uploaded, so the hash covers all of them.
+    """
+    file_path = upload_object.path  # type: ignore
+    if isinstance(upload_object, (Integration, Script)) and not upload_object.is_unify():
+        content_paths = sorted(path for path in file_path.parent.iterdir() if path.is_file())
+    else:
+        content_paths = [file_path]
+
+    content_hash = hashlib.sha1()  # nosec
+    for content_path in content_paths:
+        content_hash.update(content_path.name.encode())
+        content_hash.update(content_path.read_bytes())
+    return content_hash.hexdigest()
+
 
 class Uploader:
     """Upload a pack specified in self.infile to a remote Cortex XSOAR instance.
@@ -92,27 +180,43 @@ class Uploader:
             path (str): The path of a pack / directory / file to upload.
             verbose (bool): Whether to output a detailed response.
             client (DefaultApi): Demisto-SDK client object.
+            force (bool): Whether to upload the files which did not change since they were last uploaded.
         """
 
-    def __init__(self, input: str, insecure: bool = False, verbose: bool = False, pack_names: list = None):
+    def __init__(self, input: str, insecure: bool = False, verbose: bool = False, pack_names: list = None,
+                 force: bool = False):
         self.path = input
         self.log_verbose = verbose
         verify = (not insecure) if insecure else None  # set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
-        self.client = demisto_client.configure(verify_ssl=verify)
+        # the connections are shared by the concurrent uploads
+        connection_pool_maxsize = None if os.getenv('DEMISTO_CONNECTION_POOL_MAXSIZE') else UPLOAD_WORKERS
+        self.client = demisto_client.configure(verify_ssl=verify, connection_pool_maxsize=connection_pool_maxsize)
         self.successfully_uploaded_files: List[Tuple[str, str]] = []
         self.failed_uploaded_files: List[Tuple[str, str, str]] = []
-        self.unuploaded_due_to_version: List[Tuple[str, str, Version, Version, Version]] = []
-        self.demisto_version = get_demisto_version(self.client)
+        # the server version, and the from version and to version of each file
+        self.unuploaded_due_to_version: List[Tuple[str, str, Union[Version, LegacyVersion], Union[Version, LegacyVersion],
+                                                   Union[Version, LegacyVersion]]] = []
+        self.unchanged_files: List[Tuple[str, str]] = []
+        # the version of an unreachable server is the string "0"
+        self.demisto_version = parse(str(get_demisto_version(self.client)))
         self.pack_names = pack_names
+        self.force = force
+        self.uploaded_content_cache: Optional[UploadedContentCache] = None
 
     def upload(self):
         """Upload the pack / directory / file to the remote Cortex XSOAR instance.
         """
-        if self.demisto_version == "0":
+        if str(self.demisto_version) == "0":
             click.secho("Could not connect to XSOAR server. Try checking your connection configurations.",
                         fg="bright_red")
             return ERROR_RETURN_CODE
 
+        # the files are not uploaded again to the same server while unchanged, unless forced
+        server = getattr(getattr(getattr(self.client, 'api_client', None), 'configuration', None), 'host', None)
+        if isinstance(server, str):
+            self.uploaded_content_cache = UploadedContentCache(
+                get_sdk_cache_path('uploaded_content.json'), server)
+
         status_code = SUCCESS_RETURN_CODE
         click.secho(f"Uploading {self.path} ...")
         if self.path is None or not os.path.exists(self.path):
@@ -137,12 +241,16 @@ class Uploader:
             else:
                 status_code = self.pack_uploader(self.path) or status_code
 
+        if self.uploaded_content_cache:
+            self.uploaded_content_cache.save()
+
         if status_code == ABORTED_RETURN_CODE:
             return status_code
 
         if not self.successfully_uploaded_files \
                 and not self.failed_uploaded_files \
-                and not self.unuploaded_due_to_version:
+                and not self.unuploaded_due_to_version \
+                and not self.unchanged_files:
             # if not uploaded any file
             click.secho(
                 f'\nError: Given input path: {self.path} is not uploadable. '
@@ -156,7 +264,8 @@ class Uploader:
             )
             return ERROR_RETURN_CODE
 
-        print_summary(self.successfully_uploaded_files, self.unuploaded_due_to_version, self.failed_uploaded_files)
+        print_summary(self.successfully_uploaded_files, self.unuploaded_due_to_version, self.failed_uploaded_files,
+                      self.unchanged_files)
         return status_code
 
     def file_uploader(self, path: str) -> int:
@@ -182,25 +291,40 @@ class Uploader:
 
         entity_type = find_type(str(upload_object.path))
         if entity_type in UPLOAD_SUPPORTED_ENTITIES:
-            if upload_object.from_version <= self.demisto_version <= upload_object.to_version:  # type: ignore
-                try:
-                    result = upload_object.upload(self.client)  # type: ignore
+            try:
+                from_version, to_version = get_upload_object_versions(upload_object)
+                if not from_version <= self.demisto_version <= to_version:
                     if self.log_verbose:
-                        print_v(f'Result:\n{result.to_str()}', self.log_verbose)
-                        click.secho(f'Uploaded {entity_type} - \'{os.path.basename(path)}\': successfully', fg='green')
-                    self.successfully_uploaded_files.append((file_name, entity_type.value))
-                    return SUCCESS_RETURN_CODE
-                except Exception as err:
-                    message = parse_error_response(err, entity_type, file_name, self.log_verbose)
-                    self.failed_uploaded_files.append((file_name, entity_type.value, message))
+                        click.secho(f"Input path {path} is not uploading due to version mismatch.\n"
+                                    f"XSOAR version is: {self.demisto_version} while the file's version is "
+                                    f"{from_version} - {to_version}", fg='bright_red')
+                    self.unuploaded_due_to_version.append((file_name, entity_type.value, self.demisto_version,
+                                                           from_version, to_version))
                     return ERROR_RETURN_CODE
-            else:
+
+                content_hash = get_upload_content_hash(upload_object)
+                if self.uploaded_content_cache and not self.force \
+                        and self.uploaded_content_cache.is_unchanged(str(upload_object.path), content_hash):
+                    if self.log_verbose:
+                        click.secho(f'Skipped {entity_type} - \'{os.path.basename(path)}\': '
+                                    f'unchanged since it was last uploaded', fg='green')
+                    self.unchanged_files.append((file_name, entity_type.value))
+                    return SUCCESS_RETURN_CODE
+
+                if isinstance(upload_object, (Integration, Script)):
+                    result = upload_object.upload(self.client, demisto_version=self.demisto_version)
+                else:
+                    result = upload_object.upload(self.client)  # type: ignore
                 if self.log_verbose:
-                    click.secho(f"Input path {path} is not uploading due to version mismatch.\n"
-                                f"XSOAR version is: {self.demisto_version} while the file's version is "
-                                f"{upload_object.from_version} - {upload_object.to_version}", fg='bright_red')
-                self.unuploaded_due_to_version.append((file_name, entity_type.value, self.demisto_version,
-                                                       upload_object.from_version, upload_object.to_version))
+                    print_v(f'Result:\n{result.to_str()}', self.log_verbose)
+                    click.secho(f'Uploaded {entity_type} - \'{os.path.basename(path)}\': successfully', fg='green')
+                self.successfully_uploaded_files.append((file_name, entity_type.value))
+                if self.uploaded_content_cache:
+                    self.uploaded_content_cache.add(str(upload_object.path), content_hash)
+                return SUCCESS_RETURN_CODE
+            except Exception as err:
+                message = parse_error_response(err, entity_type, file_name, self.log_verbose)
+                self.failed_uploaded_files.append((file_name, entity_type.value, message))
                 return ERROR_RETURN_CODE
         else:
             if self.log_verbose:
@@ -253,21 +377,43 @@ class Uploader:
             The status code of the operation.
 
         """
-        status_code = SUCCESS_RETURN_CODE
+        upload_tasks: List[Callable[[], int]] = []
         dir_name = os.path.basename(path.rstrip('/'))
         if dir_name in UNIFIED_ENTITIES_DIR:
             for entity_folder in glob.glob(f"{path}/*/"):
-                status_code = self.unified_entity_uploader(entity_folder) or status_code
+                upload_tasks.append(partial(self.unified_entity_uploader, entity_folder))
         if dir_name in CONTENT_ENTITIES_DIRS:
             # upload json or yml files. Other files such as `.md`, `.png` should be ignored
             for file in glob.glob(f"{path}/*.yml"):
-                status_code = self.file_uploader(file) or status_code
+                upload_tasks.append(partial(self.file_uploader, file))
             for file in glob.glob(f"{path}/*.json"):
-                status_code = self.file_uploader(file) or status_code
+                upload_tasks.append(partial(self.file_uploader, file))
+        return self.run_upload_wave(upload_tasks)
+
+    @staticmethod
+    def run_upload_wave(upload_tasks: List[Callable[[], int]]) -> int:
+        """
+        Runs the uploads of a wave of entities which do not depend on each other, concurrently.
+        Args:
+            upload_tasks: The uploads of the entities, each returning its status code.
+
+        Returns:
+            The status code of the operation.
+
+        """
+        status_code = SUCCESS_RETURN_CODE
+        if len(upload_tasks) <= 1:
+            task_status_codes = [upload_task() for upload_task in upload_tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+                task_status_codes = list(executor.map(lambda upload_task: upload_task(), upload_tasks))
+        for task_status_code in task_status_codes:
+            status_code = task_status_code or status_code
         return status_code
 
     def pack_uploader(self, path: str) -> int:
         status_code = SUCCESS_RETURN_CODE
+        # each entity directory is a wave, whose entities may depend only on the entities of the previous waves
         sorted_directories = sort_directories_based_on_dependencies(get_child_directories(path))
         for entity_folder in sorted_directories:
             if os.path.basename(entity_folder.rstrip('/')) in CONTENT_ENTITIES_DIRS:
@@ -348,9 +494,11 @@ def parse_error_response(error: ApiException, file_type: str, file_name: str, pr
     return message
 
 
-def print_summary(successfully_uploaded_files, unuploaded_due_to_version, failed_uploaded_files):
+def print_summary(successfully_uploaded_files, unuploaded_due_to_version, failed_uploaded_files,
+                  unchanged_files=None):
     """Prints uploaded files summary
     Successful uploads grid based on `successfully_uploaded_files` attribute in green color
+    Unchanged files grid based on `unchanged_files` attribute in green color
     Failed uploads grid based on `failed_uploaded_files` attribute in red color
     """
     click.secho('\n\nUPLOAD SUMMARY:')
@@ -358,6 +506,10 @@ def print_summary(successfully_uploaded_files, unuploaded_due_to_version, failed
         click.secho('\nSUCCESSFUL UPLOADS:', fg='green')
         click.secho(tabulate(successfully_uploaded_files, headers=['NAME', 'TYPE'],
                              tablefmt="fancy_grid") + '\n', fg='green')
+    if unchanged_files:
+        click.secho('\nNOT UPLOADED AS UNCHANGED SINCE THE LAST UPLOAD (use -f to upload them):', fg='green')
+        click.secho(tabulate(unchanged_files, headers=['NAME', 'TYPE'],
+                             tablefmt="fancy_grid") + '\n', fg='green')
     if unuploaded_due_to_version:
         click.secho('\nNOT UPLOADED DUE TO VERSION MISMATCH:', fg='yellow')
         click.secho(tabulate(unuploaded_due_to_version, headers=['NAME', 'TYPE', 'XSOAR Version',
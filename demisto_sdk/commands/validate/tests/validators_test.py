@@ -22,6 +22,8 @@ from demisto_sdk.commands.common.hook_validations.content_entity_validator impor
     ContentEntityValidator
 from demisto_sdk.commands.common.hook_validations.dashboard import \
     DashboardValidator
+from demisto_sdk.commands.common.hook_validations.docker import \
+    DockerImageValidator
 from demisto_sdk.commands.common.hook_validations.generic_field import \
     GenericFieldValidator
 from demisto_sdk.commands.common.hook_validations.image import ImageValidator
@@ -37,6 +39,7 @@ from demisto_sdk.commands.common.hook_validations.pack_unique_files import \
     PackUniqueFilesValidator
 from demisto_sdk.commands.common.hook_validations.playbook import \
     PlaybookValidator
+from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
 from demisto_sdk.commands.common.hook_validations.release_notes import \
     ReleaseNotesValidator
 from demisto_sdk.commands.common.hook_validations.reputation import \
@@ -1807,3 +1810,59 @@ def test_validate_contributors_file(repo):
 
     validate_manager = ValidateManager(check_is_unskipped=False, file_path=contributors_file.path, skip_conf_json=True)
     assert validate_manager.run_validation_on_specific_files()
+
+
+def test_prefetch_docker_images_latest_tags(repo, mocker):
+    """
+    Given:
+        A pack with integrations and scripts which share docker images, a non demisto docker image and a playbook.
+    When:
+        Prefetching the latest tags of the docker images of the pack, and of a single integration.
+    Then:
+        Ensure the latest tags of the distinct demisto docker images are fetched at once.
+        Ensure nothing is fetched when the docker checks are skipped.
+    """
+    pack = repo.create_pack('PackWithDockers')
+    integrations = [pack.create_integration(f'Integration{i}') for i in range(3)]
+    for integration, docker_image in zip(integrations, ['demisto/python3:3.9.1.1', 'demisto/python3:3.8.6.1',
+                                                        'demisto/netutils:1.0.0.1']):
+        integration.yml.update({'script': {'type': 'python', 'dockerimage': docker_image}})
+    pack.create_script('Script').yml.update({'dockerimage': 'demisto/python3:3.9.1.1', 'script': '-'})
+    pack.create_script('NonDemistoScript').yml.update({'dockerimage': 'other/python3:3.9.1.1', 'script': '-'})
+    pack.create_playbook('Playbook').create_default_playbook()
+    prefetch = mocker.patch.object(DockerImageValidator, 'prefetch_docker_images_latest_tags')
+
+    validate_manager = ValidateManager(skip_conf_json=True)
+    validate_manager.prefetch_docker_images_latest_tags([pack.path])
+    validate_manager.prefetch_docker_images_latest_tags([integrations[2].yml.path])
+    validate_manager.skip_docker_checks = True
+    validate_manager.prefetch_docker_images_latest_tags([pack.path])
+
+    assert [call.args for call in prefetch.call_args_list] == [({'demisto/python3', 'demisto/netutils'},),
+                                                               ({'demisto/netutils'},)]
+
+
+def test_verify_readmes_mdx(repo, mocker):
+    """
+    Given:
+        A pack with a pack readme, an integration readme, a playbook readme and a release notes file.
+    When:
+        Parsing the readme files of the pack and of a single file before validating them.
+    Then:
+        Ensure all the readme files of the pack are parsed at once, and only the readme file given otherwise.
+    """
+    pack = repo.create_pack('PackWithReadmes')
+    pack.readme.write_text('## Pack')
+    integration = pack.create_integration('Integration', readme='## Integration')
+    playbook = pack.create_playbook('Playbook', readme='## Playbook')
+    release_notes = pack.create_release_notes('1_0_1', '#### Integrations')
+    verify_mdx_in_batches = mocker.patch.object(ReadMeValidator, 'verify_mdx_in_batches')
+
+    ValidateManager.verify_readmes_mdx([pack.path])
+    ValidateManager.verify_readmes_mdx([integration.readme.path, release_notes.path])
+    ValidateManager.verify_readmes_mdx([release_notes.path])
+
+    pack_readme_paths = [pack.readme.path, integration.readme.path, playbook.readme.path]
+    assert sorted(verify_mdx_in_batches.call_args_list[0].args[0]) == sorted(pack_readme_paths)
+    assert verify_mdx_in_batches.call_args_list[1].args[0] == [integration.readme.path]
+    assert verify_mdx_in_batches.call_count == 2
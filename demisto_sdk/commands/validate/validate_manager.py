@@ -1,6 +1,11 @@
+import io
+import multiprocessing
 import os
+import sys
 from configparser import ConfigParser, MissingSectionHeaderError
-from typing import Optional, Set, Tuple
+from contextlib import redirect_stdout
+from glob import glob
+from typing import Iterable, List, Optional, Set, Tuple
 
 import click
 from colorama import Fore
@@ -25,8 +30,8 @@ from demisto_sdk.commands.common.errors import (ALLOWED_IGNORE_ERRORS,
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.hook_validations.author_image import \
     AuthorImageValidator
-from demisto_sdk.commands.common.hook_validations.base_validator import \
-    BaseValidator
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    JSON_ERRORS_OUTPUT, BaseValidator)
 from demisto_sdk.commands.common.hook_validations.classifier import \
     ClassifierValidator
 from demisto_sdk.commands.common.hook_validations.conf_json import \
@@ -35,6 +40,8 @@ from demisto_sdk.commands.common.hook_validations.dashboard import \
     DashboardValidator
 from demisto_sdk.commands.common.hook_validations.description import \
     DescriptionValidator
+from demisto_sdk.commands.common.hook_validations.docker import \
+    DockerImageValidator
 from demisto_sdk.commands.common.hook_validations.generic_definition import \
     GenericDefinitionValidator
 from demisto_sdk.commands.common.hook_validations.generic_field import \
@@ -83,9 +90,13 @@ from demisto_sdk.commands.common.hook_validations.xsoar_config_json import \
 from demisto_sdk.commands.common.tools import (
     find_type, get_api_module_ids, get_api_module_integrations_set,
     get_pack_ignore_file_path, get_pack_name, get_pack_names_from_files,
-    get_relative_path_from_packs_dir, get_yaml, open_id_set_file)
+    get_relative_path_from_packs_dir, get_yaml, is_iron_bank_pack,
+    open_id_set_file)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
+# the manager of the running validation, inherited by the packs validation processes (validate -a --workers)
+_WORKER_VALIDATE_MANAGER: Optional['ValidateManager'] = None
+
 
 class ValidateManager:
     def __init__(
@@ -94,7 +105,7 @@ class ValidateManager:
             validate_all=False, is_external_repo=False, skip_pack_rn_validation=False, print_ignored_errors=False,
             silence_init_prints=False, no_docker_checks=False, skip_dependencies=False, id_set_path=None, staged=False,
             create_id_set=False, json_file_path=None, skip_schema_check=False, debug_git=False, include_untracked=False,
-            pykwalify_logs=False, check_is_unskipped=True, quite_bc=False
+            pykwalify_logs=False, check_is_unskipped=True, quite_bc=False, workers=1
     ):
         # General configuration
         self.skip_docker_checks = False
@@ -169,6 +180,7 @@ class ValidateManager:
 
         self.print_percent = False
         self.completion_percentage = 0
+        self.workers = workers or 1
 
         if validate_all:
             # No need to check docker images on build branch hence we do not check on -a mode
@@ -212,17 +224,20 @@ class ValidateManager:
     def run_validation(self):
         """Initiates validation in accordance with mode (i,g,a)
         """
-        if self.validate_all:
-            is_valid = self.run_validation_on_all_packs()
-        elif self.use_git:
-            is_valid = self.run_validation_using_git()
-        elif self.file_path:
-            is_valid = self.run_validation_on_specific_files()
-        else:
-            # default validate to -g --post-commit
-            self.use_git = True
-            self.is_circle = True
-            is_valid = self.run_validation_using_git()
+        try:
+            if self.validate_all:
+                is_valid = self.run_validation_on_all_packs()
+            elif self.use_git:
+                is_valid = self.run_validation_using_git()
+            elif self.file_path:
+                is_valid = self.run_validation_on_specific_files()
+            else:
+                # default validate to -g --post-commit
+                self.use_git = True
+                self.is_circle = True
+                is_valid = self.run_validation_using_git()
+        finally:
+            JSON_ERRORS_OUTPUT.flush()
         return self.print_final_report(is_valid)
 
     @staticmethod
@@ -259,6 +274,8 @@ class ValidateManager:
         """Run validations only on specific files
         """
         files_validation_result = set()
+        self.prefetch_docker_images_latest_tags(self.file_path.split(','))
+        self.verify_readmes_mdx(self.file_path.split(','))
 
         for path in self.file_path.split(','):
             error_ignore_list = self.get_error_ignore_list(get_pack_name(path))
@@ -307,6 +324,11 @@ class ValidateManager:
         all_packs = list(filter(os.path.isdir, [os.path.join(PACKS_DIR, p) for p in os.listdir(PACKS_DIR)]))
         num_of_packs = len(all_packs)
         all_packs.sort(key=str.lower)
+        self.verify_readmes_mdx(all_packs)
+
+        if self.workers > 1 and num_of_packs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            all_packs_valid.update(self.run_validations_on_packs_in_parallel(all_packs))
+            return all(all_packs_valid)
 
         for pack_path in all_packs:
             self.completion_percentage = format((count / num_of_packs) * 100, ".2f")  # type: ignore
@@ -315,6 +337,83 @@ class ValidateManager:
 
         return all(all_packs_valid)
 
+    def run_validations_on_packs_in_parallel(self, all_packs: list) -> Set[bool]:
+        """Runs validations on the given packs in a pool of `self.workers` processes (-a --workers option).
+
+        Each pack is validated by a single process, which collects the pack output, ignored files and errors.
+        The results are merged in the packs order, so the output and the report are the same as in a serial run.
+
+        Args:
+            all_packs: the sorted paths of the packs.
+
+        Returns:
+            set. the validation result of each pack.
+        """
+        global _WORKER_VALIDATE_MANAGER
+        _WORKER_VALIDATE_MANAGER = self
+
+        num_of_packs = len(all_packs)
+        packs_to_validate = [(pack_path, format((count / num_of_packs) * 100, ".2f"))
+                             for count, pack_path in enumerate(all_packs, start=1)]
+        packs_valid = set()
+        try:
+            with multiprocessing.get_context('fork').Pool(processes=self.workers) as pool:
+                # imap returns the results in the packs order, as soon as each of them is ready
+                for pack_result in pool.imap(_run_validations_on_pack_worker, packs_to_validate):
+                    packs_valid.add(self.merge_pack_validation_result(pack_result))
+        finally:
+            _WORKER_VALIDATE_MANAGER = None
+
+        self.completion_percentage = packs_to_validate[-1][1]  # type: ignore
+        return packs_valid
+
+    def run_validations_on_pack_in_worker(self, pack_path: str, completion_percentage: str) -> dict:
+        """Runs validation on all files in given pack inside a packs validation process.
+
+        Args:
+            pack_path: the path to the pack.
+            completion_percentage: the completion percentage to print for the files of the pack.
+
+        Returns:
+            dict. the pack validation result, output, ignored files and errors.
+        """
+        self.completion_percentage = completion_percentage  # type: ignore
+        self.ignored_files = set()
+        del FOUND_FILES_AND_ERRORS[:]
+        del FOUND_FILES_AND_IGNORED_ERRORS[:]
+        # the json errors of the pack are written to the json file by the main process
+        JSON_ERRORS_OUTPUT.pop(self.json_file_path)
+
+        output = _CapturedOutput(sys.stdout.isatty())
+        with redirect_stdout(output):
+            is_valid = self.run_validations_on_pack(pack_path)
+        json_errors = JSON_ERRORS_OUTPUT.pop(self.json_file_path)
+
+        return {
+            'is_valid': is_valid,
+            'output': output.getvalue(),
+            'ignored_files': self.ignored_files,
+            'errors': list(FOUND_FILES_AND_ERRORS),
+            'ignored_errors': list(FOUND_FILES_AND_IGNORED_ERRORS),
+            'json_errors': json_errors,
+        }
+
+    def merge_pack_validation_result(self, pack_result: dict) -> bool:
+        """Prints the output of a pack validated by a packs validation process and merges its report.
+
+        Returns:
+            bool. true if all files in pack are valid, false otherwise.
+        """
+        sys.stdout.write(pack_result['output'])
+        sys.stdout.flush()
+        self.ignored_files.update(pack_result['ignored_files'])
+        FOUND_FILES_AND_ERRORS.extend(pack_result['errors'])
+        FOUND_FILES_AND_IGNORED_ERRORS.extend(pack_result['ignored_errors'])
+        if pack_result['json_errors']:
+            JSON_ERRORS_OUTPUT.extend(self.json_file_path, pack_result['json_errors'])
+
+        return pack_result['is_valid']
+
     def run_validations_on_pack(self, pack_path):
         """Runs validation on all files in given pack. (i,g,a)
 
@@ -705,6 +804,10 @@ class ValidateManager:
 
         validation_results = {valid_git_setup}
 
+        changed_files = [file_path[1] if isinstance(file_path, tuple) else file_path for file_path in modified_files]
+        changed_files.extend(added_files)
+        self.prefetch_docker_images_latest_tags(changed_files)
+        self.verify_readmes_mdx(changed_files)
         validation_results.add(self.validate_modified_files(modified_files))
         validation_results.add(self.validate_added_files(added_files, modified_files))
         validation_results.add(self.validate_changed_packs_unique_files(modified_files, added_files, old_format_files,
@@ -722,6 +825,69 @@ class ValidateManager:
 
         return all(validation_results)
 
+    def prefetch_docker_images_latest_tags(self, paths: Iterable[str]) -> None:
+        """Fetches the latest tags of the docker images of the integrations and scripts in the given paths at once,
+        so an image used by several of them is requested a single time, before any of them is validated.
+
+        Args:
+            paths: the files and directories to validate.
+        """
+        if self.skip_docker_checks:
+            return
+
+        docker_image_names = set()
+        for yml_path in self.list_files_in_paths(paths, '.yml'):
+            if API_MODULES_PACK in yml_path:
+                continue
+            try:
+                yml_data = get_yaml(yml_path)
+                if not isinstance(yml_data, dict) or is_iron_bank_pack(yml_path):
+                    continue
+            except (OSError, ValueError):
+                continue
+
+            # the docker image of an integration is in its script section
+            script_data = yml_data.get('script')
+            if not isinstance(script_data, dict):
+                script_data = yml_data
+            docker_image = script_data.get('dockerimage')
+            if isinstance(docker_image, str) and docker_image.startswith('demisto/'):
+                docker_image_names.add(docker_image.split(':')[0])
+
+        if docker_image_names:
+            DockerImageValidator.prefetch_docker_images_latest_tags(docker_image_names)
+
+    @staticmethod
+    def verify_readmes_mdx(paths: Iterable[str]) -> None:
+        """Parses the readme files in the given paths as mdx at once, in batches spread over a pool of mdx servers,
+        so their validation does not wait for a single mdx server to parse them one by one.
+
+        Args:
+            paths: the files and directories to validate.
+        """
+        readme_paths = ValidateManager.list_files_in_paths(paths, 'README.md')
+        if readme_paths:
+            ReadMeValidator.verify_mdx_in_batches(readme_paths)
+
+    @staticmethod
+    def list_files_in_paths(paths: Iterable[str], suffix: str) -> List[str]:
+        """Lists the files with the given suffix in the given paths, searching the directories recursively.
+
+        Args:
+            paths: files and directories.
+            suffix: the suffix of the files to list.
+
+        Returns:
+            list. The files paths.
+        """
+        file_paths = []
+        for path in paths:
+            if os.path.isdir(path):
+                file_paths.extend(glob(os.path.join(path, '**', f'*{suffix}'), recursive=True))
+            elif path.endswith(suffix):
+                file_paths.append(path)
+        return file_paths
+
     """ ######################################## Unique Validations ####################################### """
 
     def validate_description(self, file_path, pack_error_ignore_list):
@@ -1670,3 +1836,20 @@ class ValidateManager:
 
             return is_valid_as_deprecated
         return None
+
+
+class _CapturedOutput(io.StringIO):
+    """Captures the output of a packs validation process, keeping the colors if printed to a terminal."""
+
+    def __init__(self, is_tty: bool):
+        super().__init__()
+        self.is_tty = is_tty
+
+    def isatty(self) -> bool:
+        return self.is_tty
+
+
+def _run_validations_on_pack_worker(pack_to_validate: Tuple[str, str]) -> dict:
+    pack_path, completion_percentage = pack_to_validate
+    return _WORKER_VALIDATE_MANAGER.run_validations_on_pack_in_worker(  # type: ignore[union-attr]
+        pack_path, completion_percentage)
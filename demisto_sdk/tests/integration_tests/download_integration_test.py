@@ -1,7 +1,10 @@
+import ast
+import io
 from os.path import join
 
 import pytest
 from click.testing import CliRunner
+from urllib3 import HTTPResponse
 
 from demisto_sdk.__main__ import main
 from demisto_sdk.commands.common.legacy_git_tools import git_path
@@ -18,10 +21,10 @@ def demisto_client(mocker):
         return_valure="object"
     )
     with open('demisto_sdk/tests/test_files/download_command/demisto_api_response', 'r') as f:
-        api_response = f.read()
+        bundle = ast.literal_eval(f.read())
     mocker.patch(
         "demisto_sdk.commands.download.downloader.demisto_client.generic_request_func",
-        return_value=(api_response, None, None)
+        return_value=(HTTPResponse(body=io.BytesIO(bundle), status=200, preload_content=False), 200, {})
     )
 
 
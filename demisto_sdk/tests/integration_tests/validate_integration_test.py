@@ -7,6 +7,7 @@ from click.testing import CliRunner
 from demisto_sdk.__main__ import main
 from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import DEFAULT_IMAGE_BASE64
+from demisto_sdk.commands.common.errors import FOUND_FILES_AND_ERRORS
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
@@ -3010,6 +3011,48 @@ class TestAllFilesValidator:
         assert 'The name of this v2 script is incorrect' in result.stdout
         assert result.exit_code == 1
 
+    def test_not_all_files_valid__workers(self, mocker, monkeypatch, repo):
+        """
+        Given
+        - An invalid repo with several packs.
+
+        When
+        - Running validate on it serially and with a pool of workers.
+
+        Then
+        - Ensure validate fails in both runs, with the same output and the same errors report.
+        """
+        # the latest version notice and the npm modules warning are printed by the first run only
+        monkeypatch.setenv('DEMISTO_SDK_SKIP_VERSION_CHECK', 'true')
+        mocker.patch.object(tools, 'is_external_repository', return_value=False)
+        mocker.patch.object(PackUniqueFilesValidator, 'are_valid_files', return_value='')
+        mocker.patch.object(ValidateManager, 'validate_readme', return_value=True)
+        mocker.patch.object(ValidateManager, 'verify_readmes_mdx')
+        mocker.patch.object(BaseValidator, 'check_file_flags', return_value='')
+        invalid_script_yml = get_yaml(VALID_SCRIPT_PATH)
+        invalid_script_yml['name'] = invalid_script_yml['name'] + "_v2"
+        incident_field_copy = INCIDENT_FIELD.copy()
+        incident_field_copy['content'] = False
+        for i in range(4):
+            pack = repo.create_pack(f'PackName{i}')
+            pack.create_script(yml=invalid_script_yml)
+            pack.create_incident_field('incident-field', content=incident_field_copy)
+
+        results = []
+        for extra_args in ([], ['--workers', '3']):
+            FOUND_FILES_AND_ERRORS.clear()
+            with ChangeCWD(repo.path):
+                runner = CliRunner(mix_stderr=False)
+                result = runner.invoke(main, [VALIDATE_CMD, '-a', '--no-docker-checks', '--no-conf-json', *extra_args],
+                                       catch_exceptions=False)
+            results.append(result)
+
+        serial_result, parallel_result = results
+        assert serial_result.exit_code == parallel_result.exit_code == 1
+        assert serial_result.stdout == parallel_result.stdout
+        assert 'Validating Packs/PackName3 unique pack files' in parallel_result.stdout
+        assert 'SC100' in parallel_result.stdout
+
 
 class TestValidationUsingGit:
     def test_passing_validation_using_git(self, mocker, repo):
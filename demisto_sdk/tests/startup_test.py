@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+import demisto_sdk
+
+# modules which take most of the startup time, and are imported only by the commands which use them
+HEAVY_MODULES = ('git', 'requests', 'urllib3', 'demisto_client', 'pkg_resources', 'setuptools', 'ruamel.yaml')
+# demisto-sdk itself, and commands whose modules import the heavy modules
+STARTUP_COMMANDS = [None, 'validate', 'lint', 'format', 'upload', 'create-content-artifacts']
+
+
+def get_imported_modules_times(import_time_output: str) -> Dict[str, int]:
+    """
+    Get the self import time in microseconds of each module from the `python -X importtime` output.
+    """
+    modules_times = {}
+    for line in import_time_output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, _, module_name = line[len('import time:'):].split('|')
+        if self_time.strip().isdigit():  # not the header line
+            modules_times[module_name.strip()] = int(self_time)
+    return modules_times
+
+
+def run_sdk_help_with_import_time(command: Optional[str], env: dict) -> Dict[str, int]:
+    args = [sys.executable, '-X', 'importtime', '-m', 'demisto_sdk'] + ([command] if command else []) + ['--help']
+    result = subprocess.run(args, cwd=Path(demisto_sdk.__file__).parent.parent, env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, text=True)
+    assert result.returncode == 0, result.stderr[-1000:]
+    return get_imported_modules_times(result.stderr)
+
+
+def test_get_imported_modules_times():
+    """
+    Given
+    - A `python -X importtime` output.
+
+    When
+    - Parsing it.
+
+    Then
+    - Ensure the self time of each imported module is returned.
+    """
+    import_time_output = 'import time: self [us] | cumulative | imported package\n' \
+                         'import time:       120 |        120 |     _io\n' \
+                         'import time:      3154 |       3274 |   click\n'
+
+    assert get_imported_modules_times(import_time_output) == {'_io': 120, 'click': 3154}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='the installed version is read by pkg_resources before 3.8')
+@pytest.mark.parametrize('command', STARTUP_COMMANDS)
+def test_sdk_help__commands_startup(command, tmp_path):
+    """
+    Given
+    - demisto-sdk or one of its commands, with a cached latest release version.
+
+    When
+    - Running it with --help under `python -X importtime`.
+
+    Then
+    - Ensure it doesn't import the heavy modules, which are left for the commands which use them.
+    """
+    version_cache_path = tmp_path / 'last_release_version.json'
+    version_cache_path.write_text(json.dumps({'version': '1.0.0', 'timestamp': time.time()}))
+    env = dict(os.environ, DEMISTO_SDK_CACHE_DIR=str(tmp_path))
+    env.pop('DEMISTO_SDK_SKIP_VERSION_CHECK', None)
+    env.pop('CI', None)
+
+    modules_times = run_sdk_help_with_import_time(command, env)
+
+    heavy_modules = [module for module in modules_times if module in HEAVY_MODULES or
+                     module.split('.')[0] in HEAVY_MODULES]
+    assert not heavy_modules